@@ -1,5 +1,6 @@
 // Auto-generated by train_and_export.py
 // Quantized INT8 weights with pre-scaled INT32 biases
+// Array contents live in *.bin, embedded by weights.S
 #ifndef WEIGHTS_H
 #define WEIGHTS_H
 
@@ -7,6391 +8,17 @@
 
 // fc1.weight: shape=(128, 784), scale=131.118835
 #define FC1_WEIGHT_SCALE 131.118835f
-const int8_t fc1_weight[100352] = {
-    -5, 0, -3, -2, 3, -1, 1, 1, 3, 2, -3, 1, 12, 11, 1, 2,
-    4, 2, -1, 2, -3, -4, 2, -3, -1, 0, -3, 3, 0, 1, -2, -3,
-    -2, 5, 5, 0, 1, 3, 11, 13, 8, -6, -7, 30, 27, 17, 10, 11,
-    -1, 5, 6, 3, 2, 0, 0, 2, 1, 0, -1, -2, 10, 11, 3, 9,
-    12, -20, -8, 24, 21, -3, -8, 27, 28, 28, 35, 36, 31, 31, 15, 23,
-    -8, -19, 4, 2, -3, 0, -1, 13, 13, -2, 6, 12, 29, 43, 20, 27,
-    35, 23, 1, -3, -21, -11, 29, 14, 4, 39, 24, -13, -15, 27, 29, 3,
-    1, -2, -4, 4, 23, 5, -13, 12, 20, 34, 6, 23, 1, 0, 20, -2,
-    -33, -56, -32, -38, -36, -2, -21, 13, 27, 31, 33, -9, -4, 3, 1, -15,
-    -8, -9, -22, 1, -15, -27, -31, -25, -37, -21, -16, -26, -60, -56, -57, -61,
-    -34, -5, -32, -39, -19, -4, 11, 15, -4, -2, 32, 0, 16, 25, 13, 1,
-    -15, -22, -21, 5, -42, -46, -45, -62, -79, -52, -33, -29, -20, -3, -10, -19,
-    -3, -9, 22, -24, 1, 26, 41, 0, 13, -7, 13, 8, -15, -28, -4, -13,
-    -26, -17, -27, -30, -25, -7, -5, -13, -2, 3, 16, -8, -14, 2, 27, -25,
-    32, 37, 2, 8, 14, 14, 14, 20, -7, -9, -5, -5, 3, 7, 10, 20,
-    36, 44, 34, 17, 21, 11, 18, 26, 20, -13, -4, 25, 9, 44, 2, 30,
-    40, 14, 10, 13, 10, 11, 35, 15, 25, 40, 51, 51, 59, 64, 38, 25,
-    18, 12, 30, 23, 31, 19, -17, 25, 11, 39, -5, -5, 22, -3, 21, 1,
-    13, 36, 28, 24, 27, 57, 62, 57, 42, 22, 46, 19, 25, 10, 15, 22,
-    27, 16, 10, -8, 0, 14, 16, 28, 15, -5, 4, 1, 5, 17, 5, 37,
-    22, 50, 45, 14, -6, -7, 8, 7, 2, 3, 21, 35, 57, 35, 41, 35,
-    9, 15, 11, -5, -13, -8, -10, 8, 2, 11, -9, -9, -11, 2, 10, 1,
-    -33, -19, -11, -12, -20, -12, 4, 3, 9, 28, 49, 40, -3, 12, 23, -22,
-    -41, 1, -9, -26, -17, 0, 0, 4, -1, -6, -6, -24, -17, -20, -27, -20,
-    -14, 20, -5, -11, 21, 14, 24, -27, -2, 4, 45, 3, -33, -2, -5, -32,
-    -15, 1, 15, 16, 3, -23, -19, -8, -18, -10, -1, -20, -1, 18, -1, 6,
-    11, -20, 12, -14, 5, 1, 16, -17, -11, 21, 14, -10, -2, 4, 9, 18,
-    -7, -23, -21, -20, -27, 1, 5, 5, 5, 9, -10, 2, 11, -18, -16, -38,
-    7, -10, -6, -29, -2, 29, 23, -2, 15, 27, 28, -3, -31, -33, -31, -30,
-    -12, -4, 3, 16, 0, -7, -4, -19, -24, -48, 0, -30, 4, -6, 18, -38,
-    -33, 26, 26, 9, 1, 16, 27, 12, -26, -17, 1, -15, -5, 6, 4, 10,
-    19, 0, 5, -4, 12, -25, -38, -11, 31, -8, 32, -29, -20, -3, 3, 28,
-    26, 11, 19, -11, -27, -5, 0, -15, -5, 14, 7, 9, 6, 2, 16, -6,
-    -20, -7, -25, -23, -2, 24, 16, -37, -9, -10, -6, -11, -6, -1, -10, -17,
-    -3, 6, -13, -11, -15, 15, -3, 10, 1, -7, -3, 5, -3, -9, -31, 0,
-    -3, 22, -22, -59, -41, 9, 3, 3, -1, -23, -12, 3, 8, -6, -6, -9,
-    -20, 14, -14, -7, -29, -26, -16, 13, 14, 4, -19, 5, -1, 0, -40, -54,
-    -29, -14, -16, -22, -16, 4, 2, 0, 5, -1, 3, -4, -3, 9, 5, -7,
-    -24, -14, -24, 3, 2, 8, -12, -1, -2, -3, -29, -16, -12, -27, -29, -38,
-    -9, 20, 0, -4, 0, 2, 15, 6, 9, 7, -9, -24, -20, -17, -22, -2,
-    -10, -6, -5, 2, -3, -2, -13, 5, 26, 21, -9, -9, -22, -7, 6, 12,
-    16, 5, -1, 3, 9, -8, -29, -46, -31, -23, -4, 4, 0, -10, -6, 1,
-    -1, -1, -1, 4, 32, 37, -32, -35, -15, -3, 17, 3, -10, -5, 1, 15,
-    23, 9, -23, -17, -18, -2, -10, 11, 32, -31, -26, -4, 4, 0, -9, 24,
-    -9, -30, -11, 5, 9, 0, 3, -7, -6, -17, 17, 14, 37, 9, -2, 8,
-    4, 27, 53, 24, 30, -9, -24, 2, 1, 0, 1, 0, -43, -38, -31, 6,
-    18, 9, 10, -6, 26, 55, 18, 18, 32, 2, 2, 14, 23, 19, 33, 23,
-    5, 1, 0, 4, -3, -3, -4, -3, 15, 19, 33, 32, 32, 28, 54, 34,
-    21, 40, 56, -2, 24, 43, 27, 19, 13, 36, 30, 23, -1, 3, -5, -4,
-    3, 3, -3, 3, 1, -2, 0, 3, -1, 0, -4, -1, -8, -4, -2, 4,
-    3, -3, 1, 2, 4, 4, 4, 1, 0, 4, -1, 4, 4, 1, 3, 4,
-    1, -5, -13, -12, -9, -15, -5, -7, -4, -17, -15, -14, -4, -5, -24, -18,
-    -19, -13, 3, 2, 3, -1, 1, 4, -4, 1, -2, 4, -8, -6, -10, -17,
-    -19, -35, -45, -12, 20, 7, 11, 1, 7, 11, 19, 17, 18, 5, 9, 12,
-    -4, 3, -3, -2, -2, -1, -4, 31, 30, 22, 16, 27, 36, -11, 4, -13,
-    -3, -27, -15, 9, -6, -24, -18, -11, 19, 4, -17, 6, 35, -37, 2, 0,
-    -3, -2, 8, 43, -2, -16, -9, 3, 17, 5, 11, 19, -6, -6, 6, 13,
-    1, -1, 15, 26, 6, 20, -2, -3, 25, -4, 5, -1, -2, -5, 8, 27,
-    -5, 15, -1, 15, 19, 1, -11, 1, -3, 5, -1, 4, 4, 4, 17, 15,
-    5, -2, -4, -7, 9, 10, 25, 5, 3, 5, 5, -10, 22, 6, -9, -2,
-    2, 6, 3, 7, -5, -1, 3, 1, 10, -2, 2, 16, 12, -5, 5, 13,
-    33, 55, 43, 14, 4, 15, 11, -8, -1, -9, -5, 9, 8, -4, 12, 9,
-    -2, -5, 0, 1, 10, 17, 4, 12, 15, 15, -4, -3, 3, 25, 18, 1,
-    -10, 12, 15, -9, -28, -16, -14, -5, -3, -8, 7, 23, 8, -1, 6, 5,
-    -2, 3, 8, 6, 6, 30, 11, -21, 9, 0, -1, 9, 12, 15, 5, -3,
-    -4, -5, -3, 5, -7, -11, 8, 9, 14, -2, 7, 4, -8, 3, -4, -8,
-    -12, 6, 19, -28, 3, 5, -3, 6, 14, 5, 19, 21, 24, 13, 9, 1,
-    -11, 1, 9, 6, 15, 12, 15, 3, 13, 1, -3, -3, -10, -8, -9, -47,
-    -13, 10, 15, 11, 8, 9, 15, 23, 43, 9, 20, 11, -3, 1, 17, 20,
-    13, 4, 5, 9, 17, 8, 10, 3, -8, -18, -10, -37, -40, -7, 21, -1,
-    7, 10, 13, 11, 7, 13, 4, 7, 6, 3, 4, -1, 1, 2, 2, 14,
-    11, -10, 20, 21, 7, -19, -9, -33, -58, -18, 25, -26, 0, 8, 6, 11,
-    -14, 20, 2, 5, 6, -3, -8, -6, 8, 20, 6, 12, 17, -6, 9, 9,
-    9, -3, -17, -32, -53, -9, -11, -25, 3, 6, 13, 20, -17, -43, -19, -14,
-    -11, -15, -21, -6, 4, -7, 10, 21, 9, -3, -8, 12, 9, 13, 6, -1,
-    -17, -22, -21, -8, 3, 5, 12, 17, -11, -43, -36, -75, -93, -70, -45, -18,
-    -12, -23, -5, 9, -5, 5, 3, 10, 24, 26, 20, -1, -30, -33, 23, -1,
-    3, 8, 6, 9, -19, -10, -41, -73, -90, -83, -69, -63, -51, -40, -38, -11,
-    -11, 0, 22, 17, 6, 9, 33, -24, -28, -50, -11, -7, -3, 11, -7, 33,
-    -22, -11, -13, -34, -25, -44, -69, -81, -75, -64, -55, -9, -7, 10, 6, -3,
-    -8, -2, 13, -32, -26, -37, 1, -4, 6, 8, -1, 63, 13, 0, 15, 9,
-    19, 3, -15, -32, -57, -39, -1, 3, -1, 1, 0, 3, 1, 16, 17, -22,
-    -18, -39, 6, -7, -1, 13, 0, 47, 18, 15, 19, 30, 31, 25, 5, -4,
-    -7, 2, 6, -12, -19, -3, -1, -11, -2, 6, -18, 13, -8, -18, -5, -3,
-    -4, 1, -31, 9, 8, 17, 5, 26, 29, 19, 15, 22, 25, 20, 4, -24,
-    -12, -8, -9, -2, -10, -13, -25, 5, -9, -9, -6, -1, -9, -5, -32, -29,
-    -15, -5, -16, 12, 13, 3, 24, 28, 37, 12, -3, -6, -5, -11, -1, -10,
-    5, -15, 2, 7, -28, -32, -16, 0, -10, -3, -26, -20, 2, -23, -33, -11,
-    0, -8, -3, 6, 2, 3, 11, -2, 2, 1, -1, 20, 8, -3, 13, 2,
-    -25, -24, -10, -7, -4, -2, 17, 27, 18, -3, -24, -44, -40, -4, 6, 26,
-    3, 2, 3, 2, 7, 17, 24, 9, -12, 1, -15, -13, -7, -21, 0, -3,
-    -4, -4, 20, 47, 36, 24, -17, -21, -21, -1, 4, 10, -7, -1, -10, -15,
-    10, 20, -17, -27, -11, 2, -5, -21, -22, -13, -1, -3, -2, 1, -9, 7,
-    48, 51, 7, 20, 40, 23, 26, 55, 23, -2, -14, -3, 15, -11, -15, -11,
-    14, 17, 25, 18, 3, -6, -3, -1, -4, -3, -2, 0, -10, 12, 24, 35,
-    29, 7, 24, 22, 39, 48, 28, 39, 27, 0, 11, 27, 16, 12, 9, -2,
-    0, -1, -3, -1, -1, 3, 2, 2, 12, 8, 5, 2, 1, 4, 22, -3,
-    -8, 6, 7, -3, 6, 0, 7, 2, 2, 2, -3, 5, -1, 0, 3, 2,
-    -4, -4, -4, -4, 2, 5, -5, 2, 3, -1, 5, 4, 10, 15, 18, 10,
-    1, 4, 0, 2, -4, -4, 4, -2, 2, 4, -3, 3, 4, 3, -4, 3,
-    1, -2, -19, -28, -6, 2, -22, -11, -6, -6, -3, -10, 13, 6, -11, -10,
-    -16, -29, -30, -26, 0, 2, 4, -3, 2, -2, 4, 2, -4, 8, -6, -13,
-    -9, -15, -5, 3, 12, -7, -29, -16, -15, -35, -35, -54, -55, -42, -29, 7,
-    17, 21, 4, 3, 3, 2, 1, 3, 7, 4, 15, -12, -10, -26, -43, -27,
-    -16, -7, -24, -20, -26, -50, -31, 2, -12, -50, -33, -20, 3, -1, -22, 3,
-    -4, 4, 3, -30, -23, 4, 19, -4, -34, -30, -21, -31, -32, -17, -6, -6,
-    -20, -15, -6, 5, 9, -34, -31, -17, -35, -31, -23, -23, -2, -2, 3, 15,
-    35, 14, 9, -4, 4, 4, -9, -29, -6, 17, 10, 9, 17, 0, 9, 3,
-    -13, 12, 9, 13, -17, -33, -27, -24, 1, 4, -3, 38, 21, 16, 2, -3,
-    -6, -1, 9, -7, -6, -6, -3, 0, 10, -4, -6, 16, 5, 0, 5, -8,
-    -36, -58, -27, -29, -1, 20, 23, 28, 12, 2, 12, 15, -22, -4, -3, -14,
-    -5, -1, -1, -15, 2, 11, 13, 20, 16, 8, 20, 4, -47, -63, 9, -30,
-    2, 10, -7, -20, 1, 14, 12, 24, -8, -11, 3, 3, 7, 15, 15, 0,
-    5, 16, -5, 8, 15, -16, 26, 38, -42, -70, 2, -3, 7, 8, 30, 9,
-    3, 20, 13, 40, 12, 3, 16, 17, 42, 22, 15, -2, 0, 13, -13, -11,
-    -1, -24, 15, 43, -30, -42, 14, -10, 8, -1, 36, -11, 7, 12, 43, 50,
-    37, 32, 43, 32, 1, -6, -21, -9, -9, 18, 3, -10, -9, -17, -16, -6,
-    -13, -1, 14, -5, 7, 35, 28, -33, 24, 26, 29, 48, 52, 34, 16, 4,
-    -49, -38, -10, 1, -11, 2, -2, 1, -3, -1, 0, -14, -27, 0, -23, 39,
-    3, 34, 38, -17, 2, -5, -23, 7, 17, -19, -52, -82, -67, -55, -1, -14,
-    -11, -7, -6, -11, -13, 10, -10, -22, 4, 36, 25, 37, 4, 23, 23, -21,
-    -31, -37, -44, -56, -59, -76, -89, -75, -43, 1, 24, -1, -7, -4, -3, -10,
-    -3, 11, -7, -11, 37, 28, 35, 18, 0, -6, -6, -18, -53, -85, -84, -103,
-    -110, -91, -76, -24, 9, 33, 16, -1, -12, 5, 7, 5, -11, 2, 0, -8,
-    -19, -16, 54, 17, 3, -3, -6, -16, -66, -98, -101, -93, -65, -41, -11, 27,
-    32, 46, 6, -7, -14, 14, 18, 5, -7, -1, 26, 35, 23, -8, 16, 40,
-    8, -4, 9, -13, -64, -84, -61, -28, -5, 11, 15, 36, 38, 40, -5, -11,
-    -2, 17, 23, 24, -6, 13, 19, 34, 0, -19, 32, 35, 4, 0, 6, -11,
-    -18, -39, -23, 4, 10, 27, 18, 30, 37, 37, 5, -18, -5, 11, 18, 26,
-    13, 9, 14, 11, -4, 45, 33, 43, -4, -9, -17, 8, 13, 6, 8, 44,
-    28, 28, 7, 11, 25, 29, 3, -4, -2, -6, 13, 25, -7, -24, -4, 22,
-    7, 23, 46, 28, -8, -20, -6, 25, 20, -3, 27, 47, 32, 13, 5, 25,
-    11, 14, 11, 2, 3, -9, -20, 8, -15, -27, -17, -9, 2, 23, 15, 21,
-    3, -26, 21, 23, 20, -11, 19, 32, 28, 10, 3, 25, 10, 6, 6, 11,
-    -7, -3, -11, -2, -17, -13, -10, 5, -17, -13, 23, -2, 4, 12, 19, 23,
-    20, -9, 4, -3, -7, -13, 10, -1, 7, -2, 24, 13, 13, -6, -15, -9,
-    -16, -2, 12, 14, -4, 20, 8, -4, 6, 1, 30, -9, -4, 26, 0, -12,
-    -8, -10, -5, 7, -12, 2, 5, 5, 21, -10, -11, -21, -11, -5, 15, 1,
-    1, 16, 4, 1, -1, -4, 4, -33, -7, -6, 13, -7, -24, 10, 17, 9,
-    3, 17, 2, 4, 24, 7, -13, -22, -21, -17, 5, -3, -24, 0, 25, 3,
-    1, 4, 0, -18, -12, -16, -4, -25, -5, -1, 1, -1, -7, -7, -3, 2,
-    -4, 9, -29, -14, 2, -17, -21, -30, -2, 25, 20, -2, -3, -4, -17, 31,
-    -9, -24, 2, 4, 14, -11, -13, -7, -2, -18, -8, 4, -7, 2, -20, -7,
-    -4, -14, -18, -35, -31, 9, 6, 2, 3, 3, 4, -8, -44, -50, -34, 43,
-    29, 4, -8, -13, -17, 12, -6, 1, -6, -35, -15, 3, -23, -52, -35, 2,
-    -1, 7, 0, 0, 3, -3, 4, -3, 16, 26, 33, 33, 63, 57, 54, 59,
-    45, 72, 41, 83, 73, 19, 5, 32, 12, -28, -26, -1, 4, 0, 0, 0,
-    -3, 0, 2, 3, 4, 1, 1, 2, 3, 0, -2, 3, 17, 17, 5, 0,
-    -2, -3, -1, -2, 2, 4, -2, -1, 4, -2, -2, -2, 1, 3, 4, 0,
-    4, 3, 22, 18, 19, 26, 60, 6, 8, 7, -17, -5, -10, -6, 27, 32,
-    35, 26, 22, 11, 0, -4, -4, -1, -2, -4, 7, 1, 19, 24, 26, 28,
-    23, 34, 28, 39, 22, 6, 37, 36, 22, 24, 25, 10, 13, 18, 34, 23,
-    14, 3, 3, 0, 2, -2, 2, -1, 1, 52, 23, 0, 6, 58, 17, 4,
-    -17, -5, 11, -5, 9, -12, 0, 2, -16, -34, -27, 4, 22, 16, 2, 4,
-    2, 2, 25, -26, 43, 51, 10, -21, 6, 12, 23, -8, -4, -17, -27, -51,
-    -21, -7, -14, -23, -40, -35, -41, -5, 26, 19, -23, 8, 3, -4, 36, -12,
-    49, -7, -14, -1, 29, 11, 10, 22, 10, -7, -11, -36, -21, -14, -27, -27,
-    -25, -24, -22, 19, 19, 9, -20, 10, 0, -3, 1, 37, 15, -16, -7, 6,
-    4, 20, -2, 11, 11, -8, -9, -11, -7, -4, -13, -23, -10, 6, 15, 26,
-    -5, -1, -21, 21, 5, 1, 31, 58, 12, -15, -14, -14, -12, 7, -3, 8,
-    -4, 1, 6, 4, -11, -16, 1, -5, 6, 29, 12, 6, 7, 12, 17, 17,
-    -36, 14, 17, 38, 27, 13, -7, 4, 14, 14, 16, -10, -15, 4, 13, -7,
-    -17, -18, 0, -8, -7, 4, -15, 7, 1, 11, 14, -20, 11, -2, 16, 36,
-    -5, 6, -4, 12, 16, 7, -13, -11, -11, -2, -9, -11, 7, 9, -7, -12,
-    -3, 3, -3, 22, 25, -12, 27, -35, 14, -8, 18, 1, -18, -16, -7, 14,
-    5, -10, -6, 2, -5, -15, -26, -14, -1, 1, -4, -15, -2, -5, 5, 22,
-    33, 14, -26, 5, 4, 7, 8, 7, -2, -2, 0, 13, 10, 7, 8, 9,
-    6, -44, -35, -18, -15, -23, -21, -1, 17, 23, 44, 22, 14, -9, -25, -32,
-    9, 14, -11, 28, -6, 5, -10, 11, 4, -14, 7, 15, 6, -48, -41, -21,
-    7, 0, 11, 14, 25, 32, 43, 3, 6, -25, -55, -25, 2, 8, -4, 20,
-    -14, 6, 14, 14, 17, 3, 13, 14, -13, -34, -40, -16, 7, 28, 31, 38,
-    9, 32, 26, 8, -1, -14, -14, 21, 1, -4, -3, 20, -19, 8, 24, 22,
-    17, 7, 5, 2, -27, -22, 10, 19, 17, 27, 34, 30, -3, 11, 12, -12,
-    -26, 27, 9, 4, 3, -7, -8, 34, -3, -6, 13, 9, 4, -16, -16, -29,
-    -35, 18, 42, 33, 27, 21, 13, 24, 12, 5, 11, -8, -10, 26, 26, 5,
-    11, -1, 0, 25, 6, 8, 15, -3, -6, -24, -36, -52, -25, 20, 49, 35,
-    28, 32, 14, 13, -15, -8, 3, 8, 8, 61, 21, 11, -2, -2, 31, -3,
-    1, -15, -12, -29, -5, -44, -70, -19, 12, 43, 28, 22, 29, 33, 16, -5,
-    -12, -10, 2, -16, 13, 55, -7, 6, -30, -5, 9, 5, -31, -43, -21, -23,
-    -27, -54, -55, -16, 52, 47, 18, 21, 17, 37, 23, -9, -18, -15, -16, -20,
-    16, 49, -1, -22, -6, -6, 14, -19, -53, -49, -24, -25, -32, -29, -8, 15,
-    39, 32, 24, 0, 0, 20, -2, -21, -17, -8, -20, -20, 4, 6, 14, -27,
-    3, -6, 2, -25, -63, -42, -34, -20, -20, -7, 13, 0, 18, 17, 25, 13,
-    7, 5, -15, -26, -4, -14, -14, -21, 29, -8, 30, -5, -9, 2, -17, -32,
-    -67, -61, -30, -21, 11, -4, 5, -15, -9, 21, 23, 6, 8, 22, -8, -17,
-    -17, -7, -8, 4, 14, -21, -12, -1, -11, -11, -10, -35, -40, -34, -40, -28,
-    3, -4, -8, -16, -8, -9, -7, -5, 7, -4, -9, -2, -2, 12, -1, 0,
-    27, -12, -24, -4, 2, 3, -3, -42, -23, -36, -14, -26, -5, -13, -8, 12,
-    4, 3, -6, -1, 3, -8, -3, 21, 20, 23, 21, 28, 7, -9, -20, -1,
-    4, 1, -2, -29, -43, -41, -4, -20, 9, 17, 2, 31, 22, 22, 22, 19,
-    13, 8, -5, 30, 21, 10, 36, 26, 39, -1, -15, -2, 1, 1, -16, -13,
-    -13, -15, 5, -6, -19, -6, 14, 4, -14, -12, 32, 33, 7, 4, 5, -37,
-    -28, -36, -35, -10, 0, -8, 5, 4, -3, 4, 4, -25, 0, 5, 5, -15,
-    -16, 2, -5, -11, -20, -16, 1, 3, -8, -5, -7, -26, -18, -9, -20, -15,
-    -2, -2, 4, 4, 1, -3, -2, -2, 14, 18, -14, -19, -20, -3, -19, -10,
-    -11, 20, -8, -17, -11, 15, 5, -10, -11, -3, -8, 9, 0, 2, 1, 2,
-    3, -2, 2, -4, 3, -2, -1, -2, 1, 0, 4, 0, 4, 10, -12, -1,
-    3, 2, 3, 1, -4, 0, 2, 2, -2, -2, 5, -4, -4, 1, 4, -2,
-    -1, -1, -5, -10, 3, 16, 41, -15, -20, -8, 22, -23, -16, -11, 18, -1,
-    7, 5, 0, -9, -4, -4, -4, 2, 0, 1, 4, 3, -7, 6, -6, -5,
-    24, 40, 22, 14, 16, 13, 30, -5, -23, 5, 19, -1, 2, 10, 15, -5,
-    8, -12, -1, -3, 2, 2, 15, -32, -26, 38, 32, 28, 10, 10, 4, 30,
-    -7, -4, 13, 16, -1, -24, -12, -10, -31, 1, -3, 17, 10, -21, -13, 2,
-    -2, -1, 8, -43, -6, 45, 22, 25, 32, 2, 32, 11, 14, 15, 16, -5,
-    -1, -2, -17, -17, -3, 3, -2, 4, 3, -13, -9, 32, -4, -3, -8, -12,
-    15, -30, -4, 16, 8, -8, 14, 20, 26, 16, 19, 7, 7, 7, -15, 6,
-    11, 8, -5, 18, 8, 11, 12, 31, 5, -13, -27, 5, -2, -27, -6, 14,
-    6, 10, -6, -1, 6, 1, -3, 0, 3, -9, -22, -9, -7, -7, 4, 21,
-    -6, -5, -7, 32, -1, -23, -18, 11, 22, 13, -6, -12, 9, -8, -16, -8,
-    1, 7, -10, -6, -17, -16, -13, -4, -2, 6, 2, 9, 5, -5, -4, 31,
-    -36, -34, -2, 8, 42, 16, 1, -6, -6, 2, -2, -1, 2, 13, 1, -16,
-    -16, -14, -14, 7, -9, 15, -6, -8, -18, 12, 15, -14, -8, -43, 8, 10,
-    -3, 8, 0, -8, -7, -3, -7, -2, -1, 2, -9, 0, -3, 1, -3, 14,
-    17, 13, -16, 2, -19, -12, 2, -8, -6, -21, -24, 2, -12, -2, -3, -5,
-    -8, -9, -6, -6, 4, -14, -10, -17, -11, 3, -2, 7, 3, -2, -7, 1,
-    -16, -35, -16, 12, 1, -12, -12, -21, -17, -2, 0, 7, 12, 11, 1, -13,
-    13, -16, -3, -15, -1, -2, -14, 3, -1, 1, 3, -4, -12, 4, 4, -41,
-    -5, -14, -14, -8, -8, 7, 6, 11, 11, 3, -2, 8, 5, 5, -2, 0,
-    12, 3, -12, -4, 2, 22, 14, 5, 18, -21, -49, -36, -1, -12, -27, -16,
-    -18, 9, 5, 4, 17, 3, 4, 1, 15, 17, 8, 21, 20, 5, 5, 12,
-    2, 5, 22, 14, -9, -9, -21, 28, 0, -10, -44, -18, -5, 8, 7, 8,
-    4, 5, 2, 9, 15, 16, 17, 6, 27, 14, -3, 6, -6, -4, -1, -33,
-    -36, 15, -33, 11, -7, -11, -25, 20, 12, -2, -9, 3, 14, 10, 10, 17,
-    12, 14, 23, 7, 22, 7, 0, 7, -9, -13, 5, -17, -47, 6, -7, 24,
-    -3, -10, -13, 23, -8, -7, 14, 20, 9, 11, 16, 15, 12, 10, 16, 5,
-    18, 10, 12, 3, -13, -3, -13, -13, -24, 31, -22, -9, -4, -13, 21, 4,
-    2, -7, 8, 13, 16, 17, 18, 6, 16, 23, 10, -1, 12, 4, 6, -1,
-    -4, 21, -5, -13, -25, 5, -27, -28, -18, -6, -9, 13, 7, 1, 15, 1,
-    -4, -2, -10, -1, 30, 33, 16, 2, -1, 5, 0, -4, 3, 17, -9, -2,
-    6, 0, -26, 0, -6, -25, -36, 15, 9, 8, 8, 13, -13, -9, -6, -2,
-    -10, 9, 14, 2, 5, -6, -9, 0, 0, 2, 1, 9, -20, -6, 19, -25,
-    4, -21, -6, 12, 14, 15, 2, 11, -9, -11, -7, 0, 5, -5, 9, 15,
-    3, -11, 10, -3, 17, 16, 11, -1, -3, -8, 26, -2, -5, 14, 21, 7,
-    22, 7, 10, 16, 17, 9, -2, 13, 2, 9, 4, -5, 1, 16, 10, 20,
-    18, 3, 29, 27, 2, -26, 4, -8, -1, 1, 33, 7, 13, -2, 3, 9,
-    8, 5, 16, 20, 12, 6, -7, -7, 6, 0, 11, 9, 15, 39, 24, 9,
-    24, -6, -15, -4, -3, 4, 26, 5, -20, -21, -25, -2, 20, -1, 4, -4,
-    1, 0, -10, -9, -7, -10, 23, 27, 38, 44, 22, 24, 9, -7, -26, 4,
-    -4, -2, -22, -22, -44, -65, -18, 0, 17, -2, -13, 1, 4, -4, -4, -6,
-    19, -13, 4, 8, 19, 13, 18, 4, -13, 1, -24, 1, -2, 0, 7, -34,
-    -28, -11, -5, -14, -27, -20, 5, -5, -20, -1, 0, 4, -10, 4, 17, -22,
-    -11, -10, -17, -19, -37, 6, 8, -2, -2, -1, -1, -14, 43, 40, 27, -15,
-    -3, 7, 0, -3, -16, -47, -1, -10, -23, -4, -3, -39, -26, -3, -12, -6,
-    5, -3, 4, -2, -1, -1, 1, 0, -11, -12, 1, 10, 6, -11, -37, -3,
-    2, -22, -22, 15, -4, -26, -8, -9, -6, -28, -13, -25, -1, -4, 0, -4,
-    -4, 1, -4, 2, -2, 0, 1, -3, -5, -3, -1, 2, 9, 16, 4, 3,
-    1, -1, -3, -1, 4, -3, -1, -3, -1, 0, 3, 3, -1, 2, 3, -4,
-    2, 6, 9, 15, 9, 13, 41, 22, 20, 30, -15, -17, 16, 20, 11, 21,
-    22, 18, 10, 11, 2, -5, 4, 1, -3, 4, 8, 2, 14, 23, 13, 20,
-    34, 36, 10, 7, 6, -24, 4, -9, -29, -10, 12, -14, -9, 21, 15, 11,
-    5, -12, -3, -2, -4, 3, 10, 19, 23, 16, 17, 3, -12, 22, 17, 34,
-    12, 10, 22, 23, -2, -9, -8, -13, -25, 19, 2, 30, 18, -22, -4, 4,
-    5, 0, -3, -19, -21, -1, -10, 7, -7, 8, 13, 5, -3, -13, 11, 2,
-    8, 10, 5, -12, -1, 8, -12, 30, 36, 22, 13, 31, -4, 1, 19, 0,
-    -16, -53, -30, -4, -6, -1, 22, 21, 22, 8, 13, 3, 8, 21, -15, -26,
-    0, -10, -26, -9, 12, 45, 25, 30, -2, -7, 1, -44, -23, -18, 0, 16,
-    16, 24, 8, 13, 5, 3, 9, 6, 5, -4, -17, -16, -12, -23, -20, 6,
-    -7, 31, 4, 39, 1, -26, 8, -17, -4, 7, 2, -5, 26, 8, -6, -1,
-    2, 8, -5, 6, -3, -21, -11, -21, -15, -22, -7, -4, 7, 24, 15, 38,
-    -23, -34, 6, -5, -11, -4, 9, -9, 8, -1, -14, 2, -11, 3, 0, -8,
-    -9, -13, -6, -11, -15, -12, -30, 9, 9, 45, 31, 10, -4, -46, -10, 2,
-    -22, 8, 12, -8, -7, -4, -5, -5, -11, -14, -15, -5, 5, -3, 1, 3,
-    2, -8, -27, -14, 6, 18, 23, 10, -3, -24, -22, -4, -11, 9, 15, 2,
-    4, 8, -6, -21, -5, -19, -7, -2, 2, 1, 4, -7, -17, -15, -31, 6,
-    27, -14, 30, 13, -2, -13, -17, -20, -24, 3, 16, 13, 13, 6, -5, -6,
-    2, -14, -7, -21, -1, 10, 1, -6, -16, -11, -12, 13, 42, 44, 39, -42,
-    -2, -14, -15, 3, 4, 15, 12, 9, 6, 14, -1, 8, -12, -11, -21, -19,
-    -4, 19, -14, 6, -11, 0, 12, 16, 36, -13, -32, -37, -5, -8, -26, 6,
-    8, 12, 6, 22, 10, 10, 22, 9, 4, 3, -3, 4, 10, -2, -7, 5,
-    -7, 14, 43, 32, -12, -13, 0, 32, 4, -14, -39, -9, 7, 20, 21, 17,
-    4, 5, 19, 10, 13, 11, 4, 7, 15, -3, -8, -13, -8, 14, 7, -18,
-    -18, 39, 23, 21, -2, -3, -35, -4, 35, 6, -2, 6, 17, 5, 14, 13,
-    16, 4, 11, 1, 5, -9, -10, -7, -13, 0, -5, -5, -17, 50, 6, 26,
-    -6, -11, -20, 10, 3, -3, 16, 9, 9, 2, 16, 18, 19, -6, 4, 2,
-    0, 2, -3, -8, -4, -4, -6, -1, -28, 98, 15, 29, -3, -12, 11, -1,
-    -6, -6, 14, 11, 20, 22, 31, 16, 16, 3, -10, -7, -2, 3, 2, 0,
-    -3, 1, -18, -6, -18, 38, -22, 26, 8, -18, -6, -23, 8, 2, 34, 23,
-    8, 8, 15, 8, 18, 6, 7, 0, -4, -2, -8, 3, -2, -4, -12, -4,
-    12, 50, -27, -9, -12, -27, -1, -8, 10, 5, 5, 12, -5, -14, 1, 3,
-    7, 1, 0, -4, 0, -4, -6, -3, -3, -10, 0, 8, -10, 20, 12, -25,
-    -2, -20, 24, 1, 24, 16, -12, -8, -3, -5, 6, 9, -2, 5, -2, 4,
-    -4, -13, -9, -8, 4, 5, 3, 1, -18, 14, 18, -1, -6, 0, 1, -23,
-    25, 4, -2, -5, 1, 10, 0, 8, 5, 8, 9, 2, -9, 11, -8, 8,
-    3, 5, 28, 38, 10, -9, 12, -4, -9, -6, 22, 7, 33, -19, -16, -19,
-    -11, 1, 19, 20, 24, 18, 0, -1, 5, -3, 6, -2, -6, 6, 18, 29,
-    30, 3, -34, -8, 0, 1, 3, 17, 30, -19, -41, -31, -10, -21, 6, 5,
-    5, 4, -5, -6, -5, -7, 11, 5, 18, 32, 34, 46, 22, 4, -21, -4,
-    -4, 1, -14, -9, -5, -22, -47, -44, -22, -2, -2, -2, 7, -3, 11, 1,
-    24, -9, 13, 12, 14, 0, 16, 31, 16, -8, -16, 1, -5, -2, 13, 6,
-    -10, -19, -8, -15, -45, -30, -8, -4, -29, -6, 6, 7, 10, 17, 14, 5,
-    20, 13, 9, 8, -29, 17, 20, 2, 0, 2, 4, 6, 13, 15, 19, 6,
-    19, -1, -3, 16, 15, -16, 15, -2, -2, 7, -2, -17, 0, -4, -9, 9,
-    18, 3, 1, 4, -2, 3, -1, -4, -11, -4, 15, 18, 19, -2, -12, 17,
-    14, -16, -2, 15, -2, -22, -7, 1, -16, -30, -17, -29, 3, -1, -4, 4,
-    0, 0, 1, 1, -3, 1, 2, 2, 3, 1, 3, -3, -3, 4, -4, 4,
-    -3, 4, -5, -4, -5, 4, 4, 0, -1, 0, 0, 5, -1, -2, 4, -4,
-    1, -4, -1, -2, -4, -6, -7, -9, -7, -9, 13, 19, -2, -6, -3, -1,
-    -9, -4, -5, 0, 5, 2, -1, 2, -3, -4, 2, -1, -6, 2, -6, -4,
-    3, -7, -4, -13, -39, -19, 8, 45, 32, 17, 0, 0, -5, -15, -6, -9,
-    -6, -3, 3, 1, -2, 0, -2, -2, 1, 21, 11, -11, -18, -40, -61, -19,
-    15, 10, 15, 25, 22, 8, -18, -80, -48, -13, -13, 18, 22, -4, -4, 4,
-    2, 1, -14, -19, -20, 25, -7, -14, -40, -33, -30, 6, 6, 21, 19, 19,
-    16, 15, 15, -4, -19, -7, -2, 3, 31, 10, 2, -7, 0, 3, -11, -6,
-    -32, -26, -32, -8, -25, -14, -6, 3, 7, -10, 16, 15, 13, 37, 11, -3,
-    -2, -25, -25, -43, -7, 14, 21, -5, 4, -12, 14, -22, -32, -40, -64, -52,
-    -7, -16, -12, -1, -3, 8, 15, 13, 22, 16, -2, 11, 5, -25, -8, 2,
-    15, -3, 17, -9, 2, -28, 6, -13, -2, -13, -65, -55, -11, -6, 2, 11,
-    4, 4, 11, 19, 19, 14, -12, 13, 6, -31, -19, -2, 21, 12, 6, -8,
-    2, -13, -9, 12, 9, -31, -26, -6, -5, 15, 17, 10, -8, -3, 4, 13,
-    0, -10, -10, -14, -3, -3, -4, -2, 35, 33, -17, 7, -5, -4, 9, 26,
-    -40, -46, -10, -8, 18, 20, 16, 4, -19, -17, -16, -23, -29, -17, -21, -13,
-    3, -8, 12, 30, 56, 24, 10, -7, -7, -2, -2, 3, -30, -47, -31, 9,
-    25, 13, 4, -10, -2, -17, 3, -9, -29, -30, -14, -8, 6, -9, 23, 59,
-    59, 50, 12, -14, -2, -3, -16, -26, -52, -46, -11, 20, 22, -2, -16, -25,
-    8, 19, 34, -3, -18, 6, 19, -1, -8, -8, -13, 16, 7, 16, 8, -20,
-    -4, -12, 5, -43, -60, -41, -17, -18, 5, 8, 11, 18, 15, 45, 38, 9,
-    -3, 19, 23, 13, 8, -19, -16, 2, -23, -10, 15, -15, -4, -9, -27, -34,
-    -57, -54, -39, -29, -10, -2, 19, 41, 48, 52, 23, 18, 13, 17, 16, 15,
-    -6, -32, -36, -27, -30, -6, -2, -11, -3, 15, 1, -33, -48, -40, -78, -53,
-    -36, -34, -19, 24, 48, 56, 34, 13, 13, 14, 3, -8, -22, -43, -37, -34,
-    -13, -25, -34, -23, -7, 13, 19, -29, -4, -50, -75, -83, -65, -70, -35, 3,
-    51, 35, 17, 2, 8, 12, 5, -9, -6, -21, -7, -24, -29, -25, -40, -26,
-    -8, 9, 4, -23, 12, -47, -54, -62, -54, -72, -61, -31, 18, 0, -2, 10,
-    -2, 3, -2, -25, -10, -17, -23, -37, 5, -31, -36, -29, 3, 5, -7, 0,
-    15, -13, -18, -39, -54, -45, -64, -43, -38, -23, -10, -2, 7, 6, -2, -6,
-    3, 21, 2, -7, 13, -32, 0, -28, 19, 3, -2, 6, 37, 17, 13, -16,
-    -2, -38, -32, -27, -52, -27, -10, -16, 14, 23, -3, 8, -1, -17, -24, -14,
-    1, -25, -17, -27, 9, -3, -5, 1, 51, 42, 22, 10, 19, -9, -15, -32,
-    -40, -39, -32, -20, 16, 26, 30, 14, -16, -33, -17, -2, -1, -7, 2, -30,
-    0, -3, -17, -7, 54, 54, 14, 11, 9, 3, -2, -12, -22, -21, -26, -22,
-    13, 38, 18, 10, -38, -43, -10, -1, -12, -37, 11, 0, 0, -13, -19, -15,
-    40, 51, 23, 15, 11, 9, -5, 6, -10, -11, -23, 0, 16, 16, -6, -25,
-    -37, -36, -10, 3, -13, -22, -6, -1, 2, -4, -43, -18, 3, 12, 15, -5,
-    -3, -7, 2, 15, 8, 7, -2, 10, 8, 7, -14, -26, -52, -41, -9, -9,
-    -11, -10, -30, 5, -1, 2, 25, 12, -17, 9, -2, 3, 8, -7, 12, 21,
-    7, 4, 7, 3, 5, -13, -9, -51, -68, -32, 23, -2, 6, -4, -30, -2,
-    -1, 4, 17, 31, 25, 29, -8, 8, 7, 19, 19, 6, 20, 0, -16, -26,
-    -15, -34, -8, -43, -41, -13, 19, 18, 11, -14, -11, 1, 4, 1, 3, -1,
-    0, -6, -10, -2, -2, 23, 24, -19, 8, 0, -1, -13, 5, 16, -10, -6,
-    22, 21, 48, 42, 13, 9, -6, 1, 3, 0, 4, 5, 33, -2, -5, -4,
-    4, 33, 17, -8, 4, -25, 7, -12, 2, 26, 33, 38, 27, 2, 2, -6,
-    1, -1, -2, -4, 4, -3, -3, 1, -4, 0, -4, -2, -6, -18, -22, -3,
-    -22, -18, 11, 33, 7, -28, -10, -4, -4, -5, -2, -1, 3, 4, 4, 0,
-    -4, 0, -4, -1, 4, 5, -3, 5, -4, -1, 4, 0, 0, -7, 1, -3,
-    -3, 0, 3, 1, -4, 4, 1, -2, -2, 3, -2, 0, 0, 3, -3, -3,
-    -3, 0, -14, -14, -10, -15, -25, -25, -36, -43, -21, -29, -30, -26, -19, -25,
-    -26, -15, -16, -10, -1, 1, -3, 5, -1, 2, -22, -3, -18, -12, -19, -26,
-    -27, -24, -34, -59, -83, -81, -57, -45, -41, 5, 17, -66, -35, -18, -2, -33,
-    -25, -21, 3, 4, -2, 0, -26, -10, -8, -49, -41, -62, -77, -75, -48, -25,
-    -61, -127, -91, -17, -20, 8, 23, 27, 23, 12, 15, -12, -28, -32, -8, -3,
-    3, 4, -28, -6, -27, -42, -53, -61, -57, -79, -60, -29, -43, -54, -40, -17,
-    -13, -8, 4, -10, -22, 5, 15, 6, 3, 9, 17, -14, -1, 2, -40, -1,
-    -28, -34, -51, -45, -36, -22, -36, 0, 4, -26, -17, -31, -25, -20, -32, -30,
-    -24, -24, -1, -22, -14, -4, 3, 9, -1, 0, 32, 33, 21, 14, -6, -18,
-    -10, 0, -3, -5, -7, -8, 1, -4, -12, -15, -8, 20, 10, -4, -6, 6,
-    11, 5, 13, -19, 3, -2, 27, 48, 1, 1, 10, -1, -1, -11, 5, -5,
-    0, 8, 13, 10, 22, 9, 0, 11, 9, 3, 0, 28, 12, 11, 37, -23,
-    -44, 19, 34, 38, 5, 6, 23, 17, 7, -10, -20, -2, 8, 3, 11, 18,
-    31, 11, 9, 2, 14, 20, 9, 13, 44, 58, 35, 38, 15, 11, -6, -25,
-    -9, 5, 14, 13, -2, 1, -13, 3, 2, -3, 1, 16, 30, 31, 18, 8,
-    25, 27, 12, 11, 27, 73, 42, 12, 17, 6, -5, -25, 5, 3, 13, 7,
-    3, 9, 7, 9, -1, -22, -27, -14, -5, -15, 10, 17, 27, 11, 18, 3,
-    23, 57, 38, -7, 9, 3, 9, -15, 11, 26, 32, 20, 30, 28, 9, 6,
-    -18, -43, -38, -27, -35, -35, -12, 5, -10, -1, 10, 2, 5, 26, 47, 26,
-    11, 10, 18, -5, 6, 36, 36, 39, 44, 12, 16, -10, -30, -20, -29, -1,
-    -22, -18, -19, -8, 2, -12, 0, 4, 7, 40, 34, 30, 0, 5, -4, -12,
-    20, 30, 28, 31, 32, 21, 17, -6, -8, -17, 1, 3, -4, 9, 10, 3,
-    23, -15, -14, -32, -5, 34, 6, -17, 2, -2, -20, -7, 30, 28, 30, 33,
-    40, 37, 31, 1, -2, -9, 8, 4, 17, 30, 0, 23, 3, -20, -30, -9,
-    0, -22, -44, -21, 1, 3, -29, 14, 23, 37, 38, 27, 53, 60, 54, 44,
-    18, -15, 10, 13, 7, 32, 23, 10, 0, -14, 4, -7, -21, -48, -17, -24,
-    -2, -4, -39, 8, -1, 19, 22, 3, 28, 33, 41, 28, 44, 32, 6, 12,
-    8, 6, 15, 10, -2, 0, -5, -16, 0, -50, -38, -33, -4, 6, 0, -28,
-    -39, -7, 4, 3, 3, 18, 22, 18, 14, 26, 14, 23, 11, 2, -7, -20,
-    -2, -4, 0, -17, -1, -54, -1, -28, -23, 2, 10, -79, -65, -36, -44, -19,
-    -13, -24, -12, 5, 5, 15, 16, 3, 7, -4, -22, -24, -7, -8, -15, -27,
-    -29, -53, 18, -38, 3, -23, 15, -83, -81, -59, -49, -40, -27, -46, -44, -41,
-    -16, 9, 12, 10, 5, -4, -14, -12, -15, -20, -27, -27, -12, -20, -20, -5,
-    -1, -25, 6, -54, -97, -46, -39, -32, -33, -43, -45, -46, -29, -3, 10, 18,
-    5, 11, 2, -2, -7, -8, -10, 12, 10, 22, -53, 1, 3, -7, 16, -27,
-    -30, 0, -33, -19, -27, -26, -32, -18, -10, -5, 3, 1, -3, 10, 3, -18,
-    -12, 6, 1, 1, 25, 34, -6, -3, 0, -1, -7, 5, 23, 2, -14, 2,
-    0, -4, -8, 3, -5, -11, -1, -18, -22, -10, -10, -17, -3, 8, 11, 8,
-    24, 22, 17, -4, 1, -1, -3, 5, 38, 17, 5, 9, 15, 14, 21, 7,
-    -3, -18, -30, -28, -10, -6, 5, 4, 16, 23, 29, 11, 8, 21, 13, -4,
-    2, -2, 8, 23, -2, 8, 9, 12, 11, 8, 10, 30, 23, 10, 2, 2,
-    2, 0, 13, 18, 41, 44, 33, 29, -5, -27, -20, -2, 4, 3, 8, 18,
-    8, 39, -2, -15, -5, 11, 11, 29, 18, 24, 5, 25, 37, 32, 42, 48,
-    33, 54, 66, 50, 39, -17, -15, -1, 1, -1, 0, -5, 28, 50, 42, 29,
-    25, 7, 11, 40, 61, 41, 18, 38, 46, 45, 52, 31, 44, 48, 25, -14,
-    -18, -2, -2, 3, -1, -2, 1, 2, 13, 16, -5, -3, -10, -10, 16, 16,
-    0, 13, 0, 5, -14, -13, 3, -13, -11, -7, 7, 21, -3, 4, -2, 4,
-    2, 2, -1, -4, 0, 1, 4, -1, -3, -4, 1, -1, -9, -7, 6, 2,
-    2, 2, 2, 4, 2, 1, 1, 0, 4, 0, 1, 3, 1, -4, 4, -1,
-    0, -3, -21, -17, -10, -3, -29, -4, -2, -2, 5, -25, 6, 16, -15, -25,
-    -31, -28, -24, -10, 0, -1, 0, -3, 3, -4, 1, -4, -16, -13, -17, -26,
-    -8, 17, -3, -34, 31, 32, 41, 1, -22, -41, -33, -28, -17, 6, -3, 0,
-    15, -4, 1, -4, 0, 2, 8, -24, -18, -5, -20, -6, -27, -8, -8, 17,
-    0, 26, 63, 61, 36, -17, -40, -24, -11, -21, -19, -2, -6, -25, -27, 3,
-    0, -1, -2, -7, -24, -16, 22, 15, -16, -4, -6, -3, -10, 13, 29, 49,
-    53, 52, 27, 5, 9, -14, 14, -34, -43, -25, -30, 23, -3, 2, -19, -3,
-    -20, -22, 0, -11, -19, -29, -20, -18, -12, -7, -10, 12, 33, 33, 36, 28,
-    10, -1, 0, -4, -29, -6, -11, 20, -2, 3, 7, -2, -25, 1, 12, -5,
-    -20, -8, -23, -29, -30, -27, -27, -11, 10, 25, 24, 13, 9, 22, 9, -13,
-    -23, -30, -61, -11, 3, 9, -6, -1, -24, 13, 23, -11, -17, -7, -6, -15,
-    -24, -25, -39, -9, -11, 4, 20, 25, 20, 23, 26, 12, -6, -13, -43, -20,
-    -22, -5, 17, 5, -2, 2, 1, -34, -26, -14, -29, -20, -17, -24, -23, -8,
-    -4, -1, 19, 32, 21, 19, 7, -5, -30, -25, -1, -12, -2, -14, 6, 17,
-    -12, -29, -12, -30, -44, -21, -26, -20, -16, -10, -26, -19, -15, -3, 14, 33,
-    35, 12, -3, -17, -26, -26, -9, -15, -8, -3, 7, 13, -27, -22, -15, -24,
-    -24, -15, -27, -3, -8, -3, -19, -35, -16, 1, 13, 21, 14, 15, 7, -14,
-    -44, -11, -20, -4, 3, -13, -23, -24, -31, -27, -7, -6, 15, 2, 2, -1,
-    2, 3, -13, -26, -29, -14, 7, 14, -2, 12, 13, -4, -30, -19, -34, -5,
-    -2, -15, -13, -15, 1, -4, 15, -11, 13, 3, -5, -5, 13, 2, -16, -47,
-    -34, -23, -1, 2, 5, 10, 16, 10, -17, -37, -29, -11, -3, -14, -14, -7,
-    25, 19, 10, -2, 13, -5, -15, -23, -26, -17, -15, -34, -38, -16, -8, -8,
-    10, 6, 11, 18, -27, -31, -16, -2, 4, -11, -42, -17, 41, 28, 14, 19,
-    19, 11, -21, -36, -18, -11, -5, -17, -13, -6, -2, 10, 26, 23, 17, -22,
-    -14, -22, 15, 5, -3, -12, -22, -5, 30, 35, 14, 13, 29, 16, -3, -17,
-    -4, 2, 2, -20, -14, -7, 0, 22, 11, 16, 10, -10, 8, -26, 26, 1,
-    1, -2, 27, 12, 6, 20, 23, 32, 29, 18, 3, 6, 9, 0, -17, -31,
-    -16, 1, 24, 27, 25, 26, 7, -23, -11, -28, 53, 35, 2, -3, 47, 12,
-    -5, -1, 14, 33, 25, 23, 11, 7, 16, 11, -10, -8, 5, 13, 19, 24,
-    3, 19, 1, -39, -28, 5, 25, 51, -2, 10, 11, 29, -9, 4, 22, 32,
-    31, 39, 8, 2, 11, 19, 13, 17, 15, 17, 29, 25, 2, 2, 11, -23,
-    9, 10, 33, 27, 3, 30, -23, 20, -1, 11, 10, 15, 18, 14, 13, 4,
-    20, 27, 30, 24, 15, 26, 25, 22, -1, -7, -16, -12, 17, 32, 23, 12,
-    -3, 31, 6, 41, 1, 16, 6, 6, 2, 10, 8, 4, 7, 21, 10, 12,
-    15, 24, 23, 19, -6, -5, -16, 1, 45, 35, 19, 3, -3, 13, 46, 56,
-    5, -11, 9, 5, 12, -14, -16, -7, 0, -1, 3, 9, 28, 30, 16, 15,
-    -12, -17, 26, 13, 39, 5, -7, -3, 0, 11, 54, 36, -5, -6, -9, 0,
-    2, -14, -2, 6, -1, -12, -11, -10, 18, 44, 16, 1, -6, 4, 56, 29,
-    41, -10, -21, 5, 4, -1, 3, 25, -24, -25, 2, -3, 5, -9, 11, 7,
-    10, -6, -11, -1, 0, -1, 4, 0, 5, 41, 56, 42, 17, -17, -11, 0,
-    1, -3, -20, 9, -15, -32, 9, 19, 13, 6, -5, -1, 6, -31, -32, -5,
-    -3, -1, 4, 0, 25, 22, 44, 52, 1, 10, 1, -1, 1, 0, 25, -10,
-    22, 36, 17, 9, -27, -34, -1, 24, -20, -22, -27, -20, -28, -25, 19, 30,
-    25, 28, 2, 19, -6, 2, 0, -1, -3, 3, -3, -1, 39, 57, 60, 32,
-    7, -36, -37, -18, -8, -17, -8, -3, -22, -51, -25, -23, -12, 16, 10, 14,
-    23, -1, 1, 4, 1, 1, -3, -1, -19, -24, 14, 24, 17, 15, -28, -26,
-    -19, -42, -45, -55, -34, -33, -26, 0, -9, -24, 8, -31, 1, 0, -4, 4,
-    0, -3, 0, 2, 2, -4, 3, 3, 2, -3, 0, 4, -4, -4, 1, -1,
-    3, -1, 3, -2, 1, 4, 1, 4, -3, 1, -2, 4, -2, -1, -3, -2,
-    -1, -3, -2, 1, -3, 3, -1, 0, 1, -4, 1, 5, -3, -4, 0, -1,
-    4, 0, 2, 4, -2, 2, -1, 3, 2, 1, -1, -4, 3, 2, -1, 4,
-    4, -4, 0, -4, -4, -3, -2, 4, -3, -3, 0, 1, 0, 3, 4, 1,
-    2, -4, -2, -4, -3, 3, -3, -3, 2, -3, 4, -4, 4, 2, -4, 2,
-    -1, -1, -2, 1, -3, -5, -5, -2, -1, -4, 0, -2, 1, 1, 0, -2,
-    4, -1, -2, 3, 4, 5, 1, -1, -3, -5, 0, 2, -1, -1, -5, -5,
-    1, 1, -2, -5, 3, -1, 4, 2, 0, -1, 2, 4, 0, 0, 2, 1,
-    2, 2, -4, 0, -3, -3, 1, 1, -4, -5, -1, 0, -2, 0, 0, -1,
-    1, -2, -2, 4, -3, 3, 3, 4, -4, -1, -2, 1, 3, 3, 3, -3,
-    2, -1, 2, -5, -2, 0, -5, -1, 1, 1, 2, -1, 1, -2, 3, 0,
-    -3, 2, -1, -1, -4, -4, -2, -4, 1, -4, 1, -2, 0, 1, -1, 3,
-    -6, -4, -5, 3, -5, -1, -2, 3, -3, 0, -2, -1, 3, -2, 4, -2,
-    4, 0, 2, 4, 3, 1, -2, -5, 2, 4, -4, -1, 0, -3, -2, 4,
-    -2, 0, -1, 0, 2, 3, 0, 3, 3, -3, -5, 0, -1, 4, -2, -3,
-    0, -2, -4, -3, -5, -3, 3, -1, -2, -4, -4, -5, 4, -5, 0, 0,
-    1, 2, -4, 2, -5, 3, -2, 1, -1, 3, 2, -3, 4, 3, -5, -2,
-    -5, -3, 2, 2, -2, 3, -2, -5, -4, 1, 3, -5, -5, -1, -4, 4,
-    -4, 4, 1, 3, -1, 5, 0, 2, -4, -5, -3, 0, -1, 3, -1, -5,
-    4, 2, 3, 1, 2, 2, -1, 1, 0, -2, -4, 2, -2, -3, -3, 1,
-    0, 3, 3, -3, -3, 3, 1, 2, -5, -3, 0, -4, -1, -5, -1, 0,
-    -2, -1, 2, -3, 1, -5, 3, -1, 2, -3, 0, -3, 1, -4, 1, 3,
-    4, -4, -3, -1, 0, 3, -2, -3, -2, 0, 5, -3, -3, -4, 3, 1,
-    0, -5, -4, 3, 3, -3, -1, 2, -3, -2, 3, -4, 1, 2, -5, 1,
-    -6, -2, -2, -1, 1, 1, -5, 2, 2, 2, 0, 1, -3, 0, -2, -2,
-    4, 2, 4, 4, -1, -3, -3, -2, 4, 1, -4, -5, 1, -4, -5, 2,
-    1, -4, -3, 2, -2, -1, -2, 0, 1, -4, -3, -1, 2, -2, 0, 2,
-    -5, 4, 4, 4, -1, 1, -4, 2, 2, -4, -1, 0, 3, 1, -4, 3,
-    0, -2, -1, -4, -1, -1, 1, 0, 3, -2, -1, 0, -2, -1, -4, 4,
-    -3, -4, -1, 3, -4, 3, -3, 0, 2, 0, 0, -3, -4, -5, 0, -2,
-    2, -4, 0, 2, 0, 0, 1, 2, -4, 2, 3, 2, -1, 0, -4, -4,
-    2, 2, -2, -2, 0, 2, -4, -3, 2, -2, -5, -1, -1, -3, 3, -3,
-    2, -5, 4, 1, 2, -3, 4, -1, -4, 0, 0, -5, 4, 3, 0, 1,
-    4, -5, -6, 1, -5, -3, -1, -4, -2, -3, -3, -4, 1, -3, -4, -1,
-    1, 0, -2, -4, -2, 2, -2, -3, 1, -1, -2, -2, 3, -1, 3, 0,
-    -4, -4, -2, -3, 2, -4, 0, 0, 1, -1, 0, 4, 4, 0, -1, -3,
-    -1, 1, 2, -3, 2, 0, 3, 1, -1, -2, -3, -3, -6, 1, 3, 1,
-    -1, 1, -3, 2, -1, 0, -4, 2, 2, 3, -3, 1, -2, -1, 0, 3,
-    -1, -5, 1, -2, -3, 4, -5, 3, -5, -5, -2, -3, -2, -4, 0, -2,
-    2, 4, -4, 2, -1, -1, -1, 0, -2, 1, -1, -2, 1, -2, 3, -5,
-    -3, 0, -5, 1, 0, -4, 3, -5, 2, 1, -4, 0, 0, 0, 4, 3,
-    -1, -4, -2, -2, 2, 5, 1, -3, 1, -3, -2, 0, 2, 0, -2, -4,
-    4, 0, -5, -4, -3, -1, -3, -2, -1, -3, 3, -1, -2, 0, 4, -4,
-    3, -3, 5, 4, -2, -1, 2, -4, -4, 0, -3, 3, -3, 3, 1, 1,
-    0, 0, 4, -1, -4, 3, 2, 0, -3, 1, 0, -2, 0, 2, 4, -4,
-    -4, 1, -2, -2, 4, 4, -1, 2, 4, -2, 4, 2, 2, 2, 2, -4,
-    -2, 4, 3, 2, -4, 3, 2, 1, 0, -3, -2, 3, -1, -4, 3, 3,
-    4, -2, 1, 3, -3, -1, 0, -1, -3, -1, -4, 3, -3, -4, 2, 2,
-    -2, 1, -2, -1, 2, -2, 3, -1, 4, -2, 4, -1, 10, 13, 5, -2,
-    -2, 4, 3, 3, -1, 4, -1, -1, 2, -2, -1, 2, 2, 1, 0, -4,
-    1, 7, 18, 20, 15, 16, 30, 5, 12, 11, -17, 34, 33, 28, 16, 25,
-    31, 14, 20, 14, 2, -3, -2, 4, 2, -4, 12, -4, 22, 18, 17, 24,
-    26, 20, 16, 40, 3, -6, 13, 37, 26, 60, 28, 17, 31, 22, 18, 38,
-    -4, -6, 3, -4, -2, 2, 10, 34, 42, 38, 27, 31, 24, 4, 12, 1,
-    0, 10, 19, 2, 24, 31, 41, 36, 25, 32, 32, 41, 46, -2, 8, 3,
-    0, -1, 12, 46, 44, 31, 27, 15, 3, -4, 5, -1, -17, 13, 20, 2,
-    24, 20, 28, 20, 16, 5, -24, 6, 24, -5, -15, -9, 1, -1, 34, 31,
-    20, 27, 15, 22, 23, 21, 21, 5, 4, 18, 4, 0, 30, -1, -1, 8,
-    24, 8, -33, -35, -20, -27, 6, 8, -1, 2, 3, -19, 34, 25, -3, -3,
-    -6, 9, -3, 12, -2, -9, -24, -17, -13, -11, -17, -11, -17, -31, -61, -60,
-    -35, -2, 15, 11, -4, 34, -2, -1, 31, 0, -9, 1, -10, -8, -15, -15,
-    -24, -46, -20, -36, -48, -36, -29, -51, -73, -42, -86, -91, -12, 16, -16, 10,
-    3, 34, -30, 11, 31, -23, -19, -16, -19, -29, -47, -37, -53, -56, -25, -50,
-    -70, -48, -51, -54, -10, -14, -41, -49, -10, -15, -29, -1, 6, 50, -16, 22,
-    24, -11, -13, -7, -9, -37, -47, -25, -34, -26, 1, -21, -25, -34, -42, -40,
-    -7, 10, 4, -33, -17, -15, -6, 8, 9, 33, -9, 10, 5, 4, 10, 3,
-    -3, -3, -8, -9, 3, 20, 19, 7, 2, -11, -8, -9, -5, 29, 9, -7,
-    4, 10, 1, -29, 5, 15, 12, 33, 20, 18, -2, 3, 4, 15, 5, 8,
-    14, 36, 46, 38, 28, 32, 36, 16, 6, 7, 8, 20, 13, 11, -22, 29,
-    0, 15, 7, 32, 17, 13, -2, 16, 18, 21, 3, 6, 11, 30, 56, 46,
-    43, 33, 42, 22, 6, -5, -4, 0, 17, 47, 31, 39, 1, 13, 29, 17,
-    20, 36, 13, -2, -2, 1, 1, -13, 8, 21, 25, 20, 37, 20, 34, 32,
-    24, 22, 2, 33, 48, 28, 7, -34, -3, 11, 35, 43, -7, 21, 2, -16,
-    -11, -6, -10, -13, -6, -6, 4, 7, 6, -3, 25, 25, 36, 41, 31, 28,
-    21, -11, 22, -16, 0, 1, -6, 13, -42, 2, 7, -7, -20, -22, -28, -21,
-    -17, 5, 15, 0, -9, -9, 5, 25, 35, 41, 8, 14, 14, -6, 11, -29,
-    6, 4, -23, 6, -8, 3, -11, -3, 2, -7, -28, -16, -22, 17, 10, 0,
-    -13, -4, 26, 31, 31, 42, 20, -14, -14, -24, -20, -34, -4, 16, -16, 33,
-    2, 24, 10, -14, -4, -20, -13, 3, -8, 7, 3, 14, 15, 14, 14, 4,
-    3, 9, -27, -31, -28, -1, -9, -27, -21, 12, 11, 66, 21, 29, 6, 13,
-    4, 1, 4, 7, 13, 24, 26, 27, 15, 17, 1, -16, -26, -12, -44, -44,
-    -29, 19, 5, -6, -1, -24, 31, 26, 22, 8, 1, -3, -14, 12, 13, 15,
-    18, 29, 34, 10, 5, 13, 0, -22, -37, -33, -52, -40, -23, 14, -8, -8,
-    -1, -27, -12, -1, 9, -4, -3, 2, -3, 1, -6, 6, 9, 28, 22, 26,
-    5, -2, -18, -44, -32, -45, -29, -60, -37, -22, -6, -4, -6, -5, -10, -18,
-    -40, -53, -8, 1, -1, 0, -11, -2, 9, 18, 10, 3, 2, 10, -7, -34,
-    -37, -46, -34, -39, -38, -23, 5, -2, 2, 5, -10, -20, -18, -64, -40, 2,
-    -8, 31, 16, 7, 2, 8, -11, 3, -5, -10, -17, -28, -37, -39, -30, -51,
-    -48, -17, 4, -4, 2, -1, 8, -15, -17, -26, -11, -12, 2, 9, 20, 12,
-    -10, -25, -16, -24, -35, -49, -46, -42, -24, -19, -20, -49, -37, -19, 10, 0,
-    -2, 3, 28, 34, -17, 0, 14, -16, -19, -2, -13, -21, -25, -21, -3, -24,
-    -31, -30, -48, -25, -7, -19, -5, -24, -14, 3, 9, -1, 3, -5, 2, 1,
-    -20, -24, -29, -38, -53, -64, -24, -32, -11, -30, -30, -26, 18, 4, -31, 16,
-    24, 17, 31, -9, -8, 3, 1, -2, 1, 2, -2, 3, 0, 50, 33, 4,
-    -21, -40, -41, -10, -2, 15, -52, -28, 16, 36, -31, 10, 30, 27, 19, -3,
-    -7, -3, -4, 2, -1, 1, 2, -1, 34, 31, 10, 4, 7, 15, 12, -12,
-    1, 28, 15, -11, 7, -10, -17, 14, 18, 24, 27, 23, 1, -1, 4, -2,
-    -4, 0, 3, -4, -2, 1, -1, -1, 1, 4, 3, 2, -3, -7, -17, -4,
-    3, -2, 0, 4, 2, 4, 0, 4, -1, 0, -4, -3, -3, -2, -2, -2,
-    -1, -1, -6, -10, -8, 5, 2, -5, -9, 1, 17, -13, -20, -11, -4, -13,
-    -13, -1, -7, -11, 0, 0, -1, -1, 1, 1, -1, 4, -13, -18, -7, -13,
-    -14, -6, -26, 5, 25, 15, -3, -45, -36, -19, -13, -31, -39, -14, 5, -26,
-    -20, -8, -1, -4, -2, -3, 2, 9, 38, 25, 25, 35, 28, -16, 19, 29,
-    -4, 4, 40, 16, 7, -10, 0, 3, 38, 21, -17, -11, -5, -25, -7, 1,
-    -4, -3, -1, 47, 23, -1, 0, 12, 12, 11, 40, 22, 7, 2, -7, -3,
-    9, 0, -16, 4, 11, 27, 27, 3, 46, 30, 4, 19, -3, 1, -23, 33,
-    31, -22, 5, 17, -4, 4, 17, -1, 9, -4, 21, 14, 8, -3, -29, 9,
-    18, 7, 28, 19, 20, 36, 29, 26, 4, 13, -14, -11, 13, -1, -1, -4,
-    -5, -4, -21, -20, -8, 6, 1, 2, 10, -5, -20, 4, -1, 10, 17, 32,
-    43, -1, 7, 21, -3, -6, -29, -8, 38, 45, -3, -7, -2, -8, -6, -7,
-    -5, -7, -9, -3, -3, 10, -9, -1, -15, -10, 0, 25, 29, -5, 17, 25,
-    11, -24, 10, 17, 24, 8, -14, 0, -11, 12, -13, -19, -3, -2, -6, -5,
-    6, 4, -7, -9, 5, -2, -2, 5, 9, 35, 33, 11, -11, -25, 23, -2,
-    -3, -3, -4, -8, -8, 1, -23, -9, 11, 7, -8, -17, 2, -10, -4, 10,
-    21, -2, -14, 11, 4, 40, 36, 5, -8, -8, -6, 9, -16, -12, -7, 0,
-    -15, -11, -1, -1, 10, -12, -19, -20, -9, -3, -10, 5, -5, -16, -13, 1,
-    12, -2, 20, 17, -2, -7, -18, -7, -25, -22, 3, -6, -5, 8, 6, -1,
-    7, -22, -14, -12, 3, -3, -5, 0, -5, -21, -24, -26, -6, 13, 13, -34,
-    0, -15, -6, 5, -27, -8, 8, -1, -7, 6, 24, 16, 14, 14, 5, 2,
-    -4, 2, -8, 8, 10, 7, -5, -15, 5, -10, -22, -39, 0, -9, -24, 2,
-    -16, -5, 9, 14, 9, 10, 9, 8, 15, 16, 6, 9, -1, -6, 8, 23,
-    3, 5, 7, 15, -15, 5, -5, -4, -3, 7, -36, -9, -16, 7, 22, 14,
-    10, 3, -11, -5, 16, 18, 14, 5, 4, 12, -3, -4, -13, 3, -7, -27,
-    -4, 12, -44, -10, -7, 10, -6, 9, 9, 8, 7, 14, 17, -2, -6, -8,
-    12, 6, 10, -4, 1, -6, -8, -3, -10, -1, -9, -6, -13, -2, -1, -10,
-    -5, 8, 6, 20, 12, -6, 6, 13, 16, 3, -2, 17, 29, 2, -10, -6,
-    -17, -11, 6, 14, -6, -13, -22, -5, -2, 1, -42, -1, 0, 13, 5, 31,
-    27, -10, 7, 29, 22, 9, 13, 17, 3, -7, -23, -25, -1, -2, 10, 21,
-    -10, 4, -6, 8, -37, -48, -39, 9, -32, 12, -4, 26, 12, 2, 17, 1,
-    10, 13, -2, 9, -1, -1, -27, -9, 5, 1, 8, 10, 11, -4, -20, -5,
-    -24, -58, -31, -20, -1, 6, -20, 30, 4, 23, 6, 19, -1, 0, -8, -13,
-    -20, -22, -9, -6, 8, 11, 23, 5, 9, 6, -5, -4, -5, -35, -17, -17,
-    2, 6, -31, 15, 20, -7, 6, 12, -1, 12, -9, -7, -19, -11, -2, 10,
-    15, 16, 22, 11, 15, 22, 7, -4, -29, -33, -10, 5, -5, -5, -16, -13,
-    -5, -22, -2, 11, 2, -13, -33, -3, -9, -1, 6, 17, 1, 13, 12, 13,
-    15, -2, 26, 6, -33, -12, -2, -1, -3, 1, -14, -11, -4, -28, -17, -7,
-    -16, -27, -4, 23, 8, 21, 7, 10, 3, 11, 18, 20, 8, 11, 23, 14,
-    -3, -15, 15, 1, 4, -2, 8, 21, -3, -10, -9, 13, 18, 9, 31, 27,
-    6, 23, 14, 9, 11, 20, 35, 10, 4, 8, -3, -5, -29, -8, 1, -4,
-    1, -2, -6, 25, 10, -10, 14, 27, 33, 29, 12, 25, 29, 20, 26, -3,
-    21, 9, -2, -19, 2, 4, 9, -2, -23, -22, -27, 0, -2, 2, 9, -9,
-    -37, -28, 13, 18, 4, -4, 12, -2, 4, 9, -12, -3, -15, -3, -1, -16,
-    -29, -33, -1, 22, 6, -21, -22, -1, 2, 4, -4, -2, -11, -42, -48, -49,
-    -6, -32, -19, 6, 0, -18, -23, -26, -18, -12, -7, -21, -35, -41, -39, -33,
-    -16, -1, 0, 2, -2, -4, 3, 4, -1, -1, -4, -3, -4, -22, -21, -15,
-    -28, -13, -28, -18, -25, -35, -28, -16, -23, -29, -33, -19, 2, -1, 4, -3,
-    -5, -4, 2, -2, -3, -1, -3, 0, -2, 2, 1, 3, -10, -3, 2, -1,
-    4, 2, 4, -3, 0, -3, 1, 0, -4, -1, 4, 2, 3, 2, -1, 0,
-    -4, -7, -16, -14, -7, -7, -18, 3, 4, 1, 12, -8, 17, 13, -12, -14,
-    -20, -10, -9, -8, 1, -1, 0, 0, 2, -1, -6, 4, -11, -12, -11, -14,
-    -5, 4, -11, -36, -14, -32, -10, -22, -26, -46, -18, -35, -26, -8, -3, 3,
-    8, 3, 4, 2, -1, 2, 2, -11, -3, -15, -25, -27, -29, -17, -13, -19,
-    -36, -11, 2, 10, 3, -11, -29, -27, -18, -3, -19, -12, -10, -23, -12, -1,
-    -4, -1, -14, -20, -35, -23, -24, -12, -33, -10, -31, -25, -5, -4, -1, 11,
-    -1, 5, 13, 13, 12, 10, 12, -9, 12, 8, -8, 4, -5, 2, -31, -2,
-    -41, -45, -15, -12, -2, -16, -14, 11, 14, 18, 18, 21, 15, 21, 18, 10,
-    4, 4, -5, -33, -23, 16, -16, -9, 0, -8, 17, -18, -47, -26, -10, -5,
-    -10, -6, 0, 10, 13, 10, 8, -4, 9, 19, 12, 14, 7, 1, 9, -11,
-    -39, -25, -33, 8, 5, -18, 15, 3, -31, -21, 1, -8, -4, 2, 5, -4,
-    -3, -3, -20, -6, 5, 11, 13, 7, 1, 7, 1, 11, 2, -16, -29, 9,
-    38, 5, 26, 25, -10, 2, 28, 10, -6, 9, -1, -14, -8, 2, 4, 3,
-    7, -14, -1, -2, -2, -9, -13, 11, -4, -1, -5, -4, -2, -9, 23, 21,
-    -9, 16, 23, -4, -13, -3, -16, -26, -7, 7, 5, -4, -9, -17, -18, 8,
-    22, 1, -11, 16, 3, -15, -11, -15, 3, -22, 25, 21, 2, 22, 20, 3,
-    -5, -2, -5, -10, -13, 7, 16, 3, -16, -15, -2, 8, 5, 2, 11, 10,
-    -9, -27, -7, 7, -3, 0, 17, 25, -7, 16, 17, 29, 9, 8, 8, -4,
-    -12, -6, 5, -15, -22, -18, -20, -5, -1, 2, -10, -10, 18, 1, 23, -24,
-    -1, -12, 12, 28, 18, 12, 14, 17, 9, 11, 2, -6, -21, -18, -18, -21,
-    -25, -11, -18, 18, 20, 11, 8, 5, 30, -11, -24, -25, 2, 0, -4, 18,
-    0, 7, 13, 22, 25, 24, 19, -2, -26, -25, -22, -9, -10, -2, 8, 18,
-    12, 17, 21, 10, -13, 16, 12, 30, 1, -4, -23, -25, -5, 37, 22, 34,
-    21, 14, 18, 3, -6, -17, -11, 4, -5, 3, 12, 10, 15, 11, 5, -4,
-    2, 29, 4, 17, -1, -6, -20, -1, 12, 18, 12, 23, 23, 20, 8, -3,
-    -4, -12, 5, 18, 11, 12, -2, -1, 5, 10, 10, -7, -3, 12, 3, 16,
-    0, -8, -14, -5, 13, -3, 17, 21, 6, 5, 10, -4, -2, -8, 8, 20,
-    19, 16, -18, -22, 3, 10, -13, -10, -23, 9, 12, 20, 2, -12, 11, -22,
-    22, 0, 11, 6, -1, 8, -4, 0, 3, 2, 13, 15, 6, -2, -14, -12,
-    1, 10, -2, 12, 0, 27, 12, 39, -17, -14, -7, -35, 4, 5, 13, 7,
-    9, -3, -2, -4, -4, 6, 12, 15, 4, -8, -4, -7, 3, 6, 9, 13,
-    32, 9, 22, -7, -11, 18, -3, -2, 24, 16, 8, 4, 8, -1, 8, -14,
-    -3, 20, 24, 9, -3, -12, -13, -13, -4, 13, 10, -10, -4, -23, 12, -18,
-    2, 17, 24, 12, 24, 8, -4, 7, 9, 3, 11, 5, 10, 14, -2, -6,
-    -23, -28, -17, -11, -5, 12, -1, -13, -26, -40, 1, -4, -5, 6, 22, 5,
-    31, 16, 10, 6, 13, 15, 9, 12, 3, -6, -27, -15, -25, -5, -14, 0,
-    -21, -7, 27, 12, -19, -24, -7, 7, -12, -5, 31, 16, 21, 23, 25, 18,
-    21, 11, 16, 13, 16, -8, -19, -20, -15, -3, 7, -4, -9, 12, 25, 0,
-    -2, 2, -22, 7, 0, -1, -27, -3, 5, -10, -2, 16, 28, 6, 6, 4,
-    3, -10, -14, -20, -3, -3, 10, 3, 0, 10, 6, 9, -16, -11, -27, 1,
-    3, -2, -14, -25, -21, -27, -7, -7, 5, -10, -23, -13, 3, -3, -10, -7,
-    5, -11, -7, -14, -3, -11, -3, -5, -14, 1, -6, 3, 5, -2, -12, -3,
-    -12, -15, 6, -7, -37, -36, -12, -24, -53, -17, -13, 0, 6, -22, -33, -53,
-    -55, -46, -39, -23, -34, 0, 1, 0, 0, 1, -3, -21, 31, 18, 1, -33,
-    -35, -24, -40, -28, -15, -26, -13, 1, -24, -36, -48, -44, -52, -27, -27, -15,
-    6, -5, 1, -2, -4, -1, -1, -3, -6, -2, -17, -21, -22, -26, -35, -15,
-    -16, -14, -30, -9, -13, -15, -14, -9, 14, -10, -7, -18, 1, 2, 4, -1,
-    1, -2, 0, 4, -3, -4, 3, 3, 2, -3, 4, -3, -14, -10, 12, 10,
-    3, 3, 0, -3, 2, -4, -1, 0, 0, -4, 1, -4, -2, 1, -1, -3,
-    -4, 1, -10, -15, -1, -1, -12, -23, -24, -22, -16, -5, 27, 18, -11, -30,
-    -35, -23, -13, -4, 5, -1, 1, 3, -4, 4, -7, -4, -14, 0, 4, -16,
-    17, 29, 16, -8, 3, -5, 24, 0, -13, 7, 18, -11, -9, 9, -19, 7,
-    9, 7, 4, 3, -1, 2, -8, 18, 6, 45, 33, 28, -6, -2, -1, 10,
-    -2, -26, 2, 0, -9, 2, -11, 18, 35, 28, 40, 6, 20, 43, 27, 1,
-    0, -4, -15, -25, -36, -4, 13, -13, -9, -16, -12, -1, -12, -20, -18, -12,
-    -16, -12, -17, 1, 11, -3, -7, 13, 35, 40, 32, 35, 4, 3, -13, 13,
-    4, 39, 29, 14, 18, 16, -1, -11, 0, 4, -6, -4, 11, 11, 18, 14,
-    8, -5, 12, 41, 15, 7, 34, 29, 4, 16, 5, 27, 14, 62, 23, 5,
-    8, 11, 3, -5, 11, -1, -5, -11, 6, -10, -8, 11, -10, -16, 5, -10,
-    19, -3, 50, 28, -1, 21, 10, 27, 15, 43, 8, 12, 7, 5, -2, 17,
-    11, 11, 13, -17, -15, -7, -9, -4, -1, 4, -6, -31, -7, -15, 56, 26,
-    2, 22, -24, -19, 1, 2, 7, 6, 10, 9, 11, 13, 6, 3, 17, -9,
-    -20, -1, -4, -6, 6, -4, -11, -31, -21, 4, 28, 8, 8, 9, -34, -21,
-    -32, -11, -21, -4, -7, -16, -26, -15, -14, -7, 4, -1, 3, -12, -13, -6,
-    -7, -22, -16, -22, -6, 15, 22, -5, 13, 7, 17, -29, -57, -36, -25, -34,
-    -45, -62, -65, -50, -34, -20, -9, 13, 8, -5, -11, 3, -11, -7, -16, -28,
-    7, 18, -9, -13, 4, 8, -13, -17, -33, -48, -55, -95, -89, -94, -58, -48,
-    -21, -3, -8, -1, -6, -22, -15, -4, -3, -11, -17, -17, -46, -42, -53, -3,
-    5, 2, -24, -2, -39, -49, -71, -100, -71, -69, -19, -11, 41, 39, 1, -20,
-    0, -16, -8, -13, -17, -12, -20, -49, -37, -31, -21, -9, 3, 2, -1, 13,
-    -31, -30, -38, -30, -24, -1, 27, 39, 59, 30, -24, -12, 3, 3, -4, -1,
-    -2, -10, -18, -10, -7, -13, -4, -2, -4, -6, 3, 14, 2, 12, 1, 7,
-    19, 47, 50, 51, 56, 16, -3, -3, 12, 20, 14, 14, -9, 5, 12, 18,
-    32, 11, 44, 24, 5, -2, 13, 26, 15, 53, 20, 24, 19, 49, 42, 24,
-    24, 9, 5, 5, 11, 19, 18, 18, -4, 4, -8, 35, 73, 29, 55, 19,
-    0, -2, 15, 24, 22, 45, 22, 33, 19, 27, 5, 7, 4, 5, -12, 11,
-    10, 25, 25, 34, 18, 26, 2, -5, 25, 22, 66, 23, -4, 0, 20, 21,
-    2, 12, 17, 6, 7, 10, 14, 3, -7, -14, 0, 13, 9, 14, 32, 19,
-    21, 20, 9, -1, 21, 54, 46, -16, -35, 1, 2, 28, -12, -21, 0, -6,
-    1, 14, -2, -17, 3, -10, 13, 6, 19, 25, 27, 15, 5, 18, -2, 5,
-    40, 45, 51, 25, -7, -23, 16, 19, -33, -27, -11, -22, -36, -6, -10, -6,
-    4, 20, 19, 23, 6, 20, 4, -20, -3, 2, -3, 3, 18, 57, 30, 20,
-    -3, -29, 34, 12, -53, -36, -8, -12, -22, 0, -16, -2, 13, 25, 17, 13,
-    6, 3, -4, -10, -1, 3, 3, -14, -6, 33, -4, -4, -7, 14, 23, 23,
-    -49, -31, -16, -28, -5, -18, -14, -9, 16, 21, -7, -4, 7, -7, -9, -6,
-    5, -1, -9, -16, -12, -5, -3, 0, -11, -4, 26, 5, -2, -8, -28, -20,
-    -13, -18, -4, 7, 7, -2, -17, -1, 10, -10, -15, 11, 1, -19, -17, -16,
-    -27, -25, 29, -2, 0, -2, -12, 10, 26, 17, 8, 11, -14, -12, 2, 3,
-    1, -4, -6, -4, 13, -23, -47, -29, -34, -32, 9, 9, -24, -22, 40, 1,
-    2, 3, 19, 0, 13, 1, 8, 11, -5, -1, 2, -8, 1, 24, 1, -11,
-    14, 12, -24, -37, -48, -52, 11, 12, 27, 14, 11, 2, -1, 2, -3, 7,
-    -22, -4, -10, -6, -52, -11, 6, 19, 11, -19, -25, -3, 0, -21, -2, -18,
-    -26, -32, -2, 25, 4, -9, 2, 4, 3, 2, 5, -5, 1, -14, -26, -24,
-    -28, 24, 35, 18, -7, 2, 0, 25, 25, -30, 9, 22, -11, -1, -9, -15,
-    2, -3, -3, 4, -2, 1, -3, 3, 1, 2, -19, -23, -22, -25, -30, -32,
-    -11, -21, -34, -8, 3, 13, 14, 4, -1, -4, -1, -1, -2, -2, -2, 3,
-    -3, 3, -4, -4, 2, -1, -4, -4, 1, 2, -4, -2, 2, 5, -1, 0,
-    -3, 3, 4, 4, -3, 4, 2, -3, 2, 2, 1, 3, -2, 4, 4, 2,
-    3, -2, 4, 1, 8, 1, -6, 11, 13, -8, -22, 32, 15, 15, 14, 29,
-    38, 14, 15, 6, 0, 0, 0, -4, -4, 2, 2, -4, 13, -8, 4, 19,
-    9, 5, 20, 30, 17, -6, -13, 12, 23, 9, -10, 25, 29, 15, -2, 5,
-    21, 15, 1, -2, -3, -2, 4, -16, -40, 4, -12, -2, 30, -3, 9, 0,
-    -7, -6, 23, 19, 39, 24, 17, 1, 9, -17, 12, 19, 8, -23, -9, 3,
-    2, 0, 37, -6, 12, -16, -24, -16, -9, -1, -7, 21, 11, 24, 21, 24,
-    32, 13, 9, 19, 6, -28, 11, -7, -39, -21, 17, 12, -4, -2, 38, -25,
-    22, 13, -21, -22, -3, 15, 5, -11, -17, -4, -2, -4, -12, -12, 15, 15,
-    8, -8, 10, 15, -3, -20, 7, -2, 1, 6, -11, 29, 32, -4, -10, 0,
-    5, -12, -15, -27, -30, -19, -15, -19, -3, 12, 35, 8, 11, 18, 1, -12,
-    12, -34, -6, 13, -1, 34, -1, 15, 21, -1, -1, 13, 0, -17, -28, -34,
-    -16, -14, -10, -7, 17, 24, 32, 31, 11, 17, 11, 0, -3, 11, -7, 19,
-    21, 22, -2, 6, -7, -3, 15, -1, 2, -24, -24, -26, -14, -23, -8, 17,
-    43, 31, 26, 30, 23, 25, 33, -20, -18, -36, -4, 2, 5, 36, 13, 22,
-    11, -7, 15, 9, -7, -3, 10, -15, -10, -22, -13, 27, 32, 18, 14, 36,
-    38, 11, 25, -3, -6, -48, -43, 4, 6, 36, 11, 26, 30, -1, -4, -7,
-    -11, 7, -10, -6, -15, -15, 11, 30, 22, 22, 30, 14, 31, 21, 34, 23,
-    -24, -15, -49, 7, 3, -6, 15, 33, 40, -12, -15, -2, 1, 4, 12, 5,
-    -21, -9, 7, 10, 2, 24, 28, 7, 28, 25, 31, 30, -4, -29, -28, 11,
-    1, 1, 18, -1, 37, 8, 3, -1, -11, 6, 16, 6, -22, -25, 6, 7,
-    -2, 11, 19, -1, 1, 11, 26, 46, -17, -62, -30, 1, 3, 12, 19, 20,
-    45, 19, 21, -9, -7, -7, 3, -9, -29, -34, -11, 0, -2, 8, 9, 11,
-    -13, 28, 20, 18, -20, -66, -22, -10, 3, 10, 25, 12, 22, 29, 22, -7,
-    -8, 7, -13, -6, -17, -14, -7, 8, -3, 5, -5, 7, 11, 28, 27, 4,
-    -4, -40, 10, -6, 1, 6, 14, -46, 3, 34, 24, -8, -7, -10, -9, -28,
-    -22, -8, -8, -1, 4, 3, -4, 13, 11, 12, 14, -5, 15, -27, 17, 0,
-    2, 10, 24, -36, 6, 43, 16, -2, -1, -1, -15, -33, -27, -22, -32, -12,
-    8, 4, -15, -13, 1, -19, 2, -20, -6, -59, -17, 22, 5, 17, -12, -15,
-    -3, 12, 2, 2, -5, -4, -18, -15, -22, -19, -16, -12, -6, -7, -12, 12,
-    -1, -21, -15, -20, -7, -47, -1, 38, 34, 23, 5, 8, -17, -3, -15, -7,
-    10, 7, -2, -9, -30, -7, 3, 3, -7, 7, 9, -1, -5, -5, 8, -22,
-    -7, 1, -1, 7, 13, 29, -23, -24, -13, 11, 2, -9, 4, 27, 18, 5,
-    18, 10, 0, 1, -5, 17, 17, 6, 2, -13, -4, -12, 22, 10, -4, 17,
-    3, 29, -39, -9, 1, 6, 3, 10, -1, 5, 20, 16, 13, 7, 15, -11,
-    -15, 0, -6, -13, -25, -31, -28, -18, 11, 27, 8, 2, 6, -2, -19, -4,
-    -17, -22, 12, 20, -4, -8, 7, -4, 11, 11, 7, -13, -3, -17, -11, -10,
-    -40, -49, -64, -49, -20, 3, 11, 1, 6, 16, -35, -12, -9, 4, -4, -5,
-    -11, 2, -17, -21, 4, 16, 16, -1, 8, 11, -27, -19, -46, -50, -50, -17,
-    -8, 0, 15, 5, 1, -2, 34, -19, -30, 22, -7, -5, -20, -9, -9, -6,
-    7, 16, -8, 6, -5, -5, -24, -48, -65, -49, 2, -7, 27, -6, 9, -3,
-    3, 4, 26, 26, 77, 64, -5, -2, 6, 7, 17, -1, 14, 9, -3, 7,
-    -17, -17, -45, -39, -12, 3, 11, 7, -7, -9, 1, 4, 3, 4, 27, -3,
-    1, 9, 1, 25, 52, 41, 14, 23, 26, -17, 2, -23, -27, -36, -39, -11,
-    13, 16, 6, 14, -3, 4, 3, -4, 3, 2, 0, 30, -11, -14, -9, 39,
-    44, 49, 52, 13, 5, 28, 42, 25, 2, 3, 31, 26, 53, 39, 31, 3,
-    1, 0, 3, -1, 1, 1, 0, 4, -16, -33, 20, 27, 22, 20, 23, 21,
-    15, -8, 45, 17, 30, 21, 15, 20, 13, 10, 28, -1, 4, -3, -3, 3,
-    2, -1, -3, 0, -4, -1, -4, -1, -4, 4, -4, 5, 1, 4, 5, 5,
-    3, 0, 1, 0, 4, 3, 3, -4, 4, -1, 1, 2, 1, 3, 3, 3,
-    3, 3, 9, 12, 7, -2, -6, -6, -2, 10, 11, -5, 16, 4, -5, 9,
-    4, 5, 3, 2, 2, 1, 4, 2, 0, 3, 1, 0, 8, 16, 1, 3,
-    29, 21, 37, 30, 2, -2, 25, 43, 18, 19, 17, 1, 18, 9, -6, 20,
-    18, 11, 1, -3, -2, 2, -9, 28, 38, 20, 26, 10, -5, 8, 9, 25,
-    22, -3, -18, 4, -9, 1, 21, 27, -9, 14, 21, -3, 6, 28, 25, 0,
-    2, -2, 6, -16, 3, 25, 36, 26, 28, 18, 47, 24, 4, 0, -7, -12,
-    -2, 8, 25, 15, 6, -24, -29, -4, 18, 24, 6, -30, -3, 4, 33, 39,
-    10, -21, -23, -26, -41, -26, 5, -10, -9, -9, -21, -7, 5, -8, -9, 11,
-    37, 22, 14, 9, 7, 3, -6, -15, 0, 11, -4, 1, 0, -5, -10, -12,
-    -14, -15, -9, -30, -26, -22, -17, -7, -8, -24, -19, 0, -5, -9, 3, -1,
-    9, 36, 26, -17, -5, -5, -21, 7, 1, -3, -24, -4, 2, -23, -15, -14,
-    -13, -21, 7, -16, -14, -21, -16, -3, -4, -5, -6, -23, -16, 0, 28, -22,
-    -1, -28, -29, -27, -13, -17, -8, -3, -13, -10, -6, -5, 0, 15, 15, -3,
-    -11, -19, -12, -2, 17, -1, -14, -7, -7, -4, 40, 12, -10, -37, -32, -41,
-    -21, 7, 7, 12, 12, 4, -19, -17, -9, 5, 21, 17, 16, -13, -5, 3,
-    4, 4, -9, -12, -17, 21, 30, 17, -17, -15, -29, 2, 10, 35, 20, 14,
-    -3, -12, -7, 0, 17, 5, 2, 5, 17, 9, -7, 4, -2, -8, -35, -19,
-    -11, 1, 10, -6, -5, -5, -18, 2, 6, 7, 9, -11, -17, -27, -18, -16,
-    -8, -8, -4, 1, 15, 0, -7, -8, -2, -12, -33, -40, -37, -22, -3, -3,
-    -5, -9, -25, 26, 18, -5, -9, -19, -6, 10, -6, -14, 2, -1, 3, -15,
-    -14, -7, -33, -23, 2, 2, -27, -55, -35, -20, 12, 8, -4, -18, -21, 18,
-    -7, -12, -1, 6, 21, 27, 4, -6, 7, -3, 13, -2, -8, -6, -24, -11,
-    -2, -8, -5, -16, -11, -9, 15, 17, -5, -9, -17, 19, -28, -21, 1, -16,
-    17, 10, 6, -6, 3, 15, 39, 17, 20, -10, -6, 3, -1, -17, -4, -13,
-    -35, -14, 37, 14, -6, -9, 30, 1, -6, -2, -7, -18, 8, 4, -24, -32,
-    1, 25, 25, 11, 20, 1, -1, -2, -8, -12, -21, -16, -12, 22, 22, 28,
-    -10, -4, 31, 2, -3, 1, -1, -17, -5, -10, -35, -38, -3, 6, 17, -4,
-    6, 12, 2, 20, -1, 11, 12, 8, 9, 60, 30, 44, -1, -3, 20, 20,
-    -8, -2, 2, -3, -1, -22, -31, -31, -19, 2, 7, -11, 22, 5, 13, 27,
-    11, 27, 12, -3, -30, -5, -16, 38, -16, 1, 5, 21, 14, 1, 4, 6,
-    -12, -22, -13, -13, 0, 13, 3, -1, 24, 11, -3, 17, 4, 9, 6, 3,
-    -1, 23, -23, 47, 15, -10, 13, 1, 15, 4, 2, 4, -6, -4, -6, 8,
-    -1, 14, 3, 16, 40, 27, 23, 12, 6, 0, 22, 26, -4, 76, 42, 37,
-    -1, -3, 49, 21, 0, 3, -2, -6, 1, 11, 1, 17, 15, 18, 10, 15,
-    33, 29, 47, 18, 18, 32, 57, 48, -4, 21, 39, 1, 9, 6, 42, 29,
-    -1, -1, -3, 20, 8, 16, 8, 14, 17, 22, 30, 13, 0, 20, 30, 21,
-    26, 15, 38, 42, 22, 16, 32, 2, 13, 9, 45, 23, 17, 11, 17, 14,
-    6, -2, 12, 21, 4, 4, -2, -2, -21, -12, -1, -2, 5, 6, 14, 32,
-    19, 9, 42, -7, 4, -5, 32, 37, 32, 21, 16, 1, 23, 15, 9, 2,
-    0, -20, -15, -5, -14, -23, -21, -10, 11, 0, 22, 29, 5, 7, 39, -4,
-    -3, 0, -15, 5, -20, -16, 12, 4, -4, 9, -17, -16, -7, -27, 3, -5,
-    -29, -42, -27, -29, -33, 5, 10, 8, 18, 7, 13, -4, -2, 2, 5, -1,
-    7, 8, -39, -57, -47, -17, -40, -47, 16, 14, 9, -23, -64, -59, -54, -48,
-    -38, -27, 0, 29, 25, -5, 5, -4, 0, 1, 2, -13, 24, 22, 16, -4,
-    -31, -39, -67, -64, -58, -50, -39, -41, -20, -22, -14, -13, -15, -19, -22, -32,
-    -8, 2, -5, 3, -1, 1, 4, -3, 2, -14, -19, -12, -22, -10, -27, -30,
-    -11, -10, -28, 1, -9, -18, -3, -21, -12, -16, -16, -13, -4, -4, -1, 0,
-    -4, 3, -1, -2, 2, -4, 4, 2, 4, 1, 4, -4, 17, 14, 1, 4,
-    2, 3, 2, -1, -4, -2, -3, 1, 3, -1, -2, 1, 0, 1, 2, 0,
-    5, -1, 16, 8, 13, 19, 50, 37, 29, 39, -13, -14, 29, 31, 17, 27,
-    30, 21, 12, 6, -1, -4, -3, -2, -3, 2, 15, -3, 12, 17, 26, 29,
-    26, 37, 13, 6, 3, -24, 14, -1, -32, -18, 0, -21, -14, 20, 22, 6,
-    3, -6, 4, -4, 0, -2, 20, 3, 2, 5, -9, -8, -4, 41, -1, 6,
-    -19, 9, 25, 14, 0, -6, -10, -29, -23, 17, -5, 18, 4, -25, -12, 1,
-    -2, 2, -2, -20, -12, 4, -8, 15, 7, 21, -2, -22, -9, -7, 0, 3,
-    0, 9, 2, -7, 4, 26, 10, 8, 8, -5, 5, 35, 2, 1, 7, -1,
-    -7, -22, 6, 27, 13, -1, -2, 11, 8, 7, 35, 20, 6, 17, 8, 7,
-    6, 11, -9, -10, -8, 25, 14, 25, 3, -4, 25, -18, -24, -3, 13, 12,
-    -9, -10, -6, 16, 12, 9, 10, 9, 9, -2, -13, 4, 5, 12, 12, 4,
-    -24, -14, -19, 31, -1, -12, 26, -21, -24, -1, 6, -10, -16, 0, -1, 9,
-    -3, -7, -27, -2, -10, -2, 5, 3, 11, 8, 9, 14, 9, -12, -18, 26,
-    41, -2, 12, -8, -11, 7, 22, -8, -22, 3, 9, -2, -5, -1, -10, -8,
-    -10, -14, 0, 9, 7, 1, -11, 9, -4, 11, 2, -8, 9, -14, 11, -5,
-    -7, 9, 7, -15, -27, -7, -10, 2, -3, -1, -15, -14, -12, 0, -8, 4,
-    26, 17, -14, 22, 1, -6, -10, -6, 14, -22, 22, -8, -10, 8, 7, -5,
-    -17, -7, -11, -2, -5, -1, 7, -5, -19, -9, -7, -4, 0, 18, 4, 11,
-    -5, -42, -11, 13, -2, -1, 9, 5, -21, 6, 7, 6, 1, -3, -10, -13,
-    4, 10, 3, -14, -15, -18, -14, -13, -13, 8, -9, -13, 22, -3, 19, -33,
-    5, 10, -13, 21, -5, 2, 9, 13, 7, 6, 2, 4, -4, -4, -8, -18,
-    -17, 4, -17, 0, -3, 9, 8, 6, 49, -4, -34, -41, 2, 3, -21, 12,
-    -17, 2, 14, 12, 13, 25, 21, 8, 3, -2, -14, 2, -4, -17, -6, 7,
-    1, 14, 26, 28, 6, 9, -16, 29, 3, -9, -25, -32, -35, 27, 18, 24,
-    23, 17, 28, 21, 15, 1, -7, -6, -6, -11, -2, 0, 1, 22, 6, -4,
-    16, 36, -31, 12, 3, -11, -30, -1, -24, 6, 0, 34, 36, 29, 21, 19,
-    13, 6, 13, 8, -4, 0, -5, -12, 0, 17, 6, -15, -7, 36, -24, -7,
-    -1, -11, -20, 4, -19, -15, 20, 28, 24, 30, 23, 15, 17, 4, 15, 21,
-    15, 14, -9, -16, 3, 14, -19, -9, -26, 50, -36, -1, -1, -16, 6, -7,
-    -2, -4, 7, 13, 14, 29, 30, 24, 12, 9, 11, 12, 10, 4, 0, 0,
-    15, 23, -6, 4, 9, 46, -21, 33, -31, -12, -5, -26, 0, -13, 13, 16,
-    20, 8, 16, 9, 13, 10, -5, 3, 1, 2, -2, 0, 4, 14, 1, 18,
-    27, 40, -3, -32, -14, 17, 5, 0, 13, -11, -2, 7, 16, 2, 3, -6,
-    0, -2, 0, -6, 4, 3, -12, -10, -7, 8, 9, -5, -16, 0, 7, -30,
-    1, 21, 31, 11, 18, -14, -20, 1, 5, 2, 18, 11, 4, 3, -4, 6,
-    -8, -8, -17, -25, -15, -4, -7, -38, -45, -37, 4, -5, -16, 6, 24, 19,
-    19, 5, -2, -1, 5, 21, 9, 25, 12, 16, -12, -4, -11, 1, -25, -15,
-    -28, -9, 17, -6, -36, -21, -2, 9, -14, -6, 28, 17, 20, 1, 10, 8,
-    18, 20, 26, 24, 33, 5, -5, -1, 5, -18, -8, -14, -19, -2, 11, -22,
-    -28, -15, -23, 10, 0, 1, -20, -9, 8, -18, -6, 17, 39, 10, 7, 10,
-    12, 7, 0, -6, -7, -33, -15, -2, -3, -11, -20, -19, -41, -11, -29, -4,
-    1, -4, -5, -28, -28, -17, -6, 2, 16, -3, -15, -4, 9, 16, 0, -3,
-    18, -30, -33, -31, -28, -42, -41, -34, -26, -13, -12, 2, 0, -4, -15, -2,
-    -7, -14, -3, -17, -47, -34, -18, -18, -39, -18, -17, -4, 6, -34, -56, -60,
-    -53, -58, -30, -15, -26, 10, 11, 4, 3, -4, -1, -21, 14, 12, -2, -19,
-    -18, -1, -24, 1, -9, -21, -7, -1, -28, -24, -45, -38, -41, -43, -43, -23,
-    -11, -2, 0, 1, -3, 2, 3, -2, 9, 4, -19, -18, -17, -17, -26, -30,
-    -16, -4, -22, -9, 0, -10, -15, -9, -3, -29, -34, -18, -2, 3, 2, 1,
-    -3, -3, -1, 2, 0, 4, 4, 4, 4, -3, 3, 2, -4, 0, -2, -3,
-    -3, 3, 2, 4, 4, 2, 1, 2, -3, 2, 0, 2, 1, 0, -4, 0,
-    -1, 1, -3, -1, -3, 1, -5, -5, -6, -1, -1, -1, -1, 2, -2, -5,
-    -6, 2, 2, -1, 3, 0, 3, -4, 2, -2, 4, 2, -12, 0, 3, -8,
-    -11, -23, -21, 3, -28, -45, -25, 1, 20, 31, 29, 30, 18, 9, 11, 12,
-    3, -1, 3, -5, 4, -2, -3, 4, 4, -16, 2, 4, -42, -22, -2, -23,
-    -32, -19, -11, 12, 15, 18, 34, 30, 24, 11, 9, 24, 41, -3, 5, -1,
-    -1, 3, -20, -6, -27, -7, 19, 1, -18, -6, -9, 8, 0, 3, 6, 36,
-    35, 17, 30, 22, 21, 44, 47, 80, 69, 23, 27, 1, -3, 1, -17, 4,
-    -17, 3, 7, -13, 9, 13, 20, 29, 24, 19, 6, 11, 27, 27, 35, 8,
-    -3, 15, 25, 35, 39, 28, 13, -1, -5, -9, 30, 33, 3, 16, 20, 10,
-    30, 27, 24, 19, 27, 21, 27, 18, 26, 14, 13, 1, 6, 4, -9, -25,
-    -1, -10, -11, 4, 7, -12, 25, 15, 3, 17, 17, 20, 26, 15, 29, 18,
-    19, 20, 22, 17, 9, -14, -13, -3, -3, 0, -12, -32, -17, -20, -2, 4,
-    2, 10, -17, -43, -13, 24, 10, 11, 15, 14, 5, 21, 14, -19, 3, 9,
-    -8, -13, -11, -8, -2, -7, -16, -18, -19, -27, 2, 0, 6, 11, -26, -48,
-    3, 29, 9, 20, 1, 13, 17, 12, -1, -45, -52, -18, -19, -9, -6, -25,
-    -23, -18, -6, -17, -21, -22, -16, -3, 5, 16, -21, -30, 6, 33, 15, -8,
-    13, 11, -9, -15, -32, -66, -65, -18, -1, 9, -2, -34, -34, -2, -4, -17,
-    -21, -26, -11, -1, 2, 0, -2, -40, -2, 26, 27, -6, -2, -3, 6, -11,
-    -44, -48, -48, -7, 11, 19, 15, -19, -22, 4, 11, 18, 1, -20, -10, -9,
-    -6, 1, -1, -31, 17, 24, 28, -15, -8, -7, -12, -27, -46, -61, -47, -17,
-    0, 19, 1, 0, 12, 6, 8, 31, 23, -20, 0, -4, 2, 0, 4, -28,
-    10, 0, 3, -13, -27, -17, -9, -35, -39, -44, -23, -9, -1, 16, -2, -7,
-    16, 9, 18, 14, 8, 3, 1, 16, -4, -10, -6, -27, 13, -6, 6, -10,
-    -26, -17, -11, -22, -25, -30, -19, 0, 1, 5, -1, -13, 30, 4, 6, 2,
-    -18, -13, 35, 20, 6, -11, -33, -8, -11, 10, 14, -24, -36, -20, -22, -24,
-    -22, -23, -21, -13, -2, 2, -11, -7, 11, 13, -19, -14, -15, -30, 40, 28,
-    -3, -8, -22, -5, -21, 7, -7, -33, -68, -25, -21, -28, -7, -20, -25, -14,
-    -20, -20, -26, -6, 0, -6, -10, -19, -22, -12, 38, 28, 0, -11, -13, -2,
-    -19, -2, 6, -15, -47, -13, 0, -24, -40, -46, -59, -35, -11, -3, -7, -25,
-    -16, -14, -18, -31, -19, 28, 33, 23, 0, -16, -22, -33, -29, -18, -15, 10,
-    -9, 6, 5, -9, -27, -67, -46, -7, 6, -2, 4, -21, -18, 10, -24, -31,
-    -5, 1, 14, 9, -2, -23, 11, -42, -33, -31, -15, -6, -9, 7, 7, 16,
-    1, -14, -23, -2, 9, -2, 5, -15, 11, 13, -30, -35, -2, 8, 16, -4,
-    -5, -16, 24, -4, -34, 5, -3, -12, 10, -1, 7, 24, 28, 15, 10, 14,
-    37, 15, -1, 1, -2, 8, -10, 13, 16, 14, 12, 5, -1, 1, -1, 18,
-    -11, 22, -4, 6, 22, 12, 26, 36, 43, 33, 31, 39, 41, 14, 9, 10,
-    10, 5, -5, 36, 62, 28, 27, 7, -2, -17, 7, 16, -3, 19, 7, 16,
-    47, 26, 19, 20, 10, 27, 38, 28, 34, 12, 14, 15, 12, -17, 20, 27,
-    33, 8, 4, 7, -2, -4, -24, 8, 8, 0, 25, 9, 21, 25, 29, 20,
-    22, 21, 19, 9, 4, 15, 17, 13, 11, 28, 28, 12, 16, -4, 11, 0,
-    1, 3, -3, -9, -3, 9, 13, 4, 11, 20, 1, -13, 3, -8, 0, 4,
-    3, 25, 11, 8, 29, 44, 7, 8, 35, 21, -1, -2, 0, 2, -2, 18,
-    -10, -13, 0, 15, 15, 18, -21, 14, 40, 4, 16, -5, -26, 13, 0, -6,
-    32, 57, 58, 16, 11, 9, 3, 2, 5, 0, 4, -1, 8, 4, 5, 17,
-    32, 47, 37, 47, 39, 29, 42, 33, 52, 60, 35, 19, 42, 25, 8, 10,
-    5, 1, 0, 1, -4, 2, 3, -3, 4, -3, 4, 3, 3, 4, 19, 18,
-    6, 12, 9, 4, 12, 11, 2, -1, 1, 7, 5, -1, -4, 4, -2, 2,
-    3, -3, 3, 1, -1, 2, 3, 3, -4, 1, -3, -1, 12, 17, 21, 6,
-    -4, 4, 1, -2, 0, 1, -1, 3, 2, -3, 2, 0, -1, 1, 2, -2,
-    -4, 3, 20, 16, 18, 22, 41, 32, 37, 44, 2, 2, 41, 47, 22, 23,
-    28, 21, 14, 11, 4, 1, -1, 1, 2, 2, 1, 4, 20, 17, 16, 26,
-    15, 8, -1, 4, -11, -19, 13, 16, -1, 25, 28, 1, 30, 29, 16, 41,
-    -3, -10, 1, 3, 4, -3, -1, 37, 31, 2, 20, 6, -18, -6, -14, -23,
-    -9, 7, 0, -8, -11, -3, 10, 13, 8, 50, 39, 27, 34, 39, 31, -2,
-    -3, -4, -2, 15, 12, -12, -12, -2, -19, 0, -1, -11, -22, -17, -6, -15,
-    -25, -20, -5, -10, 6, 29, -1, 55, 57, 28, 37, 1, 0, 4, 26, 17,
-    -34, 4, -3, -15, -3, 1, -1, -22, -17, -5, -15, -13, 12, 19, 27, 8,
-    18, 20, 2, 40, 60, 54, 6, -12, -2, -18, 25, -35, -24, -6, -18, -24,
-    -8, -12, -5, -12, 5, -8, 14, 25, 35, 45, 51, 33, 41, 12, -11, 34,
-    64, 77, 31, -6, -4, -41, 27, -25, -41, -47, -26, -28, 8, 6, 5, -13,
-    -3, 1, 24, 25, 32, 28, 25, 36, 32, 11, -17, -18, 22, 27, 30, -5,
-    -24, -17, 13, -27, -61, -46, -8, -18, 4, -4, -16, 0, -7, 7, 10, -4,
-    0, -6, 15, 11, -2, -23, -38, -32, -20, -21, 16, -3, 3, -7, -9, -20,
-    -18, -29, -13, -22, -9, -8, -18, 0, -16, -8, -18, -35, -57, -52, -31, -57,
-    -71, -67, -73, -99, -63, -19, 9, 18, -2, -11, -4, -35, -1, -5, 2, -18,
-    0, -7, -9, -9, -16, -27, -42, -57, -81, -99, -71, -75, -91, -68, -87, -83,
-    -53, -30, -1, 19, 3, -5, -17, -6, 10, 8, 18, -14, -25, -23, -5, -11,
-    -24, -27, -24, -24, -21, -35, -22, -13, -24, -29, -37, -40, -43, -38, -21, 17,
-    -3, -9, -16, 25, 23, -2, -12, -14, -11, -5, -9, -1, -17, -11, 0, 17,
-    23, 21, 34, 11, -6, 4, -4, -19, -16, -31, 21, 27, 1, -6, -11, 27,
-    6, -7, 1, 22, -7, -10, 0, 2, 14, 27, 34, 26, 31, 20, 19, 4,
-    3, 15, 9, 0, 2, -19, 42, 25, 3, -14, -14, 16, 20, 3, 37, 15,
-    -10, -8, 21, 1, 2, 9, 17, 20, 24, -2, 23, 3, 15, -10, -13, 8,
-    6, 4, 52, 29, -1, -7, -11, -10, 9, 16, 36, 12, 7, 12, 12, 12,
-    4, 10, 14, 20, 16, 7, 14, 2, 13, -2, -29, 3, 26, 47, 6, 32,
-    0, -19, -12, -15, -1, 21, 22, 6, 9, 4, 3, -4, 0, 25, 25, 9,
-    9, 18, 7, 7, 18, 10, 21, 10, 36, 80, 61, 40, -4, -18, -11, 26,
-    -6, 21, 32, 2, 24, 2, 0, -17, -3, 4, 7, 15, 12, 7, 14, 2,
-    28, 10, 19, 17, 26, 67, 1, 30, 6, -20, -12, 4, 21, 42, 26, 26,
-    8, 15, 19, -1, 8, 11, 30, 9, 13, 7, 4, 18, 21, 5, 1, 18,
-    31, 75, 6, 24, -10, -19, 23, -44, -4, 21, 11, -8, 7, 2, 4, 7,
-    25, 11, 8, -2, 6, -6, 13, 11, -4, -6, 12, 39, 48, 88, 16, 8,
-    2, -29, 25, -27, -3, 22, -1, -21, 0, 4, 5, -4, -7, 2, -10, -4,
-    -8, -1, 0, -4, 1, 1, 9, 24, 57, 81, 20, 0, -4, 2, -23, -22,
-    8, 35, 3, -6, -13, 3, 6, 7, 5, 12, 8, -5, 5, 8, -1, -9,
-    9, 20, 1, 28, 50, 41, 40, 1, -5, -16, 14, -2, 24, -3, -4, 0,
-    2, 3, -3, -2, 6, 0, -9, 3, 10, -2, -19, -25, 1, -10, -28, 20,
-    24, 11, 18, -2, 3, -3, -35, 5, 32, 17, -11, -45, -25, -3, 5, -2,
-    1, -8, 1, -1, -6, -18, -51, -33, -5, -9, 4, 13, 49, 22, 16, 4,
-    1, 1, -42, -15, -17, 3, 0, -8, -27, -19, -18, -12, -2, 13, 5, 13,
-    -11, -20, -27, -23, -14, -17, -14, -17, 39, 17, 11, 2, 4, -3, 15, 21,
-    -13, -16, 5, 9, -1, -13, -25, -10, 50, 56, 39, 11, -4, 6, 5, 34,
-    29, 49, 46, 17, 38, 16, 16, -3, -2, 4, -1, 22, 34, 33, 39, 47,
-    43, 37, 16, 12, 24, 35, 35, 6, 34, 43, 25, 41, 56, 41, 42, 26,
-    12, -5, 3, 2, 2, 1, -4, 1, 3, 0, -2, 3, 5, 3, 3, 1,
-    1, 1, 25, 8, 0, 1, -7, 3, -3, -14, -8, 3, 2, 2, 1, 2,
-    0, -2, 0, -4, 1, -2, -1, 2, 4, 1, 4, 0, 16, 13, -1, -3,
-    0, -4, 3, 4, -3, -4, 2, -2, 1, 1, -4, -1, -1, -5, 0, -2,
-    0, 8, 23, 17, 13, 4, 29, 16, 11, 13, 14, -2, -22, -11, 24, 17,
-    28, 27, 25, 15, 0, 0, 1, 1, 3, 3, 7, -4, 13, 11, 14, 20,
-    22, 15, 12, 22, -5, 14, 8, 14, 19, 28, 19, 3, -3, 6, 22, -4,
-    -14, -8, 2, 2, -2, 0, 5, 16, 21, 31, 28, 41, 25, 0, -13, -24,
-    -17, -1, 26, 27, 18, -19, 3, 2, 5, 12, 1, 34, 9, -22, -7, 1,
-    0, -3, -4, 38, 41, 38, 12, 10, -4, -4, -2, -22, -27, -15, 13, 5,
-    10, 2, -12, -3, 9, 22, 29, 39, 39, 28, 17, 26, -1, 1, 3, 7,
-    21, 2, 0, 3, -5, -12, -19, -4, 8, 10, 16, 3, 6, 0, -30, 0,
-    3, -3, -4, 9, 29, 47, 23, 27, -3, 3, 3, -37, 12, 5, 3, 6,
-    11, -6, -3, 7, 15, 8, 8, 5, -8, -15, -30, -12, -14, -25, 9, 31,
-    40, 55, 49, 33, -1, -21, -21, -23, 30, 23, -1, 2, 35, 18, 3, 1,
-    15, 5, 5, 2, -15, -25, -15, -10, -13, -4, 12, 27, 6, 12, 65, 44,
-    -4, -29, 20, 24, 18, 15, 17, 31, 26, 4, -14, -14, 4, 4, -11, -14,
-    -23, -29, -16, 0, -10, 7, -4, 17, 13, 47, 62, 24, -8, -31, 15, 5,
-    8, 2, 13, 18, 24, 6, -30, -4, -16, -4, -6, -16, -9, -23, -7, 4,
-    8, 13, -3, 28, 26, 41, 49, 19, -7, -9, -17, 2, 7, 13, 8, 16,
-    4, -2, -4, 2, 6, -6, -11, -22, -24, -20, -12, 10, 10, -5, -5, 27,
-    27, 23, 22, 15, -1, -8, -14, -32, 7, 16, 14, 14, 8, 13, -2, 3,
-    22, 12, 18, -9, -18, -21, -15, -6, 1, -7, 7, 12, 19, 29, 37, -34,
-    -7, -15, -11, -18, 6, 19, 26, 23, 22, 11, 14, 22, 11, 29, 17, 0,
-    -6, -4, -16, 2, 8, 1, 4, 17, 26, -9, -21, -36, 4, -12, -26, -18,
-    0, 17, 16, 18, 21, 20, 17, 14, 17, 13, 24, 15, 24, 8, -15, 16,
-    3, -10, 9, 11, 11, -20, -19, -2, -2, 0, -29, -26, -14, 21, 12, 8,
-    17, 14, 13, 17, 2, 17, 31, 14, 38, 23, -12, -8, -17, -16, 1, -7,
-    -1, 1, -43, -14, -3, 7, 1, -28, -15, -2, -4, 1, 14, 14, 32, 32,
-    19, 15, 29, 9, 19, 10, -4, -11, -29, -7, 12, 10, -13, 8, -12, -22,
-    -4, 8, 4, -33, -29, 1, -11, -17, 0, 11, 21, 25, 20, 16, 8, 3,
-    1, -9, 9, -14, -29, -10, 8, 16, 5, 20, -46, -25, 4, 9, -9, -21,
-    -39, -16, -19, -4, -5, 2, 15, 20, 1, 10, -1, -5, 1, -18, -3, -12,
-    -13, 5, 4, 11, -2, -29, -43, -19, -23, -5, -8, -31, -39, -27, 0, -8,
-    -10, -8, -9, 1, 3, 7, 2, -5, -6, -9, -12, -12, 6, 6, -20, -9,
-    -6, -28, -39, -11, 9, -2, 2, -19, -24, -20, -17, -13, -9, -5, -11, -14,
-    -22, -8, 8, 0, -5, -15, -7, 3, -3, -7, -6, 16, -9, -13, -26, -9,
-    4, 0, -2, -6, -7, -21, -7, -1, -6, -3, -6, -13, -15, -2, -3, 6,
-    -6, -3, 6, -1, -7, -3, 11, 10, -20, -9, -19, 1, 7, 0, 16, 16,
-    2, -6, 7, 4, 7, -1, -20, 5, -5, -2, 4, 8, -10, 4, 2, -3,
-    10, 5, 13, -13, -33, -3, -3, 2, 7, -1, -3, 18, 15, -14, -4, -5,
-    -14, -8, -7, 6, 8, 7, 0, 0, 3, 9, 7, 6, 1, -4, -2, -12,
-    -10, 2, 13, -5, 1, -3, 8, 22, 28, 12, 10, 1, 16, 12, 2, -16,
-    -7, 2, -3, -2, 7, 4, 34, 18, 19, 3, 8, -3, -9, 5, -3, -2,
-    2, -3, 1, 30, 17, -13, 3, 18, 36, 36, 33, 35, 35, 21, 6, 6,
-    24, -1, 10, 11, 28, 17, 5, 14, -24, -24, -11, 1, -3, 4, 9, 0,
-    -53, -47, -6, 9, 7, 17, 17, 7, 38, 39, 11, 15, 9, 11, 17, 32,
-    12, 18, 36, 48, 14, -10, -8, 0, 4, 2, 3, -15, -11, -24, -35, -20,
-    19, -1, -1, 7, 12, -12, 8, -6, 5, 28, 16, -26, -21, -17, -24, -3,
-    -23, 1, 1, -3, 4, 0, 0, -4, -4, -6, 8, 9, 9, -10, -26, 8,
-    5, -17, -12, 19, -6, -24, -8, -10, -27, -33, -33, -10, 4, 3, -1, 2,
-    4, 3, -3, 3, 2, -4, 0, 4, -3, -1, 0, 3, 22, 25, -3, -4,
-    -3, -4, 4, 0, 3, -3, 3, 1, 1, 0, 4, 2, -4, 3, -3, -4,
-    -1, 1, -7, 1, 15, 16, 46, 28, 17, 27, 29, 2, 1, 13, 9, 6,
-    23, 18, 13, 10, -2, -2, -4, -5, -1, 1, 4, -1, 2, 14, 9, 14,
-    -3, -1, 18, 53, 42, 48, 31, -8, -5, 12, 2, 6, 11, 15, 34, 27,
-    7, 5, -1, 3, 2, 3, 1, -5, 2, 1, 10, 22, 19, 39, 47, 60,
-    49, 34, 7, -3, -16, -28, -18, 13, 23, 19, 18, -4, -12, -11, -10, 3,
-    2, -2, 7, -28, -4, 8, -11, 6, 4, 31, 14, 35, 40, 27, 18, -15,
-    -11, -18, -6, 23, 39, 35, 26, 27, 23, 10, 1, 2, -1, -4, 1, -31,
-    -20, -10, -23, -6, 31, 56, 34, 20, -2, -18, -13, -20, -6, 8, 0, -2,
-    -4, 11, 22, 10, 39, 43, 27, 19, 3, 0, 1, -43, -3, 26, -4, -2,
-    31, 27, 8, 15, 12, -30, -43, -31, -2, 10, 6, 10, -2, -8, -1, 8,
-    30, 12, 35, -17, 5, -2, -10, -14, -2, 25, -8, 5, 26, 37, 40, 13,
-    -17, -61, -46, -16, 12, 16, 14, 7, 7, 7, 13, 10, -19, -17, 46, -14,
-    -3, 2, -16, 7, -7, 15, 16, 28, 24, 35, 27, 10, -40, -65, -37, 0,
-    11, 7, -3, -16, 10, 8, 6, -8, -24, 5, 26, 14, 2, -1, -27, 8,
-    -10, -40, -15, 2, 28, 50, 36, 13, -48, -81, -55, -16, 10, -17, -18, -20,
-    -10, -2, -25, -22, -23, 25, 39, 29, 2, 2, -23, -29, 1, -26, -31, 4,
-    41, 63, 51, 22, -19, -66, -64, -25, 1, -17, -21, -14, -29, -23, -22, -24,
-    -6, 11, 16, 18, 0, 0, -3, -29, -14, -13, -9, 6, 30, 47, 43, 36,
-    7, -39, -17, -2, 10, -9, -11, -17, -31, -9, 13, -14, 6, -7, -19, -33,
-    3, -9, -11, 2, -20, -16, 0, 22, 21, 18, 28, 36, 13, 2, -14, 7,
-    5, -13, -9, -6, 11, 26, 18, 13, 39, -15, -46, -41, 4, -11, -22, 5,
-    -12, 19, 1, 24, 0, 10, 18, 20, 4, -9, -12, 10, -2, -20, -2, 28,
-    20, 24, 37, 12, 19, -13, -64, -23, -2, -2, -21, 6, -11, 33, 8, 22,
-    14, 14, 6, 7, -4, -12, -1, 6, 6, 10, 16, 6, 4, 14, 27, 14,
-    14, -12, -43, -17, -5, 6, 20, 20, -6, -2, -8, 18, 10, 19, 28, 25,
-    11, -4, -8, -5, -1, -4, 6, -1, -6, -2, 0, 0, -28, -5, 4, -25,
-    -3, -3, -16, 16, -19, -29, -17, -34, 10, 9, 9, 14, 15, 3, -12, 8,
-    7, -6, -2, -5, 10, -8, -5, -7, -13, 21, -44, -28, -2, 3, -12, 6,
-    -13, -30, -38, -43, -6, 2, 1, 14, -3, -16, -11, 3, 1, -14, 1, 8,
-    21, 0, 15, 10, 19, 13, -4, -24, -4, -14, -17, -7, -11, -32, -35, -59,
-    -34, -10, 1, -10, -18, -9, 7, -5, -12, -16, 4, -4, 15, -1, -6, -2,
-    13, -2, -16, -25, -2, 2, -26, -4, -46, -34, 1, -20, -15, -5, -14, -2,
-    3, 3, 11, -7, -35, -18, -11, -2, 7, 1, -4, 0, 16, 2, -26, -7,
-    -2, 7, -2, -8, -32, -37, -2, -3, -9, 3, -10, -9, 14, 13, 17, 4,
-    -5, -14, 7, 1, 3, 4, 8, 3, -5, -18, -37, -1, 3, -19, 7, -5,
-    2, -9, 0, -2, 22, 16, -2, -13, -9, 5, 16, 23, -7, -6, -1, -9,
-    17, -3, 7, 11, 1, 20, -6, 1, -3, 2, 4, 8, 35, 10, -9, -3,
-    14, 22, 0, -12, -20, -9, 6, 17, 19, 11, 8, 19, 3, -8, -8, 1,
-    -5, 8, 29, 2, -3, 5, -10, 10, 53, 19, -6, -26, -7, 6, 6, -21,
-    -8, 11, 9, 15, 21, 12, 10, 4, 3, -15, -4, -9, -24, 11, 29, 3,
-    0, 4, 17, 10, 28, 31, -5, -26, -24, -9, 9, 14, 14, 26, 17, 12,
-    8, -1, -11, -6, -5, -21, -13, -14, -18, -18, -2, 4, -3, -4, -24, 17,
-    16, 8, 11, -6, -1, -1, 10, -9, -8, 17, 6, 20, -2, -3, 5, -15,
-    -19, 7, 37, 33, 17, -12, -2, 1, 4, -2, 2, -1, -15, -9, -21, -36,
-    -39, -24, -17, -4, -5, -40, -55, -22, -27, -43, -10, -11, -28, -39, -32, -25,
-    -24, -2, -1, 4, -4, 0, 3, 0, 0, 2, -1, -5, -5, -1, 1, 6,
-    -2, 0, -50, -49, -43, -43, -21, -22, -11, -34, -36, -3, -4, 1, -2, 4,
-    4, 2, 3, -2, 1, -1, 0, 3, -2, 0, 4, 4, 5, -1, -5, 2,
-    1, -4, -3, -1, -2, -2, 4, -3, 2, 4, -4, -4, 4, 3, 4, -2,
-    2, 2, 8, 7, 13, 11, 6, 15, 19, 3, -24, 4, 19, 17, 10, 17,
-    22, 6, 4, 1, 2, -3, -2, -2, 3, 2, 3, -2, 17, 9, 17, 16,
-    16, 18, 9, 31, 47, 22, 2, -7, -11, -20, -10, 9, 19, 21, -1, 10,
-    10, -4, 2, 4, -4, 4, 5, 12, 11, 46, 23, 10, -9, -5, 13, 22,
-    6, 4, 32, 5, 5, -11, 8, 3, 25, 14, 23, 26, 8, -20, 5, 3,
-    -3, -4, 35, 40, 42, 44, 18, 1, 0, -7, 16, 33, 7, 6, -11, -17,
-    3, 27, 20, 5, -4, -36, -11, -6, -11, -19, 3, 34, 3, 3, 37, 16,
-    35, 25, 5, -3, 2, 5, 41, 33, 13, -3, -8, -1, 9, -16, 11, 5,
-    -2, 4, -3, 29, 9, -7, 28, 29, -4, 12, -11, 18, 49, 28, -6, -17,
-    -9, 8, 9, 5, 6, 9, -5, -15, -5, -5, 0, 1, 8, 32, 33, 6,
-    32, -2, 10, 20, 0, 40, 5, 14, 38, 16, -7, -12, -6, -6, 0, 5,
-    -22, -15, -6, -6, 6, 5, 1, 14, 15, 16, 23, 12, 20, 14, 20, 20,
-    43, 25, -7, 9, 38, 1, -4, 2, 4, -11, -20, -33, -18, -35, -22, -7,
-    20, 6, 2, 6, 16, 20, 21, -6, -13, -8, 18, -2, -1, 1, -16, 26,
-    18, -7, -15, -8, -33, -36, -19, -41, -42, -36, -20, -3, 28, 8, -6, 1,
-    8, -6, 9, 0, -12, 9, -23, 6, 2, 1, 12, 28, -22, -22, -41, -41,
-    -37, -40, -28, -31, -20, -3, 7, 3, 23, 10, -3, -10, 18, 14, 15, -14,
-    -22, -13, -23, -10, -3, -4, 3, 2, -21, -30, -36, -12, -5, -32, 5, 5,
-    3, 19, 13, -2, -19, -6, 0, 0, 12, 15, 3, -32, -44, -57, -35, 8,
-    1, -13, -10, -35, -20, -10, 7, 19, 10, 10, 19, 33, 42, 33, 13, -17,
-    -26, -20, 5, -4, 1, -1, 7, -11, -15, -24, 13, 14, 1, -10, -3, -15,
-    15, 28, 34, 37, 19, 17, 18, 10, 15, 9, -4, -22, -41, -36, -6, 4,
-    -13, -7, 2, 13, 1, -10, -3, -18, 3, 7, 10, 1, 12, 26, 27, 30,
-    16, 18, -18, -13, 15, -4, -3, -9, -29, -26, -18, -2, -3, 6, 23, 14,
-    6, -18, -7, -21, -2, 5, 16, -19, -3, 18, 9, 1, -23, -28, -33, -26,
-    13, 7, -5, 0, -6, -13, -4, 9, 11, 10, 7, 9, 26, -23, 29, -6,
-    -4, 6, 22, -10, -2, 20, -19, -8, -24, -21, -41, -18, 2, 6, -7, -9,
-    8, -1, 2, 15, 30, 10, 31, 0, 9, -30, -15, 15, 0, 10, -9, -7,
-    -10, -3, -18, 13, 9, -13, -31, -29, -27, -19, -22, -11, 13, 7, 14, 18,
-    12, 2, 26, -20, -40, -57, -23, 25, 18, 15, -5, 12, -22, -7, 6, 28,
-    33, 19, -18, -21, -26, -13, -13, 20, 20, 17, 19, 4, -3, 6, 6, -43,
-    -56, -8, -14, -26, -9, 23, -11, 7, -5, 12, 16, 18, 21, 26, 12, 8,
-    23, 23, 16, 21, 3, 17, 4, -17, -1, -15, -27, -43, -41, -8, -26, -21,
-    -4, 23, -32, -3, -5, 0, 8, 19, 18, 42, 31, 15, 30, 31, 35, 14,
-    2, 4, -18, -21, -18, -27, -32, -51, -40, -14, -23, -3, -7, -4, -27, -9,
-    -22, -23, -6, 11, 12, 18, 19, 12, 16, 17, 17, 16, 12, -3, -18, -17,
-    -29, -48, -46, -44, -53, -18, -7, 3, -10, 4, -15, 20, -16, -8, -21, -11,
-    -1, 19, 14, 16, 5, 14, 20, 26, 28, 22, -15, -13, -34, -48, -36, -32,
-    -52, -21, 14, 6, -2, 4, 12, 29, -3, 13, -12, -11, -9, 1, 18, 24,
-    10, 6, 22, 24, 15, -2, 0, -33, -43, -38, -51, -42, -24, -10, 24, -3,
-    4, -1, -11, 29, 50, 41, 13, 13, 3, -8, -14, -19, -8, 4, 26, 22,
-    -7, 24, 22, -19, -33, -53, -52, -26, -13, 13, 8, 3, 1, 3, 3, 0,
-    32, 29, 5, 5, -12, -24, -9, 2, -65, -28, -17, -21, -40, -33, -34, -11,
-    -8, -8, -5, -18, -9, 0, -4, 2, -1, -3, 0, 16, -4, -13, 1, 11,
-    -11, -37, -44, -51, -13, 2, 1, 19, -9, -6, 2, 6, -13, -8, -5, -8,
-    0, 2, -4, 2, -3, -4, 0, 0, -8, -19, -4, -8, -8, -4, 1, -8,
-    2, -8, -6, 1, 12, 9, -5, -2, -3, -3, -6, 3, -5, 2, -2, -2,
-    2, -3, 2, 3, 1, -4, 0, 4, -3, -2, -4, 2, -18, -16, 4, 0,
-    3, -3, 3, -1, -3, 2, -4, 4, -3, 1, 4, -1, 3, -1, -3, -5,
-    0, 1, -23, -22, -4, -5, -33, -7, 3, 2, -13, -4, 16, 11, -23, -7,
-    -12, -15, -5, -6, 2, -4, 0, -1, 2, 1, -3, -1, -17, -21, -25, -36,
-    -14, 5, 10, -4, 25, 4, -5, -12, 1, 4, 4, -1, 17, 17, 12, 23,
-    18, 12, -4, 3, 0, -1, -3, -4, 0, -13, -15, -6, 28, 18, 19, -8,
-    -15, -25, -47, -28, -19, 4, -9, -22, -11, -12, -7, -5, 3, 18, -2, -4,
-    3, -1, 2, 37, 5, -38, -11, 8, 21, 22, 8, -1, 6, -21, -45, -42,
-    -45, -57, -51, -57, -40, -30, -47, -18, 4, 6, 5, 1, -1, 3, 1, 37,
-    27, -19, 2, 9, 2, 22, 7, 7, -8, -5, -12, -8, -38, -59, -48, -36,
-    -29, -29, -54, -48, -31, 5, -5, 1, -1, 3, 14, 39, 23, -30, 12, 4,
-    10, 15, 17, 13, 16, 32, 32, 12, -4, -9, -38, -59, -50, -52, -72, -48,
-    -44, -18, -1, 8, 1, 43, 15, 24, 22, -15, 10, -9, 6, 1, -1, 8,
-    28, 58, 35, 14, 2, -9, -29, -60, -63, -60, -75, -77, -75, -34, -5, 8,
-    16, 29, 21, 16, 16, -16, -15, -7, 9, 6, 22, 24, 37, 45, 40, 24,
-    17, 20, 5, -19, -44, -41, -38, -62, -76, -33, 14, -3, 8, 12, 25, 34,
-    6, 14, 16, 14, 7, 17, 35, 13, 26, 28, 38, 31, 26, 42, 10, -18,
-    -31, -25, -10, -53, -28, -24, -13, 3, 14, -5, 13, 55, -2, 13, 29, 12,
-    12, 3, 11, 0, -9, 18, 39, 28, 37, 25, 22, -6, -26, -22, 12, -6,
-    -23, -20, -8, 0, 0, -2, 22, 56, 10, 11, 17, 10, -10, -2, -10, 0,
-    -10, -3, -1, 24, 12, 23, 32, 12, 0, -15, -5, 0, -24, -32, -8, -26,
-    2, 3, 17, 4, 2, 12, 8, -9, -21, -15, -31, -32, -31, -15, -8, 4,
-    6, 19, 24, 10, -10, -19, -11, -2, -29, -47, -41, -6, 3, 12, 10, -20,
-    -29, -15, 5, 5, 4, -14, -34, -33, -31, -15, -10, -4, -6, 15, 16, -4,
-    -20, -9, -13, -21, -9, -43, -28, 17, 1, 8, 14, -17, -26, -21, 1, 2,
-    -6, -16, -27, -18, -10, -9, -12, 8, -11, 8, 28, 18, 6, -18, -17, -8,
-    14, -29, 19, -8, 4, 0, -17, 6, -7, 5, 11, -7, -7, -11, -22, -17,
-    -15, -10, -7, -1, -9, 13, 15, 10, 11, -9, -17, -8, 17, -9, 2, 22,
-    4, 7, 1, 12, 20, -3, 11, 2, -18, -11, -14, -5, -3, -12, -17, -22,
-    -19, 2, 5, 10, -2, 2, 10, -5, 7, -20, 31, 40, -4, 9, -7, 40,
-    2, 0, 13, 10, -9, -16, -12, -7, 16, -2, -23, -23, -20, 3, -4, 11,
-    -5, 2, 5, -2, -5, 10, 28, 45, 31, 14, -3, 43, 9, 8, 13, 2,
-    -4, -16, 2, 27, 20, 2, -11, -2, 0, 9, 9, 12, -1, 18, 20, -12,
-    -1, 9, 29, 10, -10, 35, -1, 12, 13, -9, -33, -11, -7, -5, 9, 7,
-    20, 8, 5, 9, 3, 9, 9, 13, 12, 15, 14, -2, 2, -7, 33, -13,
-    1, 32, -10, 11, 4, -32, -33, 1, -4, -15, -1, 1, -20, -1, -5, -2,
-    -5, -10, -11, 12, 20, 18, 16, 28, 24, 17, 23, -3, -5, 12, 25, 39,
-    23, -16, -12, -2, -30, -23, -20, -25, -18, -16, -6, -11, -3, -7, 3, 1,
-    -2, 9, 9, 14, 23, -15, 18, 0, 2, 13, 31, 30, 34, 19, 17, 7,
-    -8, -14, -26, -22, 0, -2, 7, 7, -5, -4, -1, -21, -4, 5, 6, 20,
-    29, 8, 4, -2, -3, -2, 18, 23, 17, 18, -24, -15, -9, -10, -12, 18,
-    9, 2, 6, 9, 2, 1, -7, -33, -24, -3, 9, 24, 49, 14, 0, 1,
-    -3, 3, -9, 10, 50, 39, 0, -3, -11, 1, 1, 12, 6, 9, 9, 4,
-    4, -5, -4, -25, -22, -3, 8, 23, 17, -1, -5, 0, -4, 3, 22, -16,
-    0, 9, 5, 18, 32, 8, 19, 6, 20, 24, 20, 1, 34, 22, 7, 15,
-    5, -6, -22, -17, -15, 3, 0, 2, 3, -2, 3, 1, -19, -13, -6, 4,
-    39, 55, 72, 24, 16, 58, 59, 8, 42, 59, 41, 16, 26, 48, 49, 41,
-    21, 5, 4, 3, -2, 2, 3, -4, -16, -17, 28, 29, 28, 20, 30, 26,
-    29, 6, 61, 43, 41, 39, 31, 19, 15, 35, 40, 15, 5, 3, -2, 2,
-    0, -2, -1, 0, 4, -5, -4, -5, 2, 1, -3, 4, -3, 1, 1, -1,
-    3, 3, 1, -3, -4, 3, 1, -2, -1, -1, 5, 0, -4, 3, 2, 2,
-    -3, 0, -2, -1, -4, -5, -7, -3, -14, -6, 13, -3, -6, -20, -14, -16,
-    -16, -5, -4, -1, 0, 0, -3, -3, -1, 4, -2, -2, -9, 3, -5, -11,
-    5, -12, 6, -12, -19, -5, -5, 15, 19, -4, 9, -25, -8, -5, -1, 8,
-    6, 17, 4, -2, -4, 1, 3, -10, -5, -24, -4, -28, -11, -4, 13, -6,
-    10, 2, -3, 37, 7, 5, -4, -4, -22, -36, -29, -10, 5, -25, -22, 0,
-    3, -4, -2, -51, -26, -6, 19, 21, 4, 10, 20, 19, 30, 26, 31, 29,
-    14, 19, 22, 14, 14, -15, -14, -23, -7, 7, -5, -33, -3, -4, 4, 9,
-    23, -19, 5, -4, -6, 1, 12, 25, 29, 15, -2, 9, 13, 18, 18, 12,
-    21, 0, 4, -22, -13, 7, -17, -34, 3, -8, -30, 8, -11, -22, 0, -9,
-    14, 25, 27, 13, 10, 0, 16, 14, 11, 4, 6, -3, 0, -15, -22, -6,
-    -16, 1, 10, -20, 0, -32, -25, 4, 7, 14, -7, -16, 28, 9, 3, -10,
-    -2, -8, -13, -6, -5, -10, -19, -15, -6, -17, -17, -12, -28, 10, 10, -21,
-    -8, -31, -37, -9, 13, 10, 7, 3, 12, -5, 6, -1, -27, -10, 0, 4,
-    -18, -14, -5, 5, -11, -31, -23, 6, 12, 38, 29, 10, -11, -44, -12, -25,
-    -12, 24, 1, -7, 15, -7, 10, 6, -14, -2, 2, 7, 4, -3, 12, 6,
-    -10, -14, -14, -1, 1, 29, 71, 33, -17, -23, -28, -37, -8, 12, -9, 9,
-    16, -3, 16, -3, 25, 9, 9, 15, 26, 23, 20, 14, -4, -16, -26, -7,
-    -23, 1, 53, 34, -3, -17, -23, -52, -24, -10, -6, 10, -13, -17, 0, 10,
-    30, 13, 25, 30, 49, 28, 27, 5, -10, -6, -20, -9, 1, 33, 48, -14,
-    -8, -10, -18, -18, -14, -21, -23, -7, -15, -13, -2, 10, 25, 24, 29, 23,
-    35, 40, 7, 4, -9, -6, -27, -17, -7, -23, -10, -17, 2, -12, -43, -9,
-    -32, -38, -28, -5, -12, -4, -2, 24, 21, 29, 31, 44, 42, 29, -3, -17,
-    0, -19, -16, -10, -19, -11, 8, 13, -1, -6, -29, -13, -45, -81, -35, -27,
-    -24, -25, -17, -12, -14, -1, 29, 19, 31, 19, -11, -26, -26, -27, -23, -15,
-    -15, 16, 16, 20, -4, -5, 14, -20, -22, -63, -50, -36, -33, -40, -37, -22,
-    -30, 0, 6, 2, 12, -11, -42, -36, -32, -23, -27, -14, -12, 30, -9, 23,
-    -7, -11, 7, -11, -41, -38, -17, -13, -14, -29, -31, -41, -28, -13, -2, -10,
-    -8, -20, -20, -26, -33, -9, -4, 15, 1, 48, 56, 29, 4, -9, 8, -9,
-    -38, -4, 21, 1, 4, 0, -19, -26, -32, -19, -11, -13, -13, -21, -6, -11,
-    -16, -3, 7, 13, 26, 27, 2, 14, 17, -10, -1, -35, 1, 11, 25, 5,
-    6, 18, 9, -7, -31, -19, -2, -19, -2, -7, -11, 3, 5, -2, 15, 18,
-    31, 15, -4, 32, 11, -7, -9, -16, 2, 9, 18, 5, 11, 14, 16, 6,
-    -17, 7, -6, -9, 14, 8, -5, -7, 0, 1, 6, 2, -14, 14, 26, 18,
-    0, -2, 28, 21, 11, 16, 16, 9, 23, 3, 8, 4, 4, 9, -18, -2,
-    13, 16, 11, 11, 8, -5, 8, 4, -25, 2, 13, -2, 11, 7, 33, 22,
-    20, 22, 21, 16, 12, 12, 12, 4, 0, 2, -8, -5, -1, 8, 8, 11,
-    -2, -3, 2, 19, -20, 6, 9, -2, 11, 7, 38, 32, 8, 7, 41, 25,
-    16, 7, 12, 13, 2, 4, 6, -16, -14, 3, 19, 1, 16, 1, 1, 0,
-    5, 31, -6, -11, 3, -1, 19, 18, 17, 3, 5, 11, 22, 20, 12, -7,
-    1, -8, -2, 6, 12, 11, 19, 11, 17, 13, 25, 29, 33, 24, -4, -2,
-    4, 2, 14, -21, -11, -36, -41, -17, 2, 4, 5, 10, -6, -26, -15, -13,
-    -11, -20, 10, 27, -8, 8, 29, 40, 24, 23, 18, -2, 3, 3, 0, -18,
-    -55, -62, -56, -53, -41, -20, -18, -37, -27, -8, 22, -6, 11, 35, -2, -39,
-    -10, -10, -7, -15, -33, 25, 17, -4, 0, 1, 1, 13, 21, -21, -30, -25,
-    3, 25, 4, -10, -38, -73, -2, -6, -4, 18, 10, -36, -25, -7, -14, -5,
-    5, -3, -1, 5, 2, -2, 4, -2, -15, -15, -13, -1, -8, -15, -12, 6,
-    -16, -28, 13, 33, 8, -9, 19, -1, -14, -11, -3, -7, -5, 2, -1, -4,
-    5, 2, 0, 3, -3, -2, 1, -2, -3, -3, -4, 0, -2, -1, 1, -2,
-    -2, -2, -2, 0, 2, -1, -1, 3, 4, 4, -4, 1, 2, 0, -2, -3,
-    -4, 0, -5, -9, -12, -8, -15, -13, -15, -16, -2, 2, -14, -17, -10, -3,
-    -7, -5, 1, -3, -3, 3, -3, 2, -1, 2, -1, 1, 2, -8, -12, -22,
-    -25, -14, -1, -1, -18, -15, -37, -27, -39, -28, -15, -12, -5, 14, 18, 7,
-    8, 2, -4, 0, 3, 4, -4, -32, -36, -6, -12, -19, 11, 22, 17, -12,
-    -4, -4, 8, -7, -9, -6, 15, 14, -3, -13, -8, -16, -18, 3, 4, 4,
-    -3, 3, 21, 11, 26, 19, 29, 14, 0, -21, -8, -7, 15, 22, 7, 14,
-    9, -5, -3, 18, -13, -3, 10, -19, -16, 8, 5, -1, 3, 0, 18, -5,
-    20, 46, 37, 39, 12, -10, -19, 7, 6, -4, -8, -16, -10, -4, 6, 16,
-    1, 8, -14, -10, 5, 13, -7, -8, -1, 13, 0, 6, 22, 21, 34, 38,
-    11, 3, 11, 9, 4, -9, -27, -23, -11, 10, 10, 20, 8, 19, -34, -22,
-    -22, -3, -25, -3, -2, 38, -2, -2, 10, -3, 22, 29, 3, 0, -15, -23,
-    -20, -31, -35, -26, -21, 0, 14, 41, 34, 8, -20, -45, -28, -30, -25, -3,
-    -33, 34, 5, 16, 0, 13, 17, 30, -3, -13, -17, -28, -10, -21, -26, -26,
-    -10, -5, 17, 47, 43, 15, 5, -46, -49, -36, -28, -5, 6, 44, 17, 26,
-    7, -2, 18, 22, -5, -11, -21, 0, -3, -10, -8, -24, -12, 21, 18, 28,
-    34, 2, -12, -38, -51, -30, -20, -10, 12, 25, 19, 31, 37, -3, 15, 10,
-    -10, -14, 12, 22, 0, -1, -15, -7, 8, 25, 15, 39, 40, 1, 8, -27,
-    -49, -42, -45, 4, 7, 12, 12, 59, 53, 22, 0, -1, -8, 12, 27, 26,
-    4, -21, 3, 13, 12, 18, 28, 29, 31, 9, -5, -9, -29, -44, -14, 38,
-    4, 14, 4, 17, 27, 33, 19, 12, 22, 9, 7, 2, -2, -13, 18, 28,
-    17, 19, 23, -5, -2, -13, -3, 1, -28, -32, 9, 41, -2, 14, 31, 9,
-    25, 28, 18, 8, 27, 4, -9, -5, -9, 4, 22, 20, 1, -5, -4, -13,
-    -7, 4, 2, -32, -23, -7, 12, -1, -3, 9, 35, 21, 16, 12, -32, -21,
-    1, -12, -11, -8, 3, 10, 26, 17, 10, 2, -15, -10, -27, -9, 1, 12,
-    -4, 0, -19, -1, 4, 5, 27, 20, -16, -19, -38, -22, -16, -26, -11, -7,
-    -15, 4, 17, 7, 11, 11, 14, 12, 5, -9, 13, -19, -25, -35, -24, -6,
-    10, 10, 18, 21, -31, -39, -17, -17, -4, 1, -9, -19, -14, 6, 7, 2,
-    13, 10, 13, 3, 3, 5, -8, -42, -15, -50, 11, -8, -3, 10, 15, 3,
-    -14, -20, -21, -18, -5, -7, -28, -4, -3, 2, 17, 0, 13, 12, -7, -12,
-    0, 9, -2, -46, -51, -27, 6, 0, -19, 17, 15, 13, -12, -1, -21, -13,
-    -16, -15, -31, -15, -18, 9, 3, 13, 14, 13, -9, 0, 19, 20, -9, -86,
-    -74, -5, 9, 31, 8, 5, -4, 7, 3, -2, 5, -8, -19, -13, -19, -24,
-    -26, -7, 18, 19, 25, 12, -19, 12, 24, 3, -42, -79, -31, -3, -3, 23,
-    -3, 2, -28, 18, 17, -9, 6, -7, -18, -15, -9, -13, -1, -1, 26, 15,
-    12, -7, -21, 11, 12, -22, -53, -70, -21, -15, -2, -6, 4, 13, -25, 5,
-    14, 9, 21, 3, -10, -11, 6, -9, -2, 2, 11, 3, 14, -13, -27, 5,
-    0, -11, -51, -69, -17, 6, -3, -1, -2, 19, -28, -4, 21, 16, 14, -10,
-    -12, -9, -10, 1, 5, 13, 6, 11, 5, -11, -11, 11, -11, -23, -55, -47,
-    -16, 13, 20, 1, -3, 4, 21, -14, -6, 12, -9, -11, -32, -26, -21, -1,
-    4, 16, 2, 15, -10, -13, -5, -11, -19, -43, -47, -36, 2, 4, 16, 3,
-    -2, 4, 22, 8, 5, 24, 6, -12, -27, -29, -22, 7, -13, 9, 8, 8,
-    -19, -33, 1, -5, -9, -33, -29, -32, -25, -6, 10, 2, -4, -1, -16, -10,
-    10, 17, 15, 1, 16, 9, -5, -11, 6, 12, 20, 0, -8, -12, 4, 6,
-    -33, -46, -29, -27, -10, -11, 5, 5, 3, 0, -1, -10, -49, -28, -13, 7,
-    8, -15, -7, -5, -28, 1, 5, -5, -9, 24, 7, -2, -10, -23, -17, 2,
-    -9, 0, 3, 3, -2, 2, 0, -4, 17, 17, -12, -20, -14, 1, -1, -10,
-    -8, 25, 6, -10, -5, 22, 2, -1, -1, 6, -17, 6, 0, 1, -3, -2,
-    -2, 2, 0, 3, 2, 4, 1, 3, 2, 1, 3, -4, 13, 17, 10, 0,
-    3, -5, 0, 0, 4, 1, -4, 2, 3, 2, 4, 4, -1, 0, 0, -4,
-    -5, 7, 14, 6, 9, 6, 13, 0, 7, 11, -26, -9, 26, 16, 15, 24,
-    19, 12, 9, 6, 0, 1, 0, -3, 2, 3, 13, 3, 19, 24, 12, 10,
-    35, 53, 31, 18, 22, -17, 25, 13, -8, 4, 17, -13, 4, 11, 7, 1,
-    21, 6, 1, 4, 4, 3, 20, -23, -20, 47, 41, 14, 15, 17, 15, 46,
-    16, 9, 31, 29, 11, -11, -4, -6, -28, 8, -6, 19, 5, -22, -8, -2,
-    -1, 0, 38, -27, -5, 19, 20, 21, 33, 15, 40, 24, 12, 7, 9, 10,
-    12, 7, -5, -6, -2, -18, -13, -17, -7, -5, 7, 32, 0, 4, 34, 3,
-    17, -36, -5, 25, 0, -2, 11, 9, 13, 5, 15, 4, 13, 12, -11, 10,
-    11, 12, -8, -3, -13, 12, 9, 23, 1, 17, -14, 13, 2, -16, 0, 12,
-    -1, 16, 1, 2, 6, -2, 2, -4, 4, -4, -13, -3, -17, -11, -4, 1,
-    -22, -6, -6, 38, -5, 13, -16, 8, 32, 3, -1, 1, 16, 2, -3, -1,
-    3, 0, -10, -5, -11, -20, -8, -9, -14, -6, -3, -10, -9, -1, -4, 33,
-    -13, -23, -13, 21, 44, 6, 1, 5, -9, 7, 7, 2, 1, 12, 2, -14,
-    -4, -5, -10, 3, -2, -5, -6, -1, -33, -5, 12, -12, -8, -44, 6, 29,
-    16, 15, 6, -8, -13, -2, -10, -8, 4, 1, -5, -9, -3, -4, -10, 6,
-    16, 11, -2, 14, -31, -13, 4, -1, -11, -31, -15, 23, -3, 10, 12, -6,
-    -16, -18, -5, -6, 0, -5, 1, -13, -14, -6, 5, 9, 4, 4, -9, 12,
-    -18, -49, 3, 20, -19, -17, -12, 8, -2, -3, 7, 4, -5, 1, -11, -6,
-    4, -7, -4, -2, -11, -14, -14, 7, 6, 11, -9, -4, 5, 7, 13, -39,
-    -13, -12, -3, 21, -5, -2, 0, 4, 1, 2, 4, 1, -2, 2, -1, -16,
-    1, 8, -12, 7, 5, 8, 2, -2, 32, 10, -24, -24, -2, -9, -20, 14,
-    -31, -4, 13, -1, 10, -4, -7, 7, 13, 19, 4, 4, 9, -2, 3, 12,
-    0, 3, 16, 15, 19, 9, 25, 38, 3, -6, -33, 6, -48, 1, 17, -8,
-    -9, -12, -1, 14, 12, 16, 14, 14, 7, 4, 7, 9, -6, 0, -8, -19,
-    -14, 28, 52, 20, -5, -3, -18, 20, -28, 0, -7, -11, 1, -4, -6, 8,
-    9, 21, 25, 17, 20, -4, -10, 14, 1, -8, 3, -7, -2, 29, 28, 28,
-    -5, -9, 8, 19, -10, -9, 5, 15, 1, 15, 17, 16, 14, 17, 27, 9,
-    9, 14, -1, 7, -6, 5, 2, 8, -5, 60, 52, 26, 4, -9, 22, 12,
-    0, -2, 4, 5, -1, 2, 14, 14, 23, 29, 2, -10, 4, 6, 0, -3,
-    1, 20, 2, 0, -8, 35, -3, 13, -26, -4, 4, 19, 1, 9, 22, 2,
-    -16, -9, -6, -6, 18, 24, -3, 4, -7, 1, -9, -1, 3, 16, 7, 1,
-    6, 37, -16, 6, -9, -21, -27, -1, 11, 21, 5, 10, -19, -14, 4, -4,
-    -5, 8, 7, -8, -1, 6, -1, -10, -3, 1, 13, 6, -21, 16, 22, -23,
-    -2, -18, 4, 16, 16, 14, -5, 17, -6, -9, 12, 14, 7, 9, 11, 10,
-    -11, -9, -1, -9, 13, 11, 4, 2, -33, -18, 21, 1, -3, 14, 41, 20,
-    18, -12, 9, 16, 9, 4, 5, 15, 8, 14, 7, 1, -8, 9, 7, 16,
-    2, -8, 20, 25, -16, -22, 4, -4, -7, 4, 44, 20, 19, -5, 9, 10,
-    6, 12, 22, 22, 17, 9, -9, -8, -4, -4, 10, 0, -7, 5, 6, 5,
-    -6, -13, -18, 1, -2, -3, 27, 32, -8, -10, -22, 1, 17, 4, 6, 6,
-    0, -1, -11, -1, -4, -10, 12, 11, 7, 1, 10, 15, -11, -9, -25, 3,
-    5, 1, -16, 6, -28, -44, -12, -18, 0, -8, -17, 0, 1, 3, 10, 6,
-    16, -15, -6, 1, -13, -24, -13, -18, -11, -1, -5, 0, 1, -1, -2, -25,
-    -39, -25, 21, 11, -15, -23, -2, -15, -3, 16, 4, 14, 7, 16, 3, -4,
-    -6, -24, -49, -42, -43, 5, 4, -2, -4, -4, 3, -13, 37, 33, 17, -12,
-    -5, -20, -1, 4, -19, -31, -8, -40, -35, -17, -23, -34, -41, -18, -29, -3,
-    -4, -2, -2, 3, 0, 0, 2, 0, -13, -29, -6, 6, 0, -12, -40, -9,
-    4, -26, -13, -14, -22, -14, -5, -3, 13, -9, -8, -12, -1, 4, -3, 1,
-    3, 1, -4, -4, -2, -1, -2, -2, -4, 2, 0, 0, 11, 21, 20, 11,
-    -2, 4, -2, 4, 3, 3, 0, -3, 3, 3, -1, -4, 1, -4, -1, -1,
-    3, 0, 0, 4, 5, 5, 4, 22, 18, -10, -30, 27, 30, 25, 28, 26,
-    31, 16, 7, 2, 4, -3, -4, -3, 3, -1, 12, 5, 10, 5, 13, 17,
-    16, 29, 25, -8, -1, -12, 3, 44, 7, -20, -11, 49, 41, 49, 31, 25,
-    18, 7, 1, 5, -1, -4, 16, -23, -31, 6, -8, -20, -14, 23, 28, 15,
-    13, 27, 19, 4, 6, 10, 0, -8, -18, 3, 11, 18, -4, -30, -17, -3,
-    -2, 2, -11, -21, 28, -11, 13, 3, -4, -2, -24, -11, 16, 17, 12, 13,
-    10, 11, 5, 5, 10, -8, -8, -8, -34, -28, 0, 13, -4, -1, 20, -34,
-    10, -24, 12, 0, -20, -15, 3, 11, 9, 26, 18, 11, -3, 6, 0, 18,
-    12, 15, -5, -32, -19, 2, -3, 3, -4, -15, -6, 11, -15, -45, -21, -14,
-    -34, -27, 12, 2, 3, -6, -4, -1, 0, 6, 12, 22, 13, 10, 5, -7,
-    -37, 0, 1, 35, 3, -30, -8, -18, -19, -17, 6, -9, -23, -2, 2, -3,
-    -2, -3, -27, -4, -3, 17, 32, 13, 9, 8, 21, -5, -19, -2, -6, 34,
-    36, -17, 28, 32, -9, 3, 26, -9, -7, 6, 16, -13, -9, 2, 4, -4,
-    12, 19, 7, 22, 11, -5, 5, 13, -13, -23, -12, -14, 3, -5, 45, 11,
-    -17, -24, 5, -19, -18, -8, 2, -14, 2, 5, 4, 3, 0, -10, -9, 25,
-    41, 22, 1, 20, 6, -22, -20, 13, -1, -7, -21, -25, -40, -26, -16, 7,
-    -2, -8, -19, 4, 0, 6, 39, 30, -7, -13, 3, 7, 32, 13, 10, 20,
-    -16, -59, -19, 14, 4, -8, -24, -10, -69, -33, -17, 28, 14, 1, -12, -5,
-    -8, 17, 35, -2, -23, -22, -19, -7, 20, 17, -2, 17, 19, -5, 15, 27,
-    -3, -2, -22, -23, -49, -36, 19, 14, 0, 17, -4, 11, 0, 12, -1, -25,
-    -13, 7, -11, 1, 4, 17, 16, 27, 37, -7, 1, 46, 4, 2, 14, -35,
-    -42, -27, 23, 0, 15, 16, 15, 22, 15, 0, -6, 2, 14, -3, 2, 0,
-    -9, 8, 19, 35, 27, -3, 28, 48, 3, -7, 5, -50, -38, 25, 6, 11,
-    7, 3, 39, 32, 14, -1, -1, 9, -7, 0, 12, -4, 10, 14, 1, 3,
-    9, 16, 45, 38, 3, -6, -1, -43, -25, 22, -7, 10, 15, 32, 35, 25,
-    17, -1, -3, 2, -4, -8, 1, 8, 4, 20, 7, -6, 10, 22, -5, 10,
-    1, -3, -1, -44, -21, 4, 15, 28, 24, 56, 54, 25, -14, -26, -10, -7,
-    -11, 3, -5, -3, -5, 22, 4, 2, -17, 18, 42, 14, 4, -11, -17, -37,
-    -1, 7, 20, 22, 38, 64, 50, 12, -43, -43, -8, -4, -9, -14, -14, 1,
-    -2, 17, 3, 12, 10, 36, 38, 35, 25, -17, -30, -35, 8, 0, 19, 26,
-    41, 70, 40, -43, -94, -46, -19, -22, -23, -10, -10, -17, -11, -2, 9, 44,
-    30, 35, 14, 25, 2, 23, -14, -31, 19, 5, 10, 19, 37, 61, 28, -77,
-    -97, -36, -21, -13, -10, -17, -27, -16, -14, 22, 45, 35, -1, -13, 21, 3,
-    2, 22, 19, -7, 17, 2, -4, 17, 28, 34, 22, -46, -55, -35, -30, -19,
-    -48, -51, -30, -21, -5, 26, 24, 16, -30, -23, -5, -1, 1, -1, 33, 23,
-    18, -6, 20, 29, 23, 38, 40, 9, -28, -32, -42, -37, -33, -22, -19, -11,
-    -19, 2, 0, -5, -25, -37, 7, 4, -1, -6, 26, 15, 1, 19, 35, 28,
-    19, 42, 41, 18, 10, -14, -34, -26, -12, -23, -18, -19, -29, -22, -39, -46,
-    -47, -17, -41, 11, -2, -3, -33, -16, -25, -8, 13, 22, 35, 36, 27, 20,
-    5, -3, -28, -36, -27, -34, -42, -25, -33, -44, -44, -41, -34, -22, -33, 3,
-    -4, 2, -26, -31, -35, -12, 14, 11, 30, 32, 36, 41, 22, 4, -23, -22,
-    -15, -33, -29, -25, -50, -62, -54, -43, -11, 1, 26, -3, -2, 0, 2, -5,
-    -34, -55, 15, 19, 29, 53, 63, 38, 5, 16, -2, -18, -17, -33, -40, -29,
-    -35, -30, -63, -45, -33, 25, 25, 0, 2, 2, -2, 18, 33, -16, -17, 10,
-    3, 18, 18, -4, -32, 5, -14, -30, -12, -33, -40, -20, -7, 26, 18, 16,
-    23, -1, -1, 0, -5, -2, 0, 3, -2, 7, 20, 26, 29, 25, 17, 6,
-    -2, -2, 16, 12, 26, 22, 6, 18, 42, 32, 31, -3, -4, -1, -5, 1,
-    -4, -2, -4, -2, 0, 0, 4, -3, 1, -4, 4, 1, -2, 4, 7, 5,
-    -4, 3, -1, 3, 1, -1, 5, 2, 0, 3, 3, -1, -3, -1, -4, -2,
-    0, -4, -8, -7, -8, -17, -40, -39, -25, -23, -24, -27, -15, -2, -7, -1,
-    -3, -6, 3, -4, -2, 3, 1, 0, -2, -1, -4, 4, -19, -21, -9, -17,
-    0, -3, 13, -5, 22, -16, -25, -45, -43, -39, -5, -27, -18, -26, -22, -17,
-    -14, 1, 0, -3, -3, 0, 3, 6, -6, 15, 4, 4, 35, 43, 58, 39,
-    41, 33, 23, 23, -9, -24, -61, -31, 3, 4, -19, -12, 20, 7, 15, -3,
-    4, 0, 9, 16, -6, -22, 6, 22, 6, 29, 29, 39, 42, 12, 7, 11,
-    -8, 11, 19, 6, 3, 1, 0, -12, 40, 35, 36, -9, -3, 2, -10, 9,
-    1, 4, 25, 12, 24, 27, 10, 25, 17, 17, 12, 3, 5, 2, 14, 2,
-    1, 6, 19, 1, 20, 41, 16, -11, -2, 10, 9, -1, 25, 21, 27, 14,
-    27, 29, 1, 12, 13, 20, 9, 6, 18, 3, 14, 15, 19, 24, 27, 25,
-    42, 38, 23, -8, 2, 28, 26, 2, 1, 17, 36, 24, 6, -4, -11, 2,
-    9, 8, -7, 3, 20, 13, 8, 21, 19, 1, 7, 6, 13, 8, -5, -12,
-    -37, 27, 21, -11, -17, 8, 4, -6, -13, -9, -4, -3, 14, 5, 16, 23,
-    3, -3, 17, 12, 21, -5, 18, 6, -5, -22, -31, -1, 6, 33, 19, -5,
-    -22, 7, 3, -10, -10, 3, 1, -20, 9, 8, 19, 4, -5, -1, 8, 10,
-    20, 0, 26, -8, 7, -8, -35, -2, 12, 7, 22, 20, -7, 14, 21, -13,
-    -5, -3, 6, -6, 9, 18, 13, 2, 1, -3, -11, 8, 11, 9, 7, -12,
-    -2, 23, 2, -2, 1, 5, 18, 19, 4, 4, 10, 4, -14, -2, -1, 19,
-    24, 10, -8, -6, -14, 16, 14, 11, 19, -24, -3, -8, -1, 7, 1, -16,
-    6, 15, 10, 10, -1, 15, -4, -13, -3, -6, 8, 5, 15, 0, -18, -19,
-    -18, -14, 22, 28, 16, -28, -37, -18, -16, -22, 22, -19, 0, 12, 19, 12,
-    -5, -14, -20, -7, -3, -8, 8, 7, 3, 2, 0, -9, -7, 0, 13, 5,
-    -2, -17, -26, -33, -9, -28, 8, -19, 1, 9, 11, 23, 0, -55, -36, -11,
-    -30, -18, -10, -2, 3, -3, 5, 8, -18, -2, 12, 9, -10, -2, -2, 22,
-    8, -2, 4, -18, 6, 5, -8, 32, 12, -48, -29, -56, -69, -37, -23, -25,
-    -11, -6, 4, 24, -6, -2, -3, 6, 12, 15, 12, 18, 19, -2, 40, 28,
-    0, 5, 6, 20, 10, -26, -36, -54, -45, -41, -43, -44, -31, -7, -5, 15,
-    8, 11, 12, 10, 8, 15, 25, 0, 13, -9, 27, 29, -2, 7, 4, 18,
-    -7, -20, -19, -48, -30, -29, -53, -41, -46, -41, -30, 1, 9, 15, 12, 4,
-    3, 1, 2, 8, 23, 57, 48, 22, -4, 8, 6, 38, -7, 17, -5, -28,
-    -4, -13, -4, -2, -41, -36, -17, -4, 11, -3, 3, 12, 7, 11, 15, 14,
-    41, 43, 41, -8, -15, 9, -10, 23, -5, 24, 9, -8, 10, 6, 12, 10,
-    7, 17, 11, -6, -8, 4, -8, -4, -2, 5, -8, -8, 26, -3, 3, -10,
-    4, 0, -31, 1, -15, 20, 21, 15, 19, 4, 18, 26, 19, 29, 4, -11,
-    -7, -4, -16, -3, 1, 1, -4, 1, -18, -31, -3, 4, -10, -3, -20, -23,
-    -12, 13, 10, 22, 20, 15, 21, 20, 25, 17, 3, -1, -1, -1, -6, -12,
-    0, 3, -4, 8, -8, -23, -25, -4, -11, -5, -2, -10, 13, -6, 13, 28,
-    26, 12, -2, 3, -5, -7, -9, -8, -3, 22, -2, -4, -7, -23, -10, 3,
-    -4, -13, -39, -3, -4, 2, 36, 21, 19, 17, 13, 11, 1, 7, 8, 10,
-    -26, -12, -4, 2, 1, -1, 0, -28, -29, -23, -40, -19, 29, -19, -30, -3,
-    4, 1, 31, 39, 34, 30, 29, 33, 21, -2, -18, -15, -26, -18, -13, -21,
-    -29, -14, -25, -30, -42, -37, -9, -13, -4, -19, -22, 3, 1, 3, -7, -6,
-    39, 41, 24, 22, 25, 13, 32, 61, 31, 8, -8, 4, 12, -13, 0, 6,
-    -5, 4, 16, 9, 21, -8, -3, -4, 2, -3, -3, -3, -44, -27, -4, 34,
-    40, 11, 23, 22, 27, 45, 21, 42, 42, 15, 10, 30, 29, 13, 0, -1,
-    4, -1, -5, -1, 0, 0, 4, -2, 12, 8, 7, 7, 10, 24, 19, 2,
-    3, 19, 4, -14, -3, 28, 11, 12, 6, 3, -10, 4, 2, -3, -4, -2,
-    -3, -3, -1, 5, 3, 4, 1, 0, 2, 1, 1, 3, -4, -5, -1, -4,
-    4, 1, 3, 4, -1, 4, 2, -4, -3, 4, -4, 3, -1, 3, 2, 0,
-    -4, 0, -11, -9, -12, -10, -12, -17, -16, -6, -9, -11, -23, -20, -6, -7,
-    -3, -3, -4, -7, 4, 3, 2, 4, -1, -1, -1, 4, 2, -3, -9, -10,
-    -4, -9, 3, 4, -6, -29, -28, -13, -13, -8, -25, -17, -16, -10, -8, -4,
-    -1, 2, -4, 2, -4, -1, 2, -1, -1, -10, -8, 19, 15, 25, -5, -9,
-    -26, -51, -62, -68, -63, -2, 33, 23, 11, -6, -6, -7, -6, 6, 1, -3,
-    -2, -2, -2, 28, 32, 15, 25, 33, -9, -42, -45, -31, -26, -22, -65, -34,
-    -16, -34, -27, -13, -34, 11, 5, -5, -8, -22, -18, -6, 1, -3, -7, -5,
-    7, 8, -7, 14, 10, 12, -11, 11, 0, -9, -2, -4, -7, -20, -7, -13,
-    -34, -9, 3, 3, 4, -8, -8, -3, -4, -12, 23, 35, 15, -4, 2, 7,
-    10, 22, 10, 17, 3, 13, 2, -6, -5, 9, -12, 3, -21, 1, -3, -12,
-    -2, -55, 1, -6, 0, 28, 37, 32, -3, -23, -10, 8, 17, 13, -1, 5,
-    12, 6, -3, -13, -12, 15, -8, 0, -18, -18, -26, 14, 11, -5, 19, -4,
-    -4, 32, 39, 18, 19, -5, -11, 14, 28, 20, 10, 21, 0, -10, 1, -2,
-    -6, 12, -2, -8, -12, -14, -5, -6, 24, 20, 10, -17, 14, 48, 29, -4,
-    13, -3, 3, 29, 6, 18, 20, 20, 14, -13, 12, 26, 19, 17, 1, -4,
-    -10, -12, 6, -1, 17, 1, -17, -2, 18, 15, 32, 4, -3, -3, 3, 8,
-    11, 5, 0, 2, -3, 11, 14, 25, 15, -3, -1, -2, 2, 3, 8, -11,
-    -10, 24, -35, -4, 9, 7, 47, 23, 16, 3, 0, 20, 31, 5, -4, -10,
-    -10, -11, 21, 14, 9, 8, 2, 12, 27, 6, 3, -20, -17, 9, -29, 30,
-    7, 6, 53, 8, -7, -18, 8, 5, 2, -18, -4, -21, -29, -2, 24, 40,
-    21, 7, 11, 7, 20, 2, -17, -6, -20, 7, -18, 28, 2, 16, 28, 6,
-    11, -17, 22, 29, 5, -25, -20, -25, -13, 15, 27, 35, 17, 19, 29, 22,
-    31, 5, -26, -17, -11, 8, -30, -35, 0, 5, -4, 8, -6, -43, -7, 32,
-    -6, -11, -13, -8, 12, 25, 22, 30, 8, 18, 41, 39, 30, -3, -29, -36,
-    -41, -6, -39, -21, 5, -2, -14, 7, 10, -36, -38, 3, -7, -3, 5, 15,
-    15, 1, 15, 16, 15, 28, 23, 29, 28, 18, -32, -29, -34, -23, 20, -17,
-    9, 0, -17, -29, 16, -15, -21, 8, 9, 12, 16, 20, 22, 11, 22, 21,
-    20, 10, 16, 18, 2, 11, -37, -24, -30, -37, -35, -31, -4, 9, -7, -33,
-    0, -8, -13, 1, -14, -20, 7, -17, -7, 5, 13, 18, 8, -5, -4, -5,
-    -20, -10, -25, -20, -14, 22, 13, -34, 22, 14, 19, -10, -34, -29, -19, -27,
-    -85, -72, -35, -12, -23, 0, -5, -2, -4, -18, -26, -25, -30, -20, -38, -42,
-    -61, 11, 39, 13, 6, 18, 20, 20, -42, -48, -43, -73, -104, -87, -66, -41,
-    -28, -19, -16, -10, -18, -31, -30, -40, -29, -28, -35, -34, -66, -15, -7, 26,
-    4, 11, 16, 33, -31, -35, -23, -36, -54, -47, -50, -38, -28, -18, -19, -21,
-    -23, -22, -32, -52, -47, -27, -18, -16, -22, 14, 1, -5, 2, 20, 26, 43,
-    13, -4, -9, -7, -12, 1, -1, 1, -15, -24, -18, -10, 3, -26, -25, -50,
-    -57, -24, -21, -11, 8, 12, 1, -1, 7, 12, 26, 25, 25, -3, 10, 8,
-    19, 15, 24, 6, -17, -23, -15, -5, -12, -13, -42, -42, -39, -35, -16, -2,
-    4, 19, 11, 2, -4, 5, -8, 24, -8, 10, 28, 35, 18, -2, 24, 9,
-    -20, -7, -5, -22, -26, -13, -9, -23, -21, -13, -13, 7, 20, 33, 5, 0,
-    4, 5, 19, 40, 37, 35, 40, 65, 38, 19, 0, -11, -26, -15, -5, -10,
-    -7, 2, 4, -10, -10, -3, 1, 4, -15, 12, 8, 1, -3, -5, 0, 11,
-    60, 82, -7, 11, 24, 16, -13, 2, -26, -21, -6, -15, 11, 9, 0, -21,
-    -32, -27, -26, -20, -24, 6, -5, -5, -3, -3, -3, 2, 39, 57, 63, 55,
-    43, 56, 52, 2, -5, 17, 52, 25, 40, 41, 24, 3, 6, 34, 21, 30,
-    21, 0, -2, 2, -4, 4, 4, 3, 10, 27, 16, 20, 24, 29, 38, 17,
-    11, 11, 44, 53, 42, 28, 18, 41, 30, 39, 40, 6, -1, -3, 0, -3,
-    3, -1, -1, -4, 3, -3, -3, -1, -2, 5, -4, -2, -12, -6, -7, 1,
-    4, -4, -4, 4, 1, -1, 0, -3, -3, 2, -3, 0, 0, 2, -1, -3,
-    -1, -3, -4, -6, -7, -16, -17, -22, -30, -37, -14, -23, -18, -20, -11, -4,
-    -9, -14, -6, -10, 0, -3, 1, 2, -3, 2, -8, 1, -14, -19, -10, -16,
-    -25, -30, -44, -57, 13, 8, -22, -79, -92, -62, -36, -60, -34, -31, -22, -16,
-    10, 11, -2, 0, 0, -3, -3, -12, -12, 7, -10, 3, 40, 13, 35, 29,
-    21, 15, 20, 13, 3, -27, -38, -53, -29, 5, -36, -28, -27, -23, -18, 0,
-    4, 4, 17, 38, 21, -6, -6, 16, 18, 18, 36, 29, 33, 18, 16, 24,
-    11, -7, -15, -15, -21, -29, -39, -11, 41, 52, 35, 10, 0, -2, 10, 25,
-    24, -22, 4, 20, -2, -2, 10, 23, 30, 13, 22, 16, 10, 5, -18, -9,
-    -3, -27, -36, -41, -18, 33, 8, 9, -3, 11, -9, 1, 15, -16, 11, 15,
-    10, 5, 10, 8, 2, 6, 5, 7, 17, 1, -22, -22, -17, -11, -17, 8,
-    -26, -6, 3, 1, -4, 13, -18, -5, 24, 12, 17, 5, 23, 3, 2, 3,
-    11, 4, -2, 6, 8, 4, -13, -10, -8, -6, -6, -4, -4, -3, 5, -9,
-    -1, -28, 15, 25, 25, 6, 9, 8, 3, 7, 5, -8, 6, 14, 15, 15,
-    12, 4, -2, -12, -6, 4, 13, -11, -11, 29, 16, 12, -10, -41, 12, 18,
-    1, 9, 12, 5, 3, -1, -12, -5, 6, 17, 18, 6, 23, 15, -4, -5,
-    10, 12, 1, 11, -10, 3, 10, 9, -15, -24, -9, 29, -4, -5, 5, 3,
-    -21, -27, -7, -5, 9, 0, 15, -1, 3, 8, 0, -3, 4, 4, 27, 37,
-    -13, -41, 4, 23, -4, -11, -15, 24, -9, -17, 5, -3, -15, -24, -21, -11,
-    19, 2, 5, -4, -7, 6, 5, 1, 17, 7, 7, -1, 14, 14, 38, -23,
-    -10, -18, -5, 7, -4, 8, 5, 3, -24, -29, -2, 10, 7, 15, 9, 5,
-    0, 12, 3, 17, 15, 21, 15, 18, 18, -4, -16, -38, 1, -15, -37, -8,
-    -15, -13, 9, -1, 6, -7, 0, 15, 11, 25, 19, 15, 12, 15, 14, 23,
-    9, 13, 20, -6, -29, 3, -8, 10, -1, 8, -40, -18, -45, -15, -8, -11,
-    -13, -13, -8, 3, 20, 21, 28, 29, 16, 24, 9, 10, -5, 7, -4, -33,
-    -34, 32, -51, -16, -2, 12, -21, -7, -18, -27, -17, -38, -22, -15, 2, 9,
-    13, 18, 38, 24, 22, 2, -3, 6, -7, -4, 2, -9, -12, 13, -49, -6,
-    -6, 9, 5, 6, -6, -27, -16, -10, -14, -2, 4, 2, 18, 11, 8, 0,
-    -14, -3, -2, -15, -17, -17, -13, 5, -5, -16, -41, -17, 2, 8, 8, 15,
-    5, -22, -16, 7, -9, -10, -16, -6, -3, 1, -13, -18, -5, 3, -9, 6,
-    -15, -4, -9, 14, -8, -64, -42, -7, -1, 10, 2, 25, 0, 11, 11, -21,
-    -5, -16, -16, 3, -6, 3, -16, -21, -12, -6, -8, 10, 9, -5, 3, -1,
-    -8, -40, -43, -26, -9, 22, -21, 14, 4, 20, 1, 1, -7, -22, -4, -23,
-    -16, -5, -9, -26, -3, 1, 13, 10, -1, -3, -5, -4, -29, -32, -16, -27,
-    -1, 19, -32, 6, 23, 6, -4, 13, -5, -4, -5, -11, -17, 5, -5, -16,
-    -12, -9, 7, 9, 2, -1, -4, -8, -40, -60, -18, -4, -7, 3, -12, -5,
-    17, -11, 9, 14, 4, 1, -6, 8, -5, -4, -13, 1, 0, 2, -2, 13,
-    -4, -18, 3, -14, -68, -35, -29, -6, -9, 5, -15, 0, 16, -12, -6, 4,
-    -9, -7, 3, 16, 10, -1, 8, -2, 0, -2, 7, -10, -16, -9, 5, -9,
-    -18, 5, -34, 0, 3, 1, 29, 27, 4, -11, -31, 0, 14, 1, 9, 12,
-    -3, 9, 3, 6, 1, -2, 14, -15, -11, -10, -2, 10, 7, 17, -27, 0,
-    -2, -4, -1, 26, 15, -9, 7, 21, 24, 13, 4, 14, 9, 17, 15, -3,
-    8, -12, 4, -2, 2, 1, 4, 11, -30, -25, -27, -4, 3, -4, 11, -23,
-    -17, 17, 27, 29, 21, 18, 29, 14, 5, 29, 16, -4, 3, 6, 14, 17,
-    -5, -26, -37, -27, -30, -5, -15, -4, 4, -2, -3, -8, 47, 46, 39, 6,
-    17, 8, 19, 22, -5, -4, 21, -13, 9, 38, 20, -23, -28, -6, -6, -7,
-    9, 0, -4, -4, -2, 0, 3, -3, -12, -22, 9, 16, 7, -9, -21, 11,
-    10, -28, -4, 22, -4, -23, -9, 9, -5, 0, -1, -5, 2, 1, 2, 1,
-    -1, -4, -2, -4, -3, -1, -3, 0, -5, -1, -3, -1, 9, 4, 15, 8,
-    2, -1, 0, 0, 1, -1, 0, -5, 2, 2, -2, -2, -2, 1, 1, -4,
-    -4, -1, 4, 11, 10, 12, 9, 28, 24, 11, -24, 11, 17, 11, 19, 28,
-    27, 8, 7, 6, 1, 1, 2, 1, 0, 2, 19, -2, 15, 9, 11, 15,
-    32, 38, 43, 27, 30, 14, 39, 26, 0, -20, -15, 17, 22, 15, 9, 13,
-    13, 1, 4, 4, -1, -3, 16, -21, -26, 13, 14, -10, -3, 6, 23, 19,
-    -9, 14, 36, 27, 30, 24, 14, 12, 2, 12, 5, -7, -26, -22, -23, 4,
-    -2, -3, 31, -15, 35, 10, 1, 10, -6, -12, -35, -13, -14, 2, 10, 36,
-    49, 53, 44, 27, 25, -5, -1, -38, -70, -55, -36, 6, -2, 0, 38, -22,
-    3, 0, 8, 12, 2, -18, -18, -44, -34, -13, 1, 9, 19, 25, 32, 28,
-    11, 14, -3, -11, -40, -68, -33, 1, 3, -2, -13, -11, -6, 16, 10, -3,
-    -23, -26, -25, -15, -6, 0, -9, -1, 7, 22, 15, 24, 30, 26, 19, -12,
-    -31, -71, -45, -11, 4, 3, 1, -19, 14, 21, 19, 5, -30, -8, -3, 18,
-    11, 7, -5, 9, -2, 6, 34, 29, 22, 24, 25, -3, -7, -36, -40, -10,
-    32, 3, 17, 20, 19, 6, 12, 8, 2, 0, -4, 6, 12, 7, 6, -8,
-    -15, -5, 21, 33, 22, 13, 13, -1, -1, -24, -28, -21, 8, 5, 32, 28,
-    10, 3, 10, 8, -11, -14, -10, 1, 10, 14, -12, -36, -45, -43, -15, 30,
-    38, 10, 10, 20, -10, -35, -38, -20, 2, 1, 12, 5, -21, 13, 7, -1,
-    -24, -16, -19, 12, 10, 3, -11, -30, -40, -25, -20, 0, 10, 22, 40, 34,
-    -3, -19, -55, -20, 1, 2, 16, -15, -16, -11, -10, 3, 3, -7, -8, 20,
-    14, 9, -23, -44, -49, -47, -33, -18, -13, 13, 25, 38, 44, 4, -45, -3,
-    2, 3, 3, -18, -4, -23, 6, -8, -3, 8, 14, 31, 15, -15, -26, -53,
-    -59, -40, -25, -22, -24, -9, 13, 39, 34, 0, -36, 3, 3, 6, 3, -16,
-    -6, -14, 5, 3, 12, 13, 14, 10, -12, -21, -21, -29, -46, -38, -12, -15,
-    -11, -9, 9, 30, 19, 15, -20, 15, -2, -10, 4, -21, -6, 10, 2, 15,
-    6, 10, 1, 11, 8, 1, -11, -16, -36, -21, -3, 1, 5, 23, 9, -3,
-    8, 20, 19, 5, 5, -11, -6, -7, -15, 8, 9, 26, 9, -3, -15, -4,
-    -2, -1, -5, -13, -18, -5, 0, 8, 9, 22, 15, 4, 32, 24, 39, 7,
-    0, -8, -3, -8, -2, 6, 14, 23, 1, 5, -10, -13, -22, -22, -26, -32,
-    -15, 13, 4, 0, 13, 20, 6, 8, 21, 41, 60, 9, 3, -5, -6, -22,
-    -8, -3, 1, 18, -3, 9, -4, -28, -25, -21, -31, -15, 14, 16, -5, 10,
-    11, 7, 1, -1, 8, 34, 27, 7, -4, -6, -7, -33, -32, -26, -5, 14,
-    26, 30, -3, -29, -22, -24, -26, 13, 16, 18, 11, 4, -5, -12, 0, 13,
-    13, 22, 3, 10, -11, 3, -1, -21, -22, -19, -4, 14, 24, 39, 22, -1,
-    -4, 1, 4, 8, -5, 13, -14, -2, -7, 1, 11, -18, -16, 4, 12, 0,
-    2, 9, 17, 6, -12, 2, 4, 1, -4, 15, 20, 16, 8, -7, -4, -9,
-    -15, -4, -9, -2, -12, -6, -7, -30, -15, -16, 4, 4, -5, 15, 32, 41,
-    13, -3, 12, 2, -1, -6, 9, 10, 16, 4, -5, -7, -1, -1, -4, -9,
-    -39, -31, -5, 12, -15, -17, 1, 4, -6, -4, 49, 33, 8, 16, 17, 8,
-    18, 14, 24, 10, 20, 10, 3, 3, 10, 11, -9, -18, -34, -18, 3, -8,
-    -33, -19, -6, 1, 0, -2, -5, -6, -8, 4, 10, 25, 25, 6, 14, 8,
-    -4, -1, -1, 6, 5, 4, -22, -20, -24, -18, -2, -15, -25, -20, -14, 4,
-    -4, 1, -10, -10, 5, 6, 1, 5, 18, 37, 15, 5, -4, -5, 10, 24,
-    13, -20, -30, -50, -28, -28, -1, -1, 9, 9, 1, -2, -4, 4, 10, -12,
-    -4, -18, -5, 8, 26, 42, 49, 31, 1, 9, 22, -10, -11, -29, -22, -19,
-    -20, -16, -21, -10, 1, 1, 1, -1, -2, -3, -2, -5, -23, -31, -20, 2,
-    23, 22, 23, -13, -39, -35, -32, -31, -30, -27, -21, -6, -12, -10, -2, -23,
-    -10, 1, 4, 2, 2, -2, 3, -2, 0, 8, 23, 24, 30, 26, 6, -1,
-    -3, -3, -3, 5, 9, 3, 2, -2, -5, 0, 1, 7, 5, 2, 2, 4,
-    4, 0, -2, 1, 0, -4, -1, -5, 3, -4, -5, -4, -7, -7, -3, 0,
-    3, 1, -3, 2, -5, -1, 3, 1, -4, -2, -4, 4, -2, 3, -2, 2,
-    4, 0, -6, -9, -15, -13, -35, -28, -26, -19, 24, -11, -19, -34, -29, -24,
-    -24, -19, -10, -7, -5, 3, 0, 4, -3, -1, -2, 2, -13, -11, -25, -37,
-    0, 25, 19, 22, 36, 22, 19, 42, 52, 27, 2, -9, -33, -46, -39, -28,
-    15, 19, -3, -2, -3, 3, 3, -20, -23, 14, 17, 19, 24, 17, 46, 38,
-    13, 9, 20, 26, 24, 4, -10, -11, -4, -11, 3, 1, 17, 42, -2, 4,
-    -3, 3, -14, 31, 22, 21, 13, 1, 23, -3, 26, 27, 21, 19, 19, 9,
-    22, -3, -6, -22, -31, -38, -37, -39, -3, 15, -16, -7, 3, 3, -27, 14,
-    21, 17, 21, 18, -3, -16, -5, -9, 16, 15, 10, 10, 20, 11, 1, 4,
-    -23, -54, -45, -55, -29, -12, -14, 0, 2, 0, 1, 29, 16, 15, 1, -11,
-    -25, -25, -17, -13, -8, 11, 8, 7, 15, 11, 4, 20, -20, -57, -90, -64,
-    -45, -34, -18, -5, 3, 25, -12, 35, 38, 16, -5, -17, -39, -17, -5, -3,
-    -4, -9, 2, 0, 17, 20, 6, 10, -14, -60, -94, -60, -63, -43, -13, -21,
-    1, -5, -3, 16, 45, 22, -12, -2, -22, 7, 4, -17, -29, -25, -16, 12,
-    29, 24, 15, 9, -47, -59, -53, -52, -67, -38, -18, -10, 3, -4, -14, -18,
-    35, 35, 21, 9, -11, -3, -45, -43, -26, -12, 10, 24, 46, 39, 14, -17,
-    -69, -65, -42, -57, -64, -29, -17, -39, 4, 6, 1, 10, 16, 8, 6, -5,
-    -37, -35, -35, -17, -6, 10, 25, 31, 32, 19, -11, -12, -57, -48, -39, -25,
-    -46, 22, 38, -2, -1, 19, 16, 14, 27, -8, -17, -18, -11, -11, -5, -1,
-    20, 24, 47, 36, 2, -26, -50, -34, -36, -37, -22, -12, -34, 17, 37, -18,
-    -4, 19, 18, 10, -12, -27, -30, -17, -7, 8, 8, 6, 24, 37, 31, 11,
-    -19, -40, -45, -34, -31, -25, -9, 0, 13, 54, -4, -20, 1, 10, -2, 4,
-    -51, -32, -6, -29, 5, 10, 7, 10, -2, 21, 24, 1, -10, -19, -25, -15,
-    6, 5, 1, 3, 19, 45, 15, 24, -2, 2, -8, 28, -56, -37, -1, -8,
-    12, 17, 4, -9, -11, 7, 22, -3, -4, -4, -12, 10, 4, 33, 19, 2,
-    3, 24, 29, 2, 1, 2, 4, 18, -42, -31, 25, 26, 21, 24, 3, 5,
-    -7, 28, 29, -5, -2, -2, 2, 28, 23, 33, 17, 15, 0, 0, 52, 37,
-    2, 6, 12, 8, -21, -18, 33, 48, 22, 27, 1, -2, 14, 41, 20, -3,
-    -3, -3, 15, 20, 20, 37, 11, 21, 22, 6, 68, 3, -1, 4, 21, -10,
-    -23, 6, 20, 35, 7, 8, -12, -9, 10, 41, 5, 0, 10, 1, 1, 12,
-    5, 44, 25, 12, 4, -4, 17, -25, -19, 14, 22, -18, -10, 24, 26, 16,
-    -9, -5, -20, -16, 3, 29, -28, -8, 9, 14, 2, 1, 13, 36, 40, 28,
-    12, -8, 16, 40, 14, -22, -32, -13, -4, 21, 7, 4, -34, -8, -5, -28,
-    -46, -26, -26, -13, 10, 19, 1, 2, 3, 19, 25, 28, -11, 5, 37, 12,
-    2, -25, -32, -5, -23, -8, 15, -7, -28, -7, -10, -15, -26, -25, -15, -8,
-    8, 15, 23, 1, 3, 5, 17, 22, -9, -29, 34, -2, 8, 7, 37, 3,
-    -27, 13, 14, -4, -11, -12, -11, -16, -17, -14, -14, -2, 10, 3, 4, 2,
-    -12, -26, 11, 10, -43, -27, -8, -2, 2, 14, 29, 6, 0, 8, 25, 8,
-    -17, 0, -2, -7, -18, -8, -9, -10, -12, -7, -8, 3, -5, -6, 1, -21,
-    -30, -35, -18, -6, 4, -2, 3, 29, 14, -13, -10, 23, -11, -5, 6, 4,
-    -7, -8, -11, -6, -24, -21, -1, 18, 2, -34, -32, -26, -44, -28, -11, -1,
-    3, 4, 3, 16, 4, -21, -1, 24, 26, 29, -4, 4, -7, -3, -1, -23,
-    -22, -6, -8, -4, -1, 1, -30, -41, -26, 16, 7, -4, 0, -3, 6, -11,
-    24, 19, 36, 24, 25, 32, 7, 1, 9, -5, -12, -22, -50, -11, -5, -22,
-    14, 0, -22, 13, -6, 4, 4, -1, -3, 0, -4, 3, -5, -8, -15, -39,
-    -10, -41, -26, -8, -23, 1, -6, -7, -7, 18, 12, -27, -36, -28, -23, -9,
-    -3, -2, -2, 4, -2, -1, -2, 0, 0, -2, -26, -23, -23, -27, -15, -22,
-    -32, -6, -36, -8, -7, -34, -36, -14, 2, -7, -5, 2, 4, 3, 2, 0,
-    5, 2, 2, -1, 1, 4, 4, -2, -3, 4, 1, -4, 13, 9, -10, -1,
-    4, 2, 3, 1, 0, 1, -4, -1, -1, 0, -2, 1, 4, -1, -1, -2,
-    5, -1, 1, 2, 10, 11, 52, 22, 1, 29, 16, -9, -12, -12, 6, 15,
-    22, 11, 6, -1, -1, 0, 3, 4, -4, 2, 2, 3, 0, 14, 4, 9,
-    16, -3, -12, -13, -26, 0, 21, 13, -3, 18, 36, 14, -3, 10, 16, 1,
-    -13, -18, -1, -2, 1, -3, -6, -2, 8, 39, 35, 37, 51, 36, 21, 2,
-    -12, -22, -4, 3, -12, -18, -9, -30, -12, 34, 6, -4, -16, 21, 19, -1,
-    3, -3, 25, 34, 9, 5, -16, 15, 0, 10, 10, 2, -5, -26, -4, -15,
-    12, 14, 12, 1, 10, 16, -14, 14, 49, 63, 38, 15, -2, 4, 19, -11,
-    -17, -3, -15, 0, 26, 26, -6, -7, -5, -20, 3, -19, 1, 4, -25, -7,
-    11, 5, -16, -14, 24, 45, 24, 22, -4, 0, 34, -20, 33, 23, -15, 6,
-    28, 15, -14, -15, 2, -19, -10, -7, -14, -9, -9, 3, 9, 10, 23, 28,
-    42, 24, 40, 4, 4, -4, 48, 6, 14, 22, 2, 22, 25, 14, 3, -18,
-    -16, -8, -14, -9, -3, 3, 1, 10, 7, 18, 15, 35, 3, -23, 61, 8,
-    -13, -3, 39, 39, 9, 17, 25, 42, 39, 21, -4, -10, 1, -8, -5, 0,
-    9, 5, 16, 16, 27, 32, 16, 13, -4, 2, 40, 11, 5, 4, 2, 1,
-    12, -1, 16, 15, 26, 17, -11, -3, -15, -27, -14, 11, 21, 21, 24, 19,
-    32, 45, -6, -3, 7, 14, 37, 13, 5, -7, -2, -8, 16, 3, 10, 3,
-    7, 17, 12, 8, -8, -25, -23, -7, -4, -19, -3, -5, 7, -2, -11, -25,
-    12, 4, 7, -8, 4, 2, -2, 6, 8, 24, 18, 3, 5, 25, 18, 21,
-    18, -30, -38, -23, -29, -47, -41, -39, -39, -23, -16, -21, -23, -1, -14, -24,
-    5, 0, 0, 16, -20, 7, 0, 32, 27, 16, 15, 15, 23, -4, -25, -28,
-    -41, -66, -67, -48, -26, -22, -27, -37, -13, -11, -28, -32, 0, -1, -6, 9,
-    -27, 8, 0, 17, 15, 16, 14, 19, 28, 6, -15, -17, -28, -50, -31, -13,
-    -14, -17, -25, -44, -16, -36, -47, -17, 3, -4, -12, 5, -15, 17, 14, -5,
-    9, 5, 9, 15, 15, -1, 4, -4, -9, -14, -8, -3, -29, -29, -29, -24,
-    -7, -63, -50, -10, -4, -2, -4, 20, -1, 10, 3, 0, 1, 8, 22, 10,
-    11, 3, 20, 2, 2, 6, 11, 3, -9, -25, -1, 9, -37, -48, -23, -29,
-    -9, -1, -22, 27, -14, 10, 0, -20, -21, 4, 5, 8, 29, 24, 17, 32,
-    32, 22, 14, 13, -2, -2, 8, -11, -48, -24, -55, -27, -1, -3, 1, 14,
-    -16, 3, -3, -27, -31, -10, 5, 17, 16, 26, 15, 39, 38, 17, 11, -1,
-    17, 17, 17, -17, -13, -4, 3, -29, -10, -13, -3, -3, -56, -24, -13, -36,
-    -16, -7, 10, 4, 33, 21, 13, 9, 21, -1, -4, 3, 22, 10, -18, -45,
-    -15, -14, 31, -26, -1, 9, -25, -6, -67, -38, -30, -27, -23, -3, 0, -5,
-    3, 12, 19, -1, 2, -3, -5, 13, 9, -8, -21, -24, -13, -33, -33, -12,
-    -3, 4, -18, -50, -70, -24, -21, -8, -6, 4, -5, -9, -14, 9, 3, 8,
-    7, 4, 1, 2, 1, -10, -1, -1, -16, -37, -37, 5, -5, -1, 0, -32,
-    -9, -6, -6, 6, 8, 1, -11, -13, -14, 1, 5, 3, 10, 16, -4, -14,
-    -7, -3, 19, 12, -24, -2, -4, -5, -3, -1, 0, 6, 11, -2, 1, 16,
-    5, 8, -2, -5, 1, -7, -3, -1, 14, 5, -1, 15, -6, -8, 5, -5,
-    -9, 1, 16, -3, -2, 2, 1, 27, 29, 25, 10, 9, 11, 10, 6, -12,
-    -15, 9, 7, 8, 12, -10, 16, 21, 21, -10, -5, -3, 1, 2, 8, 2,
-    -1, 3, 13, 32, -12, -1, -6, -16, -10, -8, 0, 22, 11, 12, 3, 5,
-    26, -12, -8, 19, 15, -13, -14, -6, 7, -31, -25, 1, -4, -3, -17, 20,
-    -3, 2, 6, -7, -30, -7, 6, 7, -14, 13, -4, 32, 28, 18, 27, 31,
-    2, 4, 19, 23, 26, -8, -7, 0, 2, -3, 0, -1, 6, 7, -3, -23,
-    -12, -27, -18, 15, 21, 0, -37, -8, -2, -27, -8, -2, -13, -16, -13, -18,
-    0, -1, 1, 0, 4, 0, -4, 2, 3, 7, -17, -19, -14, -20, -16, -21,
-    -25, 7, -30, -29, -29, -8, 1, -10, -8, -18, -26, 4, 4, 0, 0, 0,
-    2, 2, -4, -4, 0, 4, 4, 2, 1, 1, 4, 1, -2, -5, 0, -3,
-    -4, 3, -1, 1, 2, 0, -3, 0, 3, -3, 2, 1, 2, 0, -4, -4,
-    1, -7, -14, -14, -3, -8, -2, -7, -14, -23, -13, -1, -9, -6, -7, -8,
-    -8, 0, -7, 1, 1, 4, 3, -4, -4, -2, -3, 5, -5, -11, -8, -18,
-    -14, 9, 27, 23, 0, -58, -68, -42, -41, -67, -55, 16, 9, -1, 1, -8,
-    -4, 4, -2, 1, -4, -2, 0, -3, -15, 13, 9, -14, -4, -22, -4, -15,
-    -8, -3, -10, -38, -33, -21, -15, 14, 11, -5, -11, -6, -19, -24, -21, -4,
-    -1, -2, 14, 40, 24, 10, 9, -9, -7, -30, 3, 12, 5, -16, -17, -24,
-    -7, -8, -14, 13, -1, 12, 19, 3, -9, -26, -13, -3, -1, -1, 19, -15,
-    -16, 22, 31, 14, -29, -19, 4, -11, -1, -23, -19, -15, -10, 8, 3, 6,
-    4, 6, 32, 31, 19, -9, 19, 4, -4, 14, -1, -31, -21, -4, 23, 22,
-    3, 2, 28, 21, -7, -8, -26, -26, -11, -1, -5, 5, 16, 4, 10, 16,
-    12, -27, -2, -11, 1, 5, -8, -43, -2, -6, 9, 31, 21, 26, 25, 23,
-    5, -20, -23, -43, -13, 10, 12, 19, 7, 7, -2, -9, 4, -12, -21, -10,
-    -4, -15, 35, 1, -11, -20, -6, 11, 8, 16, -3, -1, 7, -14, -34, -39,
-    -5, 21, 29, 24, 18, 10, 7, -23, 14, 16, -32, -14, -3, 19, 42, 29,
-    -1, -21, 1, 19, 20, 18, -17, -14, -4, 0, -35, -28, 22, 36, 23, 16,
-    9, -9, 10, 13, -7, -30, -28, -7, -4, 22, 12, 42, 26, -4, -23, -13,
-    -13, -9, -16, -3, -4, -34, -65, -16, 20, 41, 18, 6, -8, -15, -1, 12,
-    -51, -9, -27, -4, -1, -8, -10, 11, 24, -3, -4, -19, -20, -15, -19, -25,
-    -8, -25, -22, -14, 16, 22, 7, 1, -4, -12, 3, -8, -41, -13, -11, -9,
-    7, -12, -3, -25, 2, 3, 10, -17, -38, -22, 8, 4, 11, 18, 9, 9,
-    21, 19, 5, -20, -4, 7, 28, 29, 13, 37, -6, -14, -4, -15, -18, -23,
-    12, 1, 1, -4, -7, -1, 9, 5, 7, -6, 11, 23, 15, 16, 8, -9,
-    -15, 23, 18, -16, -26, 6, -25, -3, -2, 7, -20, 6, 13, 18, -24, -7,
-    14, 27, 10, 12, 20, 17, 31, 31, 25, 26, 6, -22, -22, 17, 28, -18,
-    -31, -36, -28, -7, -3, 6, 45, 36, 26, 1, -12, -11, -8, 11, 32, 15,
-    17, 27, 31, 21, 23, 5, -7, -13, -4, 9, 30, 0, -31, -49, 17, 3,
-    -1, 13, 41, -3, -17, -18, -10, -16, -17, -11, -1, 3, 18, 27, 24, 27,
-    13, -2, 21, -17, -28, -5, -18, -26, -10, -52, -44, -8, -2, 13, 11, -8,
-    -29, -42, -28, -12, -35, -32, -39, -30, -29, -8, 13, 13, 15, 20, 9, -30,
-    -33, 25, 0, -17, -17, -2, 17, -5, -28, 23, 7, -9, -51, -51, -40, -39,
-    -64, -38, -42, -12, -38, -17, -9, 1, 21, 14, 2, -28, -15, 18, 10, -23,
-    -43, -5, 30, 25, 7, 5, 32, 26, -23, -30, -28, -41, -59, -39, -42, -38,
-    -57, -45, -4, 18, 25, 11, 11, -19, -3, 16, -12, -7, -60, -35, 0, 28,
-    -3, 9, 17, 33, 16, -6, -5, -12, -19, -11, -9, -21, -47, -36, -3, 15,
-    17, 20, 29, 1, -13, 10, -29, -33, -75, -42, -1, 4, 1, 9, 23, 25,
-    34, 33, 41, 20, 22, 1, 12, 4, -7, -6, -2, 10, 18, 15, 17, -4,
-    -3, 1, -41, -70, -34, -17, -1, 2, 0, 13, -15, 7, 35, 55, 46, 24,
-    13, 12, 5, 12, -13, -1, -5, 21, 22, 27, 20, 28, 12, 3, -37, -48,
-    -22, 7, 31, 4, -3, 2, 34, 10, 28, 55, 24, 29, 13, 3, 2, -9,
-    -27, -7, 7, 23, 22, 20, 23, 15, -11, -56, -58, -29, -24, 21, 29, 2,
-    0, 0, 23, 27, 20, 11, 10, -3, -1, 12, 12, -16, -21, -6, 5, 5,
-    13, 14, 25, -6, -29, -37, -14, 6, -21, -5, 7, 0, 1, 0, 5, -14,
-    -10, 3, -14, -21, 15, 14, -15, -22, 26, 33, -5, -31, -25, -32, -4, 5,
-    -19, -44, -18, 36, 21, 7, -4, 2, -5, -3, -2, -24, -45, -55, -56, -49,
-    9, -20, -28, -34, -45, -48, -10, -17, -32, -21, -15, -22, -40, -7, -20, -16,
-    -2, -3, -2, -1, -1, -1, 4, 4, 0, -4, -7, -13, -12, -9, -18, -10,
-    -27, -24, -30, 13, -18, -39, -32, -9, 2, 0, -4, -3, 0, 2, -4, -4,
-    0, -4, -2, 0, -2, -1, 1, -4, 1, -4, -5, 3, 0, -10, -12, -3,
-    -3, 4, -2, 0, 0, 0, 3, -3, 0, -2, -4, 0, -1, -4, 2, -4,
-    -4, 4, 14, 12, 11, 5, 28, 37, 26, 14, 40, 41, -10, -4, 15, 10,
-    12, 1, -1, -1, 0, -3, 4, 1, 0, 4, 0, 3, 9, 11, 20, 22,
-    40, 53, 72, 48, -12, 41, 53, 38, 39, 33, 39, 38, 17, -13, -12, -10,
-    3, -1, 2, -1, 1, -4, 5, -15, -15, -3, 8, 9, -5, 1, 3, -42,
-    -32, 17, 6, 14, 29, 36, 31, 9, -25, -14, 14, 47, 13, 27, -3, -2,
-    4, 2, 5, -12, -19, -15, -3, -17, 2, 0, -21, -32, -27, -15, 1, 16,
-    19, 9, 18, 46, 19, 17, 12, 11, -28, -9, -28, 0, 0, -1, 31, -25,
-    -4, 39, 19, -8, 25, 9, -11, -16, -26, -34, 12, 12, 11, 1, -6, 0,
-    18, 1, 3, 9, -13, 6, 2, 5, -1, 4, -8, -5, 5, 28, 5, 5,
-    15, -25, -17, 6, -3, -31, -25, 24, 37, 19, -6, -26, -12, 9, -12, -36,
-    -23, -6, 5, -6, 0, 5, 6, 0, 12, 30, 15, 20, -9, 27, 25, -9,
-    -21, -34, -7, 27, 40, 44, 14, -5, -20, -31, -9, -1, -12, -28, -6, 0,
-    45, 18, 17, 6, 2, 36, 31, 32, 20, 41, 20, -20, -10, -12, 17, 42,
-    30, 33, 7, -13, -5, -37, -20, 16, 8, -5, -15, -4, 10, 24, -21, -5,
-    0, 8, 19, 48, 36, 40, 25, -11, -18, -2, 26, 39, 23, 10, -2, -21,
-    2, -19, -16, 19, 19, 44, -22, 6, 14, 14, -11, -29, -6, -9, 8, 24,
-    26, 43, 28, -8, -22, -23, -6, 25, 3, 16, -17, -15, -7, -9, -7, -8,
-    15, 17, -12, -1, 4, 12, 32, -19, -17, 9, -3, 1, 14, 37, 16, -22,
-    -66, -52, -12, 0, 4, 9, -16, -8, -6, -13, -33, -23, 23, 0, -15, 4,
-    9, 13, 15, -31, -9, 7, 8, 9, 21, 28, 10, -23, -64, -55, -14, 10,
-    16, 5, -7, -19, 0, -25, -15, -18, 33, 16, 4, 10, -2, 12, 12, 7,
-    -11, 8, 12, 11, 28, 26, -4, -41, -94, -70, -8, 12, -12, -9, -21, -19,
-    -1, -13, -13, 16, 28, 16, 1, -3, 2, -4, 35, 26, -6, 40, 24, 22,
-    30, 18, -15, -44, -77, -35, 10, 8, -12, -19, -19, -24, -7, -14, -4, 19,
-    50, 0, 10, -1, 5, -6, 35, 11, -22, 28, 13, 32, 15, 11, -33, -71,
-    -80, -20, -5, 6, -16, -21, -8, -24, -8, -1, 1, 29, 29, 8, 17, -26,
-    3, -7, 22, 17, 6, 25, 8, 25, 32, 4, -58, -81, -65, -7, 24, 28,
-    -4, -24, -16, -7, 9, 22, -7, 16, 24, 9, 12, -20, -2, -6, 18, 7,
-    13, 35, 10, 7, 9, -10, -45, -62, -51, 6, 32, 22, -1, -23, -13, -9,
-    21, 32, 21, 27, 33, 26, -37, -28, 14, 23, 32, -12, -17, 21, 3, 16,
-    18, 8, -31, -63, -40, 16, 25, 8, -16, -17, 6, 4, 32, 34, 19, 25,
-    29, 19, -35, -23, 20, 25, 37, -20, -18, -6, 23, 17, 7, -1, -36, -33,
-    -26, 1, 19, 3, -1, 10, 7, 19, 32, 43, 26, 2, 16, -4, -31, 10,
-    2, 5, 36, 4, -19, -29, 8, -4, -12, -5, -9, -6, 17, 10, 20, 23,
-    15, 20, 31, 20, -5, 27, 0, -7, -16, -35, -28, 6, 13, -2, 12, 20,
-    -6, -10, -6, -9, -15, -5, 22, 31, 16, 11, 18, 14, 11, -7, -4, -17,
-    -9, 26, 2, -32, -44, -24, -8, 8, 15, 5, -17, -8, -1, 32, 14, -6,
-    -9, 5, 4, 9, 3, 16, 24, 17, 3, -6, -26, -27, -8, 23, 26, -46,
-    -61, -8, -9, 8, 0, 3, -9, -16, 17, 15, 48, 19, 3, 21, 4, -21,
-    4, 15, 18, 1, -14, -11, -33, -23, -17, 0, -24, -63, -53, -30, -15, 3,
-    4, -3, 21, 19, 30, 17, 16, 17, 17, 13, -4, -13, -2, 16, 2, -8,
-    -34, 10, -4, -23, -19, 13, -23, -48, -39, -19, 6, 2, 2, -1, -20, 11,
-    -7, -6, -7, 16, 40, 13, -34, -23, -4, -1, 21, 8, -22, 10, 29, -9,
-    -35, -20, -41, -50, -13, -21, -2, 4, -4, -4, -1, -4, 16, -9, -20, -14,
-    -12, -17, -34, -13, -10, 17, 1, -10, -8, 22, 51, 26, 3, -2, 4, -13,
-    -7, 3, -1, 0, -1, 3, 4, -4, 15, 24, 27, 13, 17, 13, 17, 6,
-    6, 49, -22, -19, -5, 21, 7, -5, 24, 39, 8, 36, 3, 1, 2, -3,
-    0, 4, 1, -1, -4, 2, -2, 2, 3, -4, -4, 2, -2, 3, -4, -2,
-    -4, 4, -3, 3, -4, 4, 1, -1, -1, 3, -3, -3, -2, 4, 1, 3,
-    -1, 2, 20, 18, 20, 3, -3, 8, 47, 24, -2, 16, 11, 6, 9, 0,
-    -2, -3, 16, 14, -3, 4, -3, 3, 3, -4, -8, 1, -6, -13, 13, 18,
-    -30, -53, -61, -41, -33, -11, -23, 15, 25, 12, -9, 12, 22, 21, 23, 23,
-    -15, -21, 5, 4, 2, 4, -10, 3, 6, -2, -13, 9, 31, 4, 18, 10,
-    22, 39, 22, 15, 4, -7, -13, -18, -15, -17, -15, -10, 0, -8, 0, 5,
-    4, 3, -1, 46, 21, -38, -25, -9, -18, 11, 13, 15, 2, -14, -21, -3,
-    -20, -26, -1, -3, -23, -12, -4, 4, 0, 1, 6, 3, 0, -5, 8, -4,
-    -24, -4, 2, -5, -16, 0, -13, -12, -15, -35, -36, -13, -18, -15, 11, 12,
-    2, -17, -13, -7, 15, 13, 21, 7, 5, -3, 15, -23, 12, 14, 14, 0,
-    -5, -9, 6, 11, -8, -7, 1, 9, -18, -11, 4, -15, -14, -15, -16, -13,
-    2, 5, 1, -4, 3, -3, 6, -27, -1, -12, 30, 27, -1, 17, 30, 26,
-    19, 31, 23, -5, -12, -22, -9, -9, -19, -28, -30, -37, -3, -20, -3, -4,
-    0, -3, 14, -18, -30, -19, 4, 3, 15, 18, 18, 30, 48, 41, 15, 6,
-    14, -3, 1, -4, -17, -23, -4, -31, -10, -31, -22, 7, 1, 0, 1, -3,
-    6, -1, 13, 14, 19, 22, 29, 37, 23, 38, 25, 14, 6, 3, 5, -12,
-    -17, -12, -17, -22, 4, 1, -16, 22, -3, -5, 9, 28, 8, 10, 21, 20,
-    28, 32, 32, 34, 11, 27, 16, 9, 11, 17, -7, -8, -3, -3, -6, -3,
-    -12, -14, 3, 16, 6, -6, 27, 32, 23, 2, 5, 13, 14, 1, 12, 13,
-    -7, 2, -15, -13, -9, 8, 2, -5, 2, -17, -23, 1, 14, -10, 21, -5,
-    6, -2, 15, 3, 20, 9, 24, 9, 4, -8, -8, -4, -14, -6, 1, -20,
-    -16, -14, 3, 0, 16, 6, 0, 33, -9, -2, -5, -35, -1, 6, 23, -5,
-    20, 2, 9, 9, -2, -5, 2, -13, -5, 7, 5, -25, -26, -21, -5, -8,
-    7, 18, 7, 9, 20, 6, -34, -35, 1, 3, 31, 3, 18, -11, -9, -2,
-    0, 3, 5, 3, 10, 12, -5, -9, -30, -29, 1, -10, 12, 21, 19, 57,
-    56, 7, -12, -23, -7, 8, -5, -27, -12, -13, 1, -12, -13, -4, -4, -3,
-    3, 0, 13, -2, -23, -7, 3, 3, 11, 28, 14, 43, 67, 11, -31, -40,
-    -7, 8, 18, -18, -28, -2, -4, -7, -12, -9, -13, -11, 3, 7, 2, -20,
-    -43, -31, 4, 12, 8, 17, 38, 47, 47, -16, -2, -33, -4, 11, 5, 3,
-    -37, -10, 1, 5, -15, -10, -7, 4, 13, 3, -5, -25, -43, -16, -8, 19,
-    10, 5, 31, 45, 35, -12, 11, -32, 3, 3, 7, 36, -23, -11, 10, -1,
-    -7, 1, 10, 2, -4, -22, -18, -25, -41, -13, -6, 34, 27, 8, 26, 25,
-    -18, -6, 11, -34, 4, 0, 36, 30, -15, -10, -14, -16, -2, 6, -16, -23,
-    -5, -35, -27, -22, -15, 6, 16, 37, 27, 11, 12, -4, 5, -8, -41, -10,
-    -2, -2, 11, 19, -3, 2, -20, -10, -11, -13, -26, -46, -43, -33, -19, 0,
-    7, 21, 11, 34, 3, 7, 11, 11, 9, 13, -43, 3, 3, 0, -3, -7,
-    -5, -19, -22, -5, -24, -28, -12, -12, -14, -13, -5, 14, 20, 2, 17, 3,
-    16, 11, -12, -22, -9, 14, 5, 9, 0, 4, -8, 8, 10, 10, -23, -17,
-    -17, -35, -24, -10, 1, -10, 4, 7, 12, 19, 12, 6, 11, -8, 10, 6,
-    -12, 2, 9, 1, 2, 4, 8, 18, -1, 17, 20, -16, 0, 0, -6, 12,
-    8, 1, 3, 4, 8, 20, 4, -16, -14, -14, 0, 11, 26, 16, 3, 5,
-    -4, -2, 9, 21, 42, 38, 33, 31, 20, 30, 36, 20, 11, 30, 20, 10,
-    4, 12, 11, -16, 9, 9, 15, 29, 14, -26, -23, 2, 2, 3, 8, 5,
-    41, 65, 50, 69, 48, 31, 21, 16, 53, 47, 17, 17, 38, 13, -3, 42,
-    32, 31, 29, 31, 43, -5, -20, 0, -3, -1, 2, 2, 13, 44, 47, 24,
-    9, 3, 39, 39, 39, 82, 91, 48, 71, 66, 39, 41, 66, 38, 53, 52,
-    10, 3, 1, -1, -2, 1, 4, 2, -2, -18, 7, 7, 6, -3, 4, 11,
-    23, 5, 37, 30, 43, 21, 19, 8, -4, 13, 18, -6, 2, 5, 1, 2,
-    -1, -3, -5, -1, -4, 2, 2, 3, 3, -1, -2, 1, 12, 7, -16, -7,
-    2, -3, 4, 5, -3, -5, 2, -2, -1, -4, -3, 4, 3, -2, -1, -2,
-    -2, 8, 21, 22, 15, 14, 30, 2, -1, -8, -6, -7, -17, -8, 10, 22,
-    32, 29, 26, 9, 5, 0, -2, 0, -2, 0, 8, 0, 15, 5, 16, 20,
-    3, -14, -11, 25, 22, -5, -16, -28, -11, 20, 11, 36, 24, 19, 45, 12,
-    -2, -7, 4, -3, 2, -1, 5, 40, 37, 32, 35, 40, 16, 2, -22, -48,
-    -50, -50, -32, -28, -26, -17, 10, 29, 30, 28, 14, 45, 38, -19, 1, 1,
-    0, -4, 5, 52, 37, 31, 12, 1, 8, 0, 19, -33, -31, -8, -10, -24,
-    -7, -9, 1, 13, 23, 55, 17, 44, 53, 19, 4, 24, 0, 2, 27, 29,
-    -7, 21, -5, 10, 4, 16, -2, -35, -20, -6, 10, 3, 13, 15, 4, 26,
-    16, 15, 27, 65, 59, 34, 35, 33, 2, -1, -12, -41, 15, 24, -5, -8,
-    1, -5, -20, -29, -11, 7, 4, 12, 1, -2, 5, 41, 28, -2, 4, 19,
-    52, 76, 57, 30, 0, 5, -18, -24, 12, 31, -13, 12, 1, -3, -11, -29,
-    -16, -11, 7, 6, 7, 18, 21, 41, 35, 11, -2, -2, 8, 11, 58, 34,
-    -6, -8, 20, -10, -9, 7, -11, -5, -3, 0, -31, -25, -7, -8, -27, -20,
-    -1, 24, 14, 20, 20, 21, -14, -5, -2, 2, 40, 7, -6, -5, -28, -53,
-    -12, -3, -12, -7, -1, -5, -40, -13, -6, -4, -3, -21, -9, 1, -4, -18,
-    -21, -23, -56, -64, -47, -11, -12, 7, -11, -3, -18, -19, -7, -3, -11, -11,
-    -2, 1, -8, -3, 8, 4, 12, -11, -12, -8, -33, -28, -62, -84, -108, -102,
-    -78, -19, -24, 4, -4, -1, -10, 3, -4, 12, 7, -2, 14, 10, 0, 5,
-    17, 4, 16, 14, 12, -13, -36, -46, -69, -92, -92, -90, -80, -49, -38, -7,
-    0, -4, -15, 26, -14, 11, 12, 2, 10, 7, 16, 8, 9, 21, 17, 14,
-    14, -12, -20, -33, -28, -52, -43, -27, -36, -57, -48, -17, 1, -10, -21, 34,
-    -2, 3, 27, 10, -8, -1, -6, -6, -3, 11, 13, 12, 5, -4, 1, 10,
-    14, 8, -1, 2, -25, -54, -52, -21, 3, 5, -19, 36, -3, 9, 33, 25,
-    10, -5, -12, -29, -8, -12, 8, -5, 1, 12, 15, 23, 23, 26, 20, 3,
-    -11, -32, -55, -14, -8, 13, 19, 12, 16, 2, 13, 26, 5, -4, 1, -13,
-    -23, -32, -2, 1, 1, 18, 21, 12, 21, 27, 26, 20, -12, -9, -16, -17,
-    -8, 12, 0, -2, 14, 18, 9, 15, 9, -1, 3, 3, -10, -18, -8, -1,
-    -5, -4, 13, 32, 17, 23, 18, 30, 29, 5, -61, -40, 3, 12, 7, 20,
-    27, 35, 17, 26, 22, 21, 17, 7, -11, -3, -9, -8, -12, -1, 7, 16,
-    20, 29, 31, 32, 20, -21, -45, -41, -29, 8, 10, 49, 28, 43, 39, 12,
-    -8, 10, -3, -7, 10, 19, 2, -16, -16, -8, -4, 3, 23, 24, 1, -2,
-    -1, -11, -42, -21, 7, -9, 4, 49, 9, 20, 19, 18, -16, -1, -11, 1,
-    -13, -10, -3, -5, 1, 1, -1, -6, 10, -4, -24, 2, 24, 25, -29, -18,
-    4, -6, -4, 21, -1, -14, 15, 4, -5, 2, -22, -18, -16, -4, 8, 5,
-    18, 15, 5, -5, 4, -4, -3, -4, 0, -12, -15, -2, 8, 4, 18, 27,
-    -14, -22, -1, -5, -7, -10, -13, 6, 7, -3, 14, 11, 15, 2, -10, 1,
-    22, -1, 5, -1, -9, 21, -3, -2, 3, 6, 4, -3, -22, -39, -30, -2,
-    -23, -9, 11, 30, 4, -4, -1, 17, 19, 5, 12, 20, 4, 4, 4, -2,
-    -7, 1, 21, 0, 0, -3, 11, 14, 24, -11, 1, 17, 3, 9, 18, 15,
-    6, 21, 21, 18, 5, -1, 31, 24, 16, -8, -17, -24, -24, -3, 21, -2,
-    -3, 0, 3, 22, -18, -26, 11, 27, 4, 1, -18, 3, 6, 22, 22, -15,
-    -3, 12, 37, 5, 4, -8, -15, -15, -4, -6, 4, -3, 4, -3, 3, 18,
-    -3, -8, 19, 21, -5, 25, -16, -9, 21, -4, -32, -24, -30, -7, 21, -1,
-    3, 17, 25, 35, 29, -1, 0, 1, 5, -4, 1, 3, 0, -9, -19, -41,
-    3, -6, -25, -17, -32, -67, -71, -63, -36, -41, -10, -10, -48, -32, -34, -50,
-    -25, 2, -3, -4, 0, -2, 0, -1, -4, -2, -16, -16, -20, -17, -15, -13,
-    -18, -10, -17, -19, -17, -29, -27, -16, 0, -27, -41, 9, 5, 0, -4, 0,
-    2, -3, 3, 2, -3, -4, 3, -3, -4, -1, -1, 3, 1, -1, -3, -3,
-    4, 2, 3, 3, -1, 2, -3, 2, 2, -2, -4, -2, 3, 4, -2, 0,
-    1, 0, 5, 1, 0, 1, -19, -18, -3, 3, 8, 26, 12, 7, -3, -3,
-    -10, 0, 0, 2, -4, -3, 3, -1, -3, -2, -1, 2, 4, -6, 5, 16,
-    -20, -29, -42, 6, 13, -1, -14, -4, 22, 28, 31, 24, 14, 0, 8, 14,
-    -9, -3, 1, 1, 4, -4, -2, 37, 40, 26, 12, -1, 11, -3, 3, -1,
-    19, 20, 23, 14, 30, 20, 24, 15, 64, 12, -31, -16, 8, 25, 37, 0,
-    3, 2, 9, 32, 22, 43, 23, 23, 23, 25, 22, 18, 4, 12, 4, 11,
-    16, 9, 11, 25, 5, 12, 3, -2, 24, 23, 25, 10, -3, 0, 21, 37,
-    8, 16, 4, 12, 1, 10, 18, -4, -19, -35, -1, 6, 9, 7, 7, 16,
-    11, -20, 12, 4, 17, 25, 19, 10, -2, 10, -14, -1, 2, -20, -7, -26,
-    -9, -4, -15, -23, -30, 0, 10, 10, 31, 19, 9, 12, 11, -13, 13, 23,
-    53, 18, 32, -2, 2, 10, -19, -7, -11, -12, -25, -34, -15, -22, -17, 4,
-    3, 6, 28, 31, 33, 22, -4, 21, -2, -19, -13, 14, 37, 15, 29, 3,
-    2, -7, -27, -30, -23, -5, 18, 2, 14, 4, 7, 2, -3, 3, 9, 15,
-    18, -6, -2, -4, -3, 1, 6, -2, 41, 5, 17, 5, -10, -14, -50, -19,
-    -28, -7, 29, 1, 20, 1, 9, 9, -12, -5, 9, 10, 5, -20, -12, -22,
-    -28, -33, -7, 14, 50, 26, -1, -6, -18, -8, -23, -20, -42, -7, 0, -3,
-    -1, 4, 2, 8, 24, 18, 38, 36, 13, 9, -7, -21, -19, -38, -5, 5,
-    23, 4, -8, -8, -5, -14, -19, -9, -33, -13, 3, 3, -6, -19, -6, -7,
-    14, 31, 41, 29, 7, 16, 24, -21, -19, -20, -24, -34, -37, -39, -11, -14,
-    -3, -15, -19, 4, -19, -9, -1, -12, -16, -4, -6, 3, 12, 34, 45, 14,
-    -7, 12, 13, -5, -13, -23, -24, -19, -40, -34, 13, 5, -3, -13, -19, 18,
-    3, -5, 11, -3, 0, 6, -11, -19, 2, 11, 23, 2, -5, 11, 2, -2,
-    -20, -8, -5, 11, 6, -4, 16, 8, 0, 11, -7, 8, 6, 3, 9, -1,
-    -4, -16, -49, -32, -5, -2, 5, -18, -2, 4, -11, 5, -3, 2, 10, 21,
-    18, -1, -27, -15, -8, 11, 10, -33, 22, -5, -7, -19, -22, -44, -71, -55,
-    -12, -18, -13, -17, -7, -5, -4, 2, 12, 13, 17, 52, 41, -2, 10, -7,
-    -9, 13, 8, -19, 31, 16, -10, -32, -26, -60, -65, -55, -37, -40, -25, -16,
-    -9, -10, 1, 1, 17, 7, 26, 61, 64, -40, -25, -12, 0, 12, -5, 29,
-    42, 18, 7, 6, -14, -45, -56, -57, -61, -45, -29, -23, -3, 7, -2, 17,
-    14, 4, 11, 41, 8, -75, -45, -5, 17, 10, -10, 46, 33, 36, 34, 28,
-    22, -23, -32, -21, -44, -25, -11, -3, 5, 3, -1, 1, -12, -16, -14, -16,
-    -43, -48, -36, -9, 14, -5, -16, 47, 28, 49, 41, 35, 42, 21, 5, -6,
-    -11, -8, -8, -4, -1, -2, 11, -23, -12, -18, -8, 4, -13, 1, -15, -14,
-    2, 0, -24, 16, 31, 44, 34, 19, 30, 51, 36, 23, 10, 16, -10, -16,
-    -5, 7, -8, -15, -20, 0, 11, 17, 15, -1, -6, 6, 19, -6, -27, -12,
-    0, 25, 12, 26, 16, 21, 19, 26, 30, 18, 8, 3, -7, -20, -20, -14,
-    5, -14, -13, -17, -17, -25, -4, -1, 16, 17, -30, -6, -8, 7, 0, 9,
-    2, -3, 13, 20, 20, 18, 6, 2, -8, -21, -19, 8, -2, -8, 4, 9,
-    -16, -19, -22, 2, 3, -3, 31, 23, -6, 23, 4, 13, -4, -6, 19, 28,
-    15, 1, -11, -2, -2, -12, 22, -6, -25, -20, -13, -14, 3, -14, -18, 3,
-    -4, 1, -4, 28, 3, 19, -1, 20, 2, 17, 11, 7, 14, -11, -19, -32,
-    -21, -35, -8, -33, -30, -5, -6, -18, -12, -15, -9, 4, -2, 4, 8, 2,
-    -8, 6, 8, 1, -13, -3, -15, -20, -24, 3, -2, -26, -1, -15, -14, -44,
-    -18, -22, -12, 3, 2, 1, 1, -3, -2, 1, 4, -2, -1, 2, -3, -45,
-    -46, -24, -10, -17, -12, -29, -13, -9, 3, 6, 7, -19, -18, -8, -16, -4,
-    -1, -3, 4, -5, -3, 1, -4, 2, 0, -9, -8, -18, -28, -37, -33, -25,
-    -29, -41, -6, 30, 23, -34, -53, -35, -1, -9, -8, -7, -4, 3, -1, -3,
-    -2, 1, -2, -3, 4, 2, 0, 3, -3, -3, 4, 2, 4, 1, -3, -3,
-    2, -2, -2, -1, 3, -3, 0, 1, -4, -4, 3, -4, -4, 1, 3, -2,
-    2, -2, 4, -2, -1, 4, 12, 2, -4, 4, 28, 11, -20, -16, -8, -19,
-    -23, 8, 7, 10, 1, 2, 4, 1, 0, -2, -5, 2, -2, 1, -7, -4,
-    -13, -29, -20, -28, -13, 30, 23, 14, 12, 3, 5, -9, -26, -22, 1, -27,
-    -26, -14, -1, 1, -2, -4, -2, -1, 2, -22, -25, -29, -41, -78, -71, -23,
-    2, 5, -1, 8, -6, 0, 18, -4, 10, 21, 6, -28, -32, 25, 16, 3,
-    -4, -3, -2, -7, -22, -2, -19, -45, -54, -25, -21, 2, -3, -11, -3, 0,
-    0, 2, 2, -16, -11, 12, 1, 27, 32, 49, 43, -17, 4, 1, -4, -6,
-    -31, -21, -22, -29, -23, -19, -13, 16, 25, 5, -1, -25, -17, 6, -19, -14,
-    -14, -16, -8, -27, 8, 28, 0, -12, 4, -10, 15, -13, 5, 1, -41, -45,
-    -4, -10, 21, 20, 13, -7, 3, -15, -22, -20, -10, -6, -1, -16, 4, 32,
-    31, 23, 29, -8, -1, -34, 5, -19, 2, -18, -37, -23, -17, 13, 24, 22,
-    9, 0, -1, -1, -13, -14, -4, -8, -15, -2, 0, 37, -5, -9, 41, -12,
-    -1, -29, -4, 2, -7, -47, -28, -3, 0, 10, 5, 10, 13, 23, 14, 11,
-    -3, -9, 9, 5, -3, 8, -9, 6, 26, 53, 42, 31, -9, 3, 11, -14,
-    -32, -62, -12, -3, 13, 9, -7, 2, -5, 20, 10, -3, -20, -1, 1, 17,
-    22, 21, -2, 16, 50, 78, 56, 24, -9, 17, -1, 12, -19, -40, -19, -12,
-    -2, 7, 5, -2, 14, 7, 15, -12, -30, -27, -14, 13, 31, 24, 30, 50,
-    66, 57, 29, 18, -5, -7, -17, -17, -23, -11, -6, -19, 1, 8, 7, -10,
-    9, 13, 17, -13, -17, -24, -22, -7, -4, 14, 15, 49, 61, 51, 57, -30,
-    -8, -8, 1, -31, -22, -3, -30, -9, 8, 7, 14, 10, 6, 38, 19, -10,
-    -7, -2, -31, -16, 19, 11, 0, 33, 24, 14, 6, -36, 2, -3, -23, -39,
-    -41, -32, -57, -34, 1, 22, 18, 23, 35, 25, 13, 6, 0, -9, -42, -1,
-    8, -9, -10, -2, 0, -4, -20, -3, -3, 9, -9, -43, -53, -11, -57, -46,
-    2, 13, 16, 20, 19, 29, 25, 11, 10, 1, -26, -10, -17, -19, -10, -19,
-    -29, -19, -44, -24, -1, 10, -9, 15, -22, -7, -14, -39, -16, -2, 11, 11,
-    21, 19, 28, 11, 7, 14, 4, -9, -23, -45, -36, -40, -46, -34, -46, -28,
-    -8, 6, 14, 7, -5, -5, -17, -57, -38, -16, 6, 5, 26, 36, 22, 16,
-    9, 5, 0, -29, -37, -48, -33, -30, -32, -36, -39, -36, -4, 7, 12, -17,
-    -19, -14, 0, -10, -33, -11, -1, 13, 16, 17, 15, 23, 21, 0, -10, -21,
-    -15, -9, -6, -9, 2, -31, 9, -38, -8, -9, 7, -44, -20, -29, 2, -6,
-    0, -3, 3, 10, 12, 22, 25, 9, 5, 1, -16, -12, -11, -45, -52, -45,
-    -3, -27, 24, -39, 6, -10, -17, -31, -25, -24, -6, 6, 23, -1, -7, -23,
-    -8, -7, 10, 0, 1, 13, 14, -4, -33, -65, -69, -33, -18, -43, -24, -27,
-    2, -11, 8, -13, -30, -8, -9, 13, 0, -12, -4, -13, -9, 0, -17, 4,
-    -4, 18, 18, 9, -38, -56, -60, -29, -32, -43, -13, 0, -6, -9, 14, 3,
-    -12, -2, 3, 6, -14, -10, -11, 9, -6, -14, -12, 0, -15, 20, 11, -4,
-    -49, -55, -39, -31, -29, -23, -17, -2, -1, -5, -9, 0, 0, -18, -3, 2,
-    -4, -18, -6, 14, -1, -8, -4, -3, -5, 14, -11, -26, -62, -66, -47, -35,
-    -9, -7, -24, 2, 0, -4, 11, -20, 4, 7, -5, -2, 13, 5, -6, -11,
-    -17, -3, 0, 0, 2, -11, -23, -24, -35, -58, -34, -31, -5, 8, -27, -4,
-    -4, -2, 19, -13, -9, -11, -9, 20, 39, 29, 16, 11, 18, 16, -7, -10,
-    2, -45, -30, -40, -5, -31, 9, 11, -2, -26, -16, 2, -4, 4, 3, -1,
-    -36, -23, -20, -1, 3, 22, 29, 14, 18, 33, 5, 6, 30, 15, 0, 39,
-    16, -3, 23, 0, -7, 3, -4, -2, 2, -3, -2, -17, 41, 17, 13, -9,
-    11, 3, 12, 43, 41, -7, 23, 16, 25, 57, 45, 10, 16, 16, 16, 5,
-    13, 4, 0, 0, 2, 2, -2, -2, -13, -20, 10, 14, 13, -7, -9, 12,
-    12, -20, 16, 34, 12, 18, 26, 1, 1, 2, -2, 0, 2, -4, 4, -1,
-    -1, 1, -3, -4, 2, 3, -4, -1, -3, -1, 4, -5, -16, -8, -1, -3,
-    -1, 0, 4, 4, -1, 3, 3, 0, -2, -1, 1, 1, -1, 1, -2, 1,
-    -4, -8, -11, -14, -16, -20, -23, -12, -10, -11, 4, 1, 8, 9, -17, -15,
-    -18, -18, -17, -7, -1, 0, 2, 5, 3, -2, -5, 3, -5, -15, -20, -15,
-    -28, -16, -10, -18, -10, -12, -34, -26, -10, -20, -10, -71, -49, -40, -23, -24,
-    -7, -12, 1, 4, 2, -2, -5, -24, -11, -19, -24, -35, -27, -22, -9, -35,
-    -30, -26, -14, 15, 2, -13, -13, -2, -2, -22, -41, -25, -23, -28, -23, -4,
-    3, 3, 10, 22, -1, -38, -24, -31, -25, -20, -6, -3, 11, -13, -14, 9,
-    -3, -13, -13, -18, -26, -30, -16, -12, 8, 24, 40, 27, 4, -3, -15, -1,
-    -13, -25, -5, -15, -5, -6, -13, 12, 7, 0, -1, 3, -3, -9, 1, -10,
-    -23, -32, -33, -34, 16, 32, -1, 11, 1, 10, 6, 9, -8, -20, -1, -3,
-    6, 6, 3, 10, 1, 7, 5, 0, 17, 19, 6, -13, -19, -8, -45, -21,
-    -26, 4, -6, -4, -2, 29, 13, 13, -1, -15, 9, -4, -6, -1, -6, -8,
-    -4, 7, -12, -1, 17, 11, 14, -4, -11, -25, -29, -21, 2, 7, -9, -7,
-    -27, 30, 14, 28, 4, 3, 15, -2, -4, 0, 9, -8, 0, 3, 8, 11,
-    23, 11, 28, 10, -16, -22, -4, -21, -14, 10, 13, -8, 12, 38, 18, 36,
-    7, 0, 14, 3, -1, -1, 10, -5, 7, 12, 21, 28, 25, 30, 5, -2,
-    2, -5, 14, 5, -20, -5, 4, 7, 13, 10, 23, 32, 2, -12, 7, 9,
-    -4, -1, -11, -10, -6, 16, 31, 27, 34, 26, 7, 3, 9, 8, 20, 0,
-    -29, -29, -8, 28, 0, 6, 19, 66, 13, -4, -3, 11, 12, 1, 9, 5,
-    1, 7, 19, 29, 14, 13, 14, 5, 32, 19, 17, -1, -4, -10, 30, 35,
-    4, 11, 15, 16, 11, 15, 3, 17, 3, -10, -9, -8, -1, 1, 3, 28,
-    8, 17, 16, 14, 21, 6, 0, 13, -12, -13, 5, 32, 3, 11, 29, 3,
-    13, -7, 1, 7, 21, 3, -9, 9, 5, 8, 8, 25, 10, 16, 12, -3,
-    2, 9, -7, -18, -26, 1, 17, -16, 0, 13, 30, -3, 9, -7, 5, 6,
-    0, -9, -8, 9, 10, 11, 12, 16, 0, 25, 0, 9, -1, -9, -16, -3,
-    -8, 8, -5, -14, 4, 12, -13, 7, 4, 6, 7, -9, -12, -15, -14, 5,
-    1, 8, 22, 28, 26, 25, -3, -3, 9, -7, 11, 11, -2, -8, -24, -19,
-    5, 6, 6, -4, 10, -11, 1, 2, -4, -3, -2, -11, 5, 25, 13, 22,
-    10, 18, -12, -19, -6, -10, 6, 8, -6, -39, 6, 15, 5, 8, 7, 1,
-    -7, -18, -9, 10, -4, -6, -18, -1, 13, 16, 10, 2, -3, 5, -18, -20,
-    -15, -6, 10, 10, 15, -20, 29, 31, 26, 12, 13, 11, -19, -14, -6, -12,
-    0, -20, -11, 8, -8, 4, -16, -13, -10, -8, -15, -7, -10, 9, 18, 2,
-    7, -15, 40, -41, -11, 30, -3, -5, -16, -19, -5, -11, -9, -17, -2, -26,
-    -21, -8, -11, -24, -11, -1, -16, -5, 5, 11, 9, -9, 10, -42, -20, -35,
-    -2, 28, -9, 2, -7, -28, -18, 11, -6, -27, -7, -11, -8, 0, -4, -17,
-    -10, -8, -15, 0, 13, 5, 1, 10, 3, -9, -39, -1, -12, 1, -10, -6,
-    1, -22, 6, 5, -6, -21, -11, -9, -9, -19, -21, -5, 4, -2, -6, 2,
-    -21, -12, -5, -6, -18, -25, -31, -3, -9, 10, -2, -12, 8, 4, 8, 13,
-    -1, -8, 4, 0, -5, -18, -1, -1, 2, -6, -16, -14, -19, -9, 6, -1,
-    -1, 5, -37, -2, 0, -4, 3, -4, -5, -2, -14, 11, -3, -10, 9, 2,
-    -2, 3, -6, -1, -15, -10, -14, -29, -20, -18, -15, 1, 16, 3, -41, -3,
-    2, -5, 13, 13, 47, 39, 21, 15, 15, -3, 4, 7, -2, 3, -5, -8,
-    -24, -30, -14, -7, -18, -18, -10, 5, -20, -24, -22, 1, -3, 4, -7, -14,
-    13, 17, 14, 11, 26, 19, 16, 4, -13, -4, 12, -3, 1, -18, -10, -3,
-    -13, -33, -47, -32, -31, -9, -8, -1, -1, -1, -2, 16, -37, -28, -16, 25,
-    35, 40, 39, 1, -19, 16, 28, 6, 6, 23, 3, 4, 4, 22, 19, 24,
-    22, -1, -3, -2, 2, -4, -2, -3, 7, 11, 14, 18, 22, 24, 29, 17,
-    7, 19, 38, 6, 25, 43, 31, 24, 25, 38, 30, 14, 0, 1, 1, 0,
-    0, -3, 2, 4, -4, -4, 1, 2, -2, 0, -3, 0, -4, -3, 11, 4,
-    4, -4, -3, 0, 3, 3, 2, -1, 4, -2, 0, -3, -4, 1, -1, -4,
-    -4, 4, 2, -5, 10, 1, -24, -19, -27, -25, -18, 4, 1, -8, -24, -35,
-    -40, -40, -29, -18, -3, -2, -2, 3, -4, 0, -9, -3, -25, -13, -4, -4,
-    23, 14, 24, 14, 19, 23, 19, 23, 32, 20, 15, -8, -4, -9, -11, 8,
-    14, 16, -2, -2, -1, 1, -13, 42, 26, -13, 8, 24, 38, 32, 31, 18,
-    36, 1, -21, 10, 7, 24, 37, 35, 4, -39, -73, -61, -10, 29, 13, 1,
-    -4, 2, -22, 30, -34, 0, 50, 15, -21, -23, 1, 18, 0, 11, 12, -4,
-    -20, -11, 22, 25, 12, -30, -41, -10, -12, 5, -7, -33, -2, 1, -31, 33,
-    17, 45, 39, -8, 6, 4, 1, 2, 1, 9, -7, 8, 11, -22, -5, 0,
-    7, 3, 6, 2, -7, -35, -37, -35, 3, 15, 19, 27, 23, 27, 6, -3,
-    10, 33, 39, 15, 15, 0, 0, 4, 22, 8, 5, 19, 4, -4, 8, 14,
-    6, -24, -23, -29, 2, 22, 30, 26, 11, -2, 1, 8, 6, 11, 31, 27,
-    23, 21, 28, 25, 35, 34, 19, 31, 26, 9, 9, 12, -14, -14, -14, -31,
-    -4, 25, -10, -13, -13, -10, -20, 5, -3, 4, 23, 22, 26, 33, 45, 33,
-    13, 26, 14, 16, 26, -3, 18, 34, -7, 0, -13, -5, -3, 12, -6, 1,
-    -18, -6, -4, 8, -11, -16, -2, -18, -14, -20, 4, 8, -5, -4, -3, -13,
-    -18, -13, 30, 20, -16, -31, -22, 30, 1, -2, -10, -13, -33, -20, -9, -30,
-    -42, -59, -45, -50, -66, -70, -55, -23, -6, -3, -29, -23, -21, -12, 0, -23,
-    -49, -37, -43, 25, 1, 10, -19, -4, -47, -41, -42, -71, -70, -96, -74, -53,
-    -93, -85, -33, 0, -2, -6, -24, -7, -17, -26, -12, -11, -44, -37, -68, 4,
-    2, 7, -30, -16, -81, -79, -82, -109, -83, -88, -59, -63, -56, -50, -3, 5,
-    14, -3, 4, -19, -30, -21, -39, -19, -15, -20, -23, -14, -4, -1, 10, -15,
-    -63, -82, -77, -78, -63, -40, -36, -15, -11, 7, 25, 13, 15, 12, 1, -14,
-    -24, -19, -18, -17, -23, -29, -9, -20, -1, 7, -2, 0, -29, -50, -13, -17,
-    -12, -7, 9, 22, 14, 29, 39, 27, 19, 8, 13, 11, -14, -20, -5, 3,
-    -2, -43, 36, 12, 3, 7, 7, 17, 21, 13, 38, 21, -1, -5, 21, 17,
-    2, 17, 10, 19, 4, 9, 10, 1, -14, -16, -27, 5, 26, -16, 60, 23,
-    0, 11, 18, 31, 34, 26, 51, 33, 17, 9, 5, 3, 13, 17, 2, 13,
-    5, -3, 15, 18, 1, -4, -33, -15, 14, -13, 31, 22, 4, 15, 8, 34,
-    20, 24, 48, 37, 24, 15, 12, 8, -3, -3, 8, 13, 0, -3, 8, 0,
-    6, -22, -30, -33, 14, 8, 52, 4, -2, 13, 11, 33, 15, 36, 27, 34,
-    19, 16, 31, 17, 4, -12, 4, 0, 10, 19, 3, 31, 12, -27, -29, -23,
-    -5, 11, 67, 31, 1, -18, 32, 3, 5, 21, 29, 13, 3, 20, 21, 29,
-    5, 12, 8, 5, 4, 7, 3, 33, 21, -3, -13, 4, 19, 30, 12, 24,
-    4, -23, 50, 0, 1, 22, 34, 4, 8, 7, 16, 17, 12, 19, 12, 5,
-    16, 0, 16, 19, 25, 19, -16, 11, 19, 29, -12, 0, 3, -4, 42, -1,
-    2, 27, -1, -7, -11, -12, 5, -1, 15, 12, -6, -6, 3, -3, -3, 3,
-    10, 14, -12, 16, 33, 35, 6, 3, 0, -4, 34, -8, 23, 27, -6, -6,
-    -5, -14, -21, -6, -9, -5, -1, -1, 7, 8, -9, 9, 5, -18, -12, 12,
-    16, 30, 30, 2, 4, -2, -4, -4, 25, 12, 11, -13, -16, -15, -28, -2,
-    0, -4, 6, 3, -8, -16, -15, -17, -19, -15, 10, 28, 5, 32, 38, 0,
-    4, 2, 29, 12, 11, -16, -5, -11, -19, -4, -24, -20, -26, -8, -18, -23,
-    -33, 7, -7, -6, -8, -26, -17, -36, -8, 6, 7, -2, -4, -2, -8, 37,
-    -22, 5, -4, 13, 20, 5, 4, 5, 2, -3, 13, 10, -3, 6, -19, -28,
-    -42, -34, -29, -13, -9, 7, 3, 0, -3, -1, 3, -1, -9, -4, 8, 38,
-    31, 28, 38, 32, 15, 28, 12, 10, 11, -11, -3, -8, -31, -9, -2, 5,
-    2, 2, -2, -1, 1, -1, -3, 3, 1, 2, 3, 1, 14, 15, 32, 21,
-    13, 11, 15, 18, 11, 9, 6, 4, -2, -6, -7, 3, -4, -3, 0, 0,
-    0, -1, 2, 1, 0, 1, 1, -1, 0, -5, -1, 2, -6, -5, 4, 1,
-    2, 3, 3, -5, -1, 2, 1, -2, 4, 3, 0, 4, -4, -4, 0, -4,
-    3, -2, -9, -6, -13, -7, -19, 1, 3, -2, 3, -3, 6, 1, -14, -15,
-    -14, -14, -8, -2, -3, 0, -2, 1, 1, -4, 0, 0, -8, -5, -1, -9,
-    -8, -31, -41, -40, -18, -24, -29, -39, -36, -62, -57, -59, -49, -36, -16, -21,
-    -20, -11, -4, 3, -2, -4, -1, -5, -4, -32, -33, -35, -24, -18, -49, -37,
-    -34, -64, -56, -26, -40, -34, -60, -26, 12, 26, 8, -16, -4, 19, 17, 1,
-    1, -1, -2, -2, -22, -51, -52, -49, -69, -42, -66, -44, -44, -60, -50, -12,
-    -24, 4, -11, -38, -22, 12, -9, -27, -2, 16, -1, -29, 1, -3, -15, -18,
-    -36, -50, -64, -62, -27, -7, -28, -29, -35, -51, -34, -43, -69, -32, -42, -60,
-    -29, -16, -12, -38, -35, -20, -23, -17, 3, -15, 27, 13, -5, -1, -10, -25,
-    -2, 2, -26, -9, -21, -25, -15, -23, -33, -25, -26, -13, -7, 17, 6, -17,
-    -4, -5, 3, -26, 6, -15, 39, 28, -9, -10, -3, -15, -5, 7, 2, -5,
-    1, 27, 5, 9, 22, 17, -9, -9, -2, 17, 26, 30, 27, 15, 9, -28,
-    28, 27, 23, 8, -3, -6, 11, 5, 22, 24, 6, 14, 22, 25, 31, 30,
-    42, 27, 15, -18, -4, 9, 16, 37, 59, 44, -5, 47, 17, 43, -3, 4,
-    -6, 0, 8, 8, 5, -10, 20, 25, 40, 25, 14, 18, 27, 32, 16, -14,
-    -16, 9, 14, 25, 41, 41, 14, 1, 19, 19, 23, -9, -7, -2, 4, 5,
-    10, 7, 19, 12, 17, 16, 17, 20, 32, 13, 21, 6, -1, 16, 33, 5,
-    38, 66, 24, -13, 8, 10, 27, 28, -2, 3, 9, 11, 20, 10, 10, 28,
-    29, 11, 12, 10, 12, 13, 18, 11, 3, 11, 24, 12, 24, 5, 12, 32,
-    7, 15, 21, 26, 18, 14, 3, 19, 17, 16, 11, 19, 12, 15, -2, 9,
-    4, 3, 29, 6, -6, -3, 10, 5, -9, 15, 38, 35, -1, 13, 37, 33,
-    29, 6, -17, 14, 8, 16, 18, 16, 24, 7, 2, 7, -11, -7, -2, -15,
-    -5, 4, 1, -10, -10, 24, 14, -33, 3, 11, 40, 19, 25, 12, -6, 11,
-    13, 15, -2, 17, 25, 6, -12, -9, -21, 17, 12, -7, 0, -6, 0, 17,
-    24, -10, -52, -26, 5, 1, -4, 21, 32, 11, 16, 9, 8, 6, 1, 12,
-    17, -20, -21, -14, -22, 17, 18, -14, -2, -12, -7, 12, 12, -36, -36, -30,
-    3, -10, -21, -11, 29, 7, -4, -11, 8, -15, -19, 8, 17, 0, -19, -4,
-    -5, 19, -2, 1, 22, -9, -11, 9, -7, -53, -52, 9, -5, -9, 0, -25,
-    3, 19, 3, -3, 4, 0, 9, 7, -2, -6, -4, 11, -5, 13, -5, -4,
-    18, -14, 3, 3, 8, -28, 20, 24, 25, -4, 21, -37, -3, 10, -12, -9,
-    13, -10, -14, 3, -12, 0, -1, -6, 5, 2, -26, -15, 3, -14, 15, -5,
-    -27, -32, 40, -34, 4, 28, 20, -18, 2, -7, -19, -12, 4, -22, -33, -31,
-    0, -4, -14, -8, -3, 3, -14, -14, -6, -8, -13, -35, -10, -10, -10, -27,
-    4, 26, 1, -51, -9, -13, -20, -29, 8, -10, -29, -28, 0, 4, -8, -16,
-    -1, 11, -8, -9, -15, -2, -9, -24, 32, 40, -37, 0, 1, -3, -24, -16,
-    16, -1, -21, -33, -13, -10, -11, -26, -12, -16, -16, -5, 10, 0, -17, -8,
-    -12, -2, -3, -20, 20, 23, -29, -2, -3, -13, -26, 3, 3, -19, -5, -20,
-    -1, 0, 5, -4, 8, -7, 5, -7, -3, 5, -10, 8, -15, -31, -6, -8,
-    8, -2, -34, 6, -4, -2, -35, 2, 12, -8, -1, -12, -11, -19, 6, 6,
-    11, 3, 7, -18, 10, 8, -3, 4, -30, -29, -13, 14, 8, -6, -29, -4,
-    4, 5, -7, 11, 12, 31, -9, 1, 6, -5, -21, -18, 2, 7, -11, 2,
-    6, -14, -9, 5, -4, -21, 1, 24, 21, -26, -16, -4, 1, 4, 0, 23,
-    20, -14, -38, -27, -15, -4, -9, 19, -29, -6, -5, 4, 12, -10, 6, 5,
-    5, 34, 46, 56, 50, 1, -7, -4, -1, -1, -2, 14, -30, -37, -24, 6,
-    6, 20, -10, -5, 37, 38, 12, 35, 14, -4, 3, 33, 40, 44, 50, 20,
-    6, -2, -1, 2, 3, 3, 3, -1, 18, 31, 9, -4, -1, 26, 44, 22,
-    8, 25, 26, -7, 10, 35, 29, 17, 24, 32, 35, 25, 3, -3, 0, 3,
-    -3, -2, 1, 0, 1, -1, 2, 1, 3, 1, 0, -4, 13, 18, 16, 7,
-    1, -3, 0, 0, -1, -3, 2, 4, 4, -1, -3, 1, 0, -3, 2, 1,
-    -3, 5, 14, 17, 14, 23, 37, 25, 28, 23, -23, 8, 46, 39, 19, 19,
-    15, 17, 14, 9, 3, -2, 3, -4, -2, 3, 10, 2, 18, 19, 15, 19,
-    36, 29, -1, 7, 19, -43, -29, 12, 4, 7, -18, -13, -3, 25, 6, 20,
-    -5, -14, 5, 2, -1, 0, 14, 36, 45, 20, 19, 8, 3, 6, 21, 45,
-    16, 5, 1, -12, -28, -28, -4, -3, 5, 27, 6, 18, 7, -12, 5, 0,
-    2, -2, 7, 33, 53, 22, 10, -1, -14, -2, -4, 24, 12, -15, 4, 5,
-    -11, -32, -7, -17, -5, -12, -44, -32, -23, -2, -4, -10, 1, 2, 11, 17,
-    20, -4, -11, 11, 36, 54, 30, 29, 19, 27, 13, -10, -7, -16, -5, -16,
-    -45, -41, -31, -21, -25, -11, 4, 7, 2, -5, 32, 7, 45, 35, 11, 19,
-    45, 49, 29, 35, 20, 16, 21, 16, -4, -23, -25, -17, -52, -26, -20, -36,
-    -21, -5, -7, -18, 4, 15, 40, 0, 15, 19, 21, -7, 17, 26, 12, 23,
-    10, 21, 2, 4, 10, -13, -23, -18, -27, -17, -29, -30, 1, 23, -13, -4,
-    -7, 29, 15, -9, 0, -2, 11, -6, 30, 25, 13, 34, 4, -3, 0, -5,
-    7, 6, 9, 15, 0, -1, 4, -4, 4, -4, -12, 2, 5, 27, 5, 12,
-    3, 12, 4, -13, 10, 8, 33, 22, 0, -11, -15, -13, 0, 37, 28, 7,
-    13, 15, 5, -15, -11, -7, -9, 11, 4, -9, 4, 3, 6, 27, 28, -6,
-    10, 22, 14, -11, -26, 2, 10, 4, 36, 38, 14, -19, 8, 20, 19, 8,
-    16, 33, 21, -12, 0, 6, 12, -2, 3, 13, 14, 5, 25, 22, 15, -5,
-    -2, 33, 6, 8, 48, 53, 17, -16, 13, 18, 13, 31, 31, 24, 18, -8,
-    4, 11, 19, -6, 19, 18, 8, -2, 6, 12, -9, -25, -43, -3, 0, 10,
-    33, 28, 13, 6, -3, 5, 5, 28, -14, -11, 18, -11, -3, 10, 18, -8,
-    25, 18, -6, -5, -1, 0, 13, -34, -35, -1, -14, -1, 11, -14, -9, -8,
-    -15, 9, 12, 40, 15, -29, -11, -22, 4, -4, -5, -19, 23, 14, 5, -4,
-    3, 13, 3, -7, -36, -17, -28, -11, -9, -9, 16, -7, 6, 8, 30, 39,
-    15, -22, 6, -11, 6, -3, -41, -19, 16, 16, 14, -5, -3, -5, -8, -15,
-    -20, -21, -23, 0, -22, -7, -2, 5, 10, 20, 8, 31, 32, 22, -17, -33,
-    1, -1, -35, -27, 24, 40, 24, 1, 3, -7, -9, 4, -2, -13, -3, -17,
-    -24, -11, -1, 1, 15, 1, 16, 7, -7, 25, 1, -10, 1, -1, -10, -15,
-    1, 38, 24, 14, 10, 1, 13, 26, 14, 4, -12, -21, -35, -11, -8, -6,
-    9, -9, -3, -3, -1, 68, 17, 16, 1, -20, -2, -7, 1, 1, 19, 34,
-    26, 17, 38, 48, 33, -5, -17, -20, -39, -2, -3, 13, 19, 11, 17, 1,
-    -11, 58, 28, -35, -21, 1, 27, 6, 4, -14, -25, -16, 4, 9, 32, 46,
-    32, -18, -11, -16, -28, -1, 5, 21, 20, 7, 5, -22, -5, 21, 3, -23,
-    -4, 13, 25, 2, 16, 9, -35, -37, -11, -12, 9, 9, -6, -23, 1, -10,
-    -7, -9, -4, 10, 0, -18, -15, -36, -3, 35, 1, 3, 1, 3, -1, -12,
-    15, 8, -13, -26, -29, -17, -5, 2, -5, -4, 8, 15, 22, 17, 4, 7,
-    4, -27, -22, -14, 39, 12, 6, -2, -7, -5, -8, -5, 24, -17, -30, -32,
-    -13, -27, -14, -6, 5, 2, 23, 24, 27, 17, 15, 17, -8, -24, -11, -5,
-    -6, -2, -19, -1, -3, 1, -7, 10, 28, -14, -10, -15, -10, -22, -21, -8,
-    1, 6, 23, 5, 10, 11, 14, 13, -2, 8, 12, 3, 37, 18, -20, 4,
-    1, -2, 5, 5, 25, 3, -11, 14, -7, 1, -10, -27, 3, 16, 13, 11,
-    17, 14, 13, 11, 5, -19, -2, 19, 32, -14, -12, -1, -5, -3, 9, 21,
-    -4, -8, -7, 3, -2, 9, 6, -9, -9, 6, -8, 1, 28, 1, -6, 33,
-    42, 33, 8, 11, 15, 19, -8, 0, 0, -4, -1, -2, -15, -8, -13, -23,
-    -1, 17, 14, 2, 17, 34, 69, 38, 36, 31, 21, 26, 62, 46, 50, 30,
-    20, -1, -5, 1, 2, 4, 1, 0, -6, -6, 26, 27, 23, 21, 8, 8,
-    20, 3, 40, 35, 29, 11, 26, 23, 5, 1, 25, -7, 1, -1, 4, 0,
-    1, 2, 3, 1, -3, -5, -1, -3, -3, 1, 2, -5, 6, 12, 16, 9,
-    -1, -5, 3, 0, 1, 5, -5, 0, 0, 1, 3, -5, -2, -1, -3, -5,
-    0, 8, 12, 8, 8, 18, 16, 19, 16, 16, 7, 14, 32, 36, 11, 26,
-    21, 5, 11, 3, 2, 2, -2, -2, -4, -2, 8, 1, 18, 22, 16, 11,
-    30, 23, 34, 56, 19, 10, 46, 55, 17, 32, 14, 13, 2, 13, 9, 3,
-    11, 6, -2, 1, -1, -3, 10, 5, 6, 4, 8, 2, -7, 28, 7, 4,
-    13, 24, 4, -11, 13, 3, -4, -6, -36, -13, -23, -2, -2, -6, -9, 0,
-    1, -1, 9, -11, 15, 23, 19, 6, 18, 23, 13, 0, -4, -10, 13, 15,
-    20, 18, 6, 17, 12, -10, -30, -33, -32, -11, 14, 31, 4, -4, 30, 1,
-    33, 1, -1, 0, -11, -19, -19, -37, -34, -11, -6, -8, -5, 0, 6, 12,
-    23, 22, 3, -4, -10, -6, 27, 18, 1, -7, -4, -3, 11, -15, -12, -15,
-    -30, -24, -26, -23, -9, -9, -1, 5, 4, 12, -11, -20, -10, -13, -25, -31,
-    -37, 11, 3, 30, 5, -10, 7, -20, 10, 6, -21, -24, -33, -32, -35, 3,
-    9, -3, 2, 25, 11, -12, -6, -13, -2, -6, -14, -43, -27, -2, -2, 34,
-    -34, -2, 1, -13, 11, -3, -5, -24, -19, -23, 6, 11, -6, 6, 4, 4,
-    1, -3, 5, 9, 5, -3, -29, -5, -13, -21, 6, -12, 7, -31, 2, 23,
-    11, -5, 0, -9, -7, 17, 23, -4, -3, 0, -5, -8, -12, -23, 1, 8,
-    0, 2, 11, -3, -14, -9, -15, 25, -2, -13, -15, -6, 23, 12, 19, 0,
-    -2, 2, -6, 6, 14, 2, -12, -14, -17, -35, -4, 4, -6, 20, 0, -10,
-    -26, -32, 13, 25, -3, -16, -2, -18, 51, 33, 12, -5, -7, -7, -3, 10,
-    10, -7, -13, -23, -17, -20, 4, 7, 17, 1, 4, 5, -27, -6, 10, 32,
-    -9, -12, 30, 3, 51, 12, 9, -18, -12, 11, -2, -1, -22, -33, -21, -10,
-    -3, 5, 20, 6, -25, -15, 4, -2, -8, -12, 10, 29, 1, -19, 25, 16,
-    12, 0, -5, -19, -11, -4, -7, -4, -13, -13, 4, 13, 17, 3, 12, -20,
-    -51, -18, 15, -2, 0, -5, 35, 20, -2, -5, 0, 21, 0, -8, 2, -9,
-    -15, -17, -8, -1, -20, 13, 21, 24, 19, -20, 3, -18, -17, -20, -1, 4,
-    0, 4, 55, 14, -4, 0, 9, -4, -11, -10, 8, -16, 1, 5, -5, 13,
-    10, 34, 30, 19, 12, -15, -5, -10, -8, -11, 14, 10, 16, 22, 20, 29,
-    3, 0, 4, -3, -1, -9, 0, -9, 3, 18, 19, 34, 16, 7, 22, 8,
-    4, -2, -6, -34, -35, -13, 4, 6, 14, 51, 52, 33, -4, -6, 3, 13,
-    2, 2, -6, -16, 4, 5, 28, 30, 23, 9, 16, 2, -10, -11, -23, -40,
-    -33, -28, -26, -12, 2, 49, 49, 61, 14, -7, 8, 22, 23, 16, 10, -4,
-    -4, 6, 10, 1, 6, 1, 2, 2, -8, -7, -19, -33, -38, -34, -19, 5,
-    9, 23, 22, 40, 4, -10, -13, -4, 19, 23, 8, -22, -7, 11, 30, 13,
-    3, 8, -8, -4, -3, 1, 1, -6, -19, -16, 2, 29, 17, 6, 40, 26,
-    -2, -4, -12, 2, 19, 4, -25, -18, -10, -8, 22, 27, 6, -2, 0, -1,
-    -9, 3, 18, 2, 12, 13, 19, 20, 31, 9, 45, 2, 6, 0, -12, -9,
-    4, -33, -22, -25, -20, -6, 11, 0, 10, 16, 3, -3, 2, 8, 3, 11,
-    5, 17, 8, 20, 14, -11, 28, -6, 4, 7, 9, 15, 9, -13, -34, -27,
-    -14, 4, 0, -17, 0, 17, 7, 0, -4, 6, 7, 12, 17, 14, -10, -9,
-    -3, -25, -15, -4, -4, -3, -2, -1, 1, 3, -40, -51, -30, -14, -18, -32,
-    0, -2, 1, 3, 1, 7, 4, 11, 2, 0, -8, -13, 4, -11, -7, -3,
-    1, 2, 1, -22, -1, -17, -46, -64, -55, -39, -36, -36, -10, -14, -9, 5,
-    -1, -2, 3, -3, -19, -16, -25, -21, 12, 16, 14, -2, 3, 3, 14, -31,
-    -1, -8, -15, -24, -44, -57, -46, -30, 26, 10, 8, -7, 17, 21, 31, 26,
-    30, 25, -9, -32, -24, 11, 19, -1, -2, 0, 4, 32, 30, 8, 2, 27,
-    17, 24, 11, 16, 26, 9, 24, 25, 42, 20, 26, 36, 52, 35, 28, -2,
-    6, 3, 4, 4, 0, -2, 1, 0, -7, -14, 4, 5, 4, 22, 22, 40,
-    36, -6, 55, 17, 36, 19, 17, 22, 27, 26, 35, 7, -1, 3, 1, 0,
-    4, -3, 3, -4, 4, 4, -1, 4, 5, -2, -2, 4, -3, 3, -2, -4,
-    -3, -5, -3, -1, 2, 3, 2, 4, 4, 4, 5, -2, -2, 0, -1, -1,
-    2, 0, -17, -21, -9, -15, -11, -22, -28, 10, 8, -43, -35, -39, -4, -9,
-    2, 0, -1, -2, -2, 0, 5, 0, 3, 3, 0, 0, 4, -6, -20, -26,
-    -38, -62, -72, -63, -108, -55, -32, -52, -79, -49, -37, -28, -22, -5, 14, -4,
-    -2, -2, 2, 0, -5, -3, 4, 3, -32, -18, 10, -29, -50, -22, -5, -33,
-    -46, -43, -36, -32, -13, 24, 15, -2, 2, 18, 47, 36, 29, -1, 0, -3,
-    -2, 3, -10, 9, -45, -11, -1, 0, 6, 24, 6, -6, 2, 25, 27, 16,
-    8, -1, -17, -31, -28, -15, 48, 62, 43, 9, -4, -4, -2, -2, -5, -3,
-    -30, -26, -14, -21, 7, 11, -15, -15, -6, 15, -9, -11, 10, 3, 13, -21,
-    -25, -9, 4, 6, 54, 33, -2, 1, 4, 1, 34, 23, 26, 8, -12, -34,
-    -7, -4, -22, -1, -10, -4, -4, -10, 2, 16, 3, -3, -19, -29, -31, -39,
-    -25, 5, -20, 11, -2, 3, 55, 51, 38, -19, -6, -5, 7, -15, -2, -21,
-    -1, 9, -3, -6, -12, 3, -4, -9, -18, -27, -32, -22, -37, 21, 8, 19,
-    7, 23, 26, 38, 39, 10, -1, -15, 5, 2, 2, 10, -3, -3, 9, -3,
-    -20, -14, 3, -8, -2, -6, -13, 4, 26, 25, 8, 2, 4, 41, 34, 37,
-    38, 27, 0, 12, 14, 19, -2, 1, -28, -33, 11, 5, -15, -11, -3, 5,
-    15, 29, 13, 23, 44, 15, 4, 2, 11, 50, 26, 31, 43, 33, 18, 18,
-    25, 23, 9, -3, -37, -44, -14, -15, -4, -14, -10, 23, 15, 27, 41, 19,
-    -6, -11, -14, 0, 18, 63, 70, 0, 30, 46, 20, 23, 18, 21, 19, -8,
-    -23, -35, -15, -20, -7, -2, -7, 21, 18, 30, 50, 28, -12, -11, -18, -4,
-    11, 42, 43, -11, 38, 46, 9, 30, 42, 30, 15, 4, -13, -27, -18, -24,
-    -8, -13, -15, 17, 36, 43, 42, 22, 5, 6, 15, -4, 1, 37, 40, -13,
-    31, 26, 6, 17, 24, 49, 40, 14, 8, -11, -15, -27, -34, -15, -11, -1,
-    58, 25, 32, 1, 11, -8, -19, 1, 4, 4, 54, 2, 19, 6, 3, -6,
-    17, 40, 44, 20, -5, -21, -37, -47, -45, -32, 9, 42, 43, 2, 8, 28,
-    1, 11, -25, -3, 13, -7, 20, 12, -12, 8, 23, 14, -2, 29, 12, -15,
-    -13, -24, -48, -72, -60, -13, 26, 56, 50, 11, 24, -12, -12, 7, 13, -3,
-    19, -3, 5, 3, 25, 13, 21, 16, 11, 16, 16, -10, -25, -38, -32, -43,
-    -24, 29, 27, 44, 32, 25, 34, 9, 7, -21, 26, -25, 3, -1, 10, -13,
-    26, 10, -3, -17, 1, 8, 7, -6, -27, -37, -52, -41, 9, 44, 59, 12,
-    11, 9, 9, -34, -19, -41, 1, -27, 4, 2, 6, -34, 6, 2, -9, -15,
-    -2, 9, 7, -25, -68, -60, -57, -33, 30, 48, 38, -4, -28, -16, -12, -61,
-    -41, -36, 1, -1, 5, -2, 17, -36, 1, 16, 14, -3, 3, -7, -11, -40,
-    -71, -65, -27, -1, 31, 38, 30, 10, -19, -26, -35, -50, -26, -8, -3, 3,
-    -1, -4, 12, -38, -28, 19, 12, 1, -20, -34, -26, -21, -37, -38, -38, -9,
-    12, 40, 29, 23, -16, -24, -40, -22, 14, 17, 4, -2, -4, -8, 1, -16,
-    -36, 10, -2, -12, -23, -30, -11, -9, 4, -4, -16, 2, 23, 34, 39, 26,
-    -7, 1, -10, -2, 42, 17, -18, -4, -1, -2, -2, -21, -19, 2, 4, 0,
-    -6, -20, -17, -7, -3, 4, 10, 6, 23, 41, 41, 34, 14, -18, -17, 12,
-    55, 25, -12, -2, -4, 3, -24, -15, -1, 6, 9, 7, 11, -10, -18, -20,
-    -13, -27, 5, 7, 12, 18, 17, 29, 18, 3, -6, 39, 42, 17, -15, 4,
-    -3, 3, 19, 22, 17, 27, 25, 30, 32, 23, -7, -30, -37, -32, -32, -12,
-    9, 2, 8, 53, 24, 16, 15, -5, 1, -3, -4, -2, 1, -4, -5, 22,
-    -8, -13, 7, 5, 39, 42, -13, -21, -12, -21, -11, -6, 20, 10, 34, 48,
-    26, 22, -7, -34, -11, -16, 5, -1, -3, 3, -3, 5, 15, -14, 3, 49,
-    59, 26, 14, 42, 2, -10, -10, 10, 17, 2, 17, 36, 26, 28, 29, 18,
-    17, -4, 0, -2, -3, -3, 5, 4, 13, 31, 5, 4, 15, 60, 43, 51,
-    63, 59, 90, 11, 0, 50, 53, 24, 30, 40, 32, 34, -2, 0, -1, 1,
-    1, 4, 2, -3, 2, 0, 0, 0, 0, 1, -4, -2, 3, -1, 12, 7,
-    -1, 3, 2, -3, 3, -4, -4, 3, 5, 3, -1, 3, -2, 2, 1, -3,
-    4, -3, -13, -10, 1, 3, -25, -23, -20, -12, 17, -19, -8, -20, -8, -21,
-    -29, -21, -15, -9, -1, 4, -3, -3, -1, 1, -3, 0, -17, -18, -13, -12,
-    -17, -25, -25, -12, 6, -20, -23, -5, -15, -26, 6, -45, -38, -30, -33, -19,
-    5, 16, 2, 3, 2, 0, -3, -11, -4, -19, -9, -15, -12, -16, 1, 8,
-    -12, -11, 23, 24, -2, -18, 5, -14, 2, 24, -16, -2, 3, -10, -24, -1,
-    4, 4, 25, 10, -20, -13, -13, -18, -25, -20, 8, 8, 6, 2, -7, 14,
-    0, 4, 15, 7, 2, -5, -17, -14, 20, 30, 4, -27, -3, -1, 1, -1,
-    -2, 5, -5, -2, 15, -2, -4, 21, 22, 14, 8, 7, 8, 19, 20, 9,
-    6, 13, 2, -16, -31, 1, -32, -27, 3, 10, 12, 19, 20, 33, 3, 6,
-    24, 41, 22, 18, 19, 19, 8, 19, 23, 20, 9, 16, 3, 25, 15, 8,
-    -17, -32, -11, -7, 3, 34, 18, 34, -5, -1, 21, 11, 17, 31, 15, 2,
-    2, 2, -9, 14, 15, -11, -2, 4, 4, 6, 19, 9, 5, -15, -5, -12,
-    -30, 25, 18, 29, 2, -12, 11, 11, 20, 38, 21, 9, -1, 7, 16, 7,
-    6, -8, 6, 8, -1, 1, 27, 21, -2, 10, 7, -7, 10, 34, 26, 43,
-    -4, -6, 21, 16, 21, 11, 3, 3, 7, 25, 12, -9, -9, 3, 4, 5,
-    24, 13, 28, 14, -27, 15, 48, 19, 13, -4, 7, -3, -10, -12, 17, 16,
-    2, -1, -1, -15, -6, 10, -1, -21, -13, 6, 16, 13, 26, 12, 6, -15,
-    -28, -8, 33, 19, 2, 7, -9, 7, -21, -11, -1, -9, -8, -10, -16, -7,
-    -4, -21, -15, -20, -7, 9, 4, 17, 15, -2, -9, -24, -2, 21, 35, 7,
-    5, 12, -4, 11, -32, -25, -50, -33, -42, -44, -12, -23, -24, -19, -19, -5,
-    13, 30, 22, 16, 2, -4, -14, -14, 11, 43, 15, 14, -2, 6, 15, 9,
-    -40, -38, -79, -77, -46, -34, -9, -3, -6, 13, -6, 11, 17, 20, 10, -3,
-    -3, 1, -1, -18, 3, 58, 41, 23, 3, 11, -10, -4, -30, -52, -65, -62,
-    -47, -19, 0, 0, 11, 8, 4, 13, -2, 10, -10, -2, -15, -5, 9, -2,
-    0, 14, 19, 13, 6, 14, -23, 15, -18, -31, -25, -49, -23, 5, 2, 14,
-    1, -5, 13, 23, 1, 2, -4, 10, 15, 6, 33, 14, 12, -15, 22, 9,
-    2, 18, 2, 17, -22, -33, -31, -12, 8, 22, 10, -2, 4, 19, 18, 10,
-    7, 15, 11, 13, 1, 27, 23, 16, -1, -7, 52, 8, 3, -5, 32, 23,
-    -11, -6, -5, -4, 17, 12, -7, 8, 15, 18, 7, -4, -7, 10, -6, -4,
-    -9, -1, 7, 3, 8, 13, 29, -4, -13, 6, 17, 43, -10, 24, 11, -4,
-    12, 0, -1, 10, -9, 3, -2, -7, -4, -6, -1, -6, -5, -9, -9, 11,
-    24, 19, 30, -23, -14, -13, -14, 25, -1, 18, 17, 7, 8, 5, 5, -22,
-    -23, -2, 10, -6, -3, -8, -10, -6, -34, -31, -9, 25, 13, -4, 7, -27,
-    5, -13, -20, 24, 16, 13, -3, 20, 8, 3, -1, -6, -5, -5, -5, -8,
-    -24, -20, -14, -13, -33, -30, -1, 24, -10, -18, -4, -3, -8, 2, 6, -5,
-    22, 4, 18, 6, 10, 4, -3, -3, -4, -11, -14, -17, -17, -9, -27, -18,
-    -44, -15, 24, 28, -15, -27, -29, 1, -10, -5, 36, -10, 35, 6, 13, 22,
-    23, 15, 15, 14, 2, -18, -24, -28, -16, -14, -14, -16, -20, -5, 35, 17,
-    1, -19, -27, -1, 2, -4, 23, 8, 15, -6, 2, 24, 26, 11, 22, 22,
-    1, -5, -17, -15, -3, -9, 5, 10, 3, 21, 18, 32, 23, -2, -29, 3,
-    0, -4, 22, 16, -2, -4, 27, 17, 20, 8, 0, 16, 1, 20, 10, 24,
-    22, 6, 0, 22, 2, -15, 3, 10, -11, -9, -14, 4, 3, -3, -7, -11,
-    10, 17, 42, 25, 3, 3, 33, 32, 16, 13, 27, 43, 29, -8, -11, 7,
-    -3, -51, -63, -43, -30, -8, 4, 4, 0, 1, 3, -12, -49, -39, -26, 20,
-    18, 15, 19, 4, -1, 6, 21, 25, -1, 12, 16, 27, 16, -15, -22, -4,
-    -6, 2, -4, -1, -1, -1, 1, -4, 14, 11, -4, -10, -11, 1, -1, -18,
-    -7, 7, -6, 18, 16, 4, -9, -7, -18, -12, -20, 2, -5, 2, 3, 0,
-    0, 1, -2, 3, -1, 5, 3, 0, 3, 1, 4, 4, -2, 3, -3, 4,
-    4, 4, -3, -2, -1, -1, 3, -4, 1, -4, -3, 1, -1, -4, 2, 1,
-    -1, -5, 9, 10, 11, 19, 26, 24, 44, 67, 67, 49, 48, 23, 20, 33,
-    20, -14, 8, 3, 0, 0, -4, 1, -4, 3, -3, 3, 7, 6, 14, 19,
-    2, 4, 17, 43, -15, -12, 7, 35, 41, 56, 32, 36, 27, 13, 12, 27,
-    11, 5, 4, -1, -4, 1, 1, 36, 32, -13, 20, 24, -32, 0, -11, -43,
-    -16, -4, -15, 1, -10, 6, 36, 38, 25, 36, 36, 5, 0, 25, 30, 1,
-    3, 1, 5, 19, 9, 4, 7, -26, -7, 0, -11, 3, -15, -9, -10, -3,
-    -8, -17, -6, -12, -10, 6, -7, 28, 5, 9, 40, -4, -2, 0, 33, 10,
-    -15, 32, 5, -33, -21, -13, -9, -29, -25, -24, -8, 4, 4, -7, 1, -20,
-    -5, -4, 19, 39, 33, 61, 14, -6, -4, 19, 26, -27, -17, 19, -16, -24,
-    -6, -16, 19, -3, 5, 4, 4, 20, -2, 3, 20, 2, 8, 6, 13, 0,
-    52, 89, 36, -18, -2, 11, 26, -18, -36, -23, -22, -7, 18, 18, 23, 32,
-    32, 15, 27, 16, 26, 24, 32, 25, 39, 6, 15, 15, 19, 47, 22, -26,
-    6, 23, -6, -31, -57, -20, -18, 12, 22, 9, 19, 41, 34, 19, 24, 26,
-    28, 29, 25, 42, 37, 5, 29, 39, 30, 24, 26, 17, 1, 19, -18, -31,
-    -3, -15, -14, 15, 29, 10, 19, 17, 2, 11, 18, 5, -25, -27, -10, -10,
-    -7, -17, 13, 19, 20, 20, -5, 25, 2, 11, 25, -5, 6, 9, 3, 6,
-    25, 7, 2, 4, -12, 4, -28, -37, -54, -72, -77, -60, -59, -57, -38, -49,
-    -20, 0, 36, 22, 5, 23, 37, 6, 5, -1, 4, -11, -4, -13, -17, -8,
-    -22, -24, -51, -41, -34, -43, -49, -53, -64, -76, -73, -84, -58, -44, 28, 26,
-    9, 20, 22, -1, -21, -28, -13, -16, 1, -9, -12, -9, -11, -34, -34, -23,
-    -10, -21, -4, -33, -54, -62, -92, -111, -90, -49, -3, 26, -4, 19, 18, -5,
-    -29, -44, -7, -12, -17, -8, -10, -6, 1, -6, -2, -4, -9, 2, -1, -12,
-    -3, -19, -88, -82, -94, -51, -7, 1, 4, -6, 25, -5, -8, -34, 15, 8,
-    -12, -8, -2, -3, 3, 2, 14, 18, 10, 2, 10, 11, 18, -10, -42, -53,
-    -38, -11, 15, -3, 3, -10, 29, -20, -24, -6, 17, 8, -9, -14, -12, -11,
-    2, 5, 18, 21, 6, 3, 18, -10, 9, -1, -30, -42, 7, 13, -11, 31,
-    5, -2, 10, -4, -52, -10, -9, -12, 6, 1, -10, -14, -32, 5, 16, 6,
-    -2, 0, 2, 0, 6, 12, 6, -13, 44, 53, 42, 31, -2, -1, -22, 15,
-    -32, -11, -15, -8, 10, -3, -9, -29, -25, -13, 13, 4, -3, 9, 1, -1,
-    20, 12, 23, -16, 20, 37, 37, -16, -2, -9, -8, 7, 14, 5, -8, -8,
-    -9, -5, -6, -29, -19, -13, 6, 9, 23, 10, 8, 7, 21, 19, 4, -30,
-    -6, 8, 39, 11, 2, 5, 45, -1, 17, 1, 8, 2, 15, 6, -26, -9,
-    1, 1, -1, 22, 14, 11, 8, 4, 26, 15, 6, -11, 18, 23, -21, 9,
-    3, -9, 35, 20, 23, 6, 9, 2, 17, 9, -13, 1, -2, 1, 12, 14,
-    21, 19, 26, 20, 23, 27, 10, 16, -2, 16, -28, -1, -4, -11, -10, 35,
-    22, 5, -5, -3, 1, 17, 22, 28, 22, 12, 33, 19, 23, 8, 23, 6,
-    21, 21, 7, 16, 16, 29, 9, -3, -2, -17, -20, 17, 18, 6, -4, -14,
-    -6, 9, 7, 20, 1, -15, -3, 12, 3, 2, 1, 9, 14, -2, 5, 24,
-    -6, 11, 15, 3, -3, -3, -11, 15, 43, 13, 33, -3, -7, 0, 2, 7,
-    3, -1, -2, 3, -7, 3, -8, 7, 5, -8, 9, 9, -2, 14, 7, 3,
-    3, 0, 32, 4, 9, -6, 8, 16, 27, 40, 13, 20, 14, 10, 4, 3,
-    -6, 24, 20, 20, 21, 2, -6, -27, 11, 4, 15, 1, -4, -2, -20, 15,
-    -9, -22, -13, 30, 60, 67, 8, 25, 48, 4, -16, 14, 7, 12, 17, 37,
-    4, 13, 37, 40, 28, -16, -2, 2, 2, 3, 3, 1, -32, -29, -26, -10,
-    10, 8, 15, -16, -15, -1, -16, 13, 18, -18, 0, 33, -6, -11, -3, 13,
-    -2, 6, -2, 1, 3, 1, -4, -1, 3, 2, 6, 17, 25, 18, 42, 34,
-    29, 40, 35, 47, 32, 49, 41, 34, -5, -27, -28, 3, 0, -3, 3, 1,
-    2, 1, -4, 1, 4, -3, -2, -1, -4, -3, 1, -3, -5, -3, 1, 1,
-    0, 3, -4, 0, 4, 3, -1, -2, -1, 1, 0, 2, 4, -3, -4, 3,
-    4, 0, -1, -5, -5, -7, -34, -29, -20, -25, 19, 12, -18, -25, -37, -43,
-    -39, -29, -6, -1, 3, -2, -2, -3, 2, -2, -17, -1, -21, -27, -15, -21,
-    -27, -45, -58, -21, -12, 23, -9, 5, 36, 37, 8, 15, 11, -9, 2, 2,
-    -17, -6, 4, -1, 1, 4, -25, 22, 23, -8, 1, 9, 30, -5, 7, -26,
-    15, 9, -4, 20, 35, 30, 9, 8, 20, -6, -20, -5, 23, -10, 4, 3,
-    -3, 2, -19, 55, 29, -1, 1, 15, 22, 29, 30, 3, -2, 8, 10, 12,
-    17, 3, -2, 17, -3, 15, -4, -21, 34, 6, 11, -5, 0, 1, -31, 9,
-    -25, 17, 9, 13, 14, 19, -11, 2, -1, -14, -9, 0, 14, 23, 8, 11,
-    8, -10, -6, -14, 5, 1, 20, 3, 3, 3, 1, -22, 1, -9, 4, 11,
-    10, 4, 2, 10, 1, -9, 9, 17, 20, 22, 25, 17, 19, -1, -11, 15,
-    23, 33, 34, 6, 3, 16, -7, -15, 1, -10, 16, 14, 2, 16, 17, -1,
-    12, 3, 11, 20, 16, 15, -1, 10, 5, -1, -29, -1, 13, 39, 11, 2,
-    -12, 20, -3, 8, -9, 8, 8, 11, 8, -7, 7, 15, 15, 12, 2, 10,
-    -1, -3, -8, -11, -18, -9, 6, -17, 14, 17, 14, 2, 6, 25, -21, 19,
-    7, -10, 9, 6, 22, 9, 12, 19, 12, 7, 11, 2, -15, 0, -8, -33,
-    -30, -7, 12, -9, -20, 20, 15, 10, 8, 20, -30, 16, 23, -4, -3, 9,
-    14, 10, 15, 17, 21, 27, 27, 11, 1, 1, -5, -9, -7, -7, -2, -10,
-    -17, 29, 34, 7, 8, 7, 12, 56, 56, 10, 5, -8, -14, -18, -9, -4,
-    21, 25, 39, 36, 18, 11, 9, -6, -4, -13, -5, -11, -26, 6, 43, 17,
-    8, 9, 7, 38, 36, 28, 7, 1, -14, -32, -29, -5, 2, 19, 43, 49,
-    18, 0, 6, 4, -9, -11, -13, -19, -69, -29, 6, 2, -4, 9, 21, 17,
-    16, 17, 6, 3, -9, -30, -42, -9, 0, 23, 36, 32, 18, 14, 1, -2,
-    5, -5, -28, -49, -42, -18, -31, -33, 3, 11, 35, 31, 6, -19, 14, -8,
-    -14, -32, -28, -16, -17, 4, 20, 0, 1, 16, 2, 7, 5, 9, -9, -16,
-    -19, 4, -40, -22, 7, 8, 6, 6, 13, -13, 20, -1, -11, -24, -19, -16,
-    -31, -12, 1, -7, 0, 14, 13, 2, 19, 16, 9, 10, -12, -4, -28, -25,
-    3, 13, -5, 9, 13, 10, 7, -4, 8, -13, -16, -40, -51, -17, -15, -2,
-    5, 8, 22, 13, 12, 9, 8, -3, 4, -61, -29, -34, -1, 12, -9, 24,
-    7, 10, 19, 15, 13, -12, -25, -38, -51, -45, -21, 7, 9, 18, 17, 11,
-    9, -5, -1, -3, 6, -75, -21, -43, 26, 8, -4, 26, 21, 22, 27, 17,
-    11, -2, -16, -31, -58, -34, 6, -1, 14, 15, -2, 16, 25, 6, -1, -8,
-    -17, -88, -10, 0, 2, -18, 4, 6, 2, 9, 15, 7, 18, 9, -2, -18,
-    -28, -23, -9, 8, 14, 11, 6, 24, 20, 0, -18, 0, 13, -22, -30, -5,
-    2, -21, -31, -19, 2, 15, 11, -8, 3, -1, -3, -11, -19, -15, 1, 8,
-    20, 18, 10, 18, 19, -6, -11, -4, 8, -1, -17, 4, 7, -12, -36, -33,
-    -14, 7, 1, -10, 1, -4, 1, -3, -13, -5, -5, 11, 11, 5, 6, 14,
-    20, 4, -16, -43, -40, -10, -23, -2, 3, 4, -43, -38, -19, -34, -22, -23,
-    -27, -16, -12, -16, -23, -21, -5, -1, 10, 16, 3, 2, 19, -2, 0, -13,
-    5, -3, -23, -8, 4, -4, 0, 1, -8, -27, -32, -37, -45, -39, -39, -24,
-    -24, -8, -20, 5, 20, 15, 12, 3, 15, 8, -2, -16, 19, 1, -17, 4,
-    0, -2, 13, 25, 7, -5, -12, -13, -20, -46, -16, -15, -10, -14, -48, -18,
-    3, 6, 2, 6, 39, 7, -24, -5, -2, -24, -9, -1, -2, -3, 9, 10,
-    11, 40, 18, 15, 29, 30, 14, 23, 48, 35, 22, 17, 32, -6, 7, 51,
-    36, 26, 17, 30, 37, -13, -10, -3, 3, -4, 2, -2, -2, 24, 32, 53,
-    53, 51, 33, 31, 41, 81, 64, 54, 71, 63, 42, 45, 76, 65, 42, 27,
-    6, 2, 3, 4, 3, 1, -5, 4, 7, 3, 11, 10, 15, 17, 36, 32,
-    29, 20, 42, 18, 39, 39, 29, 20, 22, 30, 33, 21, 2, 3, 0, 2,
-    -3, 3, -3, -1, 2, -4, 2, 2, 4, 0, -2, -5, 3, 2, 2, 2,
-    -4, -1, -2, -2, -4, 4, 1, -1, 0, 5, 3, -3, 0, -3, -5, 0,
-    -1, 7, 8, 8, 2, -2, 12, -3, -1, 11, 20, 48, 56, 35, 34, 17,
-    16, 9, 3, 4, 0, 2, -1, 4, 2, 4, 9, 3, 9, 15, 5, 7,
-    -23, -9, -21, -4, -15, 29, 22, 55, 76, 54, 19, 44, 28, 10, 16, 2,
-    -13, -20, -1, 5, -4, -1, 24, 6, 10, -23, -13, 17, -28, -32, -9, -13,
-    0, 7, 11, 5, 20, 5, 12, 39, 33, 8, -11, 41, 9, -28, -25, 4,
-    2, -5, -3, 21, -7, -27, -33, -47, -26, -20, 1, -2, -13, 18, 5, -5,
-    -2, -13, -11, -17, -11, 5, -22, -12, -37, -25, -6, -12, 3, -2, 15, 2,
-    -20, -15, -47, -52, -19, -14, 6, -13, -12, 15, 16, 23, 6, -6, -3, -23,
-    -28, -17, -9, 23, -8, -7, -9, -26, 3, 13, 2, 1, -14, -11, -41, -60,
-    -55, -47, -3, -8, 4, 30, 17, 17, 2, -15, -18, -19, -22, -18, 4, -23,
-    5, 34, 8, -23, 2, 21, -7, 16, -29, -35, -39, -27, -32, -28, -7, 18,
-    19, 15, 44, 22, 1, -17, -19, -21, 5, -5, 12, -21, -17, -15, -1, -26,
-    12, 13, -9, -3, -57, -44, -5, -9, -32, -31, -25, -3, 2, 20, 49, 35,
-    -10, -21, -30, -19, 11, 11, 2, -24, -12, -10, -10, -14, -11, -1, -34, -50,
-    -28, -20, 1, 8, -13, -32, -31, -22, -11, 30, 57, 26, -19, -41, -11, -4,
-    -5, -13, -14, -12, 9, 29, -14, 1, -19, -4, 12, -11, -15, -20, -26, 18,
-    -7, -39, -23, -1, 25, 56, 39, 5, -36, -27, -17, -17, -8, -24, -15, -10,
-    -19, -10, -20, -4, -5, -6, -9, 15, -14, -28, -26, -10, -31, -22, -12, 5,
-    29, 38, 13, -32, -38, -21, -19, 9, -15, -24, -18, -8, -42, -46, -32, 17,
-    -5, -2, 1, 31, -20, -30, -30, -41, -9, 4, 10, 16, 38, 28, -5, -54,
-    -26, -30, -17, -16, -13, -25, -4, -7, -20, -49, -16, 14, 1, -5, 1, 35,
-    -11, -43, -35, -31, -8, 21, 20, 17, 17, -5, -26, -47, -27, -22, -15, -7,
-    -14, -15, -19, 24, 5, -43, -18, -31, 2, 16, 11, 21, -28, -46, -31, -12,
-    15, 21, 1, -10, 17, -10, -14, -24, -13, -16, -17, -20, -18, -14, 15, 27,
-    31, -19, -4, -25, -6, 13, 22, -1, -33, -44, -38, -18, -2, 3, -7, -7,
-    16, -8, -17, -16, 4, -4, -13, -12, -14, 8, 12, 28, 22, 23, -4, -3,
-    -3, 16, 8, 21, -9, -3, -58, -21, 10, -3, -10, 17, 5, -1, -6, -14,
-    -1, -3, 6, 8, 3, 15, 29, 21, 40, 13, -39, -5, 4, 14, 9, 44,
-    -6, -18, -27, -6, 20, 6, 6, -4, -3, 3, 7, -10, -4, 9, 22, 19,
-    1, 16, 41, 5, 28, -14, -22, -3, -27, -4, -15, 72, 12, 6, 4, -11,
-    1, 10, -10, -14, -6, 4, 15, 10, 20, 12, 22, 18, 2, 16, 6, 3,
-    4, -10, -37, 7, 3, -1, -3, 59, 18, 17, 3, 0, 1, 13, -11, 7,
-    9, 13, 18, 28, 25, 9, 26, 15, 9, 13, 17, 31, 35, 12, -18, 22,
-    -3, -7, -17, 32, 19, 9, 3, -5, 5, 23, -6, 7, 24, 20, 23, 21,
-    27, 13, 38, 30, 13, 20, 21, 29, 37, 26, 3, -3, -1, -17, -34, 9,
-    11, 5, -14, -7, 8, 13, 3, 2, 15, 11, 23, 16, 6, -12, 28, 9,
-    30, 22, 0, -4, 34, 29, 43, 4, 5, -8, -44, 0, 2, 6, -21, -24,
-    4, 8, 7, 5, -2, -7, -1, 15, -1, -14, 0, 5, 17, -8, -21, 14,
-    -11, 3, 32, 6, -2, -1, 6, 12, 9, 11, -7, -26, -2, 19, 17, 24,
-    12, -11, 11, 12, 6, 4, -19, -12, -21, -46, -38, -3, -14, 4, 28, -3,
-    0, -4, -13, 10, 27, 5, -1, 15, -7, 37, 27, -5, -7, -6, 23, 18,
-    20, 37, -4, -2, -23, -28, -14, 10, 3, 16, 28, 2, 0, -2, 3, 11,
-    13, -23, -5, 18, 27, 41, 10, -10, -11, -8, -12, -8, -30, -40, 12, 51,
-    45, 37, 50, 27, 22, -5, -3, -1, 1, -4, 2, 0, -3, -29, -21, -4,
-    4, -6, -7, -19, -59, -17, -13, -3, -25, -34, -8, 22, -11, -6, 19, 15,
-    -6, -2, 2, 4, 3, -2, -3, 1, 2, -3, -10, -11, -10, -11, -10, -12,
-    -20, -19, -34, -8, -7, -2, -7, -4, -6, -11, -4, -2, -2, -3, -4, 3,
-    2, -4, -1, 1, -2, -1, -3, 0, 0, 2, 0, 3, -15, -9, 11, 0,
-    4, 4, 4, 0, 1, 3, -3, -4, 4, -1, 4, 5, 1, 4, -3, 0,
-    0, -3, -14, -16, -12, -9, -25, -5, -9, -17, -8, -17, 10, 1, -18, -17,
-    -26, -17, -15, -11, -3, -4, -2, -2, -2, 0, 0, -2, -13, -6, -13, -22,
-    -40, -36, -38, -30, -4, -17, -20, -14, -20, -39, -20, -41, -47, -35, -15, -11,
-    1, 4, 0, 2, 1, 4, 1, -32, -33, 11, -5, -29, -30, 9, 6, -2,
-    -12, -5, 10, 13, -30, -64, -73, -48, -26, -26, -15, -17, -10, -1, 4, 3,
-    0, -4, 6, -24, -16, -13, 5, 21, -9, -7, -5, -3, 15, 23, 16, 31,
-    -3, -8, -19, -41, -33, -39, -3, 3, 14, 1, -24, -5, 3, -2, -2, -3,
-    -4, -30, 10, 5, -7, -20, -8, 6, 6, 15, 18, 23, 20, -5, 12, -22,
-    -34, -42, -24, -28, -7, -10, -12, -2, -4, -7, 16, -17, -32, -18, 13, 7,
-    4, 10, -14, -14, -7, 9, 16, 0, 11, 0, 2, -12, -34, -31, -43, -33,
-    -35, -16, -11, 4, -5, -4, 5, -1, -18, -1, 16, 0, 0, -7, -7, -8,
-    -9, -2, -9, 4, 11, 11, 4, -10, -22, -17, -25, -24, -16, 2, -4, 6,
-    -27, -27, 15, 0, -10, -6, -11, -27, -15, -1, -5, -11, -24, -37, -14, 22,
-    27, 18, 18, 0, -19, -26, -29, -38, -33, -37, -11, 0, -10, -43, 24, 10,
-    -28, -11, -7, -20, -16, -6, -5, -25, -34, -29, -20, 17, 32, 26, 27, 12,
-    -26, -42, -50, -37, -36, -33, -20, -3, -12, -25, 0, 17, -10, -8, 1, -13,
-    -10, -4, -16, -25, -24, -16, -5, 16, 23, 34, 19, 6, -14, -42, -50, -38,
-    -39, -23, -16, -4, -4, -7, -7, -16, -12, -3, 0, -4, -2, -6, 8, -5,
-    -4, -9, -7, 6, 17, 26, 20, 17, 6, -12, -22, -30, -29, -21, -37, -2,
-    -10, -14, -1, -14, -2, 5, 14, -25, -8, 2, 3, -9, 1, 0, -9, -16,
-    -4, 16, 9, 25, 11, -10, -6, -7, -4, 0, -9, -18, -1, -10, -28, -6,
-    4, 3, -3, -5, -11, -13, 4, -16, -12, -12, -30, -21, -4, 34, 15, 7,
-    4, 4, 13, -9, -3, 15, 25, 3, 3, -14, -40, -8, 8, -8, -1, -5,
-    -12, -3, -17, -25, -20, -21, -17, -11, 24, 38, 15, 15, 5, -8, -4, -15,
-    1, 11, 15, 11, 0, -12, -37, 8, 32, 7, -4, -21, -6, -2, -3, -15,
-    -4, -10, -17, -4, 29, 24, 0, 15, -8, -19, -12, -13, -6, 11, 25, 15,
-    2, -3, 4, 12, 20, 2, -10, -19, -15, -1, 12, 9, 13, -10, -15, -16,
-    17, 20, -6, -4, -10, -13, -3, -27, -14, 14, 29, 33, 2, -1, 42, 7,
-    -1, -11, -11, -4, -2, 18, 33, 7, -12, -2, -13, -7, 19, 12, 0, -21,
-    -24, -8, 2, -21, -19, 30, 0, 36, 15, 9, 10, 25, 2, -1, 15, 6,
-    20, 11, 23, 9, -4, -9, -2, 12, 17, 10, 13, 3, -19, -2, -2, -11,
-    0, 22, 11, 9, -16, 25, -27, 39, 0, -2, -10, -8, 8, 3, 12, 2,
-    11, 14, 0, 4, 10, 0, 14, 8, -15, -8, -21, -25, -9, 24, 14, -12,
-    2, 33, 11, 56, -15, -3, -14, -8, -17, 14, 9, 6, 2, -5, -10, -2,
-    11, 0, 3, 14, 18, 19, 3, 9, 8, 7, 8, 4, -10, 13, 45, 60,
-    1, -6, -9, -8, -13, 3, -3, -3, -4, -14, -19, -2, 12, -1, 17, 19,
-    18, 33, 27, 6, 9, -7, -1, 4, -7, 4, 50, 59, 11, 9, -4, -2,
-    -7, -14, 8, 12, -3, -15, -2, 1, 3, 4, 23, 19, 34, 24, 29, -4,
-    9, -7, -16, 0, -2, -1, 4, 37, -6, 8, -2, 12, 27, 11, 26, 22,
-    1, -10, 12, 3, -6, -6, 1, 11, 26, 43, 31, 18, 22, -6, 2, -4,
-    -4, 1, -20, 9, 11, 12, -6, -1, -7, 6, 11, -4, -9, -5, 9, -7,
-    -10, -16, -8, -1, 22, 38, 46, 41, 18, 26, 14, -4, 5, -1, 21, -11,
-    27, 47, 15, -6, -33, -21, -10, -6, -19, -17, 3, -9, -12, 4, 0, -1,
-    15, 11, 1, -9, -17, 22, 11, 0, -4, 0, 1, 0, 39, 54, 49, 23,
-    9, 37, 28, 20, 16, -8, 11, -5, -10, 6, -2, -9, 10, 15, 8, 19,
-    24, -4, 4, -1, -2, -1, 2, -1, -13, -4, 14, 22, 21, 15, 7, 24,
-    19, -14, 12, 11, -6, -15, -3, 11, 4, -22, 2, -21, 3, -3, 0, -4,
-    3, 4, -1, 2, -1, -2, 0, -2, -4, -3, 2, 0, -1, 3, 9, 1,
-    2, -1, 1, 0, 5, -4, -2, -2, -2, -2, 4, 3, 2, -3, 0, 0,
-    0, 2, -4, -1, -5, -2, -15, -30, -4, -7, 10, -23, -27, -33, 1, -3,
-    -15, -16, -8, -9, -3, -4, 0, -1, -3, -3, -2, -3, -3, -2, -3, -9,
-    -11, -30, 18, 18, 22, -23, -37, -36, -52, -52, -58, -57, -30, -31, -25, 5,
-    20, 2, -3, 2, -4, 2, -3, 0, 3, 2, -3, -24, -19, 10, -7, -3,
-    -20, -69, -63, -38, -22, -18, -34, -12, -20, -51, 5, -17, -28, -23, -28, -3,
-    0, -2, -8, -32, -35, -19, -21, -34, -28, -11, -27, -23, -18, -33, -48, -24,
-    2, 3, -7, 9, 5, -11, -5, -12, -45, -62, -50, -22, -2, 2, 18, 27,
-    -24, 36, 37, 17, 44, 29, -4, -8, -27, -35, -26, -14, 1, -6, -8, -4,
-    -18, 6, 23, 17, -14, -66, -30, -14, 3, -1, -5, 25, -37, 26, 28, 27,
-    5, 18, 5, -2, -1, -7, 5, -3, 1, 8, -7, -8, -3, -1, 11, -8,
-    6, -66, -17, -29, -4, 17, -5, 3, -42, -24, -6, 3, -7, 16, 10, -14,
-    -17, 7, 15, -5, 19, 8, -11, 10, 0, 2, 12, 23, 10, -32, 0, -34,
-    -13, 20, -7, 8, -37, 7, 5, 19, 4, 9, -13, -20, -14, -28, -4, 10,
-    14, 22, 3, 17, -8, -9, 11, -4, -13, -22, -11, -22, 1, 44, -18, 4,
-    -46, -6, 27, 38, 16, 10, -17, -1, -25, -36, -15, 28, 47, 22, 24, 26,
-    -6, 10, 8, -24, -1, -39, -31, -40, -3, 38, 15, -2, -34, -19, 7, 1,
-    25, 4, 6, 5, -28, -35, -27, 35, 47, 30, 30, 39, 37, 5, -18, -27,
-    5, 26, -40, -36, -5, 14, -17, 8, 0, -15, -26, -17, -3, 3, 8, -6,
-    -24, -25, -10, 41, 41, 22, 14, 39, 25, 21, 4, 12, 12, 10, -52, 24,
-    -4, 2, -13, -19, -1, -36, -26, -18, -17, -9, -17, -25, 1, 6, 13, 28,
-    20, 9, 4, 4, 5, 38, 18, 19, -4, 31, -9, 18, -2, -1, 35, 13,
-    -26, -23, -17, -9, -13, -8, -27, -17, -6, 24, 26, 17, 12, 9, 3, 0,
-    17, 5, -29, -7, 22, 27, -9, -33, 3, -2, 37, 24, -25, -19, -25, 14,
-    -9, -6, -31, 0, 6, 4, 22, 7, 15, -1, 8, 15, 2, -3, -13, 6,
-    -13, -4, -37, -20, 0, 2, 37, -22, -28, -35, -38, 2, 3, 1, -6, -3,
-    -4, 11, 11, 11, -8, -22, -23, -25, -21, 11, -3, -3, -30, -13, -22, 7,
-    0, 13, 36, -32, -19, -27, -47, -30, 6, 13, 10, 15, 22, 37, 5, -11,
-    0, -25, -26, -32, -28, -9, -14, 3, -16, -8, 34, 17, 2, 16, 21, -30,
-    -10, -13, -20, -31, -20, 0, 29, 35, 48, 43, -13, -52, -37, -40, -14, 0,
-    -2, 5, 10, 33, -6, 29, 28, -42, -26, 26, 4, -24, 1, -43, -48, -16,
-    -14, 13, 36, 32, 54, 24, -51, -93, -41, -6, 15, -20, -13, -20, -22, -6,
-    -44, 7, 38, -22, 19, -19, -10, -16, -29, -63, -19, -9, 9, 25, 29, 43,
-    50, 10, -87, -98, -40, -23, -35, -52, -26, -29, -20, -30, 1, -15, 11, 16,
-    2, -24, -50, -37, -32, -16, 16, -6, 1, 6, 28, 41, 53, -14, -84, -82,
-    -22, -31, -49, -45, -5, -16, -16, -2, 8, -6, -6, 0, 20, 4, -43, -35,
-    -17, 22, -5, -14, -8, 16, 21, 11, 34, -18, -54, -71, -46, -46, -11, -6,
-    18, 1, -37, -9, 9, 31, 2, 3, 20, 15, -27, -38, -35, 16, 10, 12,
-    6, 12, 12, 1, 16, 5, -13, -60, -36, -33, -1, 5, 6, 8, -18, -23,
-    5, 27, 35, -1, 3, 0, -41, -42, -25, -12, 24, 21, 7, 29, 17, 19,
-    39, 32, -14, -51, -47, -48, -6, -23, -25, -7, -18, -18, -3, 15, 29, -3,
-    1, 0, -21, -39, -9, 9, 21, 22, 11, 1, 4, 24, 26, 6, -4, -45,
-    -104, -76, -47, -33, -39, 6, 22, 19, 27, 21, 24, -2, 4, 1, 4, 35,
-    48, 36, -10, 4, 4, 1, -21, 13, 3, 4, -13, -31, -22, -15, -39, -68,
-    -42, -25, 26, 33, 35, 16, 23, 1, -3, 2, 3, -21, -39, 7, 30, 28,
-    -27, -45, -26, -27, 10, 20, -11, -27, -22, -27, -42, -43, 5, -6, 16, 8,
-    -2, 23, 3, 0, 5, 5, 3, 0, 14, 11, -7, -7, -5, -16, 9, -2,
-    82, 30, 16, 13, -4, -34, -29, -36, -4, 1, 4, 11, 2, -2, 0, 0,
-    0, 0, 0, -1, -3, -5, -4, 2, 3, 2, 3, 1, 4, 5, 2, 4,
-    -1, 0, -1, 1, -3, -2, 1, 0, 3, 2, 1, 2, -3, 1, -2, 0,
-    0, 4, -4, 3, 4, 1, -2, 0, -3, 4, 4, 4, -4, -4, 3, -2,
-    -4, -4, -2, -1, -3, 3, -1, 3, -3, 1, 1, 0, 1, 4, 2, 3,
-    -2, -2, 1, 3, 4, -2, 1, -3, -4, -4, -2, -5, -3, 3, 1, 3,
-    1, 4, -3, 1, 4, 4, -3, 4, 3, 4, 2, 2, 0, 4, 2, -1,
-    -1, 2, -3, 2, -5, 5, 0, -2, 0, -1, 0, 5, 2, -2, -3, -2,
-    -2, 3, -3, 2, -2, -1, 5, -3, 3, 1, -4, -3, 4, -2, 4, 0,
-    1, 2, -4, -4, -2, 1, 4, 1, 4, -4, -3, 0, 5, -1, -1, -1,
-    -4, 0, -4, -1, 2, -3, 2, -5, -2, -1, 0, 0, 3, -3, 0, -2,
-    -5, 1, -2, -4, 4, 2, -4, 1, -1, 4, 1, -2, 2, -2, -2, -4,
-    -3, 0, 3, -1, -2, -4, 2, -1, 1, -2, 3, -2, -1, -1, 1, -3,
-    -3, -2, 3, -2, 0, 0, -1, 4, 1, 4, -2, 0, -1, -2, -1, -1,
-    -2, 1, -1, 1, 1, -4, -3, -4, 3, 2, 3, -2, 0, -3, -3, 2,
-    -2, -1, -2, -1, 0, 4, -1, 0, 1, -3, -2, 0, -4, -2, 2, -3,
-    2, -3, 0, -5, 1, 0, -3, -1, -1, 3, 2, -2, 2, -1, -1, 4,
-    -3, -4, -1, -1, 0, -2, -5, 0, -5, -4, 0, 1, -4, -1, 1, -3,
-    -2, -3, -4, 0, 1, -4, -3, 3, -4, -4, -4, 2, -3, -3, -3, 0,
-    3, -1, -5, -6, -1, 0, -1, -6, -2, 0, -1, 0, -4, -4, 1, 2,
-    2, 4, 4, 2, -3, 0, -1, 5, 0, 1, -2, -6, 0, 1, 2, -1,
-    0, 1, -2, 4, -4, 1, -7, 0, -4, -1, -2, -1, 1, -1, -4, -2,
-    0, 4, 2, 2, 1, -3, 2, 4, -3, 4, 2, 0, 1, 3, 2, -3,
-    1, -5, -5, -2, -3, -4, -4, 0, 0, -3, -1, 1, 1, -4, 1, -5,
-    -1, -4, 0, -3, -1, 3, -3, -5, 2, -5, 3, -4, 2, -3, -5, 1,
-    -3, 0, 2, 1, -2, 1, 1, 4, 4, -4, -4, -4, 3, -4, -5, 2,
-    4, -1, -3, -5, 1, 3, -1, -1, -4, 1, -4, -6, -6, 1, 1, -7,
-    0, 3, -3, -2, -4, -1, 4, -2, -3, -2, -3, -4, -2, 1, 2, 0,
-    3, -1, -1, -2, -6, -6, -5, -5, -1, 0, -2, 2, -3, -5, -1, -4,
-    -2, 1, -2, -3, 2, 3, 3, -4, -5, -5, -5, -5, -2, 2, 3, -2,
-    -2, -1, 0, -1, 1, 1, 1, -6, -3, 0, -4, 1, -3, 4, -4, 4,
-    -5, -3, -5, 1, -1, 3, -2, -3, -3, 0, -6, -3, -2, -6, -5, -1,
-    -4, 4, 2, 1, -1, -3, 3, -5, -4, -2, -3, -5, -2, -2, 0, -3,
-    3, 3, 0, -1, -3, -5, -3, 4, -1, -4, -2, 3, -4, 4, 1, 3,
-    -4, 1, 2, 1, -3, -1, -5, 0, 2, -1, -1, -3, 1, 1, -5, -1,
-    1, -1, -1, -3, -2, -4, -2, 0, -4, -1, -1, -3, 2, 1, -3, -2,
-    3, 1, 3, 2, 5, -4, 1, -5, -3, -2, -2, 2, 4, -3, 4, 3,
-    -3, 3, -3, -4, -3, 2, 1, -4, 1, 1, -2, -4, -1, 3, -2, -2,
-    -3, 0, 0, -2, -4, 1, 1, -2, 0, -4, -4, -4, -5, -2, 1, 4,
-    2, 2, -3, 2, -1, 0, 0, 1, 3, -1, 0, 4, -3, -2, 0, 4,
-    4, 1, 4, -4, 1, -3, -2, -4, -2, 3, 0, 3, -3, 1, 0, -1,
-    -3, 0, -2, -5, 3, 0, 1, 0, 1, 2, 2, -4, -4, 0, 0, -1,
-    2, 0, -4, 0, -2, -4, 0, 3, -3, -2, 5, 3, -4, 3, -2, -2,
-    3, -2, 0, 4, -3, 2, 3, -3, 0, -3, -3, -4, 0, -4, 3, 2,
-    -2, -4, -3, -1, 1, 4, 2, -3, 2, 2, 2, 2, 4, -4, -4, 5,
-    2, 4, 3, -4, 0, 3, 4, -2, -1, -4, -1, 1, 4, -4, 1, -4,
-    0, 4, 3, -4, -3, -1, 4, 2, -2, 2, -2, 3, 0, 2, 3, -2,
-    1, 4, 0, -3, -2, 3, 2, -2, 5, 2, 4, -1, 0, 4, -4, 0,
-    2, 0, 0, -2, -3, 1, 3, -3, -2, -2, 0, 4, 3, -2, 3, 0,
-    -3, -4, -1, 2, 1, -1, -4, 2, -4, -4, -4, 3, -4, -1, 3, 4,
-    1, -5, 0, -4, -1, -3, -4, 0, 2, 2, -3, 2, 4, 11, 13, 5,
-    1, 0, -3, 4, -1, 4, 3, -1, -2, -3, 2, 0, -1, -2, 0, 4,
-    -1, 2, 10, 12, 10, 11, 1, 0, -3, -1, -19, 26, 9, 5, 6, 32,
-    27, 1, 0, 2, -2, 5, -1, -3, 4, -3, 12, -4, 20, 17, 12, 6,
-    44, 60, 72, 63, 24, 21, 45, 58, 37, 44, 40, 41, 45, 32, 17, -1,
-    22, 11, 0, -1, 0, 4, 13, 3, 14, 32, 40, 39, 22, 6, 1, 25,
-    14, -7, 3, 11, 12, 21, 43, 35, 1, 18, 13, 2, -8, 34, -1, 1,
-    5, 2, 19, 17, 47, 48, 49, 16, 37, -10, 32, 19, 9, 18, 14, -2,
-    11, 17, 12, -6, -22, -39, -47, -45, -34, -9, -5, 3, -4, 1, 32, 30,
-    36, 26, 24, 34, 10, -5, 17, 3, 20, 24, -5, 1, 14, 1, -1, -2,
-    -2, -16, -46, -30, -29, -11, -10, -2, -3, 10, 4, 32, 27, 21, 16, 10,
-    -10, 9, 14, 15, 18, 9, 2, 2, -1, -3, -8, -4, -36, -27, -21, -49,
-    -36, -17, -12, -2, -5, 30, -14, 18, 32, 11, 12, 11, 3, 2, 14, 19,
-    11, 1, -3, -15, -24, -20, -19, -22, -30, -40, -41, -36, -41, -25, -2, -4,
-    0, -1, -20, -15, 25, 17, -9, 6, 7, 13, 15, 10, 1, -7, -12, -13,
-    -20, -17, -36, -30, -34, -37, -13, -19, -65, -31, -22, -8, -9, -9, -40, -39,
-    28, 24, 1, 18, 3, -1, -7, -7, -6, -18, 4, 11, 6, -11, -14, -22,
-    -36, -30, 0, -6, -57, -12, 3, 15, -10, 0, -33, -8, -5, 3, -4, 1,
-    -24, -16, -15, -15, -4, 0, -1, 3, 1, -13, -21, -6, -6, -11, -21, 3,
-    -43, 1, 2, 1, 0, -5, -28, 7, -1, -27, -32, -40, -18, -12, -4, -5,
-    3, 11, 15, 4, 4, -14, -5, 12, 10, 11, 0, -16, -30, 0, -31, 23,
-    -7, -11, -21, 10, -37, -48, -56, -43, -11, 0, 9, 18, 20, 31, 30, 12,
-    7, 0, 6, 8, 6, 13, 8, -4, -7, 20, -2, 20, 3, -6, -9, -1,
-    -47, -46, -38, -40, 9, 3, 10, 16, 25, 28, 21, 0, -3, -5, 5, 7,
-    16, 15, 8, 18, 15, 32, 24, 24, -3, 10, 6, 7, -33, -44, -28, -13,
-    11, 14, -2, -4, 6, -3, 13, -12, -16, -6, 1, 14, 14, 9, 17, 10,
-    -12, 23, 62, 25, -1, 2, 23, -2, -20, -21, -12, -3, -2, -12, -17, 6,
-    2, 5, 13, -11, 8, 16, -2, 21, 16, 16, 13, 6, 16, 29, 28, 35,
-    -3, 4, 38, 0, -4, -8, -6, -6, -24, -17, -4, 4, -14, 24, 27, -8,
-    22, 14, 10, 23, 20, 34, 33, 23, 39, 48, 65, 7, 3, 8, 35, -7,
-    -19, -13, -3, -5, 5, -16, -12, -24, -16, 19, 6, 18, 22, 9, 7, 9,
-    11, 30, 26, 16, 5, 42, 7, -28, 25, 14, 27, 9, -8, 2, 7, 3,
-    -13, -4, -18, -37, -20, 5, -3, 14, 13, 19, 6, -6, 8, 24, 28, 29,
-    3, 38, 2, 40, 9, -5, -19, -8, -10, 14, 4, 12, -5, 11, 7, 10,
-    -14, -13, -2, 8, 15, 9, -3, 7, 7, 4, 27, 45, 1, 65, 34, 27,
-    4, -9, -24, 10, -18, 11, 18, 8, -2, 13, 0, 6, -5, -13, 5, 11,
-    17, 1, 20, 12, 10, 13, 33, 41, 24, 46, 41, 0, 7, 6, 9, 8,
-    -39, -16, 10, 11, 17, 16, 14, 6, 1, -7, 3, -9, -6, 7, 24, 18,
-    27, 16, 14, 34, 26, 2, 17, -10, 8, 11, 7, 3, -18, -29, 0, 14,
-    9, 28, 26, 17, -9, -11, -30, -19, -21, -10, 16, 7, 12, -11, -24, 8,
-    13, -31, -10, -9, 3, -4, 6, 23, -9, -18, -29, 8, 1, 14, 12, 9,
-    -17, -19, -16, -6, -9, -17, -16, -12, 9, -6, 7, 19, 12, -25, 9, 4,
-    2, 2, -9, 9, -9, -7, 3, 17, 4, 2, 5, 0, -16, -24, -8, -11,
-    -10, 0, -46, -50, -39, 11, -7, -8, 12, 28, 15, 2, 2, -3, 6, -10,
-    15, -2, -6, 18, 11, 2, 8, 16, 25, 5, 4, 1, 4, -25, -43, -17,
-    1, 1, 4, 6, 14, 5, 7, 0, -4, 3, 3, -1, 1, 22, 19, 22,
-    -4, -8, -7, -25, -38, -2, 12, 16, 20, 18, 9, 17, 21, 0, 2, 10,
-    -1, -1, 4, 1, -4, 2, -3, -3, 0, -2, -6, 1, -5, 8, 1, 4,
-    3, -14, -4, -6, -15, -8, -11, -15, -11, 26, 22, 1, -1, 1, -2, -1,
-    1, -1, 3, -4, -2, 3, -3, 0, -2, 2, -3, 4, 10, 8, -4, 3,
-    2, 2, 1, -3, 0, -3, 1, 2, 1, -1, 0, -3, 1, 4, 4, 4,
-    1, 1, 8, 6, 15, 10, 17, 16, 19, 27, 3, 6, 22, 16, 9, 10,
-    12, 4, 2, 6, 1, 4, 1, -2, -5, -3, 15, 2, 11, 11, 11, 10,
-    2, 6, 9, 46, 3, -5, 10, -15, -26, 11, 26, 3, 10, 32, 23, -3,
-    -9, -14, -4, -3, -3, -3, 14, 20, 23, 34, 23, 26, 11, -4, 6, 31,
-    9, 17, 28, 6, 10, 24, 42, 10, 25, 47, 28, 39, 1, -18, -6, 5,
-    4, 0, 25, 51, 12, -4, -9, -15, -8, 8, 28, 24, 3, -14, -7, 4,
-    11, 5, 15, 3, 11, 23, 9, 21, 30, 25, 30, 31, -1, 1, 35, 27,
-    6, -15, -20, 3, -3, 9, 7, -6, -8, -25, -3, -4, 9, 18, -9, 5,
-    21, 12, -14, -12, 13, 14, 35, 29, 0, 8, -19, -20, 14, 1, -5, 1,
-    5, -14, -5, 0, -8, -17, -1, 12, 4, 16, 5, 16, 21, 10, -12, -2,
-    6, 23, 9, 12, -6, 3, -12, -5, 26, 2, -8, 1, -6, 3, 10, 9,
-    -9, -4, 6, 25, 14, 2, 13, 10, -2, -1, 0, -8, -1, 6, 4, 24,
-    1, -11, 17, 24, 14, -15, -17, -4, -8, 4, -3, 4, 8, 15, -7, -4,
-    19, -11, -11, -6, 6, 6, -12, -4, 2, -20, 13, 14, -1, -17, 13, 16,
-    2, -26, 2, -5, 4, -3, -12, -1, 5, 11, -9, -23, -12, -10, -25, -26,
-    5, -12, -13, 14, -2, 17, 16, 11, -10, -11, -2, 22, -11, -9, 8, -13,
-    -9, 0, 4, 3, 15, 9, -2, -36, -28, -26, -21, -14, 9, -9, -8, 5,
-    12, 0, 31, 7, -10, -8, -28, -11, -21, -26, -5, -18, -6, 8, 6, 13,
-    16, 18, -2, -24, -18, -7, -10, -2, -9, -8, -43, -36, 20, 17, 41, -10,
-    -7, -9, -6, 5, -39, -20, -21, -1, -1, 6, 4, 17, 3, 12, 5, -6,
-    -10, 0, -5, -9, -27, -28, -52, -35, 1, 16, 15, -22, -4, -6, -15, 11,
-    -20, -18, -17, -19, -6, -3, -2, 1, 3, 14, 7, -1, -2, -16, -13, -9,
-    -33, -21, -22, -22, -18, -10, 3, -6, -2, 7, -5, 15, -25, -13, -8, -8,
-    0, -7, 3, -2, 8, 10, -1, 4, 0, -11, -20, -27, -18, 2, -16, -18,
-    -15, 13, -6, -16, -6, 7, 10, -1, -13, -9, -4, 6, 3, -4, -4, 11,
-    23, 7, 4, 0, -3, -23, 1, -6, -7, 15, 9, 15, 6, 32, -35, -33,
-    -7, 6, 26, -3, -11, -7, -24, -12, -4, 10, 22, 25, 13, 4, -3, -18,
-    -32, -25, -9, 0, 0, 0, 19, 22, 13, 18, 9, -35, 2, 10, -8, 6,
-    -11, -16, -18, 10, 3, -1, 16, 31, 14, 0, -23, -34, -31, -17, -6, 11,
-    6, 5, -2, 8, -26, -44, -46, -7, 23, -2, -5, 5, -13, -16, -1, 5,
-    3, -16, 18, 16, 15, -10, -34, -23, -15, 4, 2, 20, 29, 4, -5, -11,
-    -48, -30, -52, -37, -16, -2, 11, -2, 3, -1, -6, 4, -5, 2, 17, 14,
-    1, -27, -22, -21, -6, 25, 31, 16, 23, 9, 7, 12, -15, -30, -24, -19,
-    0, 4, -12, 0, 12, -2, -17, -5, -5, 6, 15, 5, -22, -3, 6, 1,
-    -7, 13, 18, 5, 12, 10, 0, -8, -24, -6, -19, 0, -4, -3, 3, -25,
-    2, -23, -7, -4, -22, -13, -8, 11, -1, 17, 26, 16, -1, 5, 3, 8,
-    13, -10, 1, -9, -40, -3, -12, -2, -6, 1, -4, -13, -2, -26, -14, 2,
-    -28, -24, -1, 24, 24, 17, 18, 27, 3, 8, -2, 9, -16, -22, -8, -5,
-    -27, -4, -10, 1, 4, 2, 11, 16, 7, 14, 2, 11, 7, -6, 6, 16,
-    12, 22, 13, 17, 4, 11, 3, -4, -5, -12, -10, -9, -13, 0, -23, 2,
-    -4, -3, -2, 28, 23, 24, 35, 34, 33, 29, 22, 24, 52, 36, 32, 13,
-    29, 13, 8, -21, -1, -29, -23, -19, -10, -38, -26, -4, 4, 1, 3, 0,
-    -22, 0, 49, 43, 34, 31, 41, 28, 58, 54, 22, 26, 41, 36, 13, 31,
-    2, 15, 39, -7, -3, -15, -8, 1, 3, -2, 2, 12, 6, -22, -24, -24,
-    -13, 6, 14, 27, 18, 35, 9, -11, 24, 29, 11, -22, -6, -9, 6, 1,
-    -1, -3, 4, 2, -3, 3, 4, -3, -6, -2, 0, 1, -4, -11, -3, -3,
-    -3, -10, 18, -13, -16, -10, -21, -19, -15, -18, -6, 1, -4, 3, -5, -3,
-    -1, -2, 2, -4, 2, 0, 0, 0, -1, 1, -3, 3, 7, 6, 17, 6,
-    3, 4, -2, 0, -1, -2, 1, -4, 3, -3, 0, -3, 0, -4, -1, 0,
-    -2, 4, 13, 15, 16, 17, 41, 12, 5, 2, -5, -4, 7, 6, 9, 16,
-    21, 8, 6, 1, -4, 1, 4, 5, 2, -4, 2, 1, 16, 16, 15, 7,
-    43, 27, 9, 17, 14, -15, 12, 31, 20, 18, 51, 1, 6, 26, 20, 4,
-    -2, -3, 2, -4, 4, -2, 8, 26, 27, 17, 20, -13, -22, 24, 8, 17,
-    10, 4, -7, 1, -7, 4, 12, 21, 1, 42, 33, 17, 7, 0, 2, 2,
-    5, 1, 6, -31, -14, 15, -2, 2, 3, 19, 11, 9, -7, -5, 14, 10,
-    17, 12, 6, -1, 30, 15, 13, 14, 21, 20, 6, 10, -4, 4, -2, -11,
-    -22, -13, -13, -5, 30, 31, 23, 7, 0, 4, -6, -8, 2, -1, 8, -6,
-    0, -1, -15, -11, 8, 13, -5, -2, 4, -5, -4, 11, -11, 2, 5, 13,
-    36, 32, 12, 7, 11, -1, -7, -13, -16, -1, -6, -11, -18, -32, -4, 8,
-    -24, 17, -3, 27, -1, -18, 26, 26, -22, 10, 6, 3, 19, 33, 16, -8,
-    -5, -16, -15, -14, -9, -22, 1, -20, -16, -10, 24, 2, -8, 30, 6, 21,
-    -26, 5, -2, -3, -8, 20, 27, 15, 25, 31, 18, 3, -27, -35, -12, -2,
-    -19, -24, -15, -20, -17, -17, -18, 3, -8, 11, 27, -2, -3, 4, -25, -10,
-    -11, 4, 19, 7, 23, 28, 21, 11, -45, -64, -46, -19, -21, -28, -11, -6,
-    -20, -13, -15, 0, -1, -26, 5, -9, -1, -1, -19, -33, -1, 12, 21, 16,
-    39, 47, 25, -14, -44, -50, -36, -15, -8, -23, -5, 6, -15, -10, -16, 1,
-    25, -17, -27, -5, -2, 3, 2, -28, -16, 14, 20, 22, 37, 40, 23, 0,
-    2, -10, -4, 8, 9, 2, -5, 6, -11, 3, 12, 14, 31, 16, -19, -32,
-    3, 0, -14, 0, -8, 2, -6, 24, 33, 35, 15, 9, 1, -7, -6, 16,
-    17, 9, -2, 17, -21, 6, 9, -5, 35, -6, -41, -33, 4, -1, -22, -1,
-    -25, 17, -12, 22, 22, 25, 22, 22, 2, 7, -9, 3, 7, -11, 14, 19,
-    15, 8, 22, 6, -9, -18, 1, 26, -3, -7, -37, -10, -22, 52, 43, 27,
-    21, 11, 23, 23, -4, -4, -5, -5, 21, 12, 17, 18, 3, 10, 22, -2,
-    -20, 27, 1, 8, 6, -9, -41, 7, 15, 6, 15, 15, 24, 7, 8, 14,
-    8, 10, -16, 6, 16, 10, 13, 7, -3, 7, 12, 1, -23, 31, 14, 37,
-    3, -10, -12, 14, 21, 2, 4, -22, -7, -35, -16, -5, 4, -6, -15, 20,
-    55, 25, -12, -4, 0, -2, -12, 6, -24, 56, 30, 3, 1, -9, 23, 29,
-    24, -13, -15, -55, -18, -22, -9, -4, 3, -3, -8, 29, 37, 11, 2, 0,
-    26, -15, -12, -1, 22, 46, -13, -27, -21, -8, 16, 18, 15, -12, -6, -25,
-    -17, -27, -4, -23, 21, 9, 25, 26, 6, 4, 11, -2, -2, -22, -19, -4,
-    40, 46, 25, -12, -18, 1, -8, -9, 4, -9, -7, -6, -7, -28, -26, 5,
-    34, 24, 23, 16, -13, 0, -5, -2, -7, -25, -12, -6, 13, 6, 36, -36,
-    3, -5, 22, 1, -10, 0, -15, -9, -18, -32, -21, 7, 34, 30, 5, 10,
-    -8, -11, 0, -7, -22, -23, -12, -19, 4, -14, 33, 1, -16, 1, 3, -29,
-    -16, -2, -32, -20, -12, -4, -14, -12, 24, 26, 20, 5, -7, 15, -2, -6,
-    -21, -9, 7, 31, 30, 10, 16, -1, -14, -11, 20, 0, -10, -3, -18, -17,
-    -11, 7, -1, -1, 10, 4, 6, 1, 8, 3, -2, -11, -12, 4, -4, 3,
-    25, -9, -7, 0, 0, 5, -25, -17, -5, -18, -26, -20, 10, 15, -8, -18,
-    6, 4, 11, -5, 14, 3, -8, -5, 17, 23, 18, 17, -18, -17, 4, 2,
-    -4, 1, -4, -14, -16, -17, -36, -55, -44, -6, 2, -12, 7, -4, -5, 8,
-    13, -12, -5, 26, 15, -14, 2, -2, 36, 12, -10, -4, 1, 3, -13, 20,
-    20, -20, -24, -31, -40, -8, -10, -10, -33, -22, 13, 30, 6, 18, 25, -15,
-    3, 16, 30, 22, 8, -9, -1, 4, -1, -3, -4, -1, 7, -28, -21, -31,
-    -24, 0, -10, 9, 16, 14, 11, 18, 6, -3, 14, 8, 6, 7, -8, -11,
-    -17, -3, 3, 4, -1, -3, 4, -1, -1, 4, 11, 5, -2, 7, 8, 16,
-    13, 22, -6, -2, -2, 6, 19, 17, 20, -20, -18, 6, -3, -3, 4, 4,
-    -2, 0, 4, 4, -1, -4, -5, -1, -3, 1, 1, 3, 6, 17, 12, 6,
-    -4, -3, 2, 4, -2, -2, -2, 1, 2, -2, -1, 3, 4, -4, -3, 4,
-    4, -1, 7, 8, 3, 8, 5, 10, 10, -12, -32, -21, 20, 25, -2, 15,
-    6, -9, 0, 3, -4, 1, 4, -4, -2, -4, 4, -4, 10, 12, 9, 3,
-    32, 18, 6, 3, 51, 23, 21, -3, -16, -22, -4, -36, -40, -27, -26, -10,
-    4, -1, -4, 3, 3, -4, 7, 27, 14, 37, 22, 15, 41, 30, 28, 44,
-    59, 47, 50, 36, 19, 15, 13, -16, 10, 0, -17, -10, 31, 31, 26, 2,
-    -4, 4, 26, 39, 4, 36, 52, 73, 31, 25, 29, 45, 29, 11, 25, 33,
-    14, 33, 27, -10, -6, -22, -4, 2, 10, 9, 28, 1, -3, 4, 23, 15,
-    -20, -6, 30, 35, 17, 3, 21, 38, 33, 24, 20, 9, 21, 32, 34, 11,
-    8, -18, -20, -45, -12, 55, 28, 3, -3, 9, -2, -23, -30, -7, 2, -14,
-    -28, -3, 5, 7, 10, 21, 29, 33, 34, 29, 39, 29, 23, 16, -18, -16,
-    -24, 42, 26, -3, 0, 19, 0, -19, -14, -26, -11, -38, -16, -29, -16, 6,
-    2, 16, 6, 31, 40, 31, 36, 16, 20, 17, -11, -21, -42, 5, 13, -4,
-    33, -5, -20, -14, -9, -27, -28, -37, -18, -31, -5, 0, -12, -12, -1, 8,
-    23, 12, 11, 10, 21, -2, 16, 1, -22, 13, 18, -5, -1, -28, -3, 1,
-    -14, -24, -27, -28, -20, -17, -9, -9, -14, -17, -26, -22, -20, -15, -2, 6,
-    19, -7, 16, 18, -15, 3, 39, 7, -7, -21, -5, 9, -27, -34, 0, -15,
-    -12, -13, -10, -6, -25, -14, -25, -41, -30, -25, 8, -1, 11, 3, 10, 15,
-    -1, 18, 60, 14, 2, -7, -6, -5, -28, -32, -3, 15, 2, -24, -12, 3,
-    -9, -6, -21, -24, -18, -6, 0, 2, 17, 13, 7, -4, 5, 35, 46, -19,
-    -6, -19, -6, 3, -2, -19, -7, 1, -7, 2, 10, -3, -6, -11, -1, 0,
-    -10, -7, 6, 21, 5, -7, -5, -11, -12, -13, -21, -28, 2, -4, -18, 1,
-    10, -8, -8, -5, 6, 7, 10, -9, 4, 18, 5, 1, -5, -21, -8, 12,
-    -7, 5, 8, -31, -26, -17, -19, 4, 2, 7, -15, -3, 9, 5, 2, -7,
-    -3, -5, 4, -13, -5, 20, 11, 24, -7, -23, -17, -5, 4, 9, -5, -4,
-    -25, -22, -13, 9, -1, 6, -20, -10, 12, 16, 15, -3, -10, -1, -6, -19,
-    -13, 1, 20, 20, 8, -22, -10, -4, -10, -17, -7, 8, 14, -9, 22, 4,
-    -1, 9, 9, -7, 20, 9, -3, -2, -9, 12, 4, -4, -7, -1, 3, 1,
-    8, 7, -11, -19, -22, -13, 16, 12, -3, -3, 1, 11, 3, 1, 0, 5,
-    2, -6, 10, 2, 4, -2, 1, -1, -1, -2, -11, 8, 9, 15, -11, -27,
-    -31, -13, -7, -12, -11, 42, 6, 13, 30, -2, 4, -1, 4, -6, 17, 23,
-    23, -6, 10, -4, -12, -21, -11, 3, 13, 12, -1, -9, -21, -5, 16, 12,
-    9, 42, 5, -7, -18, 14, 7, -20, 14, 1, -4, -1, 4, -12, 2, -17,
-    -9, -2, -15, -8, -1, 20, 4, 0, -13, -15, -7, -4, 2, 8, -4, -19,
-    4, 28, 21, 14, 20, 25, -14, 9, 6, 10, 14, -2, -11, 14, -4, -11,
-    -14, 3, -12, -6, -10, -12, -8, -17, -7, 4, -5, 3, -8, 4, 33, -10,
-    12, -6, 3, 5, -7, 1, 8, 3, 4, 17, 1, -10, -12, 2, -13, -10,
-    -30, -28, -7, 10, -1, 16, -9, 4, -8, -8, 34, 13, 19, -18, 9, 14,
-    6, 6, 9, 9, 6, 10, -4, -8, -7, 1, -7, -16, -37, -46, -4, 10,
-    12, 1, -25, 3, 0, 3, 6, 39, 31, 2, 9, 16, 4, 2, 20, 10,
-    -9, -4, -1, -2, -3, 6, -10, -11, -13, -4, 13, 34, 28, 11, -22, 2,
-    3, 2, -11, 26, 53, 28, 13, 5, 5, 0, -1, -6, 15, 15, 4, 23,
-    9, -2, 7, -7, 11, 0, 5, -10, 17, -1, -5, 1, 4, -4, 1, -15,
-    -5, 10, 36, 34, 34, 8, -2, 17, 16, 7, 5, 25, 18, 2, 18, 19,
-    23, 21, 5, -13, -9, 9, 11, 0, -3, 0, 0, 24, 1, -10, 1, 22,
-    39, 16, 8, 21, 24, 36, 12, 15, 15, 15, 8, -2, 16, 11, 7, -4,
-    8, 1, 1, 2, 1, 2, -3, -2, -10, -6, 1, -2, 0, -2, 12, 9,
-    13, -7, 8, -2, -3, -4, -5, 1, -5, 0, 2, -6, 2, 1, 3, 2,
-    3, 0, -1, 5, -2, 3, -1, 3, 4, 3, 4, -2, 8, 14, -5, -3,
-    2, 4, -4, 5, 3, -3, 5, 4, 3, -5, 3, 2, 2, -2, 0, -5,
-    1, 3, 17, 19, 18, 8, 36, 30, 28, 37, -20, -6, 26, 28, 12, 22,
-    32, 17, 13, 7, 1, 1, -1, 3, 2, 0, 18, -3, 16, 15, 15, 20,
-    17, 16, 2, 17, 3, -7, 36, 41, 19, -1, -7, 70, 58, 48, 43, 33,
-    8, -4, -1, -1, -1, -4, 18, -5, -6, 37, 18, 39, 7, -3, -21, 7,
-    -2, -5, 31, -6, -16, -30, -34, -18, -1, 4, 17, 27, 26, 9, 20, 4,
-    -1, -4, 11, -19, 3, 28, 4, -27, -31, -38, -26, -19, -14, 9, -6, -14,
-    -10, -9, -16, -25, -19, -19, 4, 20, -6, -14, -11, -9, 3, -4, 32, -34,
-    3, 9, -18, -24, -4, 23, 9, -21, -38, -21, -29, 0, -10, -19, 16, -20,
-    -34, -11, 10, 31, 7, -6, -15, -25, -2, -10, 0, 20, 21, -5, -10, 10,
-    30, 33, -1, -5, -15, -1, -13, 2, -9, -14, -9, -26, -32, -23, -12, -34,
-    -16, -9, -14, 3, 0, 13, 28, 26, -9, -3, 8, -14, 11, 18, -14, -12,
-    -21, -11, 7, -1, 1, 25, -2, -37, -21, -8, -12, -5, 23, -2, -30, 6,
-    37, 35, 27, 14, 26, 10, -10, -36, 11, 19, 0, -1, -12, -12, 1, 0,
-    -1, -6, -25, -32, -14, -10, -12, -23, -11, -13, -19, -23, 14, 46, 10, 12,
-    12, 17, -8, -13, 0, 2, 14, 4, -3, 6, 11, 6, 1, -11, -15, -6,
-    -14, -27, -19, -16, -8, -58, -13, -18, 18, 23, 35, -2, -21, 13, 7, 5,
-    5, -13, -27, -12, 3, 31, 8, -7, 1, -18, -9, 2, -23, -37, -12, -17,
-    -1, 5, -17, -17, 12, 16, 26, 30, -34, -14, -15, 1, 1, -29, -29, 0,
-    31, 24, -1, -7, -2, 11, 16, 20, -12, -26, -32, -14, -32, -30, -67, 17,
-    11, 8, 39, 17, -41, -22, -6, -21, -10, -24, -7, 16, 30, 22, 7, 8,
-    17, 13, 49, 30, -9, -10, 4, -2, -31, -24, -34, 10, -2, 17, 39, 19,
-    -21, -1, 14, -10, -5, -18, 20, 12, 18, 8, 2, 12, 15, 26, 49, 18,
-    8, -7, -10, 13, 15, -34, -34, -39, -5, 13, 19, 7, 15, -14, -9, -12,
-    -6, 19, 30, 18, 17, -1, -1, 9, 26, 35, 42, 28, 22, -10, -1, 1,
-    2, -27, -28, -12, 1, -1, -13, -21, -13, -19, -21, -9, -19, 21, 36, 19,
-    25, 8, 1, 21, 20, 45, 43, 22, 0, 7, 8, 2, 5, 3, -20, -9,
-    2, -8, -1, -49, -18, -1, -10, 4, 5, 8, 23, 35, 16, -11, 11, 25,
-    40, 30, 24, 5, 2, 19, 23, 8, -6, -17, -36, 7, -2, -4, 2, -62,
-    -27, -8, -26, -25, 4, 20, 38, 37, 6, 8, 25, 45, 46, 26, 18, -5,
-    -13, 10, 18, 3, -22, 24, 18, 13, 26, -3, 16, -24, 10, -31, -45, -20,
-    -2, 16, 25, 16, 8, 3, 24, 36, 33, 26, 18, -1, -28, -3, -9, -7,
-    -30, 37, 28, 4, -9, 33, 16, -1, 11, -46, -38, -37, -38, -27, -3, 10,
-    4, -3, 11, 22, 17, -6, -8, -17, -30, -11, -17, -34, -40, 5, -11, 15,
-    4, 27, -10, -12, -23, -45, -18, -10, -35, -21, -23, -12, -11, -11, 4, -9,
-    -5, -16, -9, -22, -30, -14, -19, -31, -4, 14, -25, -1, -6, 4, -35, -19,
-    -46, -16, -21, -11, -12, -21, -32, -30, -17, -22, -26, -29, 0, -22, -8, -20,
-    -29, -11, -21, -31, 1, -22, -11, 2, -3, -4, -12, -30, -61, -51, -10, 2,
-    -1, -12, -19, -43, -34, -37, -33, -21, -8, -28, -22, -10, -18, -16, -10, -16,
-    -9, -12, -3, 2, 4, 1, -31, -25, -59, -66, 12, 42, -1, -9, 11, -3,
-    -21, -28, -10, -25, -34, -34, -34, -13, -6, 12, 0, -10, 0, -26, 6, 1,
-    -1, 4, 4, -19, -17, -15, 26, 34, 0, -15, -18, -28, -15, -10, 6, -22,
-    -35, -22, -11, 19, 24, 34, 25, 6, -2, 23, 7, 1, -4, 3, 18, 1,
-    29, 24, 2, 17, 30, -3, -12, 6, -15, -7, 16, 7, -4, 4, 9, -28,
-    -1, 4, -33, -10, -23, 26, 8, -2, 0, 0, -1, 7, -20, -14, 6, 42,
-    38, 58, 32, 8, 2, 18, 33, 29, 21, 9, 4, 27, 35, 24, 13, 39,
-    18, -2, 4, -3, 0, 0, -2, 3, 22, 36, 20, 20, 21, 43, 48, 22,
-    16, 22, 54, 10, 34, 59, 44, 30, 17, 43, 39, 10, -3, -4, 4, 1,
-    -1, -4, 0, -1, 1, 5, -1, -5, 0, -1, 2, -2, 0, 3, 6, 1,
-    2, 2, -4, -1, -1, 1, 2, -2, 0, 2, -4, 4, 2, -2, 3, -3,
-    -1, -1, -15, -12, -12, -3, 2, 7, 4, -2, 28, 5, -2, -5, 13, -10,
-    -4, -14, -15, -5, 1, 4, 1, -3, -2, 4, 9, -2, -15, -2, -11, -8,
-    10, 33, 46, 14, -3, 25, 27, 23, -4, 0, 7, 8, -3, -4, -8, -7,
-    17, 3, 5, -4, 2, -2, 12, -30, -30, 1, 1, -15, -14, 15, 0, 13,
-    -7, 6, 13, 12, 15, -1, -22, -23, -34, -21, -12, 9, -3, -26, -27, -1,
-    0, -4, -2, -51, -9, 16, 9, 19, 31, 29, 20, -3, 12, 19, 9, 5,
-    14, 1, -13, -7, 5, -15, 7, -9, -31, -18, -4, 5, 1, 4, -10, -9,
-    11, -32, -1, 17, -2, -10, 10, 7, 18, 11, 16, 4, -2, 2, -10, 10,
-    13, 20, 21, 9, 0, 1, -21, -8, -3, -5, -26, 10, -12, -24, 0, 6,
-    -1, -1, -1, 2, 10, 6, -4, -5, -9, 0, -20, -16, -11, 0, 15, 8,
-    -25, -15, -17, 34, -2, -12, -32, 11, 19, 3, -7, -8, 6, 6, -4, -5,
-    7, -1, -12, -5, -13, -9, 1, -5, -1, 3, 19, 8, -5, -11, -16, 24,
-    38, -30, -16, 15, 33, 15, 8, 6, -2, 4, 10, -4, 2, 12, 7, -6,
-    -9, 1, -3, 4, -10, 0, -2, 0, -15, -6, 8, -9, -12, -35, -5, 24,
-    6, 15, 7, -2, -8, 10, 0, -10, -3, 2, 2, -2, 5, -3, 0, 12,
-    9, 17, -5, 8, -14, -16, -6, -4, -7, -18, -7, 6, -3, 8, -2, 2,
-    0, -2, 0, 1, -2, -4, 0, 2, -11, 3, 6, 8, -8, 0, 4, 18,
-    -15, -49, -15, 16, -11, -22, -15, -7, 0, 7, 4, 6, -2, 7, -6, -18,
-    4, 1, 9, 2, -4, -11, -15, 6, 9, 14, 4, 7, -3, 1, 7, -30,
-    -10, -12, -12, 13, 12, 6, 3, 15, 0, 3, -7, 4, 9, 16, 2, -16,
-    -4, 6, -15, 5, 9, 28, 27, 18, 37, -4, -37, -29, 2, -11, -21, 8,
-    -4, -1, 17, 5, 11, 8, -6, 7, 6, 1, 5, 10, 7, 8, 1, 20,
-    9, 17, 36, 18, -2, 7, 11, 33, -4, -5, -32, 1, -14, 20, 12, 5,
-    3, 0, 0, 12, 7, 5, 10, 1, 13, 10, 5, 12, -3, 11, -6, -28,
-    -16, 40, 52, 18, 0, -2, 11, 17, -2, 8, -12, 1, 21, 5, 6, 13,
-    13, 14, 12, -6, 20, 1, -8, 0, -7, -3, 3, -19, -26, 33, 13, 21,
-    6, -3, 14, 15, 0, -7, 11, 20, 9, 14, 13, 18, 13, 2, 8, 3,
-    14, 6, -13, -14, -12, -2, -16, -9, -24, 42, 47, 25, -1, -7, 21, -9,
-    9, -4, 0, 2, -6, 6, 6, 5, 15, 5, 10, -2, 11, -6, -7, -7,
-    0, 11, -10, -3, -9, 18, -9, 48, -29, -1, -8, -5, 2, 2, 4, -2,
-    -18, -10, -12, -18, 3, 11, 7, 0, -2, -5, -3, -5, -2, 1, 5, 10,
-    21, 14, -18, 38, 12, -26, -28, -5, 14, 13, 7, 8, -6, -9, -4, -5,
-    -9, 11, 9, 2, 14, -3, -1, -4, 1, 10, 24, 18, -8, 3, 32, 11,
-    -1, -17, 11, 18, 16, 12, 7, 7, -10, -10, 3, 14, 20, 0, 5, 12,
-    5, -7, 12, 5, 19, 19, 10, 12, -9, -8, 44, -2, 4, 11, 27, 28,
-    28, 5, 18, 22, 19, 5, 11, 10, -4, 3, -1, -6, -1, 9, 3, 16,
-    8, 3, 22, 18, -12, -24, 11, -7, 3, 10, 31, 11, 14, 26, 26, 13,
-    6, 7, 18, 10, 5, 7, -3, -3, -7, -8, 12, 5, 15, 25, 21, 4,
-    1, -4, -14, -2, -1, -2, 21, -15, -22, -8, -9, 4, 18, 7, -1, -14,
-    2, 4, -12, 0, 5, -2, 16, 19, 26, 16, 16, 11, -12, -10, -14, -1,
-    5, 3, -23, -36, -50, -63, -24, -14, -4, -10, -16, -6, 6, -5, -10, -6,
-    0, -21, -11, 12, -6, -6, 0, -10, -14, 13, 9, 0, -2, 0, -4, -30,
-    -41, -33, -1, -9, -22, -29, -13, -38, -31, -11, -1, 0, -17, -12, -10, -28,
-    -23, -31, -32, -27, -33, 10, 16, 3, 4, -4, -4, -14, 38, 29, 14, -32,
-    -24, -39, -41, -14, -30, -62, -26, -29, -37, -27, -35, -47, -46, -20, -21, -9,
-    4, -7, 3, 1, -4, 0, 3, -2, -14, -23, -14, -1, -7, -9, -38, -11,
-    -4, -21, -40, 12, -8, -25, -11, -5, -2, -26, -13, -22, -4, -4, 3, 3,
-    0, -3, 0, -3, 4, 3, -4, -1, 0, 1, 2, 3, 2, 5, 9, 5,
-    3, -2, 2, 2, 4, 2, 1, 0, -3, 4, -4, 1, 4, 3, -4, 1,
-    -4, 4, 17, 18, 22, 18, 21, -4, -2, 12, -31, -11, 32, 20, -5, 15,
-    11, 14, 18, 20, -4, -1, 4, -1, 0, 2, -8, 3, 15, 14, 26, 27,
-    37, -4, -18, 2, -10, -39, -22, -16, 3, 18, -2, -22, -12, -18, -26, -15,
-    -16, -8, 1, 0, 4, 2, -5, 36, 32, 42, 20, 22, 10, -36, -38, 5,
-    30, 28, 16, -7, -3, -4, -15, -6, 20, 24, 25, -12, -21, -10, -2, -2,
-    -1, 2, 7, 27, 16, 2, -22, -28, -42, -45, -36, 6, 5, 16, 20, 3,
-    -9, -33, -35, -8, -3, -12, -59, -18, 6, -17, -9, 9, 5, 4, 3, 22,
-    21, 14, -13, -20, -25, -4, -19, -6, -19, -23, 1, 24, 19, -17, -40, -46,
-    -37, -19, -18, -4, 4, -17, 14, 27, 0, 1, 8, 8, 11, 49, 17, -7,
-    -12, -16, -33, -8, -27, -16, -20, -7, -4, -36, -57, -49, -53, -21, -1, -15,
-    19, 23, 22, -26, -3, 6, -4, 27, -7, 39, 25, 20, 11, 8, 0, -14,
-    -37, -36, -29, -40, -54, -46, -68, -69, -66, -11, 2, -3, 18, 16, 24, -28,
-    40, 22, -11, 14, -8, 19, 8, -6, 0, 12, -10, -22, -35, -49, -33, -29,
-    -29, -23, -22, -16, 16, 20, 20, 24, 30, 18, -7, 6, 7, 25, -8, 27,
-    -26, 3, -1, 11, 13, 0, -21, 1, 1, -1, 17, 23, 35, 36, 31, 29,
-    27, 26, 22, 18, 26, 28, 1, -10, 7, 0, 3, 30, -45, -3, 1, 19,
-    16, -16, -2, 12, 16, 32, 31, 54, 34, 29, 33, 42, 30, 38, 25, 23,
-    35, 50, 22, -44, 7, 27, 1, 28, -19, -17, -19, -8, -3, -7, 0, 18,
-    20, 23, 9, 30, 16, 2, 12, 24, 22, 25, 18, 12, 7, 8, -13, 16,
-    2, 8, -7, 16, -31, -42, -32, 6, 3, 8, 26, 24, 28, 23, 14, 6,
-    0, -17, -3, 4, 2, 8, 11, -49, -8, 51, 40, 39, -4, 1, 24, 15,
-    -21, -2, -2, 22, 10, 33, 36, 20, 14, -2, -27, -14, -3, -4, 6, -10,
-    -5, -30, -35, -33, -10, 24, 25, -18, -4, 0, 24, 19, 5, 17, 25, 9,
-    20, 32, 34, 16, 19, -3, -17, 8, 22, 17, 3, -22, -24, -33, 3, 20,
-    -2, -20, 24, -17, -4, -2, -10, 5, 9, 0, 13, 16, 4, 20, 13, 10,
-    15, 1, 2, 16, 9, 15, -1, -5, -15, -12, -8, 9, 3, 6, -20, -19,
-    -8, -6, -35, 5, 23, -15, -18, -8, 0, 1, -15, 0, -1, 7, 2, 23,
-    6, 5, 8, 13, 17, 3, -29, -12, -4, 5, 10, 9, 0, 10, -44, 4,
-    21, 19, 9, -19, -18, -4, 3, 9, -7, 2, 13, 28, 31, 25, 19, -28,
-    -11, -20, -31, -20, -30, 0, -13, 26, -24, 7, -38, -15, 3, 17, 10, 1,
-    12, 6, 16, 24, 27, 22, 24, 28, 22, 15, -9, -29, -31, -16, -37, -21,
-    -21, 10, -8, 8, -12, 16, -12, 5, -4, 17, 9, 8, 3, 18, 19, 27,
-    31, 34, 35, 32, 2, 2, -7, -50, -53, -29, -31, -25, -9, -3, -29, 8,
-    -4, 15, -15, -8, -10, -5, 26, 22, 12, 33, 26, 21, 11, 14, 12, -7,
-    -16, -11, -7, -36, -38, 3, 0, -18, -17, -31, -39, 1, 0, -11, -16, -22,
-    -27, -9, -1, -7, -14, 19, 3, -4, -4, -14, -20, -34, -13, 15, 26, -12,
-    -12, 5, 1, -1, 13, -4, 16, 1, -4, -2, -7, -15, -42, -15, -13, -16,
-    -31, -2, 7, -11, -11, -8, -27, -28, -15, 15, 12, 17, -1, -5, -17, -2,
-    12, 13, 22, 2, 5, -1, 20, 17, -17, -20, -21, -7, -19, -12, 20, 0,
-    -5, -31, -15, -36, -12, -20, -36, -12, -5, -8, -20, 0, 11, 16, 27, -2,
-    1, 0, 7, 37, -23, -4, -23, -40, -34, -24, -25, -29, -39, -20, 5, -31,
-    -27, -15, -35, 6, 8, 16, 14, 8, 22, 12, 14, 1, 4, -2, -6, 16,
-    9, -4, -30, -62, -59, -39, -21, -26, -28, -42, -48, -39, -43, -42, -24, -11,
-    -4, 10, 16, 20, 28, -16, -2, -4, 4, 1, 1, -24, -50, -42, -37, -31,
-    -34, -36, -34, -20, -11, -27, -80, -73, -30, -1, -14, 2, 1, -35, -32, -15,
-    -22, 3, 3, 4, 2, 1, -2, 2, 14, 27, -15, -26, -24, -6, -12, -14,
-    -11, 11, -44, -41, -16, 1, -1, -20, 3, -2, -15, 25, 3, 3, 3, -2,
-    -4, 2, -5, 0, 2, 3, 4, -3, 0, -3, 2, -2, 2, 3, -2, -3,
-    -1, 3, 5, 4, -1, -3, 0, -2, 0, -2, 3, 4, 0, -2, 4, 3,
-    1, 3, -2, 2, 1, -3, -10, -24, -22, -18, 5, -13, -23, -20, -2, -13,
-    -14, -6, -9, -9, -3, -1, 3, -2, 2, 2, -2, 3, 2, 0, -13, -11,
-    -5, -11, 9, 7, -37, -38, -27, 5, -16, -18, -10, -33, -25, -28, -27, -17,
-    -5, 5, -4, -2, 1, 0, 1, -5, 2, -10, 9, -22, -34, -24, -12, -19,
-    -9, -32, -58, -55, -39, -44, -18, 21, 8, 2, -3, -36, -31, 32, 14, 4,
-    -2, -2, -11, -11, -19, -29, -29, -13, -5, -11, -37, -41, -31, -28, -32, -29,
-    -52, -22, -23, -36, -14, -18, -11, -31, -22, 29, 35, -14, -2, 3, -33, 1,
-    -35, -25, -31, -17, 8, -2, -33, 2, 16, -3, -27, -37, -39, -28, -16, -3,
-    5, -5, 10, -28, -23, 17, -9, -11, -3, -12, 6, 13, -19, -12, -17, 5,
-    15, 11, -18, 0, 15, -2, 11, 3, -7, 5, 22, 13, 10, 8, -1, 5,
-    7, 45, 12, -20, 3, -21, 28, 12, -23, 7, -17, -8, 4, -10, -9, -11,
-    7, 25, 24, 16, 19, 16, 21, 22, 26, 28, 8, 12, 11, 33, 20, -18,
-    -40, 4, 3, -7, -8, -9, 7, -1, -4, -9, -11, -5, 2, 14, 21, 9,
-    0, 9, 16, 22, 4, 7, -9, 52, 50, 47, 29, 2, 10, -5, -30, -11,
-    -19, 8, 20, -9, -11, -17, -5, 1, 8, 16, 14, -4, -14, 3, 11, -10,
-    -14, 5, 12, 7, 48, 52, 81, 32, 10, -12, -21, -25, 2, 33, 33, -6,
-    -12, -8, 7, 4, 19, 36, 33, 23, 10, -5, 11, 15, 5, 19, 5, -10,
-    45, 56, 76, 8, -1, 2, 18, -29, 18, 46, 41, 15, 6, 11, 12, 38,
-    38, 34, 28, 26, 19, -2, -6, 17, 10, 15, 12, 21, 44, 51, 39, 28,
-    -3, 10, 27, -11, 25, 47, 44, 25, 18, 32, 28, 19, 11, -2, -13, -1,
-    -3, -18, -9, 0, -1, -4, -9, 9, 13, 27, 46, 41, 1, 8, 6, -6,
-    17, 35, 29, 7, 7, 30, 24, 2, -23, -43, -13, 1, 9, -14, -18, -10,
-    3, -5, 4, -14, -14, -21, 16, 17, 2, -2, 4, 5, 14, 16, 17, -13,
-    0, 10, 2, -24, -48, -36, -5, -1, 8, 9, -5, -5, -8, -5, -10, -14,
-    -34, -27, 21, 12, -1, 0, -20, -1, -9, -16, 1, -24, -3, -5, -23, -23,
-    -21, -8, 1, 4, -1, 7, -1, -29, -14, -17, -17, -15, -57, -23, -36, 8,
-    -1, -1, -20, -39, -38, -25, -10, -13, -12, -25, -17, -23, -13, 0, 4, 5,
-    0, -13, -27, -26, -22, -23, 2, -16, -49, -7, -10, 10, -4, -3, -13, -44,
-    -53, -40, -19, -22, -23, -21, -20, -4, 0, 13, 18, 12, -8, -30, -20, -25,
-    -10, -15, -10, -38, -30, 19, 32, 32, 30, 3, 5, -41, -16, -34, -34, -25,
-    -17, -27, -28, -10, 1, 12, 24, 2, -15, -30, -27, -24, -7, -14, -9, -32,
-    7, 10, 36, 34, 1, -1, 1, -18, -25, -34, -33, -10, 13, -22, -17, -4,
-    6, 30, 24, 13, 2, -14, -20, -14, -20, -16, -23, -19, -11, 17, 22, 21,
-    -4, -6, 15, 1, -30, -20, -31, -29, 10, -12, 1, 6, 10, 16, 4, 17,
-    10, -4, -26, -20, -17, -26, -27, -17, -3, 36, 8, -6, 3, -5, 24, 2,
-    21, -10, -24, -30, -5, -3, -5, 3, 4, 2, 14, 16, -2, 5, -18, -14,
-    -16, 0, -26, -14, -3, 31, -26, -4, -4, 2, 20, 7, 27, -3, -19, -17,
-    -5, 6, -13, -16, 3, 20, 40, 11, -4, -4, 0, -4, 8, 0, -14, -5,
-    -5, 3, -22, -1, -2, 2, -23, -13, 16, -6, 8, -11, -1, 4, -7, -14,
-    8, 9, 8, 4, 18, 13, 19, 33, 20, 8, 4, 16, -9, -9, -9, 1,
-    2, 0, -10, -29, -18, -39, -23, -10, 8, 1, 8, 17, 15, -3, 1, 15,
-    7, 10, 26, 51, 34, 2, -2, 41, 20, -5, -4, -1, -1, -4, 8, 18,
-    -23, -41, -8, -14, -24, -14, -2, 1, -15, -10, 41, 33, 31, 33, 25, 15,
-    44, 36, 21, 21, -9, 5, -1, -1, -1, 5, 4, 18, 12, -27, -19, -8,
-    6, 37, 5, 0, 22, 4, 35, 36, 10, 9, 12, 14, 43, 52, 41, 22,
-    4, -2, 1, 1, -3, 3, -4, 3, -4, -5, 17, 21, 26, 22, 29, 29,
-    30, 3, 36, 37, 39, 18, 25, 30, 10, 11, 20, 21, 2, 0, -1, 1,
-    4, 4, 3, 3, -3, -3, -3, 4, -1, 2, 3, -2, -2, 3, 4, 1,
-    -1, 2, 1, 2, -4, 0, -3, -1, 1, -4, 3, -1, 0, 0, 4, 2,
-    -1, -2, 10, 3, 4, -3, -13, -5, 7, 6, -5, -5, -1, -4, -5, -5,
-    -4, -6, -3, -4, -4, 3, -4, 1, -1, 4, 1, 1, 2, -6, 1, -4,
-    1, 1, 8, 4, -2, -25, -11, -18, -54, -38, -18, -33, -34, -4, 2, 10,
-    1, 4, 3, -2, 1, 4, 6, -1, 5, -16, -25, -22, 17, 26, 24, -4,
-    2, -5, -17, -31, -20, -23, -56, -49, -18, -23, -12, 4, 35, 38, 38, -4,
-    -3, 4, 16, 23, -12, -23, 6, 27, 9, 27, 1, 26, 8, -7, -9, 0,
-    -22, -12, -13, -42, -17, -24, -3, 17, 15, 15, 50, 0, 3, -1, 0, 22,
-    19, 20, 41, 21, 36, 32, 31, 25, 18, 28, 17, 4, 13, 15, 19, -4,
-    -17, -20, -6, -14, 11, 66, 39, -12, 0, 14, 30, 44, 45, 42, 40, 29,
-    43, 54, 44, 19, 32, 41, 53, 62, 37, 39, 44, 20, 8, 10, -8, -5,
-    -3, 26, 19, 10, 1, 24, 38, 38, 9, 6, 33, 27, 22, 39, 31, 42,
-    34, 51, 51, 56, 58, 37, 32, 19, 8, -3, -15, -32, -34, -9, 2, -2,
-    -1, 18, 27, -18, -2, 1, 4, 6, 23, 14, 27, 26, 33, 24, 44, 36,
-    26, 15, 25, 18, 7, -13, 3, -14, -28, -11, 3, 9, 7, 17, -2, -30,
-    -11, -25, -10, -8, 5, 2, 1, -14, -7, 6, 14, 2, -12, 16, 17, 5,
-    6, -11, 7, 8, -1, 7, -9, -6, 8, -1, 9, -14, -16, -9, 5, -13,
-    -9, -8, -29, -38, -42, -25, -15, -30, -15, -1, 5, -13, -7, -5, 13, 5,
-    -12, -11, 10, -9, 5, 10, 13, 18, -9, -29, -5, -8, -11, -18, -31, -12,
-    -36, -28, -55, -33, -15, 6, 12, -2, -3, -9, 6, 0, 10, -14, 23, -34,
-    6, 11, 2, 12, -6, -23, -15, -16, -13, -13, -19, -19, -27, -47, -30, -14,
-    -16, -6, 15, 16, 0, -2, -11, 9, -8, -35, -14, -43, -3, 7, 7, 22,
-    -10, -21, -17, -5, -13, 8, 11, -8, -5, 7, -8, -1, -12, -12, 6, 8,
-    11, 14, -9, -16, -17, -36, -30, -14, -1, -10, 25, 28, 0, -22, 1, -8,
-    -2, -1, 16, 7, 6, 21, 8, 3, -23, -28, -1, 0, 9, 18, -1, 13,
-    6, -9, -11, 14, 3, -7, 17, -11, -13, -33, 5, 2, -4, -3, -10, -6,
-    3, 7, -5, 2, -18, -9, -19, -27, 3, 19, 2, 9, 20, 3, 2, 21,
-    -2, -4, 7, -16, -20, -26, 4, 11, -9, -3, 5, 4, 12, -4, -13, -18,
-    -11, -12, -35, -24, -2, 17, 12, 3, 21, -5, 7, 29, 0, -5, -18, -18,
-    -22, -28, -12, -14, -11, -15, -9, -5, -7, -11, -16, -11, -15, -4, -29, -25,
-    -14, -15, -12, -9, 10, 45, 39, 29, 32, -7, -6, -29, -46, -26, -19, -19,
-    2, -16, 5, -3, -14, -34, -34, -4, 11, 4, -3, 1, 0, 4, 17, 2,
-    19, 43, 45, -1, -13, 1, -9, -21, -49, -33, -14, -15, -7, -15, -4, -14,
-    5, -17, -14, 3, 15, 24, 7, 14, 18, 7, -1, -18, 10, 3, 15, -20,
-    -2, 4, -4, 2, -41, -20, 6, 7, 15, -10, -3, -10, -6, 0, 3, 16,
-    13, 6, -7, 12, -6, -6, -18, -35, -23, -15, -4, 2, -8, 3, 15, -3,
-    -17, -10, 0, -1, -3, -13, 4, -5, 9, 13, 13, 13, 21, 7, -10, -10,
-    -18, -16, -14, -13, 7, -2, 9, 7, -15, -11, 41, 8, 6, 11, 25, 5,
-    4, 5, 1, 3, 16, 7, 17, 1, 19, 16, -4, -5, -14, -22, -4, 11,
-    -8, -14, -14, 7, 0, 3, -11, 10, 30, 43, 49, 29, -2, 7, 28, 38,
-    23, 4, 7, 4, 1, 1, -11, -2, -10, -11, 13, 26, 18, 8, -21, 3,
-    -2, 2, 12, 18, 71, 73, 27, 13, 12, 19, 18, 17, 11, 15, 3, 13,
-    -8, -11, 14, 8, 9, 10, 13, 20, 42, -5, -4, -2, 3, -4, -23, 16,
-    18, -3, -2, 7, 41, 51, 30, 34, 32, 2, -14, 6, 16, 15, 3, 2,
-    -10, -11, -7, -1, 13, -1, 4, 3, -2, -5, -3, 23, -36, -32, -25, 8,
-    68, 29, 30, 15, 8, 43, 25, 20, 27, 12, 37, 30, 17, -22, 8, 7,
-    0, 0, -2, -4, 3, 0, 4, 1, 3, 4, 3, 4, 4, 12, 32, 23,
-    19, 21, 39, 37, 32, 20, 5, -7, -8, -4, -7, 6, 0, 4, -4, -4,
-    -5, -4, -1, -3, -2, -3, 1, -2, 4, 0, 3, -1, 9, 7, 0, 1,
-    3, 1, 4, -3, 1, 4, 4, -1, 0, -2, 1, -1, 0, -1, 2, 0,
-    1, -4, 1, 5, 6, 4, 14, 9, 12, 16, 6, -1, 14, 12, 17, 27,
-    28, -2, 6, 6, 1, 2, -1, 0, 2, -4, 1, 2, 7, 13, 6, 9,
-    22, 20, 21, 45, 43, 29, 42, 26, 3, 12, 23, -3, 1, 23, 23, 23,
-    25, 12, -3, -5, 1, 2, 9, 3, -2, -9, 3, -20, -31, -12, -24, -20,
-    -3, 3, -11, -14, 31, 4, 3, 4, -41, -6, -14, 12, 16, -24, -24, 1,
-    4, 4, 21, -12, 3, 11, 13, -14, -4, -4, -16, -2, 13, 1, 23, 27,
-    34, 21, 13, 9, 17, 1, -9, -28, -32, -19, 1, 4, 3, 1, 33, 18,
-    9, -3, 3, -19, -23, -32, -35, -26, -25, -27, -23, -20, -15, -4, 14, 39,
-    34, 36, -7, -37, -39, -58, -19, -11, 1, -5, -10, -18, -31, -52, -37, -10,
-    2, -18, -35, -20, -20, -33, -8, 4, 4, 16, 23, 6, 23, 12, -7, -6,
-    -47, -19, -12, 32, 5, -7, 0, -37, -11, -22, -25, -7, -12, -29, -40, -10,
-    2, -5, 1, 21, 0, -12, 17, 20, 31, 22, 26, 6, -13, -1, -2, 27,
-    -46, 5, -9, -13, 2, -2, -4, -4, -18, -37, -2, 7, 5, 7, 1, 3,
-    2, -2, 5, 30, 7, -2, 4, 41, 16, -16, -12, -20, -4, -26, -6, 16,
-    3, 1, 2, -18, -24, 4, 22, 2, 2, 7, 4, 6, -6, -30, -22, -17,
-    -3, -11, 9, 30, 16, 9, -6, 12, 3, -8, -17, 10, 13, 3, 11, -22,
-    -7, 7, 5, 13, 30, 31, 15, 3, -12, -45, -25, -14, -17, 9, 4, 13,
-    18, 1, 21, 15, 0, -8, 24, -14, 50, 14, 8, 6, 4, -8, -3, 26,
-    28, 25, 13, -11, -26, -30, -6, 11, 16, 6, -3, 2, -8, 9, 30, 24,
-    -14, -4, 40, -11, 52, 5, 23, 23, 11, 14, 3, 17, -16, -25, -33, -8,
-    -3, 2, 13, 12, -2, -3, -20, -27, -31, -20, 16, 41, 0, -8, 9, -7,
-    3, -15, 23, 12, 4, -1, -7, -8, -30, -26, -8, 9, 20, 1, 6, -10,
-    -29, -3, -2, -39, -36, -12, 36, 17, 0, -2, -10, 4, -18, -13, 25, 9,
-    -20, -27, -26, -27, -44, -4, 11, 20, 29, -5, 0, -21, -25, -23, -30, -49,
-    -40, 10, 16, 7, 0, -3, 3, -39, -32, -16, 24, 4, 7, -7, -29, -2,
-    -7, 23, 25, 12, 7, -15, -21, -37, -45, -56, -52, -54, -29, 8, 8, 11,
-    4, -4, -2, -38, -22, -19, 17, 16, 10, 6, 7, 10, 7, 4, 13, -2,
-    -7, -14, -8, -41, -60, -55, -47, -27, -20, 34, 17, 4, -4, -3, -22, -2,
-    -3, -10, -9, -6, 2, -8, 10, 17, 31, 14, 17, -5, -28, -31, -28, -51,
-    -58, -21, -26, -17, -12, 51, 52, 53, 5, -7, -25, 8, -1, -4, -3, -20,
-    -11, 1, 20, 19, 23, 18, 7, -17, -39, -16, -12, -36, -30, -3, 5, -14,
-    24, 20, 36, 47, 11, -9, -6, 4, -4, -1, -2, -17, -3, 13, 29, 16,
-    22, 24, -10, -19, -12, 5, 11, -1, -11, -11, 9, 14, 2, 9, 29, 26,
-    0, -8, -1, 13, 14, -5, -11, -13, 2, -10, 16, 17, 12, -4, -23, -4,
-    -4, 26, 15, 12, 25, 15, 32, 19, 16, 37, 23, 2, 9, 4, -16, -2,
-    40, 4, -3, -8, -13, -10, -7, -7, -11, 2, -2, 4, 12, 31, 15, 15,
-    14, 35, 36, 50, 21, 29, 18, -2, 7, 8, 9, 19, 46, 37, 3, -10,
-    -17, 1, -13, -16, -2, 7, 16, 14, 17, 19, 27, 11, 37, 42, 18, 45,
-    43, 13, -7, 1, 3, 2, -1, 12, 32, 31, 16, -6, -15, -11, -29, -27,
-    8, 3, 9, 24, 22, 13, 22, 16, 21, 21, 35, 55, 47, 15, -9, 4,
-    1, -4, -5, -11, 14, -20, -13, -26, -25, -32, -29, -13, 0, -15, 9, 29,
-    14, 10, 15, 6, -8, -2, -2, 17, 23, 18, 22, 1, -3, -1, 17, -28,
-    -44, -49, 11, 15, 4, -8, -2, -4, 23, 5, 30, 22, 47, 40, 23, 14,
-    19, -4, -20, -25, -24, 26, 27, 2, -2, 4, 2, 31, -3, -27, -19, 16,
-    21, 33, 35, 7, 8, -2, 30, 37, 44, 22, 15, 19, 8, 19, 31, 8,
-    6, -9, 3, 0, -1, -4, -2, 4, -14, -20, 3, 3, 5, 19, 19, 45,
-    36, -7, 25, 45, 43, 44, 47, 21, -2, 9, 31, 12, 3, -2, 3, 3,
-    -1, -2, 2, -2, 2, -4, 2, 4, 1, 4, -5, 3, 15, 15, -4, 2,
-    3, 3, -1, 4, 2, 2, 1, -4, -4, -1, 4, 4, -2, 4, 2, 0,
-    1, 2, 15, 13, 12, 15, 39, 27, 39, 26, -21, 35, 45, 36, 15, 20,
-    28, 15, 16, 11, -2, -1, 0, -5, 2, 0, 14, -4, 14, 16, 20, 21,
-    -3, -1, 16, 46, -7, -9, 4, 26, 34, 55, 38, 23, 0, -12, 11, -4,
-    -9, -8, 0, 0, -1, 4, 21, 17, 15, -14, -2, 23, 9, 11, 6, 15,
-    1, 23, 29, 6, 8, 10, 25, 2, -25, -23, -4, 3, -7, -2, 0, 2,
-    -3, 3, -19, 10, 18, -31, -32, -20, -19, 8, 6, 1, -9, -6, 30, 25,
-    21, 23, 21, 14, 8, 8, -6, -43, -40, -35, -7, 4, -4, 0, 8, -19,
-    -43, -37, -42, -16, -13, -6, 15, 9, 7, 18, 22, 32, 25, 12, 7, 4,
-    -2, -9, 1, -22, -36, -24, 8, 5, -4, -2, -30, -44, -7, -16, -13, 5,
-    5, -8, 20, 30, 20, 25, 20, 21, 11, -1, -6, -11, -16, -17, -19, -50,
-    -28, -5, -13, -4, 2, -8, -18, -28, -24, -22, -7, -3, -5, 11, 26, 40,
-    25, 21, 15, -3, -17, -37, -23, -11, -26, -19, -40, -51, -31, -30, -39, -2,
-    4, -11, -8, -22, -55, -33, 7, 5, 7, 19, 20, 29, 10, -1, -8, -18,
-    -44, -42, -37, -29, -31, -18, -47, -82, -48, -44, -14, 2, 0, -13, -39, -15,
-    -38, -19, 24, 5, 14, 26, 29, 28, -6, -32, -40, -40, -38, -36, -31, -51,
-    -34, -37, -67, -70, -43, -21, 24, 3, -6, -20, -7, -18, -32, 15, 21, 6,
-    20, 36, 10, -16, -25, -21, -30, -18, 1, 0, -3, -18, -15, -5, -37, -12,
-    8, 25, 31, -1, -6, -13, -35, -32, -44, 9, 21, 15, 24, 21, 0, -11,
-    -1, 4, -11, -7, 19, 40, 38, 35, 36, 27, -5, 25, 42, 29, 19, -7,
-    -2, -10, -25, -11, -20, 4, 16, 2, 6, 17, 8, 16, -3, -36, -16, -5,
-    18, 28, 35, 31, 26, 21, 1, 27, 13, -11, 14, 2, -5, -14, -12, -9,
-    7, -7, -14, 3, 1, 19, 30, 1, -22, -47, -32, -18, 2, 0, 8, 26,
-    9, 16, 13, 24, 9, -28, -10, -9, 0, 11, -20, -27, 4, 2, -10, 2,
-    4, 23, 29, 10, -16, -31, -18, -7, 6, 2, 30, 1, 21, 10, 16, 21,
-    16, -9, -21, -21, -5, 8, -23, -53, -11, -7, -13, 2, 8, 8, 12, 4,
-    6, -14, -18, -15, -3, 10, 21, 14, 11, 18, -6, 14, 19, 30, -35, -33,
-    -9, 15, -16, -43, -8, -13, -29, -18, 6, 2, -2, 13, 15, -11, -3, -28,
-    -15, -5, 10, 9, 21, 6, 1, 12, 18, 28, -47, -28, 3, -5, -17, -12,
-    -27, -13, -14, -14, -6, -3, 9, 19, 16, 9, -9, -38, -31, -6, -2, 6,
-    11, 3, 9, 16, 14, 5, -38, 5, -1, -13, -14, 15, 7, -7, -3, -4,
-    -2, 4, 21, 20, 31, -3, -20, -25, -33, -7, -14, -4, 9, 8, 4, 14,
-    -20, 22, -48, -28, -1, 3, 30, 44, 32, -4, -26, -9, -10, 5, 17, 30,
-    30, -4, -28, -30, -29, -5, -2, 5, 14, 29, 23, 16, 3, 28, -36, -5,
-    -3, -1, 22, 11, 49, 22, -30, -32, -18, 0, 2, 20, 15, -9, -11, -16,
-    -4, 6, 5, 28, 13, 28, 27, 2, 13, 57, -29, 1, 2, -15, -17, -35,
-    27, 22, -4, -4, -7, -4, -1, 20, 22, 17, 2, 1, 9, 10, 10, 13,
-    20, 18, 6, -17, 2, 25, 20, 1, -2, -3, -39, -29, -5, 0, -21, -13,
-    -24, -26, -9, -5, 16, 21, 6, 19, 36, 24, 8, 16, 10, 2, 0, -5,
-    -31, 4, -1, 2, -2, 4, -2, 13, 15, 16, 7, -5, -8, -24, -29, -20,
-    0, 5, 18, 13, 20, 22, 14, 13, 13, 17, 5, -8, 10, 8, -8, -5,
-    -3, -2, -21, 21, 34, 29, -2, 28, 9, -15, -21, -49, -33, -17, 0, 24,
-    25, 13, 18, -7, 25, 5, -9, 18, 26, -12, -12, -3, 0, -1, 19, 14,
-    9, 9, 26, 14, 18, 24, 10, 2, -20, -24, -32, -18, -12, 6, 18, 45,
-    44, 34, 47, 28, 46, 8, -8, -2, -2, 3, -5, -1, 4, 5, 6, -18,
-    -15, 19, 19, 12, 3, -8, 14, 5, 12, 44, 36, -1, 44, 8, 14, 35,
-    18, 1, -4, -4, 5, 2, -4, 1, 1, 0, 0, 3, -3, -19, -25, -24,
-    -22, -28, -43, 15, 9, -33, -11, -4, -25, -37, -33, -12, -4, -3, 3, 2,
-    1, -1, -2, -1, 0, -2, 2, 3, -3, 2, 3, -4, 9, 14, -1, 3,
-    -4, 2, 3, -2, -1, 2, 5, -2, 1, 1, -1, -2, 3, -1, -3, 0,
-    2, 1, 1, 2, 7, -4, 14, 23, 23, 12, 10, 24, 17, 24, 22, 32,
-    29, 12, 7, 4, 0, -4, -5, 2, 2, 3, 8, 2, 10, 9, 14, 9,
-    -6, 20, 36, 51, 13, 29, 41, 17, 10, 13, 6, 34, 32, 61, 28, 17,
-    5, 1, 2, -3, 3, 2, 3, 10, 3, -2, -12, -17, 7, -2, -20, 11,
-    -1, 16, 12, -5, 13, -8, -10, 1, -25, -23, -21, -4, -22, -28, -24, -2,
-    -1, 3, 19, -7, 11, 19, 27, 26, 52, 29, 32, 7, 16, 1, -3, -1,
-    -3, -21, -34, 6, 7, 2, 5, -19, -28, -32, 0, 20, 4, 4, 21, 48,
-    49, 20, 27, 34, 16, -1, 0, 4, 2, 1, 1, -6, -23, -18, -5, 8,
-    -3, 16, 2, -4, 7, 2, 14, 7, 1, 7, -35, 53, 10, -18, 6, 27,
-    10, -4, -15, -7, 6, 6, 9, 2, 1, 9, -9, -19, -26, 6, -10, -15,
-    -31, -20, 6, 31, -2, 26, -40, 50, 33, -3, 3, 0, -6, -5, -15, -15,
-    1, 6, 5, 10, 4, 6, 10, -2, -24, -15, -13, -32, -28, -17, 2, 28,
-    25, -11, -19, 57, 44, 23, 6, -12, -2, 11, 25, -2, 9, 12, 5, 6,
-    13, 27, 32, 16, -9, -25, -26, -49, -30, -4, 11, -5, 2, -23, -1, 71,
-    26, 32, 14, 10, 0, 10, 17, 7, 8, -4, 3, 7, 29, 41, 38, 13,
-    5, -18, -52, -35, -49, -5, 3, -5, 3, 7, 25, 54, 12, -3, 6, 16,
-    -9, -9, -2, 7, -4, 1, 3, 14, 18, 47, 41, 13, -18, -38, -42, -41,
-    -73, -20, 10, 18, 3, 23, 0, 46, 10, -13, -12, -11, -20, -5, -6, -1,
-    0, -4, 16, 18, 9, 27, 20, 7, 8, -4, -14, -47, -61, -26, 32, -8,
-    -2, 15, -8, 28, 5, -9, -14, -9, -26, -15, -11, 6, 3, 17, 18, 28,
-    28, 31, 9, 1, -10, 10, -6, -35, -42, -45, 2, -30, 1, 9, -14, 22,
-    -8, -9, -13, -22, -17, -19, -16, 1, 9, 21, 25, 33, 36, 19, 18, -4,
-    -13, 4, 12, 1, -46, -31, 18, 25, 2, 6, 9, 4, -13, -7, -21, -49,
-    -34, -20, -13, 11, 16, 28, 22, 5, 6, -6, -5, -7, -22, -7, -19, -6,
-    -4, -11, 41, 15, 8, 7, 39, 2, -23, -30, -47, -59, -27, 9, 16, 25,
-    21, 26, 24, -12, 2, -19, -16, -4, -13, -20, -24, -38, -34, -7, -32, 16,
-    11, 13, 39, 3, -4, -45, -72, -46, -18, 22, 24, 31, 14, 5, 0, -18,
-    -3, -8, -18, -17, -14, -13, -29, -33, -4, -3, -6, 25, 0, 6, 34, 5,
-    -26, -36, -61, -42, -7, 22, 27, 19, 4, -6, -14, -36, -5, -5, -1, 9,
-    0, -8, -29, -22, -2, -8, -14, 39, -19, 15, 22, 21, -26, -33, -38, -37,
-    -3, 19, 8, 1, -9, 10, -14, -17, -7, 6, 6, 9, 1, -10, -14, -25,
-    -7, 28, -29, 32, 10, 37, -14, 6, -20, -31, -31, -2, 6, 14, 22, -18,
-    -36, -12, -5, -9, -1, -8, 11, 6, 0, -16, -7, 2, 6, 33, 16, 19,
-    3, 41, -10, 24, -13, -51, -29, 17, 6, 6, 8, 7, 4, -14, -3, -1,
-    -2, -7, 8, 5, 0, -8, 3, 10, -2, 14, 27, 2, 8, 19, 6, 9,
-    -31, -37, -2, 3, -1, -4, -7, -1, 8, -2, -4, -4, -5, -6, -9, 7,
-    -4, 1, 25, 1, -35, 3, 29, -1, 2, 13, 19, 19, -11, -10, 2, -3,
-    -10, 5, 0, -3, 2, 5, 5, 15, 4, -9, 11, -6, 11, 32, 18, -2,
-    -10, 10, 25, 2, 0, -3, 21, -8, -25, -7, -21, -4, -8, 2, -4, -4,
-    6, 14, 4, 14, 3, 8, 18, 17, 24, 11, 0, 2, 0, 16, 23, 1,
-    3, -1, 2, -18, 2, 20, -7, -13, -15, -21, -14, 1, -10, -10, 2, 8,
-    0, -19, -4, 19, 10, 2, -11, -5, -35, 6, 13, 4, -5, 1, -9, -8,
-    0, -6, -4, -16, -15, -16, -19, -26, -16, -5, 19, -13, -17, 9, 20, -4,
-    11, -31, -36, -36, -31, 2, 10, 0, -1, -2, 0, -9, 0, -29, -41, -40,
-    -7, -7, -14, -34, -51, -49, -21, -36, -40, 37, 10, -12, 17, 5, -10, -4,
-    1, -4, 4, -4, 2, -2, -1, -3, 4, 8, -4, -8, -3, -9, -36, -12,
-    -3, -6, 9, 25, 11, 1, -21, -7, 13, 13, 12, 3, -4, 3, 1, 1,
-    0, -4, -2, -2, -2, 0, -1, 4, -3, 4, -5, 4, 16, 14, -11, -5,
-    -3, -2, -4, 1, -1, 0, 0, 3, -2, 2, 0, -1, -3, 3, 0, -3,
-    1, 7, 20, 21, 7, 10, 37, 19, 18, 26, 29, 21, -4, 6, 13, 27,
-    38, 27, 23, 17, -3, 5, 1, 0, -2, 3, 16, 3, 14, 16, 18, 24,
-    8, 0, 2, 32, -3, 34, 13, -18, -3, 28, 15, 29, 16, -10, 10, -2,
-    4, 5, -4, 1, 3, -3, 17, 1, -2, 8, 24, 31, 2, 3, -4, -10,
-    -10, 16, 12, -8, -11, -8, -18, -9, -21, -7, 12, 6, -16, -6, -2, -4,
-    -4, 4, -5, 17, 35, 28, 0, -14, 10, 7, 10, 10, 13, 24, 8, 0,
-    -2, -3, -9, -14, -6, 17, 23, -25, -60, -24, -19, -1, -2, 3, 24, -32,
-    11, 45, 18, 5, 15, 16, 16, 15, 10, 8, 9, 10, 3, 7, 16, 22,
-    5, -19, -38, -16, -40, -47, -26, -1, 1, -1, 9, -15, 12, 27, -1, -1,
-    -2, -4, -6, 5, 10, 4, -2, 5, 4, 2, 8, 4, 24, 3, -28, -26,
-    -13, -33, -30, -31, 1, 0, 4, -10, 4, 10, 3, 1, -13, 3, 0, 13,
-    14, 11, 0, 10, -1, 1, 2, 14, 16, 3, -10, -14, 21, -9, -28, -27,
-    -20, 9, 16, -8, 0, 14, 4, 1, 14, 3, -1, 18, 21, -6, -12, -3,
-    -8, -11, -4, 5, 11, 26, -7, -32, 10, -4, -15, -7, 7, 20, -2, -24,
-    25, -9, -13, 8, -2, 5, 15, 26, 27, -6, -35, -5, -15, -19, -11, -7,
-    13, 7, -18, -28, -31, -3, -39, 12, 16, 11, 11, -16, -10, -8, -15, 10,
-    10, 26, 3, 13, 8, -21, -34, -7, -2, -20, -32, -17, -8, -3, 0, -36,
-    -35, 22, -39, 9, 5, 17, 54, -10, -26, 7, -1, 11, 16, 18, 17, 17,
-    -6, -38, -19, 1, 10, -6, -11, -31, -5, -9, 4, -11, -38, -37, -39, 0,
-    15, 16, 32, -22, -3, 18, 16, -2, 16, 17, 21, -1, -44, -54, -7, 24,
-    14, -7, 9, -27, -1, 1, 22, 40, 3, -38, -27, -20, 1, 17, 26, -21,
-    35, 23, 6, 6, 5, 10, 8, -46, -58, -57, -8, 2, 12, 10, -11, -24,
-    -2, 12, 24, 45, -8, -21, -23, -28, 1, 15, 41, -6, 46, 14, -1, 14,
-    7, 13, 5, -32, -34, -22, -10, -6, 7, 6, -15, -15, 18, 11, 35, 36,
-    17, -15, -20, -10, 1, 13, 17, -7, 20, 13, 14, 36, 15, 9, 6, -14,
-    -23, -22, -13, 4, 1, -7, -8, -2, 14, 14, 24, 23, 7, 4, -13, -23,
-    5, 10, -20, -21, -9, 36, 26, 37, 35, 12, -6, 1, -24, -37, -12, 7,
-    -9, -22, -2, 6, 23, 8, 16, 10, 26, 3, -58, -36, -3, 10, -3, -15,
-    -26, 14, 13, 33, 29, 7, 16, 0, -20, -37, -7, 16, -8, 9, 13, 12,
-    7, -2, 9, -1, 9, -23, -45, -56, 2, 3, 29, -14, -30, -5, -9, 9,
-    18, 17, 4, 12, -22, -39, 9, 21, 10, 29, 24, 11, 16, 17, 7, 7,
-    -4, -12, -44, -25, 0, 7, 34, -12, -26, -10, 5, -1, 14, 22, 11, 19,
-    -21, -36, 9, 35, 13, 14, 30, 20, 16, 12, 7, 6, 23, -4, -39, -9,
-    -1, 0, 18, -29, -15, -11, -11, -15, -3, -3, -22, -21, -8, -15, 24, 19,
-    28, 26, 23, 14, -2, -4, -8, -2, 42, 22, -45, -1, 0, -15, -28, -11,
-    -24, -6, -16, -24, 1, -22, -24, -12, -1, 6, 20, 20, 33, 13, 9, 11,
-    6, -1, -21, -27, 33, 11, -18, 4, -2, -1, -35, -22, -14, -20, -27, -34,
-    -15, -7, -25, -31, -6, 13, 14, 23, 26, 17, 9, 25, 20, 3, -12, -20,
-    -1, 17, -5, 1, 3, 2, -3, -23, -6, -9, 12, -32, -59, -44, -31, -13,
-    7, 15, 16, 14, 8, 19, 13, 19, 6, 1, -20, -29, 8, 7, -23, -5,
-    0, 0, 1, 4, 16, 7, -22, -36, -61, -40, 1, -9, 14, 13, -3, 12,
-    36, 41, 20, 0, 19, 21, -1, 1, -19, -9, -13, -3, -2, 2, 11, 4,
-    -5, -26, -37, -57, -20, 3, -5, 38, 54, 25, 24, 7, -1, -20, 8, -6,
-    -19, 1, 5, -2, -13, -3, -13, 5, 0, -1, 1, 0, -4, -15, -13, -9,
-    28, 24, 9, 3, 3, 4, 17, 18, 35, 30, 32, 20, 22, 39, 35, 4,
-    13, 2, -2, 2, -2, -4, 4, 4, 1, 6, -5, -7, -3, 32, 31, 32,
-    18, 28, 28, 4, 15, 51, 40, 19, 26, 41, 48, 28, 2, 5, 3, 0,
-    1, -2, -4, -1, -4, 2, -2, -2, -3, -3, 1, -2, -2, 1, 0, 0,
-    -2, 2, 3, -1, 0, 4, 1, -5, -2, -4, 1, 3, 4, 0, -4, -5,
-    0, -2, -10, -14, -10, -14, -32, -27, -8, -15, -17, -20, -10, -6, 3, -6,
-    -5, -2, -9, -2, -2, 2, -4, 2, 4, 2, -2, -1, -16, -15, -13, -13,
-    12, 8, 9, -15, -11, -43, -52, -52, -28, -26, 15, 7, 15, 11, 15, 11,
-    -10, 2, -4, 2, -4, 1, 1, -4, -8, 5, 3, 8, 47, 24, 31, 23,
-    25, 1, -2, 26, 12, -25, -28, 0, 11, -5, -17, 6, 29, -35, 4, 1,
-    -3, 3, 16, 25, -1, -19, 4, 25, 6, 20, 33, 36, 29, 1, 9, 17,
-    13, 7, 13, 13, -2, 1, -8, -19, 10, -6, 31, 10, -3, 2, 6, 13,
-    -3, -8, 25, 11, 13, 24, 13, 25, 22, 26, 8, -6, 8, 14, 1, 1,
-    7, -1, -15, -33, -8, 21, 46, 36, -3, 9, 14, 0, 30, 17, 18, 7,
-    26, 26, 6, 13, 19, 14, -4, -1, 7, 6, -2, 6, 5, 12, 26, 24,
-    31, 39, 47, 1, -4, 26, 24, 2, 5, 11, 35, 34, 15, 1, -2, -1,
-    2, -6, -33, -18, 6, -2, 1, -11, 0, -3, 16, 26, 6, 24, 31, -1,
-    -4, 30, -4, 4, -3, 23, 20, 16, 3, 3, 2, 6, 14, -2, -5, -2,
-    1, -13, 2, 7, 9, 1, 28, 29, 5, 4, 36, 14, 11, 36, -1, 7,
-    10, 28, 26, 7, 11, 4, 5, 1, 10, 20, 17, -1, -7, 2, 0, 0,
-    16, 15, 22, 4, -17, -1, 13, 4, 12, 4, -5, 18, 30, 29, 32, 6,
-    -5, 7, 16, 9, 14, 31, 22, -4, -4, 4, -2, -4, 9, 3, 0, -25,
-    -45, -21, -3, -2, 2, 9, 17, 57, 53, 27, 15, 3, -16, 5, 5, 27,
-    41, 21, 14, 14, -3, 0, 2, -8, -4, -22, -21, -48, -70, -23, -7, -17,
-    1, 7, 14, 39, 26, 22, -10, -7, -4, 6, 7, 12, 17, 14, 6, 6,
-    -2, 1, 5, 5, 7, -12, -24, -33, -60, -40, -11, -24, 2, 11, 25, 21,
-    5, 9, -30, -6, -8, 5, 5, 2, 3, 28, 13, 9, 5, 4, 5, 6,
-    -1, -2, -16, -30, -25, -19, -9, -10, -2, 7, 29, 23, -11, -51, -38, -29,
-    -20, -9, -19, -12, -18, 9, 21, 18, -3, 4, 13, 13, -8, 5, 8, 36,
-    2, 9, -6, -13, 4, 9, -6, 18, -34, -70, -46, -48, -46, -23, -38, -35,
-    -25, -4, 15, 24, -12, -2, 6, 14, 9, 8, 29, 29, 19, 31, 28, 3,
-    -1, 5, 8, 10, -27, -44, -39, -44, -40, -29, -40, -59, -21, 1, -1, 10,
-    9, 20, 21, 23, 3, 12, 28, 28, 12, 3, 21, 15, -1, 11, 9, -3,
-    -22, -18, -20, -27, -20, -40, -61, -45, -26, -18, -20, 12, 2, 20, 7, 12,
-    2, 4, 12, 22, 15, 22, 37, 9, 11, 3, 15, 22, -3, -4, -7, -18,
-    -13, -29, -20, -10, -20, -25, -11, -8, 0, -9, -8, 11, 14, 9, 9, 14,
-    12, 4, 25, -20, -17, -5, -12, 16, 2, 2, 3, -7, -9, -4, 4, 3,
-    -10, -5, -7, -20, -18, 5, -10, -2, 6, 2, -12, 3, 9, -29, -20, -19,
-    -3, 1, -20, 3, 1, 1, 12, 14, 3, -6, -8, -5, -9, 2, -6, -13,
-    -13, -13, -12, 2, 14, -2, 1, 22, -22, -43, -16, -6, -13, 0, -18, -34,
-    1, 5, 6, 13, 5, 3, 3, 1, -1, 9, 4, -5, -7, -8, -14, 2,
-    2, 0, -1, 7, -43, -42, -22, -7, -14, -4, -2, -13, 25, 6, 9, 23,
-    15, 12, 12, 8, 1, 2, -7, -8, -4, 3, -17, -14, -13, -22, -9, 6,
-    -4, -15, -34, -9, 3, -4, 31, 23, 30, 19, 4, 17, 8, 12, 19, 31,
-    -6, -1, -7, 2, -6, -24, -22, -39, -14, -26, -15, 2, 12, 2, -17, 2,
-    4, -3, 30, 40, 7, 15, 31, 16, 10, -6, -13, 1, -6, 3, -12, -2,
-    -7, -11, -33, -13, -14, -28, -14, -2, -1, -30, -21, -4, -3, 0, -7, -6,
-    2, 15, 40, 38, 22, 9, 30, 33, 31, 21, -9, 29, 50, 11, 6, 48,
-    24, 0, 5, 1, 17, -3, -7, -4, -1, -4, 4, -2, -40, -29, -20, 33,
-    39, 6, 21, 14, 25, 46, -1, 24, 40, 15, 10, 30, 13, -5, -16, -1,
-    1, 4, -2, -2, -3, 0, 0, -4, 10, 11, 3, 3, 2, 17, 14, 2,
-    4, 17, 10, -15, 7, 24, 5, 11, 13, 11, -10, 5, 2, 1, -1, 3,
-    -1, 0, 1, -2, -1, 1, -2, -4, -4, -3, -3, 5, 12, 13, 4, -1,
-    -3, 3, -4, -3, 4, 4, -1, 0, -3, 2, -1, -2, -4, 0, 2, -2,
-    2, 4, 10, 7, 15, 14, 34, 2, -2, 6, -8, -5, -14, -8, 13, 17,
-    20, 11, 10, 7, 0, 3, 3, -4, -3, 2, 6, 4, 11, 16, 6, 6,
-    5, 12, 16, 29, 7, 0, 17, 17, -6, 41, 53, 22, 18, 29, 18, 9,
-    -1, -11, -4, -4, -3, -1, 14, 9, 2, -7, -4, -11, -15, -11, -27, -15,
-    0, 11, -2, 7, 1, 8, 25, 11, -38, 7, 0, 34, 13, -29, -12, 3,
-    -3, -4, -1, -18, -21, 0, -20, -14, -28, -12, 6, -1, 5, 0, 24, 5,
-    12, 15, 2, -7, -5, 2, -10, 22, 30, 17, 16, 20, 3, -4, 25, -14,
-    -30, -32, -44, -44, -50, -28, 2, 21, 21, 14, 9, -1, -4, 7, -14, -10,
-    8, 0, -34, -27, 2, 23, 11, 19, -1, -8, -2, -21, -26, -71, -71, -33,
-    -16, -2, -2, 16, 14, 5, 12, 16, 10, 8, -1, -16, -2, -30, -22, 1,
-    -9, 34, 15, 44, -2, -29, 5, -18, -33, -76, -68, -51, 1, -8, -4, -5,
-    8, 12, 3, 16, -1, -8, -2, -1, -4, 5, -9, -7, -12, 18, 13, 42,
-    -33, -34, -24, -29, -34, -48, -9, -13, 13, 4, 5, 15, 5, 13, 1, 2,
-    -6, 3, 3, 11, -8, 8, -29, -10, 13, 27, 14, 21, -11, -38, -14, -10,
-    -55, -36, 4, -4, 8, 13, 14, 15, 1, 7, -10, 2, 1, 7, 5, 3,
-    -9, -4, -17, -33, 0, 10, 24, 10, -5, -23, -36, -29, -30, -8, 5, 1,
-    10, 12, 6, -6, 15, 4, 11, 4, -6, -11, -3, 1, -7, -6, -20, -1,
-    15, 18, 24, 18, -4, -12, -10, -33, -18, 4, 13, 5, 8, -2, -7, -7,
-    11, 12, 23, 4, 9, 1, -4, -5, -1, 3, -3, 13, 28, 62, 50, -28,
-    -9, -17, -6, -15, 5, 13, 15, 8, 6, -2, -17, -1, -17, 8, 19, 17,
-    10, -4, -16, -13, -8, 8, -2, 25, 12, -1, -18, -42, -3, -13, -35, -14,
-    -3, 8, -4, 13, 4, -3, 4, -1, 10, 13, 16, 21, 20, -10, -20, -12,
-    -1, 14, 20, 8, -16, -13, -5, 18, -4, -8, -30, -5, 6, -3, -2, -2,
-    -2, -2, 13, 10, -2, 2, 0, -4, 10, -11, -15, -7, 3, 2, -1, -23,
-    -36, 31, 10, 10, 1, -10, -19, 11, 26, -7, 6, -10, 7, 9, 13, 12,
-    8, 8, 4, -10, 3, 4, 1, -5, -9, -3, -6, -20, -37, 36, -22, 12,
-    1, -10, -14, 6, 4, 6, 19, 1, 4, -1, 10, 14, 2, -7, 1, -9,
-    6, 4, 6, -12, -20, -17, -10, 0, -19, 57, -3, -26, 3, -8, -2, 13,
-    -20, -1, 24, 1, 16, 9, 15, 10, 2, -7, 5, 5, 3, -5, -2, -17,
-    -14, -10, -17, -11, -8, 1, -36, -30, 26, -12, -6, -8, 5, 3, 15, 5,
-    -2, 7, 2, 2, 7, 8, 21, 9, -11, -2, -21, -14, -1, -12, -10, 1,
-    20, 11, -36, 5, 5, -22, -36, -28, 3, 5, -4, -3, -3, 1, 10, 9,
-    -2, 6, 2, 0, 4, -6, -4, 15, 3, -1, 16, 36, 27, 19, 5, -12,
-    2, -23, -36, -40, 4, 24, -2, -13, -13, -9, 8, 1, 0, 3, 1, 6,
-    -6, -4, -2, 12, 14, 9, 24, 27, 32, 40, 22, -3, 5, 4, -46, -34,
-    2, 9, 9, 4, 12, 12, -2, 4, -1, 3, -2, -5, -12, 6, 3, 10,
-    20, 9, 6, 17, 22, -13, 15, -5, 3, -9, -31, -2, 9, -11, -3, -3,
-    0, 10, 8, -1, 4, 2, -4, -11, -6, 1, 1, -7, 12, 7, 0, 21,
-    29, -1, -34, -2, 4, -4, -8, 3, 3, -1, -20, -15, 2, -7, -12, -10,
-    -9, -12, -11, -3, -2, -9, 5, 4, 25, 17, 34, 37, 47, 8, -28, -3,
-    -3, -2, 3, -26, -12, -18, -15, -5, 1, -4, 0, -1, 3, -14, -16, 0,
-    8, -24, -10, 3, 21, 3, 12, 35, 9, -10, -13, 0, 4, 1, 14, -5,
-    -22, -13, 2, -7, -14, -7, 0, -12, -8, 12, 19, 2, 20, 13, 6, 20,
-    32, 14, -4, -6, -22, 6, -3, 0, 1, -3, -4, 14, 51, 47, 35, -1,
-    9, 18, 11, 12, 16, -9, 26, 13, 15, 27, 18, -7, 23, 19, 6, 19,
-    22, -4, 0, -2, 4, 3, 2, 1, -11, -14, 16, 17, 18, 3, 2, 17,
-    17, -14, 10, 23, 14, -8, 5, 8, -4, -33, -15, -20, 3, -3, -2, 4,
-    3, -4, -4, 0, -1, -1, 4, 1, 4, 1, -4, 0, -9, -12, 4, 7,
-    2, -2, 3, 4, -4, -5, -3, 2, -2, 5, 2, -1, 4, -4, -4, -2,
-    -4, -5, -14, -12, -16, -3, -30, -32, -34, -39, -25, -3, 0, -13, -11, -13,
-    -27, -15, -17, -13, 1, -4, -2, 1, -2, -2, -16, 1, -11, -7, -16, -29,
-    -45, -54, -47, -35, -38, -33, -13, 23, 49, 43, 11, 9, -8, -19, -13, -13,
-    -8, 3, -3, 0, -2, 1, -8, -33, -43, -25, -24, -47, -45, -31, -13, -2,
-    -40, -15, 30, 40, 41, 47, 30, 20, 4, -33, -26, -60, -43, -14, -15, 0,
-    1, -3, -2, -29, -25, 16, 4, -12, -12, 3, 26, 9, 13, 3, 2, 10,
-    9, 24, 22, 25, 17, -21, 0, -77, -58, -42, -13, -13, 4, 1, -21, -5,
-    -6, -6, 2, -5, -9, 7, 20, 9, -6, -44, -41, -25, -3, -3, 31, 29,
-    9, 0, 17, -20, -59, -44, -13, -6, 4, 12, -17, 26, -7, 18, 16, -3,
-    8, 20, 15, -13, -19, -24, -30, -21, 1, 15, 21, 30, 16, 7, -18, -36,
-    -40, -53, -12, -11, -5, 35, -33, 21, 28, 39, 22, 17, 2, -8, 8, 18,
-    1, -18, -28, -31, -2, 33, 35, 32, 24, 2, -7, -24, -63, -65, -11, -9,
-    5, 10, 3, 27, 28, 21, 7, -2, -13, 9, 17, 10, 1, -37, -63, -55,
-    8, 50, 40, 20, -1, -6, -17, -14, -66, -51, -6, 2, 3, 20, 35, 10,
-    -5, 8, -30, -22, -10, -15, -17, -12, 3, -49, -85, -48, 38, 36, 36, 9,
-    -22, -14, -19, -43, -75, -31, 6, -6, 1, 22, 24, 22, -12, -25, -49, -37,
-    -28, -34, -14, -6, -29, -68, -69, -11, 38, 44, 18, 12, -41, -26, -25, -30,
-    -53, -19, 18, -4, 0, 10, 21, -14, -20, -48, -39, -35, -17, -17, 2, -19,
-    -30, -29, -12, 15, 34, 21, 4, -4, -32, -34, -14, -11, 21, -4, -13, -11,
-    5, 8, 21, -11, -39, -23, -24, -18, -16, -1, 25, -2, 22, 9, 1, 4,
-    14, 17, -3, -29, -18, -23, -14, -5, 53, 39, 6, 7, 2, -8, -8, -5,
-    -19, -19, -7, -13, 12, 18, 7, 13, 5, -4, -5, 4, 4, 18, 2, -14,
-    -10, 7, 17, 5, 55, 52, -5, 16, 1, 15, -10, 11, 7, 3, 9, 7,
-    12, 23, 14, 7, 1, 8, 18, 0, 6, 27, 6, 12, -1, 23, 23, 23,
-    23, 20, -1, 9, 3, 7, 50, 19, 37, 48, 41, 19, -8, -12, 2, 4,
-    -12, 7, 13, 10, 6, 15, 6, 20, 13, 30, 10, 5, -10, -23, 39, 3,
-    0, 22, 52, 25, 17, 32, 35, 24, 4, 1, -6, -2, 10, 5, 15, 10,
-    -14, 9, 20, 28, 11, 30, -22, -10, 5, -9, 20, -16, -1, 16, 40, 10,
-    15, 11, 19, 19, 3, 3, -6, 5, -7, -7, 13, 3, -10, -4, 22, 8,
-    -14, 11, -5, -13, -2, -20, -18, -26, -21, 23, 45, 30, 0, 2, 11, 12,
-    1, 13, -5, -4, -18, -2, -2, -2, 8, 7, 13, -10, -13, 4, -3, -15,
-    7, -21, -17, 2, 16, -16, -6, 45, -1, 8, 15, -6, -28, -7, -1, -5,
-    -34, 1, 1, 2, 16, 6, -13, -3, 11, 14, -8, 3, 9, 11, 11, 6,
-    -3, -18, -2, 47, -4, 7, 12, 0, -22, -24, -10, -16, -16, -8, -7, -1,
-    17, 12, 11, 11, 34, 22, 9, 10, 17, 13, 31, -2, 14, 25, 35, 31,
-    -22, -7, 11, 5, 10, -20, -1, -6, -13, 0, -5, -13, 1, 4, 16, 20,
-    44, 29, 17, 13, 40, 26, 20, -6, 12, 25, 20, 15, -8, 17, 13, -1,
-    9, -13, -17, -2, -12, 5, 2, -4, -14, -9, -7, 15, 29, 36, 17, 10,
-    34, 14, 18, -2, -3, 1, 39, 38, 0, 15, 12, 33, 12, -3, 7, -7,
-    -4, 18, 5, 2, -2, -18, -4, -3, 5, 20, 13, 14, -30, -11, 26, -1,
-    -4, 3, -3, 15, 13, -15, -1, -3, 17, 12, 6, 5, 4, 31, 30, -15,
-    -20, -1, -4, -32, -34, -9, -5, -20, -30, 10, 4, 0, 2, -2, -7, -14,
-    26, 5, -5, -16, 4, 4, 13, 2, 7, 6, 4, -23, -20, 13, -2, -44,
-    -49, -38, -19, 28, -7, -2, 5, 1, 1, -3, -2, 3, -20, -42, -57, -54,
-    -30, -37, -28, -5, -25, -57, -33, -30, -44, -38, -29, -12, -51, -34, -26, -24,
-    -19, -5, -4, -3, 2, 5, 4, 0, 2, -1, -16, -12, -8, -12, -31, -35,
-    -4, -29, -42, -14, -13, -6, 1, -5, -11, -5, -2, 2, 1, 0, 1, -3,
-    -1, -2, 1, 1, 1, 3, 0, 1, 0, -4, 4, -3, -1, -3, -4, 2,
-    -1, 4, 0, 2, -2, -3, 2, 4, -1, 2, 2, -4, -1, 1, 0, 2,
-    -4, 2, 11, 9, 0, -4, 6, -1, 27, 24, 3, 5, 8, 2, 5, -6,
-    -1, 5, 4, -3, 2, 1, 3, -3, 4, 2, -3, 4, -7, -13, 5, 17,
-    -8, -28, -26, -7, -4, -18, 3, 12, -3, -7, 20, 8, 17, 19, 13, 18,
-    2, 2, 0, -3, -1, -1, 2, 2, 2, 1, -8, 7, 30, 3, 11, 12,
-    22, 22, 12, 3, -4, 2, -10, -8, 1, -17, -17, -22, 2, 27, 33, -5,
-    -4, -2, 5, 40, 12, -28, -19, 6, 14, 39, 14, 20, 13, -11, -16, 12,
-    4, -6, -16, -36, -32, -11, -3, -7, 22, 27, 39, -2, -4, 4, 5, 19,
-    27, 2, 13, 20, -5, 1, -7, -7, -9, -4, 13, 18, 23, 8, -16, -17,
-    -16, -10, -10, -27, 16, 38, 15, -1, -1, 10, 6, 4, 36, 16, 23, -2,
-    5, -12, 26, 14, -6, 7, 14, 19, 11, 14, 20, 6, -10, -20, -27, -11,
-    8, 21, 17, -1, -2, 20, -15, -7, 22, -2, 9, 21, 16, 23, 22, 15,
-    3, 4, 2, 8, 11, 10, 30, 11, -10, -16, -7, -21, -18, -33, -10, 4,
-    -1, 17, 6, 17, 6, -10, -1, 17, 16, 7, 17, 6, 36, 22, 3, -9,
-    23, 24, 14, 6, -3, -11, 12, -8, -17, -35, -9, 27, 6, 12, 0, 10,
-    22, -9, 8, 16, 25, 8, 5, 8, 14, 31, 26, 4, 11, 11, 1, 1,
-    11, -16, 1, 17, 23, 38, 8, 30, 6, 5, 4, 11, 16, -5, -2, -11,
-    3, 4, 7, 18, 10, 34, 29, 4, -2, 0, 7, 6, 18, 3, -12, 15,
-    26, -4, 27, -8, 5, 11, -2, 31, 11, -16, -12, -19, -12, -6, -4, 16,
-    6, 33, -3, -8, -25, -8, 1, 9, 8, 1, -30, -24, -1, -1, 37, -11,
-    6, 9, 6, 12, -18, -20, -10, 7, -4, 4, -9, 3, 5, -5, -17, -32,
-    -24, -2, -1, -8, -2, 2, -33, -41, -28, 6, 11, -22, -2, 7, 8, -7,
-    -30, -8, 0, 0, 7, 4, -14, -1, -8, -4, -19, -22, -22, -17, -6, -9,
-    1, 9, -16, -33, -7, 11, -12, -10, -1, 7, 22, 2, -15, -13, 2, -13,
-    8, 4, 6, 11, 4, 5, -17, -5, -23, -19, -7, -19, -9, 4, -18, 13,
-    28, 27, -41, -12, -1, 5, 22, -13, -11, -9, 4, 4, 1, 3, -6, -2,
-    -4, -9, -9, -14, -18, -15, -1, -26, -21, -2, -15, 9, 35, 7, -26, -31,
-    3, 10, 25, -18, 2, -13, -23, -4, 4, 17, 10, -5, -7, -4, -12, -19,
-    -17, -17, -22, -9, -14, -1, 12, 20, 39, -6, 1, -24, -3, 10, -18, -6,
-    -5, -26, -36, -14, -14, -2, -11, 7, 10, 3, -8, -23, -13, -8, -20, 2,
-    -3, 5, 24, 31, 1, -43, 3, 12, 23, 8, -6, 5, -17, -21, -26, -26,
-    -27, -25, -1, -11, 1, -14, -27, -14, -14, -6, -5, 7, 19, 9, 18, -1,
-    -31, -59, -39, -28, -6, 4, 3, 15, -7, -12, -13, -7, -21, -23, -10, -15,
-    -5, -28, -22, -15, -13, 10, 19, 24, 34, 30, 32, 22, -21, -72, -21, -29,
-    -3, 0, -17, 7, 7, -17, -6, 2, -15, -7, -9, -9, -19, -8, -1, 7,
-    -13, 13, 20, 30, 29, 32, 40, 40, -21, -67, -14, 2, 0, 5, -10, -8,
-    11, -18, -2, 8, -13, -11, -8, -6, 1, 13, 21, 19, 3, 12, 26, 29,
-    31, 26, 19, 18, -31, -58, -2, 4, 0, 6, -6, 11, 22, 6, 6, 8,
-    -15, -11, -7, 14, 13, 10, 18, 23, 8, 22, 19, 9, 15, -3, 5, 17,
-    -29, -46, -19, 6, -1, 4, 15, 29, 25, 36, 18, 19, 10, 16, 22, 27,
-    15, 21, 21, 36, 27, 24, -2, -12, 3, -7, 7, 3, -4, -36, -25, -2,
-    3, -3, -15, 32, 18, 37, 36, 14, 18, 31, 38, 36, 27, 30, 28, 30,
-    2, -6, 8, -2, -2, -13, -15, -5, 13, -31, -25, -1, -1, 4, -13, -15,
-    3, 8, 49, 40, 41, 32, 13, 15, 38, 25, 16, 15, 24, 0, -11, 35,
-    10, 6, 21, 10, 32, -13, -21, 1, -1, 1, -2, 6, -21, -16, -3, 20,
-    17, -17, 9, 12, 9, 27, -5, -4, 13, 5, 6, 24, -8, -27, -4, 11,
-    -9, 1, 1, -1, -1, -2, -1, -1, 5, 8, 15, 17, 17, 13, 10, 5,
-    3, 21, 25, -19, -8, 16, 18, -8, -3, 20, 0, 20, -1, 1, -4, -1,
-    -3, -3, 3, 2, -4, 2, 3, -5, 3, -1, -2, 4, 6, 10, -1, -2,
-    -2, 1, -2, 2, -2, 2, 3, 2, -2, -3, 0, 4, -2, -5, 1, -3,
-    1, 3, 7, 12, 12, 15, 31, 20, 16, 20, -26, -10, 30, 39, 23, 17,
-    21, 11, 17, 7, 0, -1, -2, 2, 1, -4, 11, 4, 17, 14, 16, 23,
-    26, 16, 5, 16, 0, -16, 2, 0, -9, 29, 40, 5, 2, 22, 14, 4,
-    -4, -4, 2, -5, 4, -2, 15, 27, 15, 30, 22, 7, 9, 29, 24, 45,
-    7, 6, 25, 17, 14, 11, 17, 7, -4, 31, 10, 39, 26, -24, -4, 3,
-    2, 3, 11, -4, 0, 21, -5, 21, 11, 37, 44, 13, -4, -34, -9, -5,
-    6, 8, 6, -6, -4, 20, 8, 26, 26, 14, 15, 28, -4, -4, 34, -14,
-    -33, -30, -20, 21, 28, 27, 15, -2, -7, -27, 7, -9, -1, 4, -23, -9,
-    -4, -13, -15, 4, 20, 33, 30, 21, 2, -3, 17, -48, -39, -11, -11, 25,
-    23, 4, -19, -11, -1, -24, -7, -5, -7, -21, -33, -16, -16, -22, -7, 19,
-    6, 22, 12, 35, 4, -20, 22, -30, -22, -9, -8, -4, 4, 0, -1, -6,
-    -9, -16, -13, -1, -9, -19, -16, -23, -14, -16, 1, 10, 9, 7, 23, 31,
-    1, -25, -1, 10, -16, 1, 12, 4, 4, 15, 1, 4, 2, 1, -7, -10,
-    2, -14, -19, -20, 0, 5, -14, 18, -1, 1, 7, 19, -7, -45, -3, 26,
-    -3, -7, -2, -8, 15, 10, 0, 0, -8, 0, -11, -21, -4, -1, -9, -9,
-    6, 2, -4, 21, 6, 27, 9, 20, -5, -36, -9, 25, -12, -24, -2, 2,
-    16, 16, 4, -16, -9, -7, -7, -19, -12, -10, 0, -13, -9, 6, -5, 15,
-    19, -36, 12, 13, -8, -5, 11, -25, -57, -26, -2, 13, 16, 24, -2, -6,
-    11, 11, -2, -15, -7, 1, -10, -11, -10, 10, -9, 3, 42, 23, 38, -42,
-    4, -6, -19, -26, -55, -21, 1, 27, 8, 2, 4, 17, 2, 10, -1, -9,
-    -6, 9, -12, 1, 6, 22, 11, 10, 72, -1, -30, -41, -3, -2, -34, -37,
-    -58, -5, 7, 9, 0, 1, 2, 15, 19, 8, 2, 12, 10, -15, -5, 13,
-    15, 27, 34, 16, 17, -18, -13, 10, -4, -2, -33, -43, -58, 16, 21, 0,
-    0, -7, 2, 4, 5, 8, 13, 15, 7, -15, -11, -9, 2, 31, 33, -3,
-    1, 13, -20, 0, -3, 4, -33, 13, -31, 5, 3, 3, 3, -13, -9, 4,
-    14, 14, 30, 15, -7, -12, -2, -2, -6, 14, 13, 9, -15, 29, -15, -13,
-    -4, 1, -36, 14, -14, 8, 1, 8, 1, 0, 2, 9, 23, 9, 14, 19,
-    -6, -1, 1, -9, -21, -8, -14, 7, -18, 54, -52, -25, 3, -16, -27, 40,
-    -3, -1, -9, -3, 4, 1, 18, 27, 24, 14, 0, 6, -1, 5, 9, -7,
-    0, 4, -7, 7, -7, 8, -47, 5, -30, -22, -37, 18, -18, -24, 16, -2,
-    -5, -4, 12, 10, 30, 22, 0, 4, -1, 6, -3, -8, -9, -6, -20, -10,
-    -11, 7, -38, -28, -19, -21, -36, -22, -52, -18, -2, 2, -15, -11, 15, 21,
-    14, 1, -1, -10, -17, 4, -9, -14, -8, -17, -4, -6, -34, -10, -20, -21,
-    4, -13, -20, -28, -57, -9, -17, -4, -9, 7, 32, 24, 7, 17, 6, 0,
-    -26, -11, -3, -9, -12, -9, -3, -39, -55, -36, 2, 2, -11, -12, -3, -20,
-    -26, -36, -21, -16, -1, 17, 9, 29, 22, 31, 12, 13, -17, -2, -7, 0,
-    -16, -20, 5, -25, -39, -7, 8, 2, -10, -5, -2, -13, 5, -37, -45, -31,
-    -24, 0, 18, 29, 27, 22, 5, 2, 3, -9, -2, 2, -30, -21, -11, -25,
-    -23, 20, -22, -3, 0, -1, 0, 8, 16, -24, -34, -24, -9, -32, -11, -18,
-    -13, 4, -4, -2, 10, -9, 6, 6, -10, -15, -8, 4, -28, 7, -21, -1,
-    1, 4, 7, 6, 6, -13, -51, -50, -28, -16, -20, -25, 8, 8, 10, 13,
-    49, -8, -6, -1, 12, -25, 3, -1, -22, -27, -27, -2, -4, 0, -16, 5,
-    -35, -50, -18, -29, -60, -20, 9, 3, 5, 19, 0, 22, 30, 40, 41, 34,
-    37, 29, 26, -18, -30, -11, -2, 3, -4, 4, 0, -7, -17, -36, -54, -62,
-    -6, -37, -28, 21, 24, -12, -22, -20, -6, -1, 6, -22, -51, -30, -15, 1,
-    3, 5, 0, 3, -1, 4, 3, 4, 1, -3, -20, -23, -24, -26, -39, -16,
-    -8, -17, -40, -4, -7, -26, -1, -12, -2, -11, -8, 4, 3, -2, -2, -1,
-    4, 3, 2, 2, -1, -4, 2, -1, 3, -4, 4, -1, 4, 6, 15, 9,
-    -1, -3, 4, 2, -1, -4, 4, -2, -4, 3, 0, -2, 1, -4, 0, -2,
-    1, 2, 2, 5, 9, 0, 3, 4, 12, -13, -16, 7, 19, 13, 7, 7,
-    -2, 4, -1, 0, 2, 0, -4, 2, -5, 1, 2, -2, 5, 2, 5, 3,
-    23, 26, 39, 51, 64, 31, 14, 34, 30, 20, 17, 4, 10, 17, 5, 26,
-    15, 11, -4, 4, -5, 1, 0, -13, -29, 11, 3, -15, 9, 15, 13, 52,
-    66, -2, -20, 2, 11, 9, 16, 23, -19, -8, 22, 6, 14, -11, 4, -3,
-    4, -2, 12, -20, -10, -4, 7, 3, 42, 20, 28, 51, 36, -2, -3, 3,
-    -4, -13, -8, 5, -11, -34, -39, -27, -45, -26, 1, 11, 2, -1, 10, -8,
-    -7, -20, -17, 10, 13, 9, 31, 10, 3, -1, -10, -13, -9, -25, -18, 2,
-    10, 8, 20, 35, 4, -1, -3, -2, -3, 14, -1, 9, -6, -11, -21, -5,
-    9, 18, 30, 17, 20, 13, 8, 17, 5, 2, -10, 12, -4, 16, 43, 17,
-    36, 17, 28, 19, -2, 27, -9, 17, 14, -3, -22, 6, -2, 8, 20, 17,
-    15, 21, 35, 20, 15, 8, 9, -2, 2, 6, 38, 21, -9, -6, 47, 24,
-    1, 9, -21, 15, 9, -18, -23, 9, -21, -11, 5, 6, 5, 12, 22, 16,
-    12, 16, 10, 7, 8, 2, 37, 25, -18, -9, 41, 11, 2, 12, 3, 20,
-    -11, -12, -5, 1, -26, -13, -16, -38, -34, -25, -13, -9, 6, -5, 21, -3,
-    -9, 2, 23, 39, 13, 9, 1, -13, 2, 13, -15, -14, -19, -9, 3, -14,
-    -22, -20, -29, -62, -59, -58, -38, -25, -2, 8, 9, -4, -7, 8, 23, 36,
-    25, 20, -9, -13, 0, 11, -22, -28, -32, -21, -16, -46, -45, -48, -52, -63,
-    -55, -22, 7, -8, -24, -8, 0, 2, 4, 33, 30, 20, 14, -29, -54, 15,
-    0, 12, -29, -41, -51, -41, -27, -65, -57, -41, -41, -27, 6, 19, 32, -6,
-    -18, -12, -19, -21, -6, 28, 2, -18, 10, -19, -2, 17, 0, 1, 7, -24,
-    -47, -22, -14, -26, -21, -17, -13, 11, 26, 39, 19, -13, -21, -26, -22, -28,
-    -14, 6, -15, -23, 3, -11, 4, 5, 3, -6, 4, 9, -23, 2, -3, 13,
-    20, 23, 22, 28, 20, 13, 18, -2, -11, -20, -15, -31, -11, -17, -18, -15,
-    -10, -17, 35, 9, -4, -12, 20, 28, 10, 30, 19, 16, 20, 23, 10, 2,
-    -11, 6, 5, -3, 2, -15, -6, -24, -26, -34, -32, 14, 19, -12, 57, 27,
-    -2, 6, 22, 29, 49, 46, 6, 15, 18, 17, -2, 12, 13, 13, -5, 1,
-    14, 6, -5, -22, -22, -17, 1, 32, 46, 20, 34, 31, 2, 12, 17, 20,
-    31, 18, 10, 16, 22, 1, 11, -5, 3, -11, -1, 3, 15, 8, -10, -19,
-    -17, -17, -2, 0, 11, 44, 20, 35, -3, 10, 2, 26, 16, 13, 4, 10,
-    10, 2, -10, -25, -18, -16, 2, 2, 8, 9, -6, -22, -11, -14, -12, -18,
-    -10, 47, 28, 45, 9, -8, 3, -1, 14, 13, 8, 10, 0, 0, -13, -9,
-    -10, 16, 11, -7, -1, 13, 4, -17, 9, -5, 9, 1, -15, 35, 16, 29,
-    -3, -11, 8, 11, 1, 5, 6, 5, 0, 10, -4, -2, -3, 7, 10, -3,
-    4, 11, 20, 2, 21, 28, 14, 22, 13, 22, 21, -2, 8, 9, 32, 16,
-    -5, -3, 1, 15, 3, -12, -1, -1, 11, 23, 18, 13, 8, 11, 12, 13,
-    29, 33, 16, 25, 24, 2, 16, 5, 4, 9, 39, 31, 21, 27, 12, 14,
-    -1, 0, 0, 17, 14, 10, 12, 16, 11, 11, -8, -1, 20, 16, 4, 15,
-    -6, -8, 10, 4, 1, -4, 25, 38, 29, 17, 8, 13, 12, 20, 12, 11,
-    19, 13, 11, 17, 9, -8, -29, -18, 21, 26, 27, 20, -21, -5, 28, 3,
-    3, 1, 2, 22, 4, -7, 0, 13, 21, 11, -4, -13, -10, 4, 2, -23,
-    -38, -25, -33, -19, -23, -9, 2, -17, 11, 14, 14, 4, -3, 3, 2, 8,
-    -5, -2, 18, 11, 12, 10, -7, -1, 0, -19, -25, -17, 0, 2, 9, -8,
-    -21, -27, -30, -25, 0, -1, 9, 2, 3, -1, -3, 2, 7, -23, -23, -14,
-    -25, 8, 9, -26, -53, -9, -21, -32, -16, -23, -13, -23, -32, 1, -4, -3,
-    2, -5, 1, -4, -1, 1, -4, 1, 6, 2, 5, 4, 3, 0, -11, -2,
-    -1, 0, -5, -2, 0, -6, -5, -1, 0, -2, 1, 3, 0, -3, 3, 0,
-    -2, -1, 3, -4, 3, -1, 0, -4, 4, 3, 4, 0, -4, -7, 2, -4,
-    -1, 0, 2, 0, 4, 5, 1, -3, -1, 3, -2, -3, 3, 1, -4, 4,
-    -3, -6, -7, -12, -6, -6, -7, -7, -16, -6, 20, -19, -24, -22, -10, -17,
-    -15, -5, -11, -2, -1, 0, 4, -3, -2, 4, -2, -4, -15, -11, -10, -14,
-    -16, 24, 5, -7, -36, -19, 3, -1, 12, 40, 34, 31, 18, 36, 39, 22,
-    11, -11, 3, 4, 2, 4, -7, -38, -38, 9, 11, 0, -34, -24, -38, -28,
-    -46, -7, -14, -44, -34, -28, -31, -33, -35, 2, 42, 24, 6, 57, 5, -2,
-    -3, 1, 0, -26, -18, 17, 27, -5, -9, 11, -26, -16, -3, -11, -41, -27,
-    -19, -25, -36, -26, 6, 25, 67, 50, 19, 20, -29, -7, -4, 2, -17, -26,
-    5, 51, 29, -11, 25, 39, 18, -7, -8, -12, -17, -14, -9, -18, -19, -12,
-    -19, 4, 8, 10, 3, 3, -33, -2, -3, -10, 45, 29, 22, 34, 24, 23,
-    34, 27, -16, 1, 11, -3, -9, -20, -13, -11, -15, -16, -7, -14, -14, -7,
-    -16, -5, -25, -6, 1, -21, 32, 54, 29, 21, 15, 12, 7, 10, 5, -8,
-    -4, -7, -11, -9, -16, 4, 12, -1, -1, -9, 9, 11, 24, 27, 1, -17,
-    -38, 17, 4, 17, 28, 38, 23, 6, 9, 13, 11, 14, -17, -18, -2, -4,
-    -16, -1, 18, -5, -11, -13, -29, 9, 24, 10, -4, -18, 14, 16, 2, 2,
-    38, 40, 13, 14, 9, -1, 13, -1, -14, -19, -15, -3, 2, 6, 21, 14,
-    1, 4, -21, -11, 8, -16, 4, -7, 10, 11, 17, -5, 20, 11, -2, 12,
-    21, 3, -17, -8, -17, -17, -21, 4, 12, 18, 21, 21, 12, 11, -3, -25,
-    -15, 31, -14, 1, 6, 20, 35, 1, -14, 6, -1, 15, 13, -16, -3, -3,
-    6, -17, -25, -1, 21, 25, 5, 17, 21, 17, 16, -8, -34, -3, -27, 3,
-    7, 17, 3, -11, -28, -17, -12, -11, 17, -8, 16, 18, -1, -26, -38, -17,
-    24, 20, 13, 30, 28, 23, 25, 4, -3, -50, -33, -1, 1, 14, 19, -8,
-    -19, -23, -18, 2, 2, 20, 30, 10, -4, -44, -31, -4, 17, 33, 13, 3,
-    32, 25, 13, 5, -19, -51, -30, -13, -2, -6, 31, 8, -20, -19, -15, 14,
-    5, 28, 38, 11, -10, -26, -21, 4, 40, 28, 26, 25, 36, 21, 25, 8,
-    -28, -23, -38, -8, 6, -8, 19, 4, -14, -15, -3, 29, 12, 27, 27, -7,
-    -8, -14, -25, 14, 19, 30, 26, 25, 30, 27, 19, -18, -53, -38, -43, -3,
-    8, -16, 5, -33, -18, -9, 8, 27, 23, 8, -2, -18, -20, -35, -3, 34,
-    26, 25, 26, 27, 12, 17, -6, -10, -36, -30, -34, -26, -2, -12, 20, -33,
-    -14, -24, -4, 0, 18, 11, -2, -37, -51, -47, 4, 33, 32, 19, 34, 7,
-    6, -1, -8, -40, -38, 7, -21, -33, -25, -10, 3, -34, -29, -32, -11, 11,
-    17, -4, -21, -53, -61, -35, 12, 20, 28, 18, 21, -7, -34, -18, -35, -68,
-    -50, -36, -4, -8, -2, 5, -7, 6, -11, -13, -1, 13, 17, -9, -27, -57,
-    -68, -35, 11, 30, 15, -1, -10, -21, -42, -30, -55, -61, -46, -39, -3, -4,
-    2, -11, 24, -1, -22, -1, -15, -5, -22, -16, -22, -41, -13, -10, -4, 0,
-    -3, -11, -11, -28, -41, -32, -48, -51, -29, -23, -4, 3, 1, -2, 14, -3,
-    -30, -14, -24, -33, -24, -11, -1, 5, 16, 18, -3, -12, 1, -2, -10, -22,
-    -38, -32, -25, -22, 16, 0, -7, -3, -5, -6, 18, -21, -33, -30, -25, -22,
-    4, 0, 5, 10, 23, 23, 5, 8, 12, 2, -18, -12, -15, -39, -15, -19,
-    19, 37, 18, 3, 5, -4, -23, -16, -7, -31, 3, -2, -1, -3, -4, 1,
-    28, 16, 22, -2, -10, -9, -22, 5, 2, 16, -8, -5, 6, 29, 12, -2,
-    -1, -4, 5, -3, -4, -17, -14, -12, -9, 1, -3, -6, -1, -9, -6, -3,
-    14, 17, -1, 19, 26, 33, 25, -14, -1, 3, -3, 2, 0, 2, 5, 0,
-    -4, -20, -32, -44, -13, 3, -9, -2, 7, -6, 29, 32, 16, 25, 12, -26,
-    -16, -5, -23, -23, -21, 0, 1, 1, -1, 4, 1, 5, 0, -35, -31, -25,
-    -8, 28, -6, -11, -13, 0, 11, 10, 12, 1, 6, 1, -6, 17, 20, -5,
-    14, 3, 1, -3, 4, 1, -2, 2, 15, 31, -6, -18, -19, 7, 13, 5,
-    5, 26, 9, -13, 6, 43, 28, 10, 30, 39, 40, 28, 2, -4, 4, 1,
-    4, 0, 5, -1, -3, -4, 4, -5, 2, -1, 0, -4, 16, 14, -15, -3,
-    1, 1, 4, 5, 2, 4, -4, -2, 0, 2, -5, -4, 4, -2, 4, 3,
-    -1, -1, -8, -7, 4, 9, 44, 12, 1, 11, 16, -20, -16, -8, 21, 6,
-    22, 15, 8, 4, -2, -3, 1, -3, -4, -2, 8, 5, -3, 14, 0, 7,
-    6, 5, -19, -10, 8, -20, 2, -5, -12, -2, 7, -9, -5, 12, 21, -2,
-    -12, -11, 2, 1, -4, -1, 10, 10, 26, 4, 12, 13, 0, 8, 15, 22,
-    -26, -6, 24, 17, -2, -18, -6, -2, 12, 39, 9, 24, 5, -24, -13, 4,
-    -1, -4, -19, 23, 11, -5, -23, -3, -26, -11, -7, 1, 14, 8, 17, 10,
-    1, -2, -8, -3, 0, 22, 10, 21, 17, 3, 6, 27, -3, 0, -22, -5,
-    -11, -15, -24, -2, 13, 25, 10, 28, 27, 23, 27, -6, -17, -4, -16, -21,
-    -13, -17, -36, -12, 0, 23, 13, 18, 2, -10, 31, -12, 9, -11, -7, 24,
-    23, 18, 2, 21, 20, 10, 6, -2, -2, -4, -27, -7, -3, -6, -14, 11,
-    -3, -7, -9, 32, 0, -24, 41, 5, -16, -9, -8, -14, -4, -3, -7, -5,
-    3, 3, -13, 5, 11, 13, 7, 4, 12, 7, 7, 27, -2, -32, -10, 31,
-    -37, -5, 38, 14, -13, -5, 23, 5, 7, 6, -10, 5, -1, -7, -14, -2,
-    12, -2, 3, -1, 6, 12, -15, -16, -11, 0, 9, -1, -6, 23, 4, 4,
-    -11, -10, 9, 0, 7, 1, 3, 16, -6, -20, -18, -4, 5, 4, -13, 7,
-    20, 23, -18, -8, 6, 3, -3, -18, -6, -3, 11, -6, 1, -2, 1, 4,
-    12, 19, -2, 1, -1, -15, -6, 11, 0, -2, -10, -2, 11, 3, 6, 9,
-    7, -17, -32, -4, 2, -13, -3, 3, -14, 1, 5, 25, 34, 29, 8, 9,
-    12, -4, 9, 8, -1, -2, -25, -24, -7, 6, 9, 0, 14, 6, 19, -29,
-    -2, -9, 4, 8, -3, 24, 3, 23, 13, 8, 8, 12, -13, -17, -5, 12,
-    3, -5, -18, -10, -1, 23, 12, 32, 20, -26, -28, -32, -2, -7, -23, -9,
-    -7, 13, 2, 24, 16, 18, 22, 10, -9, -11, -8, 10, 17, -8, -10, 8,
-    9, 23, 33, 27, -19, -9, -28, -12, 1, -1, -48, -31, -6, 26, -1, 28,
-    16, 20, 26, 22, 5, 5, -10, 0, 5, 19, 14, 15, 0, 14, 21, -10,
-    -26, -4, -53, -14, 7, -6, -49, -12, 17, 8, 8, 30, 30, 17, 30, 16,
-    4, -2, -14, 0, -1, 25, 16, 5, 0, 1, 11, -5, -42, -11, -34, -28,
-    5, -10, -45, -21, -11, -1, 33, 21, 28, 8, 10, 12, 6, -8, -15, 8,
-    20, 28, 11, -14, -9, -23, -17, -24, -35, -5, -56, -41, 4, -13, -14, -37,
-    -22, -9, 12, 19, 18, 10, 20, 12, 2, -15, -18, 9, 25, 25, 14, 0,
-    4, -14, -19, -5, 12, -27, -5, -53, 6, -18, -7, -36, -21, -19, -3, 4,
-    13, 6, 10, 11, 17, 6, -4, 4, 7, 14, 1, 1, 5, -5, -22, -14,
-    -1, -27, 9, -47, -13, -1, -16, 3, -18, -20, -14, -12, 8, 3, 8, 0,
-    15, -6, 1, -9, -7, 3, -9, 5, -6, -9, -15, -22, -11, -48, -25, -29,
-    3, 6, -25, -16, -5, -11, -25, -32, -19, -13, 2, -5, 9, 6, 0, -4,
-    -7, -8, -21, -9, -11, -10, -20, -33, -7, -13, -28, 2, -10, -1, -29, -18,
-    6, 11, -16, -20, -9, 1, -5, 0, 11, 4, -4, 7, 4, 9, -10, 0,
-    -6, -10, 9, -10, -8, -22, -29, 0, -3, -6, -9, -3, 17, -13, -18, -20,
-    -11, -3, -2, -7, 16, 9, 12, 15, 21, 11, -1, 8, -14, -2, 18, 1,
-    11, 5, -30, 1, 2, 0, -21, -12, 6, -11, -29, -28, -7, -30, -37, -41,
-    -23, 7, 10, 10, 6, -15, -4, 0, 4, 19, 7, 2, 26, 1, -23, -3,
-    -1, 4, 10, -15, 18, -1, -10, -2, 10, -15, -32, -20, -4, 15, 5, 0,
-    15, -34, -32, -7, 16, -12, 7, 8, -23, -24, -19, 4, -2, -4, 8, 14,
-    3, 9, -7, -8, -4, 14, 17, 10, -31, 0, 6, 3, 4, -8, 5, 3,
-    -13, -7, -18, -21, -28, -7, -2, -3, 0, 3, 2, -4, 47, 52, 29, 1,
-    13, 31, 3, 9, 20, -13, 21, 8, 4, 13, 7, -13, -2, 23, 17, 17,
-    21, -4, -1, 0, 1, 3, 3, 5, -9, -12, 11, 16, 17, -3, 13, 22,
-    13, -17, 2, 25, 6, -10, -1, 17, 1, -18, 7, -20, 1, -2, -2, 2,
-    0, -3, -1, -3, 3, -4, 2, 4, -4, 4, 0, 1, 16, 16, 17, 5,
-    -2, -3, 0, -3, 0, 0, 3, 0, 2, 4, -1, 4, -4, -2, 1, 0,
-    -2, 2, 17, 12, 9, 10, 14, 9, 23, 31, -4, 5, 10, 17, 8, 12,
-    23, 19, 13, 8, 3, -1, 0, 1, 3, 2, 13, 1, 10, 13, 16, 27,
-    37, 32, 30, 50, 6, -3, 30, 29, 13, 0, 2, 23, 29, 7, 7, 34,
-    9, -2, 4, 2, -3, -1, 14, 5, -1, 22, 21, 47, 52, 1, 7, 21,
-    -11, -16, -20, -42, 2, 7, 13, 35, 35, 28, 30, 22, 21, 37, 32, -2,
-    2, 5, 20, 33, 18, -17, -2, -1, 9, 2, 16, 18, -20, -35, -28, -28,
-    -13, -21, -16, 19, 22, -31, -20, -1, 11, 21, 35, 31, -4, 1, 15, -19,
-    9, 5, 7, 16, -32, -26, -4, -8, -9, 9, -4, -4, -13, -20, -25, -16,
-    -5, 1, -23, -8, 32, 59, 48, 40, 4, 16, 25, -19, 11, -9, -5, 6,
-    -30, -6, 14, 3, -5, 8, -6, 10, -6, -12, -23, -13, -26, -15, -8, -15,
-    -21, 37, 35, 37, 2, 24, 22, -14, -11, -21, 9, 13, -9, 4, 12, 6,
-    8, 9, 16, 19, -8, -4, -15, -16, -5, -6, -9, -20, -25, 7, 23, 37,
-    1, 19, 52, -19, -9, 12, -12, 3, -3, -1, 29, 31, 18, 25, 21, 0,
-    -4, 0, -4, 10, -5, -4, 11, -23, -46, -21, 13, -3, 6, 8, 35, 9,
-    41, 25, 8, 21, 26, 19, 35, 25, 21, -3, -12, -25, -7, -11, -17, -15,
-    -8, -4, 18, 21, -47, 0, 28, 20, 6, -1, -14, 13, 40, 24, 27, 33,
-    29, 21, 7, 5, -23, -46, -56, -31, 0, 1, -6, 2, -8, -10, 4, 2,
-    -41, -28, 21, 17, 6, 13, -18, -2, 16, 22, 22, 7, 16, -5, -51, -44,
-    -87, -63, -27, -4, 9, 5, -10, 0, 12, -3, -6, -11, -18, 13, -6, 31,
-    8, 3, -24, -33, -30, -9, -27, -51, -53, -67, -84, -71, -38, -12, 38, 37,
-    22, 3, -4, -14, -5, -5, -10, -18, -6, 35, 21, 37, -5, 6, -8, -40,
-    -73, -72, -64, -92, -74, -68, -44, -5, 16, 33, 26, 8, 17, 5, 1, 6,
-    -7, 12, -9, 12, 48, 38, 31, 8, 3, 17, 3, -38, -60, -65, -48, -58,
-    -37, -16, 5, 33, 40, 47, 28, 17, 5, -5, -4, -1, -6, -3, 7, 11,
-    18, 4, 57, 7, -4, 10, 13, -32, -48, -21, 2, 2, 5, 2, -1, 29,
-    38, 41, 34, 6, 1, -8, 7, -2, 1, 5, 11, 9, 21, -2, 15, 19,
-    0, 22, 31, 16, 8, 13, 20, 22, 14, 7, -2, 17, 12, 35, 22, 6,
-    1, 2, 3, 18, -2, 14, 3, 11, 37, 8, 36, 24, -3, 24, 27, 37,
-    20, 15, 13, 22, 9, -21, 1, 13, 9, 26, 9, 3, 4, 0, -22, 4,
-    13, 6, -5, -16, -8, 24, 45, -20, -2, 18, 36, 40, 32, 12, 4, 12,
-    -7, -24, -8, -1, 18, 9, -3, 4, 16, 10, -10, 7, 3, -7, -4, -24,
-    -14, 38, 44, 3, -7, -8, 21, 0, 37, 11, 18, 12, -7, -1, -13, -8,
-    1, 19, 16, 14, 0, -10, -3, 5, -3, -7, -10, -40, -39, 5, 22, 8,
-    4, -16, 15, 19, 30, -2, -12, 18, 19, -10, -19, -33, -26, -10, 5, -3,
-    -3, -18, 12, 11, -12, -7, -18, -34, -33, -22, 6, 1, -1, 2, 50, 33,
-    6, -15, -2, 26, 15, 5, 1, -18, -12, -3, 3, 12, 5, -16, 19, 13,
-    3, 1, -12, -23, -21, -26, -2, 2, -7, 11, 33, -11, 10, 35, 1, 14,
-    21, 7, -2, -6, -21, -20, -7, 8, 2, 10, 11, 19, 5, -6, -29, -25,
-    -11, -33, -3, -2, 2, 3, 42, -13, -5, 31, 34, 18, 1, 6, -3, 0,
-    -10, -15, -5, 3, -3, 0, -7, 20, 1, -16, -7, -18, -16, -17, -9, 2,
-    -4, 0, 23, 22, 1, -10, -2, -8, -17, -13, -19, -15, -23, -28, -18, -2,
-    -14, 4, -23, -14, 3, -2, -15, -20, -12, 14, 8, -1, -2, -4, -7, -7,
-    -27, -20, -18, -12, 7, -14, 2, -3, -1, -40, -43, -2, 17, 6, -7, -8,
-    -10, -43, -48, -47, -22, -12, -2, -5, -1, -2, 2, -1, -30, -37, -29, -19,
-    -5, 8, 3, 0, -14, -2, -2, 6, -23, -24, -16, -5, -17, -58, -33, 8,
-    -3, 1, -1, 0, -4, 1, -3, 4, 2, 5, 1, 4, 5, 16, 28, 31,
-    10, 5, 10, 10, 14, 30, 21, -20, -32, -39, -29, 0, 4, 4, 3, -2,
-    -1, 2, -2, -4, -1, 1, -2, -3, -2, -1, 0, -4, 25, 18, -6, -6,
-    -2, 2, 0, 3, -3, -2, 0, -2, 2, -4, 3, -2, -4, -4, 0, -3,
-    0, -1, -4, -6, -5, 4, 31, -1, -6, 6, 25, 2, -17, -14, 14, 10,
-    24, 16, 4, 2, 0, 0, 4, 0, 1, 4, 1, -4, -2, 12, 3, 1,
-    12, 30, 8, 10, 3, 30, 26, 10, -5, 2, -2, 1, 2, 11, 9, -10,
-    13, 13, 4, 1, -2, -5, 9, -23, -7, 20, 26, 41, 28, 18, 15, -5,
-    -12, 2, 12, -19, -43, -63, -43, -6, -24, -19, -2, 28, 17, -17, -21, -3,
-    3, -2, 12, 10, 37, 41, 23, 30, 32, 5, 13, 10, 26, 36, 19, -19,
-    -20, -31, -56, -25, 4, 9, 33, 29, 12, -4, -11, 44, 2, 1, 8, -12,
-    13, 52, 28, 28, 19, 2, 3, 33, 47, 23, 1, -20, -41, -39, -35, -27,
-    -10, -7, -8, 29, 24, 12, 13, 27, -4, -9, 13, -10, 7, 4, 5, 15,
-    3, -5, 1, 23, 21, 1, -17, -19, -31, -18, -22, -17, 2, -4, -1, 30,
-    13, -12, -14, 32, 4, -5, 23, 3, -5, -23, -14, -11, -20, 6, 7, 2,
-    1, -17, -17, -8, -20, -24, 1, 18, 0, 6, 14, 28, 13, -22, -11, 32,
-    -39, 13, 23, 12, 0, 5, 0, 3, 4, 14, 8, -6, -12, 0, -5, -14,
-    -27, -20, 6, 12, -1, 14, 10, -9, -2, 6, 2, -18, 11, 48, 1, -7,
-    6, 1, 2, 14, 10, 12, -3, 9, -2, 0, -1, -11, -17, 1, 21, 22,
-    16, 22, 9, 4, -2, -8, -21, -22, 8, 28, -2, -10, 16, -7, -9, 10,
-    4, 0, 2, 10, 14, 15, 5, -16, -23, 11, 28, 28, 14, 7, 25, 1,
-    -16, -24, -49, 3, 4, 9, 19, 28, 37, 11, -15, 4, 17, 13, 12, 12,
-    24, 27, 23, -12, -14, 4, 15, 8, 10, 8, 17, 6, -24, -10, 9, 45,
-    14, 10, 24, -7, 18, 20, -13, -5, 6, -3, -5, 0, 4, 17, 19, 13,
-    11, 9, 19, -8, 1, 13, 17, 34, -11, -23, -36, 16, -3, 17, 32, -13,
-    33, 6, -9, -9, 14, -3, -6, -13, -21, -3, 21, 18, 17, 14, 12, 14,
-    13, 20, 17, 10, -19, -12, -30, -24, 3, 16, 48, 14, 18, -10, -19, -2,
-    18, 9, 10, -4, 0, -5, 19, -5, 2, 22, 11, 27, 4, 6, 12, -14,
-    -35, -2, -43, -15, 2, 5, 16, 12, 4, -10, -1, 7, 21, 7, 15, 4,
-    -11, 11, 21, -14, -5, 21, 13, 22, 19, 11, 22, 1, -39, -11, -31, -14,
-    8, 7, -3, -7, -2, 4, 19, 18, 26, 13, 13, -8, -6, 19, 24, -1,
-    7, 12, 14, 4, 13, 0, -3, -2, -2, -18, -50, -36, -4, 9, -8, -21,
-    -17, -21, -2, 17, 18, 8, 1, 2, -6, 7, 34, 10, 10, -8, 6, -5,
-    1, 1, 12, -14, 3, -26, -35, -44, 9, 4, 1, -30, -24, -28, -24, -9,
-    -1, 0, -10, -4, -2, 29, 18, 6, 17, 11, 11, -8, -2, 0, -6, -32,
-    -41, -22, -4, -1, 8, -4, 13, -49, -36, -26, -8, -7, 2, 4, -18, -5,
-    -5, 1, 7, 11, 14, -6, -18, -5, -13, -8, -23, -31, -40, -18, 0, 32,
-    4, -8, -11, -45, -38, -30, -17, -10, -22, -22, -25, -26, 6, 11, 19, 23,
-    18, -17, -20, 1, -6, -25, -40, -28, -10, 4, -4, 2, 2, 15, -20, -31,
-    -24, 6, -5, -12, -9, -15, -17, -8, 0, 9, 3, 1, 2, -19, -17, 9,
-    -5, -28, -27, -25, 4, 2, -6, -1, 5, 7, -12, -32, 1, 21, 15, 5,
-    -8, -12, -21, -6, 3, 1, 9, 4, -1, -13, -8, 4, -23, -33, -28, -23,
-    9, 11, -14, -4, 2, -2, -26, -54, -10, 12, 16, 7, -17, -29, -35, -26,
-    3, 9, -1, 8, -18, -26, -3, -7, -13, -22, -29, -20, 13, 6, -25, 2,
-    0, -4, 12, -22, 6, 36, 21, 16, -2, -15, -14, 16, 11, -2, -19, -9,
-    -23, -38, -12, -11, 14, 1, -28, -12, -22, 4, 2, 0, 0, 2, 2, 0,
-    35, 29, -6, -3, 10, 13, -2, 4, 3, 2, 29, 5, -3, -18, 1, -14,
-    -33, -21, -37, -17, -17, -2, -1, 4, 0, 1, -1, 2, -25, -8, 9, 11,
-    29, 41, 19, -12, -20, -2, 26, 21, 28, 19, 2, -12, -1, 31, 26, 17,
-    6, 3, -2, 1, -2, 1, 2, 3, 19, 27, 7, 0, 0, 26, 32, 13,
-    3, 20, 38, 14, 30, 46, 29, 40, 32, 48, 47, 25, 0, 1, 4, 1,
-    0, -1, 2, 3, 2, -2, 1, 0, -4, 2, 2, -4, -1, 2, -5, 0,
-    -2, -4, -1, 3, 4, 4, 0, -4, 2, 2, -2, -2, 3, 2, 3, -2,
-    3, 0, -4, -5, -12, -6, -11, -12, -16, -24, -11, -8, -4, -5, -9, -1,
-    -8, -2, -5, -6, -1, 4, 3, 4, -1, -4, -1, 3, -11, -8, -9, -6,
-    -11, 0, -9, -49, -64, -63, -54, -31, 5, -7, -10, -12, -7, 12, 21, -12,
-    -2, -6, -1, -4, 3, 1, 4, 10, -11, -27, -6, -19, -31, -32, 13, 9,
-    -54, -87, -34, -1, 13, 17, -4, 1, 23, 34, 30, 2, -15, -7, 0, 4,
-    0, -2, -3, 1, -34, -36, -34, -4, 6, 10, 14, 29, 31, 28, 8, 3,
-    -12, -24, -6, 18, 22, 36, 42, 8, 8, 14, 8, -4, -2, -2, 0, -17,
-    -41, -37, -43, -50, -5, 24, 32, 2, -12, -39, -30, -33, -33, -29, -16, -8,
-    26, 24, 36, 29, 28, 29, 30, 9, 0, 1, 21, 16, -8, 20, -14, -23,
-    -8, 1, 0, 13, 16, -3, -22, -42, -48, -19, -3, 17, 7, 33, 37, 31,
-    -1, 15, 26, 3, 6, 26, 25, 25, -12, 2, 14, 2, 6, 13, 18, 18,
-    5, -14, -28, -48, -26, 6, 28, 28, 13, 0, 18, 5, -20, -25, 17, 1,
-    19, 27, 52, 17, 4, 15, -6, -3, 19, 18, 16, 19, 7, -2, -26, -39,
-    -16, 9, 31, 5, 28, 31, 23, 7, -9, 2, 16, -13, 13, 17, -14, 4,
-    -5, -8, -13, 17, 11, 17, 16, 25, 9, -9, -15, -22, -19, 6, 31, 5,
-    28, 34, 15, 21, 19, 52, 13, 5, 17, 17, 5, -14, -10, -12, -24, -2,
-    16, 12, 37, 34, 9, -2, -23, -31, -17, 5, 26, 25, 19, 16, 22, 14,
-    16, 38, 11, 9, 4, 20, 21, 18, -4, 11, -1, -8, -7, 15, 37, 34,
-    22, -31, -60, -26, -7, 9, 19, 2, -10, 0, -3, -3, -1, -27, 19, -8,
-    9, 21, 1, 15, -16, 10, 7, 22, 14, 13, 25, 29, 22, -41, -58, -25,
-    4, 20, 16, -11, 0, -18, -1, -14, -6, -45, 14, -4, 4, 20, 22, 14,
-    -10, 15, 15, 21, 18, 22, 18, 15, -16, -49, -50, -23, 2, 15, 10, -17,
-    2, -27, -20, -14, 2, -34, 4, -8, 2, 10, 39, 13, 4, 34, 13, 18,
-    14, 16, 29, 1, -44, -67, -31, -7, -6, 4, -1, 2, -12, -15, -17, 21,
-    20, -46, -1, -1, 3, 3, 29, 29, -6, 21, -3, 19, -3, 7, 25, -11,
-    -48, -51, -23, -8, -20, 6, 8, 1, 0, -8, 10, 8, -42, -58, -28, -3,
-    9, 2, 17, 23, 3, -7, -3, 15, -2, 0, -7, -31, -39, -29, -5, -13,
-    -10, 4, 0, -4, -12, 12, -6, -21, -28, -63, -28, -5, -4, 2, 20, 13,
-    25, 7, -7, -14, -5, -15, -28, -32, -30, -17, -8, -15, 0, 12, 16, 7,
-    11, 18, 10, -2, -14, 4, -21, -10, 1, 3, 20, 11, 24, -9, -4, -5,
-    8, -7, -27, -44, -16, 9, 1, -18, 5, 8, 18, 3, 20, 35, 6, 5,
-    -7, 10, -3, -3, 4, 2, 13, 10, 25, 4, 10, 3, 1, -19, -51, -49,
-    -8, 1, 9, -12, -10, -4, -7, -12, 16, 18, -36, -30, -26, 6, -25, -7,
-    -3, 6, 4, -27, -20, -30, -2, 2, -11, -45, -37, -26, 5, 2, 2, -16,
-    -15, -6, -11, -3, 9, -14, -50, -47, -43, -16, -13, 3, 1, 3, -8, -25,
-    -22, -34, -45, -39, -26, -22, 10, 24, 1, 7, -9, -10, -1, -8, 13, 7,
-    15, 23, -6, -47, 2, -9, -12, 4, -1, -3, -1, -9, -28, -31, -40, -47,
-    -3, -6, 11, 13, 5, 2, -15, -6, 5, 1, 11, 11, 4, 40, -7, -40,
-    -27, 8, 31, 6, -2, 4, 3, 16, -8, 7, 1, 1, 1, -15, 7, 11,
-    1, 3, 3, 5, 13, 8, 4, -4, -12, 20, -11, -34, -24, 6, 22, 2,
-    2, 2, 2, 11, 10, 39, 23, 6, -14, -33, -3, 3, 6, 14, 10, 4,
-    0, 5, -5, -12, -44, -9, -4, -35, -15, -5, 1, 2, -1, 5, -25, 6,
-    20, 0, 7, 6, 23, -8, -7, 16, 35, 19, 6, 22, 19, 6, 2, -21,
-    -25, -2, -1, -39, -11, 1, -3, -3, -2, 1, 3, -5, -17, -24, -20, -14,
-    -9, -26, -32, -14, 7, 2, -23, 1, 2, -15, -2, 12, -7, -10, 0, -8,
-    -2, 6, -3, 0, 2, 0, -5, 0, 24, 28, 2, -9, -3, 8, 9, -11,
-    -13, 29, -8, -23, -15, 34, 21, -8, 11, 40, 14, 32, -4, 3, -4, -1,
-    -2, -4, 4, 5, 2, -3, 3, 0, -2, -4, 4, 1, -12, -7, -2, -4,
-    0, 1, 2, -3, -2, 0, 0, 1, 0, 4, -4, -4, -2, 3, 5, -3,
-    -1, -9, -16, -10, -7, -6, -8, -11, -21, -24, -16, -5, -7, -7, -5, -5,
-    -1, -8, -5, -2, 2, -2, 2, 3, -4, 2, -6, 4, 0, -5, -9, -20,
-    -22, -41, -52, -71, -81, -80, -80, -69, -58, 3, 17, 16, 21, -11, -9, -5,
-    -2, -1, 1, -2, 4, 4, -7, -3, 5, 6, -1, -17, -40, -57, -60, -63,
-    -7, 7, -18, -4, -17, 11, 23, 11, 17, 26, 24, 14, 3, -7, 4, 0,
-    2, -1, 2, 27, 3, -34, -26, -18, -59, -51, -18, 9, -7, -13, 1, 3,
-    10, 21, 23, 19, 17, 30, 30, 46, 38, 36, 14, -20, -3, -1, -3, -26,
-    -45, -30, -20, -27, -30, -11, 13, 42, 39, 15, -9, -8, 8, 18, 8, -10,
-    24, 20, 18, -12, 19, 35, 9, -15, 4, 2, 36, -11, 5, -11, -16, -28,
-    -2, 15, 39, 34, 19, 21, 1, -1, 8, 8, 1, -13, 19, 4, -28, -28,
-    -10, 3, 9, 5, 1, -10, 31, -34, -15, 4, 0, -12, -3, -4, 15, -5,
-    3, 22, 0, 4, -8, 12, 1, -8, 7, 4, -34, -55, -51, -23, -21, 13,
-    -4, -13, 16, -50, -47, -22, 7, 19, 10, -2, -24, -18, -7, -2, 14, 12,
-    3, -3, -20, -30, 4, 5, -31, -52, -45, -52, -19, 8, 0, -18, 2, -43,
-    -28, -1, 28, 17, 18, 6, -18, -24, -4, -4, -12, -5, -1, 9, -11, -28,
-    2, -11, -31, -46, -40, 2, 7, 25, -6, -16, 1, -6, -18, 10, 23, 14,
-    19, 19, -10, -27, -21, -38, -39, -33, -15, 5, 8, -18, 15, -8, -40, -25,
-    -5, 12, 28, 23, 2, -5, -37, -22, -19, 0, 19, 14, 29, 30, 5, -10,
-    -27, -34, -19, -6, 11, 26, 16, 9, 19, 7, -16, 9, 36, 22, 20, -37,
-    -1, -10, -24, -43, -13, 7, 18, 8, 29, 22, 18, 7, -7, -1, 6, -5,
-    -6, 10, 24, 18, 33, 24, 15, 68, 18, -8, -23, -21, -3, -10, -28, -44,
-    -9, -5, -16, 22, 27, 24, 34, 31, 13, 25, 18, -4, -17, -10, -4, -10,
-    16, 16, 14, 30, 33, -9, -43, -9, 4, 4, -27, -38, -15, -30, -15, 21,
-    31, 29, 31, 17, 17, 28, 20, 10, -7, -9, -7, -28, -15, 1, 15, 10,
-    23, -37, -55, -23, -7, 9, -7, -28, -19, -42, -16, 0, 10, 27, 39, 33,
-    37, 23, 30, 14, 3, 2, -13, -28, -28, 13, 12, 15, 31, -42, 31, -35,
-    -1, 8, 27, -15, -47, -62, -40, -28, -11, 6, 25, 46, 57, 44, 19, -4,
-    -6, 1, 10, -14, -21, -2, 23, 6, 36, -48, -46, -33, -4, 8, 34, -2,
-    -69, -59, -41, -34, -37, -16, -5, 7, 25, 25, -7, -8, -3, 9, 16, 2,
-    -14, 1, 19, 10, 10, -34, -12, -43, 12, -5, 30, 7, -50, -46, -39, -47,
-    -70, -55, -39, -19, -29, -26, -30, -12, -8, 2, 8, 19, 9, 3, 10, 12,
-    -16, -39, 10, -18, 1, -2, 43, 29, -15, -27, -54, -73, -74, -74, -75, -68,
-    -47, -57, -33, -22, -8, 6, 25, 22, 12, 31, 10, 12, -3, -35, -33, -1,
-    4, -1, 32, 50, 32, 5, -20, -32, -36, -45, -50, -63, -55, -24, -16, 4,
-    5, 14, 14, 14, 19, 33, 41, 19, 5, 3, -43, 6, 5, 2, 28, 53,
-    50, 19, 5, 14, -10, -21, -5, -17, -11, -20, -5, 23, 0, -16, -9, -5,
-    16, 28, 17, 16, 9, 18, 15, 3, 2, 4, 10, 51, 59, 16, -8, 0,
-    -7, -4, 16, 16, -6, -11, 1, 6, -21, -15, -13, -7, 8, -3, 23, 41,
-    16, 11, 16, 2, -1, 4, 5, 38, 57, 56, 25, 5, 5, 24, 40, 43,
-    15, 21, 18, 4, -14, -16, -20, -26, -2, 7, 31, 35, 18, 15, 14, 1,
-    -3, -4, -3, 36, 32, 38, 59, 50, 38, 45, 63, 45, 31, 31, 25, 3,
-    -13, -24, -19, -32, 21, 32, 36, 47, 9, -27, -29, 0, -2, -3, 2, 19,
-    22, 62, 67, 51, 45, 40, 36, 30, 20, 19, -11, -14, 2, 16, 6, 39,
-    46, 41, 52, 56, 45, -9, -14, -2, 1, 5, -3, 6, 24, 54, 36, 24,
-    40, 18, 33, 42, 39, 38, 42, 1, 13, 46, 33, -6, 23, 0, 0, 26,
-    5, 4, 3, 0, 4, -4, -3, -1, 3, -3, 16, 14, 20, -3, 8, 17,
-    14, -21, 18, -15, -19, -27, -23, 13, 5, -28, -37, -19, 3, 3, 5, 2,
-    -4, 1, 4, 0, 2, 4, -4, 3, -1, 4, 1, -4, 8, 15, 19, 7,
-    0, -1, -2, -1, 4, 1, 3, 2, 0, -4, -1, -4, 3, 2, -1, 4,
-    0, 1, 8, 15, 16, 9, 24, 28, 27, 18, -13, 38, 36, 31, 11, 20,
-    19, 7, 10, 5, 0, 2, 1, 0, -2, 0, 11, 3, 12, 16, 15, 18,
-    30, 33, 50, 50, -10, -2, 14, 58, 28, 33, 32, 49, 40, 24, 6, 15,
-    13, -4, -4, 4, 0, 4, 13, 2, -11, 10, 24, -1, 10, 50, 9, 7,
-    20, 33, -3, -7, 9, 26, 21, -3, -40, -1, 19, 26, 18, -19, -4, 3,
-    0, 0, 3, -20, 4, 1, 8, 18, 27, 42, 42, 14, -9, -4, 13, 7,
-    15, 36, 31, 5, -2, -26, -15, 17, -22, -13, 22, 30, 3, -1, 29, -1,
-    0, -13, -8, -10, -19, -11, -1, -29, -37, -17, -15, 2, -13, 0, -1, 22,
-    43, 24, 5, 0, 1, -4, 27, 32, 0, -6, 9, 12, -15, -32, -24, -30,
-    -39, -39, -31, -18, -2, -5, 4, -7, -5, -5, -6, -6, 5, -21, -11, 1,
-    -13, 7, 5, 22, -2, -32, 18, -16, -40, -58, -43, -41, -47, -30, -35, -7,
-    -4, -1, -2, 2, 4, 1, 0, -9, -11, -3, -7, -21, -26, 15, -3, 24,
-    41, -30, 16, -2, -59, -54, -24, -19, -21, -13, -6, 0, -2, -6, -6, 14,
-    18, 30, -1, 4, 2, -1, -18, -14, 3, -26, -20, 11, -7, -38, -9, 13,
-    -66, -42, 6, -4, -9, -10, 5, -5, -10, -4, 1, 11, 16, 16, 5, 10,
-    0, -7, -33, -34, 7, -20, 2, 31, -6, -19, -3, 4, -30, 4, 16, -4,
-    -8, -2, 5, 4, 17, 1, 0, 9, 4, 7, -1, -12, -8, -14, -35, 15,
-    17, -22, 36, 3, -13, -26, 17, -10, -6, 19, 16, 3, -6, -10, -23, -26,
-    -25, -8, -1, -2, -6, 6, 7, 10, 11, 8, -3, 21, 52, 45, 20, -39,
-    -5, -21, 6, 16, 24, 5, 22, 11, -13, 6, -17, -21, -33, 3, 21, -7,
-    -19, -4, 6, 7, 3, 26, 11, 11, 15, -13, -14, -38, 1, -24, -32, 26,
-    3, -5, 16, 18, 10, -12, -3, -8, 11, 18, 17, -15, -26, -12, 1, 8,
-    -10, 16, 32, 22, 0, -18, 9, 37, 1, -11, -21, 23, -2, 1, 24, 3,
-    0, 2, 16, 18, 10, 19, 11, -8, -17, -31, -2, 2, 19, 20, 26, 5,
-    9, 19, 64, 28, -5, -8, 6, 8, 22, 16, 1, 4, 6, 5, 11, 15,
-    28, 16, -5, -24, -3, -22, 1, -3, -4, 2, -14, -6, 18, 45, 28, 26,
-    -3, -5, 18, 7, -6, 3, 5, 6, 5, 15, 23, 29, 18, -9, 0, -11,
-    0, -6, -8, -10, -10, -16, -11, -8, 6, 80, 54, 45, -1, -6, 1, 5,
-    -25, -16, 1, -1, 7, 22, 31, 27, 13, -9, 13, 12, -1, -4, -17, -19,
-    -10, -11, -5, -5, 1, 45, -19, 49, 27, -10, -3, -12, -5, -13, 7, 3,
-    -2, 11, 25, 9, -2, -16, 26, 22, -1, -7, -13, -10, -9, -25, -2, 2,
-    26, 58, -30, 52, 15, 7, 6, -28, 10, 11, -13, 6, -9, 6, 23, 14,
-    5, 9, 11, 19, 13, 13, 16, 14, 18, -1, 26, 47, 14, 101, 52, 30,
-    1, 8, 34, -2, 23, 10, -5, -13, 7, 11, 20, 28, 13, 8, 14, 25,
-    18, 12, 34, 23, 7, 8, 22, 30, 29, 78, 46, -3, 12, 5, 24, 33,
-    14, -3, 10, 21, 16, 24, 25, 18, 10, 18, 29, 24, 8, 9, 11, -1,
-    -13, -18, -11, 8, -2, 17, 36, -2, 10, 5, 20, 51, 8, 20, 15, 3,
-    3, 11, 12, 6, 4, 12, 4, -6, -19, -19, -20, -28, -25, -39, -30, 2,
-    -25, -10, -6, 6, -1, 4, 24, 18, 1, 25, 3, -31, 5, 10, -11, -22,
-    -17, -33, -37, -43, -40, -26, -25, -17, -15, -22, 9, 18, -5, -12, 20, 4,
-    1, -1, 24, -10, -20, -24, -19, -28, -33, -11, 2, -18, -23, -48, -41, -70,
-    -52, -35, -9, -4, 10, -14, -4, 19, 55, 23, 24, 0, 3, 2, 15, -34,
-    -29, -12, -18, -27, -53, -57, -45, -28, -8, 17, -10, -45, -10, -1, 2, 36,
-    37, 12, 16, 22, 24, 19, 11, 2, 0, 4, -2, 26, 60, 45, 45, 5,
-    7, -22, -7, 26, 31, 20, 21, -9, 24, 36, 17, 26, 47, 19, 2, 28,
-    4, 1, 2, 2, 2, -4, 2, 2, -23, -35, -3, 7, 5, -2, 4, 18,
-    25, -4, 23, -25, -25, -13, -1, 9, -15, -37, -12, -24, 0, -4, -4, 2,
-    4, -2, -4, -3, -1, -2, -2, 4, 1, -1, -3, -3, -2, -3, 2, 2,
-    3, 1, -3, 1, -1, 1, 1, -3, -3, 4, -3, -5, -1, -1, -4, -2,
-    2, 2, 3, -3, -1, -4, -2, -4, -4, -2, -1, -11, -29, -26, -6, -9,
-    -4, -3, -4, -1, -4, 5, 4, -3, -4, -4, 0, -2, -1, 1, -1, 2,
-    -5, -32, -29, -30, -22, -26, -16, -26, -36, -41, -38, -21, -32, -27, -11, -5,
-    0, 3, -2, -4, 1, -5, 4, 0, -5, -33, -8, -1, -31, -43, -49, -60,
-    -49, -53, -71, -58, -47, -30, -27, -1, -3, -26, 34, -9, -42, -23, -26, -4,
-    1, 3, 3, 13, 4, -44, -17, -15, -30, -70, -59, -38, -29, 12, 1, -17,
-    0, -32, -17, 18, 3, 10, 27, 1, -40, -38, -31, -2, -2, 0, 2, 6,
-    5, 14, 7, -16, -5, -8, -18, -27, -21, -17, 0, -9, -14, -11, 3, 2,
-    -13, 3, 35, 43, 30, 3, -9, -1, -2, -17, -13, 28, 11, 7, -9, 0,
-    -8, -12, -22, -13, -3, -1, 9, 1, -3, 8, 4, 1, 3, 7, 37, 22,
-    36, -27, -9, -18, 1, -25, -12, 34, 4, 1, -15, -11, -19, 3, -10, -10,
-    -3, -1, 10, -15, -4, 16, 6, 14, 8, -6, 23, 41, 11, -34, -14, -24,
-    -4, 6, -5, 45, 21, 19, 8, 17, 4, 34, 10, -19, 7, 2, -1, -7,
-    -20, 17, 20, 6, -8, -9, -3, -25, -4, -16, -16, -5, 17, 39, -10, 11,
-    10, -3, 7, 13, 26, 33, 18, 6, 3, 11, 20, 18, -4, 8, 33, 14,
-    -18, -16, -9, -26, 6, -21, -44, -40, 10, 30, -4, -4, -6, -10, -30, -28,
-    6, 12, -9, -9, -15, 19, 29, 26, 7, 17, 18, 16, 6, -12, -7, -25,
-    1, 7, -47, -40, 3, -8, 25, 37, 27, -21, -54, -15, 27, 10, -6, -28,
-    -17, 29, 33, 14, 6, 6, 9, 6, -18, -3, -14, -34, -14, -17, -23, 25,
-    -1, 3, 17, 15, -35, -46, -36, 5, 26, -7, 11, 4, 9, 44, 31, 22,
-    11, -2, 0, -22, -9, -5, -25, -24, -20, 12, -13, 51, -4, -3, 20, 17,
-    -26, -26, -7, 20, 13, -10, 4, 10, 12, 11, 30, 28, 14, 10, -2, -17,
-    10, -21, -49, -18, -18, -6, -28, 3, 2, 2, 32, 23, -23, -23, -28, 10,
-    9, 4, -11, 6, 24, 30, 41, 19, 20, 18, -1, -12, -24, -19, -22, -22,
-    -46, -15, -42, -10, 2, 3, 6, -14, 46, -32, -25, -4, -9, -3, 8, 11,
-    21, 29, 38, 33, 19, 32, 5, -26, -31, 18, 7, -8, -29, -34, 1, -19,
-    -3, 0, -12, -6, 43, -1, -22, -28, -30, -12, 1, 3, 19, 44, 26, 27,
-    26, 13, -34, -32, -28, -23, -36, -23, -45, -49, -27, -18, -2, 21, -26, -11,
-    26, -2, -1, 2, -27, -12, -21, -14, -1, 23, 27, 21, 4, -41, -59, -38,
-    -20, -17, -8, 0, -3, 21, 25, -40, -23, 15, -35, -21, 16, -20, -24, -11,
-    -36, -27, -33, -11, 3, 15, 18, 8, -31, -80, -90, -61, -36, -17, 4, 10,
-    -33, 16, 43, 13, 18, 22, -11, 0, 0, -42, -45, -16, -22, -30, -56, -30,
-    -5, 10, 16, 2, -60, -113, -103, -49, -41, -4, 1, -11, -26, 13, 18, 30,
-    -2, 5, -39, -44, -54, -14, 2, -7, -27, -29, -28, -31, 6, 10, 24, -1,
-    -31, -74, -49, -21, -13, 18, 14, 1, 8, 6, 15, 2, 7, -10, -38, -9,
-    -9, 35, 10, 5, -8, -4, -6, -14, 1, 1, 14, -7, -31, -49, -30, -9,
-    12, 29, 5, -11, -2, 26, 25, 3, 10, -2, -26, -1, 4, 31, 38, 31,
-    19, -2, 13, 4, -3, 7, 13, -11, -20, -24, -37, -6, -3, 18, -9, -10,
-    -25, -15, 35, 1, -5, 0, -34, -35, -5, 10, 10, 21, 8, 11, 12, 8,
-    10, 7, 9, -18, -17, -40, -36, -32, -49, -22, 21, 14, -13, -20, 27, 2,
-    4, 0, -23, -30, -3, 18, 1, 14, 1, -10, -7, -11, -24, -16, -7, -15,
-    -54, -54, -57, -49, -42, 5, 34, 33, 5, 23, 24, -1, -1, 1, -4, 27,
-    53, 34, -34, -16, -3, -2, -21, -5, -22, -20, 6, -15, -46, -71, -72, -57,
-    -46, -38, -16, 12, -5, 1, 0, 3, -1, -1, 4, -14, 31, 37, 24, 4,
-    -11, 16, -10, -34, -20, -3, 24, 32, 33, 0, -10, -30, -32, -36, -17, 1,
-    4, 16, -5, 1, 4, 3, 3, -4, 15, 31, -2, -5, -7, -5, 15, 14,
-    4, 15, -22, -17, -10, -2, -8, -1, -5, 4, 6, -3, -3, -2, -4, 2,
-    2, -1, 4, 4, -1, 1, -4, -4, 4, 1, -3, -1, 6, 15, 20, 8,
-    2, -2, 3, -1, -1, -4, 0, 1, -3, 3, 1, -3, -2, -2, 2, -1,
-    2, 1, 1, -3, 8, 0, 12, 1, -8, -5, 0, 7, 34, 21, -4, -9,
-    -5, 1, -2, 2, 1, 1, -5, 3, -3, 0, 1, 0, -3, 8, 5, -1,
-    -1, -2, 24, 29, 45, 66, 61, 46, 22, 2, 12, -30, -23, -9, -4, 16,
-    9, 2, -3, -3, 5, -4, -2, -29, -23, 16, 29, 23, 27, 34, 31, 15,
-    39, 37, 39, 32, 42, 37, 8, -12, -4, -27, -22, -10, -1, -5, -4, 5,
-    0, -2, 18, -27, -14, -17, 34, 34, 9, 11, -5, 38, 43, 40, 53, 55,
-    31, 17, 9, -16, -16, -66, -41, -16, -31, -10, 9, -18, 3, 1, 22, -17,
-    -9, -33, 7, -9, -34, -50, -23, 7, 15, 45, 35, 37, 19, 7, 15, 4,
-    8, -18, -12, -29, -19, 8, -16, -13, -4, 3, -11, -25, -35, -40, -17, -53,
-    -38, -23, 18, 5, 6, 8, 41, 39, 38, 32, 51, 12, -5, -2, -38, -39,
-    -57, -13, 15, -2, -2, 34, -8, -44, -4, -38, -39, -42, -11, 11, -2, -11,
-    -16, 4, 24, 34, 39, 33, 40, 26, 8, 10, 8, -17, -74, -22, 15, -6,
-    22, 7, -34, -19, -8, -28, -48, -19, 13, -18, -20, -30, -34, -30, -12, 15,
-    34, 30, 37, 30, 6, 6, 33, -3, -45, -13, 40, -5, -8, -35, 6, 8,
-    -7, -45, -9, 5, 0, -32, -25, -39, -19, -20, -16, -2, 12, 19, 19, 24,
-    15, -3, 17, 2, -33, -38, 18, 19, -9, -18, 9, 6, 6, -24, 2, -1,
-    -19, -34, -26, -8, -12, -23, -13, -13, 3, -3, 18, 19, 18, 13, 25, 8,
-    -49, -25, 15, 12, -6, -10, -7, 15, 22, -18, -9, -3, -20, -26, -5, 8,
-    -22, -19, -15, 9, 1, 9, 24, 26, 39, 24, 28, 11, -18, 30, 12, 12,
-    -7, -15, 13, 10, 29, -30, -3, 0, -9, -1, 4, 1, -24, -37, -3, 10,
-    -2, 6, 5, 23, 23, 12, -2, -15, -36, -33, -35, -6, 0, -14, 6, 22,
-    23, -5, -1, 12, 17, -5, -6, -5, -19, -9, 9, 18, 3, 2, -2, 21,
-    7, 13, -13, -55, -62, -37, -26, -11, -3, -2, 1, 17, 21, 7, 15, -1,
-    5, -9, -6, -13, -25, -3, 15, 18, 1, -5, 0, -3, 1, -7, -18, -39,
-    -27, -20, 25, 10, -3, -1, -10, -3, 14, 17, 25, 2, -2, 9, -8, -4,
-    -22, -2, -5, 6, 12, -1, -9, -22, -27, -15, -6, -20, -17, -24, 37, 11,
-    0, 8, 38, -6, 20, 8, 8, 9, -2, 17, 6, 1, -14, -13, -17, -6,
-    7, 3, -21, -43, -30, -6, 25, -5, -18, -13, 22, 9, 5, 13, -1, -1,
-    7, 2, 3, -4, -6, 3, -1, 7, 5, 7, 5, 6, 5, -15, -33, -42,
-    -27, -11, 5, -37, -22, 42, 17, 35, 29, 16, 7, 11, -8, 14, -5, -6,
-    7, 0, 4, -2, -34, -15, 2, 3, -14, -13, -25, -16, -25, -8, 20, -10,
-    -8, 36, 37, 31, 9, 23, -8, -24, -8, 6, 1, -3, 3, -2, 6, -24,
-    -18, 0, -15, -4, -14, -1, -6, 9, 0, -6, 13, 1, -17, 12, 33, 26,
-    3, 30, 8, 3, 3, 8, -13, -1, -7, 3, 9, -3, -4, -12, -3, 4,
-    -8, 6, 19, 23, -1, -10, 7, 17, -2, -13, 25, -3, 10, 24, 47, 36,
-    5, -22, -2, 8, -6, 8, 17, -5, -3, 3, 2, 0, 4, 8, 10, 17,
-    -11, 0, 1, 11, 15, 3, 17, 5, 6, 12, 47, 36, 19, 13, 22, 21,
-    16, 21, 19, -5, -4, -4, 12, -8, -8, -10, 6, 9, 2, -15, -10, 18,
-    23, -10, -4, 5, -1, -4, 29, 32, 1, 28, 10, 27, 18, 23, 22, 6,
-    4, -4, 2, 0, 6, 13, 4, 11, 4, -7, 26, 33, 38, -5, 14, -1,
-    2, -4, -12, 8, 46, 19, -16, -14, -7, 6, 18, 1, 13, 2, 4, 14,
-    19, 6, 6, 13, 20, 18, 14, 30, 50, 22, 19, 2, -3, -2, 15, -25,
-    -29, -13, 17, 28, 47, 19, -6, 5, 35, 19, 14, -11, -1, -1, -15, 13,
-    36, 37, -2, -2, -8, 12, 21, -4, 3, 1, 4, 22, -10, -15, -9, 17,
-    43, 32, 44, 21, 23, 40, 19, -9, 18, 34, 31, 11, 33, 39, 31, 22,
-    6, -4, 1, -1, 4, -2, 3, 0, -10, -21, 18, 21, 13, 19, 30, 31,
-    24, 7, 47, -5, 15, 23, 27, 10, 2, 8, 21, -5, 1, -3, 0, 2,
-    -5, 0, -4, -1, -2, -2, 0, 2, -4, 1, -4, -3, 8, 5, 8, -2,
-    3, -1, 4, -3, 1, 3, 2, 0, 2, 1, 3, -4, -1, -4, -4, -4,
-    -4, 3, 17, 14, 10, 8, 14, 11, 20, 36, 20, 27, 25, 14, 32, 11,
-    10, 12, 3, 10, 4, 3, -1, 1, 0, 4, 12, 3, 7, 5, 16, 27,
-    29, 27, 40, 54, -16, -9, 15, 27, 16, 38, 49, 15, -10, -12, -10, -7,
-    -1, -2, -2, 3, 0, 0, 17, 5, -2, -3, -1, -28, -29, 11, -13, -32,
-    -43, -26, -8, -2, 22, 29, 13, 5, -34, -38, -34, -13, 10, -3, 1, -4,
-    -1, 1, -3, -2, 11, -28, -46, -30, 6, 29, 13, -20, -23, -21, 2, 5,
-    15, 9, 14, 7, -7, -21, -31, -23, -17, 17, 31, 28, -4, -4, 11, -1,
-    0, -42, -39, 4, 31, 13, -4, -24, -4, -2, 0, 0, 6, 17, 13, 19,
-    -20, 1, -7, 7, 15, 23, 16, 17, 4, -1, -13, 0, -10, -32, -20, 7,
-    -4, -20, -31, -2, 17, 8, 5, -11, -11, 7, -1, 5, -8, -2, 4, 12,
-    -22, 25, 8, 41, 3, 17, -14, -32, 1, -9, -12, -4, -13, -11, -24, -11,
-    -5, -4, -5, -2, -12, -4, 6, -4, -1, -4, 28, -8, -5, 14, 8, 36,
-    4, 19, -20, 20, 39, 21, 27, 10, -3, -17, -10, -12, -2, -9, -6, -14,
-    -15, -8, -9, -4, 4, -14, -7, 11, -4, -7, 22, 4, 10, -9, 13, 53,
-    30, 20, 20, -2, 1, -14, 1, -1, -12, -4, 4, -16, -14, -8, -14, 0,
-    -9, 1, 3, 17, -29, -20, 31, 11, 11, -4, 33, 5, 9, -5, 24, 22,
-    13, 7, 18, 4, -17, 1, 6, -10, -19, -14, 8, 4, -13, 11, 1, -12,
-    -11, -35, 7, 19, 6, 26, 9, 9, -5, 20, 28, 48, 31, 30, 9, 2,
-    -17, 2, 19, 5, -22, -25, 7, 2, 8, 9, -3, -19, 5, -27, 6, 36,
-    2, 24, 28, 19, 19, 21, 23, 55, 43, 30, -3, -17, -13, -11, 22, 5,
-    -9, -14, 6, 6, -7, -10, -15, -26, 33, -8, 8, 46, 1, 12, 35, 29,
-    14, 29, 21, 5, -2, 10, -17, -19, -20, 1, 16, -1, -7, -17, 12, 17,
-    -18, -17, 3, 8, 13, 4, 23, 49, 3, -5, 39, 32, -4, 30, 25, -4,
-    -25, -44, -43, -16, 1, 26, 15, -8, -19, -9, 14, 8, -20, -10, 19, 22,
-    31, 20, 41, 29, 0, 1, 31, 17, -13, 5, -3, -17, -40, -57, -54, 15,
-    37, 54, 17, -19, -12, -9, 7, -17, -24, -21, 3, 18, 23, 24, -26, 11,
-    5, 2, 20, 7, 27, 11, -15, -28, -49, -47, -11, 47, 54, 34, 6, -11,
-    4, -4, -8, -17, -10, -15, -18, 5, 5, -13, -32, 6, -4, 1, 0, 25,
-    37, 21, -15, -67, -63, -26, 24, 70, 52, 13, 13, -11, 5, -1, -1, 5,
-    18, -4, -2, 19, 27, 23, -14, 30, 5, -1, -2, 15, 4, 2, -29, -51,
-    -55, 4, 43, 28, 38, 22, -6, -3, -5, -5, 7, 0, 12, -4, -3, -6,
-    2, -9, -6, 36, 6, 9, 8, -9, -12, -17, -17, -23, -23, 12, 43, 37,
-    33, 22, 4, -5, -3, 3, 7, 0, 9, -9, -12, -16, -15, -18, 16, 23,
-    -1, 11, 13, 0, -28, -46, -35, -26, -6, -4, 28, 43, 34, 14, 7, 9,
-    -2, 3, 8, 6, -15, -16, -26, -36, -8, -13, 11, -4, 0, 4, -5, -4,
-    -24, -57, -26, -27, -16, -3, 6, 13, 28, 18, 13, 7, -9, -4, -6, -9,
-    -27, -16, -3, -3, -37, -8, 19, 0, 6, 1, -1, 11, 1, -16, -13, -16,
-    -16, 12, 6, 5, 11, 10, 14, 5, 7, -10, 0, -26, -30, -20, -8, -12,
-    -14, 23, 28, 0, -4, -3, -3, -10, -4, -21, -21, -26, -19, 17, 8, 2,
-    28, 44, 20, 4, 20, 13, -9, -2, -12, -27, -25, -3, -29, 21, 24, -2,
-    -4, 2, 0, -21, -48, -8, -29, -74, -70, -38, -12, 7, 21, 12, 8, 3,
-    1, -16, -6, 24, 5, -47, -19, -9, -16, -2, 2, -3, -5, 3, -21, 9,
-    22, 0, 4, -51, -68, -55, -30, -38, -25, -11, -3, 1, -26, -11, -2, -3,
-    2, -20, -13, -54, -47, -13, 4, -2, 3, -4, 4, -4, -24, -15, -13, -9,
-    -8, -32, -23, -3, -13, 5, -24, -33, -19, -17, -18, 14, 6, -1, 1, -13,
-    -10, 4, -3, -2, 1, 0, 5, 0, 19, 20, 17, 11, 12, 17, 39, 6,
-    -12, 52, 45, 28, 24, -14, -30, 5, 5, 2, -5, -1, 4, -3, 4, -1,
-    -4, -1, -2, 1, -1, 3, 3, 0, -4, 1, -4, -4, 2, -3, -3, -4,
-    -2, 1, -2, 4, 0, 0, 4, 1, -1, -2, -3, 3, -2, -4, -2, -4,
-    -3, -4, -1, 3, -4, -1, -5, -7, -10, -4, 2, 0, -9, -11, -1, -15,
-    -16, -4, -11, -1, 1, 1, 4, -3, 2, -1, -8, -5, -6, 4, 1, -1,
-    -10, -1, 21, 14, -8, -39, -40, -22, -32, -3, 1, -54, -46, -47, -41, -30,
-    -7, 11, -3, -3, -2, -2, -10, -12, 0, -22, -2, -3, -12, 27, 13, -8,
-    4, -24, -42, -38, -20, 16, -5, -36, -37, -38, -22, -35, -20, 26, 8, -1,
-    2, 4, -19, -27, 7, -27, -11, -19, -45, -24, -53, -48, -32, -24, -16, -27,
-    -11, 18, 5, -25, -21, -13, -20, -4, -9, 19, 10, -25, -4, 4, -30, 7,
-    1, -12, -17, -56, -41, -15, -32, -36, -16, -6, -10, -16, -30, -15, -25, -1,
-    28, 4, -7, -35, -22, 12, -17, -19, 2, -14, 10, -4, -20, -44, -37, -44,
-    -22, -35, -34, -21, -17, -26, 1, 0, 0, -4, 0, 0, 25, 9, 7, 6,
-    8, 22, 15, -26, 3, -31, 4, -28, -43, -22, -32, -34, -18, -40, -33, -6,
-    4, 6, 8, 19, 8, 2, 5, 7, 20, 34, 10, 21, 8, 32, 35, -24,
-    -30, -27, -13, -29, -13, -15, -1, -12, -15, -33, -27, -3, 0, 11, 2, 12,
-    10, 16, 17, 2, 0, 19, 0, 36, 62, 51, 25, 28, -7, -36, -2, -18,
-    -11, -36, -12, -38, -25, -16, 1, 12, -1, 16, 16, 14, 15, 10, 5, 10,
-    -4, 11, 12, 5, 63, 54, 53, 13, -12, -13, -17, -2, -5, -36, -66, -52,
-    -14, -9, 23, 13, 26, 11, 7, 11, 12, 7, -3, -11, -29, -3, -1, 11,
-    70, 69, 67, -4, -6, -6, 22, -19, -11, -33, -54, -26, -31, -15, 16, 19,
-    9, 3, -8, -12, 14, -2, -15, -33, -34, 3, -8, 42, 77, 76, 57, -31,
-    -1, -3, 13, -2, 1, -33, -30, 1, -20, 7, 25, 36, 32, 24, 6, 5,
-    16, 5, -18, -31, -4, 10, -24, -8, 13, 10, 12, -37, 2, -2, -13, -9,
-    -16, -30, -10, 23, 14, 27, 19, 37, 39, 16, 26, 36, 39, 1, -35, -38,
-    -24, -27, -20, -37, -38, -1, 4, 20, -5, -2, 3, -18, -21, -1, -3, 29,
-    28, 24, 23, 1, -1, 15, 21, 16, 33, 3, -23, -40, -18, -25, -16, -12,
-    -2, 30, 7, 4, -1, -2, 26, 8, -1, -7, 20, 28, 37, 18, 9, -3,
-    -7, 1, 6, 16, 16, -11, -31, -36, -12, -11, 4, -24, 0, 37, -18, 13,
-    -5, -3, -18, 19, -10, 10, 35, 12, 18, -5, -9, -20, -19, -12, 9, 15,
-    12, -22, -35, -25, -5, 0, 20, -14, 2, 36, -25, -6, -2, -3, -32, 10,
-    2, 11, 42, 15, 1, 4, 9, -13, -18, -14, 26, 29, 3, -25, -27, -18,
-    11, -26, -12, -19, -4, -12, 19, 0, 22, -1, -23, 0, -4, 6, 32, 24,
-    5, -15, -10, -10, -24, -2, 28, 1, -9, -8, -30, -4, 7, -40, -23, -17,
-    21, -19, 7, 38, 13, 0, -31, 0, 3, 1, 14, -7, -7, -23, -26, -22,
-    -14, 7, -7, 3, 15, -8, -14, 14, -3, -32, -29, 5, 23, 6, 11, 35,
-    -3, 4, -28, -34, -20, 4, 12, -16, -16, -29, -9, 3, -3, 6, -7, 12,
-    14, 9, 3, 17, -4, -20, -16, 8, 26, 16, 14, 5, 13, 3, -26, -22,
-    -10, -12, -2, -9, -11, -6, -7, 4, -16, -2, -8, 2, -3, 9, 18, 18,
-    3, -18, -26, -10, 5, 2, -6, -2, 8, 7, -26, 5, -11, -17, -10, -13,
-    -11, -1, 11, 8, 13, 10, 4, 2, 8, 27, 22, 7, 2, -18, -15, -1,
-    15, 5, -21, -6, -3, -1, -37, -22, -11, -10, -10, -21, -1, 10, 12, 3,
-    11, -14, 0, 6, 29, 23, 18, 11, 4, 11, 23, 19, 6, 8, -23, 0,
-    0, 1, -29, -30, -1, -27, -36, -28, -9, -6, -10, -1, 3, -14, -15, -4,
-    4, -9, 13, -3, 7, 37, 32, 40, 33, 8, 5, -3, -5, 4, 9, -4,
-    -46, -58, -48, -33, -39, -24, -35, -29, -38, -19, -17, -17, 0, 6, 0, -1,
-    23, 9, 8, 28, 18, 15, 6, 3, -3, 0, 3, 16, 26, 7, -4, 3,
-    28, 18, -6, 9, 16, -27, 12, 16, 18, 9, -21, -1, 9, 15, 3, 0,
-    0, 3, 0, -2, 2, -4, -5, -4, -4, -4, 19, 19, 16, 21, 13, 29,
-    11, -1, 34, 38, 25, 32, 28, 6, -7, -6, -10, -4, 0, 0, 3, -1,
-    -4, -2, 0, -3, 2, -4, -4, -2, 3, 4, -2, -2, 1, -2, 2, -3,
-    2, -3, 4, 2, -4, 1, 1, -5, 4, 0, 0, 0, 0, 0, -3, -2,
-    -2, -1, 4, -2, 4, -3, -1, -3, 4, 1, -2, 4, 4, -4, 5, -1,
-    -2, 3, -1, -4, 3, 2, 2, 2, -3, 1, 1, 4, -3, -3, -2, 0,
-    -1, -4, 1, -2, -2, -3, 2, 3, 0, 0, 2, 0, 1, 3, 2, 1,
-    -3, 3, 3, 3, 2, 3, 0, -2, -4, -2, -4, 4, 4, 0, -2, 0,
-    5, 3, 1, 4, -5, 4, -4, 2, 5, 3, -2, 3, -1, 0, 3, 0,
-    -3, -3, -4, 2, 2, 4, -4, -5, -1, 1, 3, 4, 4, 1, 0, 1,
-    -4, 2, 2, 0, 2, -4, -3, -4, 2, 4, 1, -5, -2, -3, 3, 0,
-    4, 4, 0, 0, -5, -2, 2, -1, -1, -3, 0, 1, -5, -3, 3, -3,
-    0, -4, 1, 1, -2, -4, 4, 2, 3, 3, -4, 3, -3, -1, -3, 0,
-    3, 3, 2, -4, -4, 1, 2, 0, -6, -3, -3, 0, 3, 2, -4, 4,
-    -1, -5, 0, 2, -2, 1, 3, 3, -4, 2, -1, -3, 4, -2, -3, 3,
-    -3, -4, -6, 1, 2, -1, 1, -1, -1, -3, 0, 2, 3, -3, -2, 1,
-    1, -3, -3, -1, -2, 0, -1, -4, 5, 1, -4, -3, -5, 1, -5, 1,
-    -2, -4, -2, -3, -1, 1, 2, 0, -4, -3, 0, 2, -2, -4, 0, 1,
-    4, 0, -2, -3, 3, 0, -3, -5, -4, 2, 2, -2, 1, 0, -1, -4,
-    3, -3, 2, -3, 1, -2, 0, -2, 2, -1, -3, -1, 2, -3, 1, 3,
-    -2, 1, 3, 2, 3, -5, 3, 0, -3, -2, -2, 1, -5, 3, -4, 3,
-    -4, -4, -3, 2, 2, 2, -2, -1, 2, 3, 3, 2, 4, -5, -5, 1,
-    -4, -6, 0, -3, 2, 0, -1, -4, -4, -4, -4, -1, -2, 4, -1, 5,
-    -1, 0, 5, -1, 0, 3, -4, -1, 1, -5, 0, -5, 3, 0, 1, -1,
-    0, -1, 1, 3, 3, -4, 0, 0, -1, -2, 3, -2, 2, 3, 5, 0,
-    1, -1, 1, 2, 3, 0, 2, 2, -1, 1, 2, -1, -2, -3, -3, -3,
-    3, -2, 0, -3, -4, -5, -4, 4, 2, -3, 1, 3, 4, 2, -3, -4,
-    0, 4, -2, 0, 0, -2, 3, -6, -2, -1, 2, 0, -2, 1, 0, -5,
-    0, 0, 4, 5, -5, -4, -1, 2, -4, 0, -5, -5, -1, 0, 3, -2,
-    -5, 3, -4, 1, -5, -2, -2, -2, 2, 1, -1, -3, 2, -3, -2, -2,
-    0, -4, 4, 2, 2, 4, -2, -3, 2, 4, -4, -3, 0, -1, -3, -2,
-    -2, 2, -1, -4, -5, -1, -3, -2, -1, 0, 4, -1, -2, -1, 2, -2,
-    2, -4, -2, -5, 2, -2, -4, -1, -5, 1, 3, 1, 2, -3, -3, -2,
-    1, 0, 1, -3, -2, -4, 2, 1, 3, -4, 0, 1, -5, -4, -5, -2,
-    -5, -1, 3, 3, 1, -6, -1, -3, 2, -3, 0, 2, -5, 1, -2, -3,
-    -4, 3, 1, -2, -4, -4, -1, 2, 1, -1, -1, 0, -4, -1, -2, -6,
-    0, 2, -6, -2, -3, -4, -3, 4, 3, 3, 4, 0, 5, 1, 2, 1,
-    -3, 4, 3, -1, 1, 0, 2, -2, -1, -5, 3, 3, -6, 1, 3, -2,
-    -3, -4, -1, -1, 0, -3, 1, 2, 2, 3, 5, 1, 3, -3, 0, -4,
-    -1, 1, -1, -4, -3, 3, -4, -5, 1, -5, 1, -5, 0, -6, -5, -2,
-    -5, -3, -2, 1, 0, 2, 3, -2, 1, 3, 0, 1, 1, 2, -3, -2,
-    -1, -3, -4, 0, -6, 3, -3, -1, -4, -5, -2, 2, -4, -3, 2, -3,
-    1, -1, 0, 1, -3, 3, 0, -3, -2, 1, -5, 1, 2, 2, 1, -5,
-    1, 0, -3, 3, 0, 0, -4, 1, -1, 3, 3, 1, -2, -4, -3, 4,
-    -3, -1, -4, 0, -2, -4, -2, 0, 3, -3, -4, -4, -4, -1, 1, -6,
-    1, -5, 1, -1, -3, -5, 1, 4, 1, 3, 4, -3, -2, 1, 2, -3,
-    3, -3, -1, 1, -4, -4, -2, -2, 4, -5, -2, -2, 0, -4, -4, 0,
-    1, 1, -3, 3, -2, 2, 0, 0, 4, 4, -1, -2, 2, 0, -2, -2,
-    3, -2, -3, 4, 0, -4, 0, 3, -3, 1, -4, -4, -1, -3, 4, 4,
-    -1, -3, 1, 2, 4, 4, -4, 2, -1, -2, 1, 3, 4, 0, 3, 1,
-    -4, -4, 4, -4, -1, 1, 2, 2, 2, -4, -2, 3, 0, -4, 3, 3,
-    4, -3, 4, 0, 2, 4, -2, -4, -1, 3, 4, 3, 14, 10, -2, -4,
-    4, -4, 5, 2, 4, 1, -3, 0, 3, -2, 1, 4, -2, -3, -3, -4,
-    4, 7, 14, 9, 5, 8, 21, 21, 21, 10, 4, -5, -7, 3, 12, 13,
-    24, 25, 18, 12, -1, 5, -2, -4, -4, 0, 10, 1, 5, 3, 11, 15,
-    8, 18, 21, 23, 2, -14, -7, -1, 5, -8, -9, 40, 22, 26, 25, 6,
-    2, -7, 2, 4, 3, 0, 3, -4, -5, -1, 2, -11, -27, 8, 14, -11,
-    -18, -47, -44, -12, 3, 4, 9, 11, -22, -20, -20, 0, 0, -23, -6, 4,
-    5, 4, 2, -9, -8, 7, 15, -15, -3, 17, 3, -43, -38, -50, -39, -23,
-    16, 21, 15, 32, 9, -7, 5, -13, -20, -22, -3, 17, 2, 4, 17, 10,
-    27, 0, 7, 6, -4, -18, -20, -24, -27, -22, -12, -3, -20, 5, 8, 29,
-    11, 10, 5, -4, -2, -12, -3, 4, -2, -17, -25, -18, -23, -42, -13, 5,
-    9, -38, -34, -20, -26, -21, -8, 1, 2, 5, -5, -17, -3, -1, -4, -7,
-    -24, -23, -14, 30, 1, -33, -29, -32, -33, -1, -10, -17, -15, -28, -20, -15,
-    -6, 7, 16, 17, -20, -20, 5, 3, 5, 23, 16, 13, -6, -20, 1, 27,
-    27, -31, -20, -8, -7, 4, 8, -8, -11, -10, 7, -8, 1, 6, 7, -7,
-    -27, -18, -2, -6, -2, 23, -5, -8, 1, 13, 7, -4, -9, -37, 21, -4,
-    -20, -31, 8, -6, -3, 19, 8, 4, -13, -1, -8, -11, -9, -1, -6, -7,
-    -15, 10, -17, 9, -3, -2, -4, 2, -6, -13, -22, -19, -20, -38, -10, 16,
-    14, 27, 2, -5, 4, -15, -7, -6, -3, 4, -12, -8, -22, 1, 12, 8,
-    -26, -33, -26, 11, -7, -8, -20, -54, -44, -24, -8, 8, 3, 12, -6, -13,
-    9, 2, 0, -27, -17, -6, -2, -8, 2, 25, 13, -4, -31, -40, 0, -31,
-    -1, -7, -4, -47, -47, -5, 11, -4, -4, 1, -5, 22, 20, 24, 3, -22,
-    -6, 13, 17, 23, 30, 27, 4, 0, -25, -66, -54, -33, -2, -8, -26, -34,
-    -50, -38, 3, 10, 8, 17, 5, 18, 20, 10, 10, 10, 11, 17, 28, 42,
-    -2, -9, 13, -20, -40, -57, -51, -4, -2, -1, 4, -24, -42, -27, -20, 2,
-    -4, 0, -11, 9, 3, 19, 26, 2, 19, 10, 9, 3, -19, -31, -31, -22,
-    -2, 10, -37, -4, -7, -3, 25, -12, -30, -29, -29, -17, -10, -17, -27, -3,
-    8, 37, 30, 6, 18, -11, -16, -23, -38, -12, -6, -13, 14, 7, -31, -11,
-    0, -2, 17, -13, -35, -34, -17, -9, -8, -16, -17, 7, 22, 17, 8, 6,
-    22, -8, -17, -47, -43, -21, -15, 22, 27, 21, -10, -6, 2, -4, -13, -10,
-    -42, -58, -41, 4, 7, -2, 10, 21, 19, 4, -1, -3, 9, -6, -27, -48,
-    -41, -19, -18, 20, 4, -5, -13, -12, 12, 1, -15, -9, -47, -47, -24, -22,
-    -15, 11, 10, 7, 20, 8, 4, 7, -4, 3, -23, -22, -21, -16, -45, -32,
-    -8, -5, -10, 21, 15, -3, -24, -12, -21, -39, -43, -30, -10, 5, 18, 3,
-    3, 10, 3, 1, -2, -2, -7, 5, -5, -22, -46, -41, -11, -20, 7, 14,
-    -3, -6, -21, -18, -20, -26, -55, -32, -19, -8, 8, 14, 17, -4, -5, -4,
-    -6, -4, 8, 10, 6, -31, -57, -38, -6, -21, 9, -1, 10, -1, -21, -33,
-    -33, -38, -18, -17, 0, -2, 1, 12, 11, -4, -12, 4, -17, -4, 6, 5,
-    -13, -30, -37, 1, 4, -3, 10, 3, 12, 4, -7, -23, -32, -12, -15, -6,
-    -1, -18, 9, 10, 15, 4, 7, 19, 3, 2, 20, 8, 6, -14, -14, 19,
-    30, 16, -4, -3, 3, -4, -4, -29, -37, 4, -18, -6, 24, 10, 9, -4,
-    12, 8, 16, 13, 22, 31, 41, 5, 5, -9, 10, 17, 42, 30, -15, -1,
-    2, -2, 0, -15, 5, -29, -18, -10, 15, 1, -1, -14, -1, -7, 7, 16,
-    37, 16, 30, 7, 8, 34, 24, 31, -10, 1, 1, 5, -2, -3, 20, -34,
-    -20, -14, -9, 5, 8, -6, -10, -24, -7, 3, 12, -7, 28, 39, 28, -4,
-    -7, -19, -16, 1, -5, 0, -4, 4, 4, -1, 1, 1, 42, 25, 20, 2,
-    8, -10, -5, 14, -3, -36, 12, 2, 6, 40, 32, 3, -5, -1, -8, 0,
-    16, -6, 4, -1, -1, 4, 2, 0, -13, -15, 13, 18, 7, -6, -14, 10,
-    14, -12, 18, 32, 5, -1, 25, 14, 7, -8, -11, -3, -2, 1, 1, -4,
-    3, 2, -1, 2, -4, -3, -3, 4, 3, 3, -2, 0, 14, 17, -5, -3,
-    3, 4, 3, -4, -4, 3, 1, -4, -2, -3, 4, -1, 3, -4, 4, 2,
-    -1, 3, -3, 0, 3, 15, 15, 9, 23, 24, 4, 16, -8, 7, 20, 26,
-    30, 23, 20, 8, 4, 0, 0, -1, -1, 2, 17, -4, 13, 20, 0, 2,
-    0, -11, -18, -15, -32, -36, -26, -20, -10, 8, -3, 27, 35, 39, 48, 22,
-    -16, -8, 2, -2, 3, 3, 24, 32, 25, -19, -32, -9, -44, -33, -17, -19,
-    -13, -15, -6, -28, -25, -3, 6, -1, 26, 26, 22, 52, 18, -29, 0, -2,
-    -3, 3, 6, 37, -21, -1, -28, -55, -89, -61, -60, -26, -27, -8, -23, -28,
-    -19, -30, -21, 3, 4, 31, 10, 45, 18, -12, -1, 25, -3, -2, 46, 23,
-    -27, 18, 1, -2, -30, -8, -5, 0, -15, -21, -9, -4, -16, 5, -2, -4,
-    2, -6, -20, -2, 30, -2, 20, 25, -4, -15, -2, 8, 28, 11, 11, 5,
-    -2, -25, -7, -3, -8, -6, 3, 12, 7, 9, 7, 14, 40, 14, 4, 6,
-    39, 7, -6, 9, -3, -41, -14, 17, 1, -36, -43, -36, -35, -30, -22, -4,
-    -4, 10, 20, 30, 21, 22, 23, 20, 31, 19, 1, 23, 17, 11, -3, 8,
-    29, -22, 4, 25, 0, -36, -31, -36, -42, -27, -23, -15, 5, 17, 21, 24,
-    20, 16, 17, -2, -5, 23, -11, -33, 13, -15, -23, 15, -4, 13, -14, -27,
-    -10, -34, -31, -33, -26, -18, -20, 13, 9, 12, 17, 10, -2, 11, 1, -14,
-    -14, -16, -21, -22, -5, -39, -50, 1, -5, 23, -12, -23, -7, -34, -47, -29,
-    -31, -33, -15, 18, 23, 20, 17, -3, -12, -6, -4, -11, -16, -20, -10, -23,
-    -21, -10, -23, -16, -2, -13, 8, -13, -5, -22, -37, -19, -45, -44, -4, 9,
-    11, 22, 9, -14, -8, 17, 14, -5, -16, -25, -35, -64, -53, -42, 12, -28,
-    2, -8, 25, -11, -10, -27, -44, -45, -40, -17, 9, 38, 16, 27, 19, 17,
-    1, 3, 14, 5, -4, -20, -34, -56, -69, -46, -19, -28, 3, -3, -2, -15,
-    -29, -68, -73, -44, -21, 16, 32, 18, 31, 19, 25, 18, 8, -2, 6, 18,
-    -1, -11, -59, -80, -72, -44, -17, -13, 2, 18, 0, -17, -44, -40, -67, -33,
-    3, 30, 28, 13, 23, 19, 2, 5, 3, -7, 2, 10, 24, 16, -48, -66,
-    -62, -16, -47, -11, -9, 10, -32, -33, -17, -21, -30, -15, 1, 1, 21, 7,
-    28, 7, 0, -3, 14, 26, 32, 14, 25, 12, -30, -37, -27, -8, -31, -24,
-    -8, 11, -16, -24, 22, 4, -15, -30, -4, -5, 15, 16, 25, 7, -9, -3,
-    22, 24, 32, 10, 4, -59, -59, -36, -24, -47, -64, -15, -3, 16, -9, -21,
-    21, 7, -17, -10, -9, -1, 19, 18, 9, -1, 6, 19, 24, 40, 35, 8,
-    -23, -61, -50, -6, -24, -51, 4, 3, 22, 5, 11, -34, 12, 0, -16, -3,
-    -4, 0, -2, 19, 26, 20, 25, 21, 34, 43, 21, -5, -50, -68, -68, -19,
-    -42, -48, 40, -31, 17, 23, -11, -23, 3, 8, -4, -1, -1, -2, -6, 11,
-    31, 6, 7, 15, 18, 19, 23, 2, -53, -70, -63, -14, -1, -40, -14, -7,
-    -2, 23, -27, -28, -2, 7, -4, -20, -10, -24, -13, -13, 4, 4, 12, 7,
-    9, 3, -17, -31, -59, -46, -32, -20, 0, -20, 4, -2, 6, -23, -31, -10,
-    -23, -3, -9, -9, -6, -6, -21, -5, 1, -1, 0, 1, -6, -10, -21, -31,
-    -30, -32, -19, -21, -18, 1, 27, 0, 6, -11, -41, -9, -29, -22, 1, 5,
-    6, 12, 11, -3, 18, 11, 14, 14, 2, -13, -30, -11, -53, -47, -14, -4,
-    -27, -31, -37, -4, 1, -3, -34, -39, -28, -10, -6, 4, 11, 0, -5, 3,
-    4, 1, 7, -7, -18, -26, -14, -41, -55, -60, -42, -28, -24, -49, -36, -2,
-    1, 4, 11, -22, 15, 45, 8, 9, 2, -3, -9, -16, 19, 21, 7, 8,
-    10, -6, -25, -83, -52, -41, -31, 24, -5, -14, -10, 3, -3, 0, 20, 14,
-    -8, 21, -16, -3, -4, -1, -17, -4, -6, -4, -1, -6, 39, 20, -31, -46,
-    -54, -37, -24, 30, 5, -10, -15, -3, 3, -1, -3, 16, 55, 58, 52, 21,
-    15, 17, 17, 30, 39, 10, 53, 29, 51, 65, 21, 4, -8, 14, 12, 1,
-    6, 8, 2, -2, 4, 1, -2, -1, -6, -13, 19, 18, 18, 10, 22, 32,
-    18, -11, 43, 44, 22, 25, 24, 9, -2, 2, -1, 2, 4, 4, 4, 1,
-    -3, 2, 3, 0, -3, 4, 2, -4, -4, -1, 4, 4, 7, 2, 4, 6,
-    -2, 0, -2, 5, -3, 4, 2, 3, -4, -3, 3, 1, -4, -1, 4, 0,
-    -2, -1, -1, -3, -2, 1, -3, -3, -2, 7, 3, -1, 20, 16, -1, -4,
-    -4, -3, -1, 0, 2, 1, -3, 2, -1, 0, -2, 2, 3, 0, -1, -1,
-    2, -11, 6, 10, -6, 5, 11, 14, 3, -7, 14, 3, 14, 17, -1, 1,
-    2, 1, -3, 4, -3, 3, -1, -8, -3, 8, 20, 21, 20, 26, 0, 8,
-    30, 9, -25, 9, 20, 16, 25, 14, -22, 7, 23, -27, -17, 21, 11, 0,
-    -1, 5, -6, -31, -12, 5, 23, 18, 34, 45, 48, 47, 25, 7, 1, 12,
-    36, 25, 16, 19, 1, -18, -5, 9, -26, 8, 23, -18, -3, 2, 17, 30,
-    36, -4, 18, 23, -3, -14, 3, 9, 7, -3, -10, 0, 12, -12, -18, 7,
-    34, 46, 45, 13, -5, 3, -6, -16, -1, 10, -26, 15, 1, -10, 1, 9,
-    0, -14, 9, -6, -14, -21, -13, -18, -11, 0, 0, -8, -3, 12, 17, 12,
-    -13, -9, 20, -8, -5, 7, -27, 4, 24, 11, -2, 19, 3, -13, -12, -23,
-    -11, -6, 3, -10, -14, -6, 8, 1, -9, 4, 30, 1, -15, 3, 17, -15,
-    6, -22, -31, 23, 33, -11, -10, -1, -32, -40, -31, -21, -3, -8, 5, 10,
-    14, 14, 18, 16, 13, -1, 28, 38, -11, 2, 14, 12, -15, -13, 16, 15,
-    40, 5, -17, 1, -7, -22, -14, -13, -7, -2, 7, 8, 21, 13, 19, 19,
-    9, 4, 23, 60, 18, 30, 24, 28, -12, 3, 14, 21, 21, -8, -11, -6,
-    0, -20, 19, 8, 6, 6, -6, -4, 1, 1, 23, 24, 13, 8, 23, 52,
-    23, -2, 32, -2, -18, -7, -30, -26, 31, 3, 21, 14, -19, -14, -14, -20,
-    -19, -7, 2, 0, -15, -7, 17, 18, 19, 15, 24, 21, -7, -8, 11, 10,
-    -9, 3, -7, -28, 18, -14, 16, 16, -11, 13, -24, -24, -8, -16, -9, -33,
-    -35, 4, -12, 9, 14, 33, 4, -23, -11, 8, 24, 16, 1, 10, 10, 8,
-    -6, -9, 4, -6, -15, -7, -36, -14, -2, -5, -4, -36, -39, -9, -7, -3,
-    6, 2, -20, -31, -27, -12, 11, 9, -4, -11, 34, 25, -17, -24, -3, -11,
-    -15, -27, -11, 0, -1, 6, 6, -21, -33, -23, -26, -32, -15, -18, -40, -49,
-    -43, -16, 23, 10, -5, -5, 31, 4, -37, -16, -6, -8, -12, -8, -14, -17,
-    4, 28, 23, -12, -4, -36, -38, -46, -43, -36, -38, -33, -26, -12, 12, 5,
-    -7, -11, 24, 19, -16, -10, -23, -12, 4, 10, -7, -9, 17, 27, 25, 12,
-    18, -21, -50, -34, -49, -27, -17, -3, -18, 6, 15, 7, 1, -8, -8, 20,
-    1, 7, -16, -26, -3, -14, -16, 0, 19, 24, 23, 4, 20, -18, -31, -13,
-    -26, -28, -23, -28, -15, 24, 13, 17, -4, 8, -20, 8, 20, 6, -9, -13,
-    -17, -26, -18, -7, 18, 21, -1, 7, 23, -1, -13, 0, -11, -42, -48, -49,
-    -19, 0, 10, 28, 11, -8, -2, 1, 40, 9, -8, -10, -9, -21, -20, 6,
-    9, 28, 16, 15, 34, 34, 20, 12, 12, -33, -32, -34, -22, 20, 20, 31,
-    -2, 3, 27, 23, 31, 2, 13, 11, -4, 3, -12, -1, -2, 23, 20, 22,
-    29, 31, 49, 28, 27, 8, -4, 4, 11, 21, 17, 0, 13, 9, 43, 43,
-    36, 10, 16, 17, 1, -10, -12, -5, 5, 21, 34, 26, 3, 24, 46, 43,
-    36, 10, 9, 36, 36, -3, 17, -4, 6, 3, 45, 53, 25, 28, 17, 12,
-    1, -5, -11, 18, 16, 10, 19, 16, 4, 19, 42, 13, 17, 3, 12, 55,
-    29, -2, 13, -5, -4, -4, 14, 27, 9, 14, 11, 10, 29, 20, 4, 22,
-    29, 17, 11, 34, 37, 38, 25, 10, 28, 11, 28, 59, 30, 8, 26, 3,
-    4, 1, 5, -2, -33, -32, -14, -7, 22, 29, -3, 5, 19, 19, 27, 22,
-    14, 26, 19, 33, 29, 23, 10, 19, 37, 18, 13, 4, -5, 4, -17, -26,
-    -42, -48, 18, 14, 12, 2, 0, -20, 16, 9, -6, -27, -8, 16, 11, 25,
-    17, 6, -4, -17, -8, 2, 7, 2, -1, 4, 2, -4, -34, -31, -21, -7,
-    -16, -32, 0, 3, -2, -19, -72, -72, -27, -11, -5, -18, -25, -31, -23, -2,
-    -4, 0, 0, -4, -1, 0, 1, 5, 6, -8, -10, -13, -8, -28, -50, -49,
-    -31, -11, -31, 1, 0, -30, -35, -26, -23, -13, -19, -5, -2, 2, -4, -1,
-    -3, -1, 0, -4, -1, -3, -2, 0, -5, -2, 1, 1, 8, 16, -2, 2,
-    0, -2, 3, 3, -4, 4, -5, 0, 4, -3, -3, 1, 4, 1, 3, 1,
-    -4, 4, 0, 1, -3, -6, 13, 5, 2, 15, 19, 26, -8, -17, 15, 30,
-    42, 25, 16, 12, 1, 3, 0, -4, -4, 0, 19, 4, 19, 13, -1, 5,
-    -6, -17, -9, 14, -39, -21, -1, 20, 31, 34, -16, 46, 41, 53, 52, 35,
-    11, -3, 3, -3, -2, -3, 21, 2, 2, 1, 11, 18, 0, -3, -22, -40,
-    -48, -16, -21, -26, 3, 30, 39, 34, 38, 27, 39, 47, 23, -23, -12, -4,
-    -4, 5, 27, -8, -7, -15, 0, -7, -31, -34, -27, -2, 10, 38, 7, -18,
-    -9, -4, 5, 13, 12, -4, -12, -8, -20, -35, -36, 4, 3, 1, 53, -3,
-    3, -9, -17, -18, -31, -44, -22, -18, -10, -2, -26, -6, -9, -10, 12, -3,
-    -26, -9, -10, 11, -21, -43, -8, -2, 0, -2, -6, 1, 7, -15, -28, -32,
-    -48, -44, -24, -38, -22, -24, -9, 6, 10, 20, 23, -27, -44, -28, -5, -29,
-    -28, -23, -40, -5, -3, -24, -10, -8, -19, -37, -55, -46, -38, -46, -28, -25,
-    -9, -1, 31, 13, 3, 10, 17, -11, -16, -10, 1, -38, -56, -66, -38, -13,
-    -5, -18, -15, -13, -45, -29, -9, -22, -46, -84, -48, -45, -6, 24, 29, 5,
-    -16, 3, -6, -2, -29, -12, -24, -28, -63, -56, -37, -19, -10, 6, -4, -14,
-    -42, -21, -6, -20, -65, -75, -34, -22, -7, 28, 33, 15, -5, -28, -15, -14,
-    -39, -28, -39, -12, -37, -36, -34, -43, -6, 19, -23, -28, -39, -31, -51, -27,
-    -74, -55, -20, 8, 3, 32, 29, 13, -7, -32, -30, -11, -35, -40, -11, -11,
-    -13, -54, -60, -27, -8, -6, 23, -6, 11, -15, -32, -40, -60, -24, 10, 11,
-    22, 26, 26, 9, 0, -17, -5, -14, -19, -9, 5, -5, -46, -74, -54, 3,
-    1, -9, 14, 3, -7, -34, 0, -29, -44, -6, 23, 29, 34, 37, 30, 11,
-    9, -8, 1, -31, -2, -6, -7, 11, -46, -45, -58, -11, -3, -10, 0, -8,
-    8, -19, -8, -45, -16, 2, 18, 27, 22, 22, 35, 1, 8, -3, 16, -8,
-    24, -12, -34, -30, -32, -46, -69, -14, -4, -1, 0, -3, 3, -32, -36, -31,
-    -5, 25, 24, 14, 15, 24, 17, 0, -1, -12, 21, 25, 36, 0, -21, -48,
-    -33, -21, -35, 0, -3, 1, 8, -3, 15, -26, -32, -20, -8, -1, 20, 25,
-    26, 11, -2, -10, 5, -7, 17, 27, 21, 20, -6, -19, -20, -16, -20, -15,
-    -2, 12, 2, 2, 26, 9, -34, -37, -10, -8, 4, 25, 17, 10, 8, -10,
-    6, -12, -1, -1, 14, 11, 6, 17, 2, -44, -39, -31, 0, 22, 14, 25,
-    20, 7, -15, -42, -30, -15, 8, 5, 14, 28, 24, -7, -22, -24, -2, 6,
-    22, 24, 17, 30, -8, -61, -14, -41, 30, 26, 14, 26, 6, -7, -19, -50,
-    -48, 13, -7, -6, 27, 34, 23, -4, -33, -6, 14, 7, 2, -2, -28, 1,
-    -42, -56, -1, 31, 22, -26, 7, 14, -3, 4, 7, 1, -15, 2, -12, 10,
-    30, 21, 2, 0, -24, -31, -4, 15, -1, -18, -33, 8, 9, -40, -8, 24,
-    2, -25, -7, -5, 8, 23, 9, -20, -14, -14, -11, 5, 22, -6, 15, 10,
-    -9, -24, -12, 2, 13, -36, -48, 16, 23, -15, 6, -1, 14, 0, -13, -10,
-    10, -1, -19, -20, -22, -4, -2, 8, 0, -21, 8, -2, -6, -17, -4, -2,
-    20, -15, -46, 13, 15, -5, 23, -1, 13, 10, 0, 1, -15, -32, -29, -10,
-    -20, -24, 1, -20, -26, -18, -2, 8, 8, 5, 16, 6, 15, 7, 7, 30,
-    12, -1, 36, -1, 0, -3, 3, 6, -4, -41, -31, -27, -9, -3, -22, -17,
-    -3, -10, -1, 1, -2, 18, 28, -3, 0, 13, 31, 12, 21, -1, 23, 4,
-    0, -1, -2, 7, 38, 13, -22, -7, -22, -7, 19, -4, -18, -7, 22, 26,
-    6, 31, 25, -14, 1, 12, 22, 36, 28, 28, 23, -3, -3, -2, -2, -1,
-    50, 41, -3, 7, 31, 2, -10, -13, -5, 3, 42, -3, 19, 39, 15, -12,
-    -11, -13, -3, 41, 27, -1, -4, 3, -4, 3, -2, 18, 49, 25, 37, 53,
-    43, 43, 8, -16, 5, -28, 18, 8, 2, 21, -2, 8, 16, 2, -5, -13,
-    3, 1, -1, 0, 2, 2, -3, -3, 2, 1, 7, 5, 10, 12, 32, 32,
-    22, 30, 47, 12, 6, 35, 32, 13, 3, -1, -3, -2, -5, -3, 3, 4,
-    4, -4, 3, -2, -1, 4, 5, 4, -4, -3, 4, -3, -2, -7, -13, -2,
-    1, 4, 5, -2, 3, 3, 0, 2, 4, 0, -1, 1, 4, -1, -2, 4,
-    -1, 0, -9, -12, -6, 7, 3, 4, 3, 12, 3, -15, 23, 23, -5, -23,
-    -23, 4, 8, 1, 1, 1, 4, 4, 1, -3, -2, 5, -15, -14, -6, 3,
-    -1, 5, -37, -17, 30, -19, -36, -39, -34, -25, -17, -25, -33, -18, 9, -19,
-    -27, -12, 1, 4, -2, 1, -6, 19, 32, 10, -19, 9, 22, 17, 40, 36,
-    4, 12, 36, 33, 10, -8, -11, -8, 34, 28, -9, -19, -7, 20, 10, 1,
-    0, 4, -23, 51, 6, -9, -12, 11, -4, 15, 19, 21, 3, -15, -13, 10,
-    4, 7, 1, -3, 3, 26, 14, 16, 38, 60, 29, 17, -2, 3, -32, 25,
-    -8, -24, -2, 24, 16, 22, 20, 23, 7, -10, 9, 5, 12, 24, 0, -3,
-    3, -11, -9, -21, -2, 47, 21, 18, -2, 4, 2, -34, -1, 26, 21, 28,
-    31, 19, 4, -4, -5, 6, 3, 11, 15, 11, -5, 18, 9, 15, 14, 12,
-    11, -16, 6, -13, 1, 9, 5, -21, 7, 44, 31, 19, 20, 12, -2, -1,
-    -15, -5, -15, 6, 16, 7, 3, 8, 0, -1, -3, 26, 29, 0, -7, -11,
-    37, -14, 41, 22, 16, 12, 7, 6, 5, 14, -8, -3, 0, 7, 9, 6,
-    22, -3, -5, -3, 1, 0, 1, 21, 21, 47, 4, 19, -3, -19, 32, 14,
-    -10, 2, -1, -29, -14, -1, -23, -12, 4, 4, 10, 2, 2, 2, -16, -13,
-    13, -3, -9, 20, 14, 37, 12, 6, -9, -27, 6, 31, -18, 6, 4, -14,
-    -17, -5, -5, -5, 7, -2, 8, -8, 1, -5, -18, -17, -4, -7, 6, 16,
-    12, 2, 33, 15, -5, -13, -13, 18, -33, -11, 9, 12, 8, 0, -2, 0,
-    3, -4, 0, -6, -3, -3, -9, -14, -20, -4, -13, -15, 20, 19, 46, -41,
-    -5, -15, -10, 21, 2, 14, 7, 4, -10, -16, 7, 1, -3, 1, -7, -10,
-    -12, -3, -10, 15, 6, 7, -4, 6, 11, -6, -16, -41, -4, -11, -24, 19,
-    14, 1, 7, 22, -7, 3, 11, -1, 9, 9, -4, -5, -13, -21, 1, 28,
-    1, 12, 13, 20, -2, 5, -6, 6, 5, 8, -40, -1, 4, 29, 26, 30,
-    11, -3, -6, -3, 16, 5, -5, 6, -22, -16, 7, 7, 8, 27, 11, 16,
-    32, 16, -58, -28, 1, 10, -21, -12, 27, 33, 24, 23, 15, -7, 2, -11,
-    2, -12, 8, 13, -8, -9, 6, 7, 9, 21, 13, 24, 32, 26, -12, -34,
-    -5, 11, -11, 8, 28, 12, 15, 12, 7, -4, 13, 1, 6, -4, 6, 7,
-    -9, 8, -4, -4, 14, -4, -2, 15, 7, 18, -44, -8, 4, 1, -1, 21,
-    44, 7, 11, 26, 9, 21, 15, 13, 6, 3, -13, -2, 1, 13, -10, -1,
-    -5, 1, 2, 30, 2, -11, -32, 32, -27, -17, -17, 10, 20, 1, 21, 14,
-    21, 5, 15, 19, 24, 6, -2, 7, 11, -6, -22, 2, -2, 7, 14, 11,
-    1, -10, -22, -37, -19, 13, -7, 25, 23, 6, -8, 4, -5, -5, 9, -1,
-    17, -2, 3, -8, -6, 1, -11, -24, -2, 2, -7, -36, -16, -17, -18, -31,
-    1, 25, -20, 7, 33, 2, -25, 1, 0, 9, 6, 3, 0, 14, 8, -6,
-    -13, -19, -35, -24, -1, 13, -2, -29, -42, -31, -17, 0, -5, -8, -22, -20,
-    5, -19, -5, 0, -2, 0, -8, 12, 1, 9, -7, -2, -11, 0, -22, 4,
-    -6, -7, 29, -4, -37, 5, -10, 3, -8, -7, -12, -3, 3, -20, -9, -8,
-    -10, -7, 9, 18, 16, 9, -5, 2, 3, 0, 4, 18, -17, -6, 29, 6,
-    -13, 6, 0, 1, -2, -4, 17, 30, 12, -9, -14, -1, 13, -9, 14, 12,
-    -6, 1, 8, -8, -5, -1, 26, 8, -13, 3, 0, 7, -18, 24, -18, -1,
-    -2, -3, -9, 35, 28, 12, 12, 22, 21, 6, -7, -3, 22, 39, 32, 4,
-    29, 0, 21, -2, 22, 2, 2, 10, -12, -26, -22, -4, 0, -3, 7, -17,
-    -1, 16, 21, 24, -14, -9, 25, 32, -7, 32, -6, 11, 29, 23, 25, 29,
-    3, 2, 18, 37, 22, -15, -17, 1, -3, 1, -1, -17, 39, 34, 31, -13,
-    -9, -28, -19, 20, 25, -3, -5, -12, 8, 9, 7, -11, -27, -30, -31, -27,
-    -20, -5, 4, 4, -1, 3, -1, 1, -14, -20, -1, -1, -2, -18, -25, -1,
-    -9, -28, -28, 6, -20, -37, -17, -21, -22, -33, -30, -31, -2, -2, -1, -1,
-    0, 0, 3, 2, -2, 3, 4, 2, 3, 0, -2, 2, 23, 20, -10, 0,
-    -4, -4, 4, 2, 2, -3, 3, -2, -3, -3, 0, 2, -4, 4, -4, 3,
-    1, -1, -4, 0, 3, 12, 32, 15, 0, 20, 20, 0, 4, 2, 29, 9,
-    14, 12, 5, 3, 2, 0, -2, 4, 4, 4, -2, 3, 3, 13, -4, 0,
-    12, 9, 3, 19, 13, 4, 21, 19, -3, -2, 29, -12, -12, 4, 31, -5,
-    -11, -8, -3, -3, -4, 3, -3, 34, 32, -2, -13, -9, -13, -25, -33, 0,
-    -9, 4, 27, 29, 22, 37, 44, 9, 7, 43, 22, 15, 4, -8, -2, 4,
-    -1, 1, -1, 13, -12, -5, -47, -40, -53, -14, 1, -19, -10, -18, 0, -3,
-    10, 10, 10, -1, -11, 17, 5, 36, 52, 54, 30, 24, -1, 4, 6, 5,
-    -37, -35, -58, -54, -31, 5, 7, 8, 4, -6, 10, -3, -10, 3, -18, -15,
-    -6, -22, -12, -16, 14, 54, 34, 25, 2, -9, 14, -28, -24, -40, -49, -34,
-    4, 20, 6, -5, -6, -7, -6, 0, -4, -8, -20, -5, -5, -26, -13, 15,
-    23, 53, 33, 9, 3, -28, 14, -34, -31, -9, -43, -35, 1, 15, 7, -10,
-    -18, -13, -19, -2, -7, -3, -9, -9, -2, 3, 10, 25, 14, 19, 48, 18,
-    -7, -32, -2, -33, -21, -28, -6, -10, 3, 18, -6, -6, -9, -8, -13, -2,
-    2, 0, -5, -2, 1, 8, -2, 18, 25, 36, 52, 21, -5, -38, -11, -15,
-    -42, -47, -7, -8, 9, 20, 3, 7, -9, -15, -28, -16, 6, 5, -10, 0,
-    -1, 8, -12, 9, 20, 30, 47, 19, -7, -23, -18, -11, -39, -32, -6, 3,
-    17, 29, 8, -10, -5, -24, -20, -20, -18, -9, -3, -1, -9, 2, -9, 9,
-    43, 14, 42, 6, 0, -3, -8, -33, -37, -15, 24, 23, 15, 18, 5, 5,
-    9, -7, -8, -37, -21, 6, 3, 4, -14, -8, -6, 16, 49, 51, 51, -38,
-    1, -7, 11, -26, -32, 2, 31, 23, 11, 16, 21, 26, 9, 9, -19, -26,
-    -16, 5, 4, 11, 3, 9, -4, 4, 13, -16, -16, -40, 0, -9, -23, -29,
-    -30, -8, 11, 30, 9, 27, 41, 31, 23, 16, -9, 12, 2, -5, 5, 13,
-    0, -6, 15, 3, -29, -23, -18, -2, -1, -10, -23, -19, -20, 10, 22, 13,
-    15, 12, 28, 33, 20, 14, 5, 4, 13, 6, 2, -16, -16, -4, -8, -16,
-    7, 26, -31, 3, -1, -2, -20, 9, 3, 5, 12, 9, 20, 18, 25, 27,
-    22, 5, 1, -10, 8, -1, 1, -14, -28, -18, -14, -6, -5, 16, -23, 1,
-    -9, -2, -25, 15, -27, -18, 1, 2, 23, 13, 21, 33, 29, -2, -6, 3,
-    7, -5, 6, -7, -19, -35, -29, -19, -5, 37, -43, -8, 3, -9, -18, 8,
-    -15, -17, -5, 5, 27, 29, 33, 29, 20, -12, -2, 2, 5, -9, -9, -22,
-    -17, -23, -25, 2, 1, -2, -28, 7, -9, -7, -21, -17, -24, -18, 17, 18,
-    27, 14, 15, -5, 0, -3, 2, 5, -6, -22, -30, -12, -4, -26, -26, -6,
-    12, -11, -22, -28, 1, -22, -26, 5, -5, -8, 3, 15, 7, -5, -11, -9,
-    -8, 1, 8, 12, -2, -9, -10, -3, 10, -3, 2, 15, 42, 8, -12, -17,
-    2, -15, -5, -1, -16, -10, -12, -5, 1, -3, -5, 10, -4, 7, 4, 22,
-    -5, -9, -1, 9, 12, 14, 13, -3, 14, 23, 4, 0, -1, -1, -2, -13,
-    -22, -31, -16, -2, -7, 9, -8, 9, 10, 7, 2, 13, -18, 5, -5, -7,
-    1, 0, 14, 6, -6, 13, 24, 2, -4, -4, -2, 21, 0, -31, -28, -11,
-    -13, -11, 2, 0, 10, 9, 4, 8, 8, 6, 8, -1, -5, -1, 0, -3,
-    12, 9, 14, -2, 0, 3, 0, 24, 21, -11, -26, -24, -8, -11, -16, -27,
-    -15, -2, 3, 6, 9, 10, 31, 17, 19, 19, 9, 0, 2, 15, -3, 0,
-    2, -1, -8, 3, 18, -5, -22, -19, 2, 10, 3, -9, 10, 5, 11, 10,
-    40, 20, 27, 25, 29, -1, 9, 5, 2, -19, -13, 0, -2, 0, 21, 9,
-    -21, -30, -2, 9, -5, -10, -8, -9, -21, -6, 4, 23, 35, 39, 32, 29,
-    27, 27, 56, 42, 16, 5, 3, -4, 3, -3, 4, -3, 25, -7, -6, 4,
-    9, -26, -20, 18, 23, -22, 10, 2, 7, 12, 5, -20, -14, -7, -21, 9,
-    -17, -3, 1, -2, -1, 2, -4, -3, 1, -2, 14, 19, 7, -1, -3, 18,
-    5, -8, -9, 22, 2, -27, -3, 0, -30, -33, -36, -14, -3, 0, -1, -1,
-    -2, -2, -1, 4, 0, -2, 4, 2, 0, -3, 3, 1, 9, 9, -2, -5,
-    2, -2, 2, 4, -1, -3, -4, 4, 3, 4, -4, -2, -4, -1, -1, 3,
-    0, 1, 6, 9, 5, 2, 4, 6, 9, 3, -2, 1, -1, -1, 9, 8,
-    4, 7, 1, 5, -4, 5, 4, 3, -2, -1, 1, 3, 3, -1, 9, 4,
-    2, -8, -5, 2, 30, 55, 50, 12, -17, 24, 28, 15, 28, 6, 5, 5,
-    2, -4, 1, 1, -4, 1, -5, -1, 12, 27, 23, 6, -10, -35, -28, -3,
-    23, -10, -22, -25, 3, 44, 29, -2, -6, 38, 36, 22, 26, 5, 3, 0,
-    4, 3, 10, 42, 17, -5, 8, -8, 9, -14, 4, 12, 2, 9, 9, 10,
-    -22, -19, -18, -19, -21, -1, 5, 4, -3, 3, -16, -17, -4, 4, 22, 21,
-    26, -5, -3, 7, 15, 0, 12, 18, 26, 24, 7, 17, 21, -10, -10, -10,
-    -4, -38, -15, -3, -3, 5, -12, -29, -2, 13, 8, -5, 46, 8, 1, -13,
-    0, -9, 7, 20, 10, 25, 4, -6, -7, 4, 1, -2, 13, 1, 7, 6,
-    19, -15, 16, -1, -4, 31, 30, -20, 37, 34, -6, -9, -6, -20, -2, -4,
-    -5, 15, 5, -16, 4, 8, -4, -2, 2, 1, -20, -4, 16, 6, 26, -1,
-    4, 5, 35, -14, 21, 18, -17, 13, -5, -13, -18, -17, -7, 6, -3, -4,
-    -2, 5, -5, 1, 5, 4, 1, -6, 20, 9, -23, 24, -8, 1, -13, 10,
-    29, -8, -1, 21, -5, -8, -9, -20, -6, 11, -3, -19, -27, -17, -10, -1,
-    1, 2, 8, 3, 30, 34, -25, -14, -3, 4, -22, 21, 8, -17, -19, 6,
-    16, -12, -8, -3, 21, -5, -23, -16, -20, -24, -22, -10, 6, 12, 11, 23,
-    25, 68, 13, -23, -3, 3, -1, -33, -24, -30, -40, 8, 19, -15, -8, -7,
-    19, 11, -13, -14, -5, -9, -10, -1, -1, -7, 25, 25, 17, 59, 28, 8,
-    1, -5, 23, -34, -13, 4, -4, -3, -7, -5, 15, 19, 31, 36, 14, 1,
-    -3, -7, -8, -28, -8, -15, 9, 14, 28, 26, -10, -9, 1, 0, -5, -42,
-    -9, 16, 14, 5, -5, 0, 29, 25, 40, 22, 13, -6, 6, 1, -11, -12,
-    0, -17, -2, 12, 10, -34, -50, -2, 4, 4, -9, -39, -5, 8, 20, 29,
-    11, 24, 32, 22, 35, 17, 15, 8, -12, -12, 3, -13, -4, -7, 3, 1,
-    -13, -55, -36, -2, -4, 9, 17, 5, -9, -17, -22, -13, -4, 28, 41, 39,
-    36, 7, -5, -11, 3, 7, -3, -2, -5, 12, 12, -4, -58, -61, 31, -6,
-    0, 11, 16, -8, -42, -63, -90, -53, -62, -33, 14, 35, 29, -6, -14, -12,
-    4, 3, 13, -12, -6, -15, 2, -11, -42, -62, -51, -6, -2, 7, 13, -8,
-    -46, -90, -105, -80, -91, -111, -70, -49, -42, -27, -26, -10, -9, -6, 15, -18,
-    -14, -11, -18, 5, -20, -13, -26, -7, 22, 9, 26, 15, -15, -64, -76, -85,
-    -118, -126, -111, -76, -60, -51, -23, -10, -8, -10, 2, -13, -4, 0, 6, 26,
-    -18, 2, -15, -3, 1, 3, 21, 19, 9, -28, -46, -61, -73, -64, -75, -58,
-    -32, -24, -5, -2, 0, -23, 3, -19, -2, -1, 7, 28, 16, 16, -5, 1,
-    4, 5, 28, 23, 30, 7, -10, -6, -4, -8, -14, -21, -2, -1, 8, 3,
-    -8, -2, 6, -1, 4, -16, -9, 37, 22, 11, -7, 3, -3, 5, 11, 36,
-    26, 27, 18, 20, 33, 36, 29, 21, 26, 5, 11, 7, -3, -7, 6, 7,
-    -5, -17, -4, 27, 14, 6, -4, 1, -4, 5, -3, 27, 39, 28, 19, 19,
-    33, 22, 54, 41, 22, 16, 5, -6, -19, -7, 2, 1, -3, -2, 14, 26,
-    7, -41, -3, 4, -1, 3, 33, 37, 65, 56, 32, 24, 35, 22, 38, 34,
-    20, 13, 16, 3, 0, -3, 15, 5, -6, 2, 9, 8, -2, -16, -7, 1,
-    4, 4, 8, 47, 91, 67, 33, 43, 38, 32, 27, -3, 2, 9, 15, -10,
-    -30, 2, 9, 2, 6, 22, 5, 16, 13, 32, 26, 5, -2, 3, 4, 11,
-    44, 67, 20, -4, -7, -24, -11, -1, -6, 19, 23, 3, 14, 37, 29, 6,
-    29, 28, 72, 62, 44, 24, 1, -4, 4, 2, -4, 20, 24, 40, 28, 8,
-    12, 2, 15, 18, 24, 12, 29, 7, 31, 74, 57, 25, 35, 25, 16, -11,
-    -2, -2, 4, -3, 3, 1, -5, 2, -10, -12, 1, 5, -4, 4, 35, 30,
-    19, 21, 46, 5, -6, -5, -8, 7, -2, -11, -10, 1, 3, 4, -3, 3,
-    1, -2, -3, 2, -3, 3, -3, 2, -1, -1, -4, 3, -10, -8, -3, 2,
-    4, 1, -1, -1, 4, 0, 1, 2, 2, 2, -2, 1, -4, 4, -4, 1,
-    1, 3, 6, 4, 7, 8, -5, -18, 0, 0, 0, -5, -4, -3, -6, -7,
-    -3, -2, -7, 0, -4, -1, -1, -2, 0, 4, 2, 0, -5, 8, 8, 1,
-    32, 25, 31, 17, -18, -48, -55, -37, -56, -39, -40, -34, -34, -16, -15, 5,
-    21, 20, 4, -3, 3, 1, 2, 33, 35, 17, 20, 6, 41, 47, 48, 30,
-    30, -19, -37, -33, -54, -56, -28, -6, 23, 22, 11, 35, 57, 15, 7, -4,
-    -3, -3, -17, 27, -2, -4, 16, 45, -9, 5, -10, 4, -2, -8, -6, -10,
-    -36, -26, 4, 14, 20, 18, 17, 48, 69, 47, 26, -2, -4, 4, -22, 29,
-    -39, -39, 3, -8, -10, -21, -6, 42, 44, 38, 14, 11, 11, 18, 27, -1,
-    19, 15, -20, -17, 41, 67, 29, 4, -3, -15, 26, -49, -16, -14, 14, 5,
-    31, 33, 46, 51, 47, 50, 68, 70, 56, 44, 38, 3, 1, -10, -16, 14,
-    -6, -2, 5, 0, -5, -35, 16, -33, -17, -36, 1, -18, 28, 33, 32, 40,
-    32, 59, 57, 41, 31, -8, -6, -26, -12, -3, -28, -45, -40, -27, -2, 6,
-    -6, -27, -2, -3, -21, -17, -8, -14, 34, 24, 23, 17, 19, 28, 21, -6,
-    -20, -29, -6, -7, -26, -14, -23, -43, -46, -23, 22, 11, -6, -27, 1, 15,
-    -3, -9, 15, -8, 21, 11, 3, -2, -13, -14, -31, -34, -32, 13, 27, -7,
-    -31, -34, -18, -39, -10, 1, 42, 1, -4, -25, -11, 7, 1, 5, 18, -1,
-    4, -5, -11, -21, -37, -31, -5, -29, 11, 32, 41, 3, -12, -14, -20, -2,
-    22, 30, 39, 3, -2, -23, -7, 26, 13, 6, 12, -6, -11, -14, -17, -20,
-    -23, 15, 12, 13, 32, 40, 24, -6, -5, -3, -27, 1, 21, 13, 34, -25,
-    -8, -16, -4, 30, 25, 4, 4, -11, -19, -8, -30, -39, -29, 5, 9, 5,
-    11, 15, 1, 8, -7, -13, -40, -10, -22, -37, 25, -19, -3, -26, 3, 18,
-    12, 2, -20, 3, -5, -13, -10, -33, -20, 3, -16, -13, 4, -5, -11, 1,
-    16, 15, -8, -7, -19, -40, 18, 28, 3, -8, -11, 10, 13, -20, 3, -15,
-    5, -2, 5, -29, -30, -8, -23, -4, -6, -5, 8, -4, 18, 0, -8, -1,
-    -16, -27, -11, 20, -6, -9, -35, 1, 8, -16, 7, -20, -12, -1, -5, -21,
-    -26, -11, -14, -1, -4, 5, -6, -20, -11, -3, -12, -12, 7, -1, -25, 20,
-    -2, -8, -13, 13, 8, -10, -3, -24, -23, -17, -12, -15, -6, -16, -15, -11,
-    -2, 11, -7, -14, -6, -16, -9, -7, -12, -6, 13, 25, 0, -24, 11, 29,
-    3, 2, 9, -21, -21, -26, -24, -14, -9, -13, -6, 4, -8, 3, -12, -24,
-    -7, -31, -28, -14, -8, 19, -8, 37, 22, -24, 6, -4, 12, 16, 28, -2,
-    0, -21, 12, 10, -13, -24, 0, 3, 2, 3, 0, 11, 1, -5, -2, 3,
-    10, 26, 11, -4, -18, -18, 13, -21, 5, 11, 6, 16, 5, -13, 17, 11,
-    4, -7, -20, 2, -6, 5, 10, 17, 8, -12, -17, 0, 2, 8, 16, -24,
-    3, -13, 28, -1, 31, 56, 16, 12, 20, -3, 11, -2, -12, 0, -16, 2,
-    -7, -7, 1, 7, -1, -7, -1, 3, 6, -1, 7, 6, -8, -6, -5, -26,
-    19, 39, 30, 26, 23, 15, 5, -12, -2, -7, -4, -10, -1, 1, 1, 8,
-    10, 18, 5, 25, 36, 14, 10, -8, -12, -11, 21, 19, 9, -3, 12, 34,
-    27, 25, 20, 12, 17, 4, 8, -9, 2, 11, -10, -9, 4, -8, -1, 29,
-    53, 16, -13, -3, 1, 3, 5, 46, 21, 7, -9, -4, -1, 13, 23, 35,
-    13, -1, 8, -1, 6, 12, -1, -6, 4, -2, 27, 45, 74, 28, -21, 5,
-    2, 3, -19, 17, -20, -13, -10, 12, -11, -2, 3, -2, 8, 3, 8, 20,
-    18, 13, 34, 10, 16, 1, 11, 32, 57, -18, -21, -4, 2, 0, 19, 11,
-    -21, 5, 25, 16, 8, 2, 12, 3, 28, 31, 25, 24, 18, 23, 13, 24,
-    25, 21, 6, 0, 23, 18, 7, 5, 2, 0, -3, 1, -5, 25, 19, -20,
-    -21, 39, 45, 46, 55, 50, 46, 32, 24, 36, 36, 3, 58, 52, 46, 39,
-    19, 3, 2, 2, -3, 4, -3, -3, -4, -6, -1, -4, -3, -7, -8, -13,
-    -17, -21, 19, -22, -17, -27, -22, -10, -6, 8, 20, -14, -4, -3, 2, 4,
-    2, 3, 4, 0, 2, -2, 1, -3, -1, -3, -4, -3, 17, 12, -1, 1,
-    -2, -1, -1, 4, -4, -5, -2, -3, 2, 2, -2, 0, 2, 3, 2, -1,
-    2, 4, 9, 8, 11, 8, 33, 21, 15, 21, 7, -12, 21, 34, 8, 2,
-    10, 18, 14, 3, -2, 3, -4, 4, 4, -1, 4, 2, 2, 18, 12, 12,
-    25, 28, 7, 5, 38, -15, 2, -24, -38, -5, -13, -12, -16, 9, 22, 9,
-    -2, -8, -1, 2, 3, -1, 9, 30, 33, 20, 30, 41, 10, -4, 19, 47,
-    7, -2, 29, 25, -6, -27, -23, 0, 11, 23, 9, 33, 24, -16, 0, 5,
-    -1, -2, -22, 20, 2, -2, -2, 20, 15, 25, 31, -10, -24, -20, -8, -10,
-    -8, -4, -3, 21, 11, 26, 14, 15, 30, 5, -11, 28, -3, 0, -29, 28,
-    5, -23, -17, 3, -10, -8, 8, 1, 5, -11, 10, 6, 4, -4, -15, -5,
-    23, 15, 26, 31, 12, 29, 32, 33, 3, 18, 27, 23, 21, 34, 17, 2,
-    -10, -19, -32, -6, 20, 17, -1, -14, -12, -13, -34, -20, -18, 1, 35, 18,
-    19, 9, 16, 17, -4, 2, 25, 28, 34, 32, 4, -1, 4, -7, -13, 14,
-    22, 22, -2, -25, -20, -14, -12, -20, -20, -18, 7, 17, 18, -5, 20, 24,
-    41, -23, 8, 8, 25, 2, -3, 1, -6, 6, -5, 3, 20, 18, -5, -29,
-    -28, -17, -20, -8, 5, -7, 5, 28, 12, 13, 12, -6, -12, -39, 2, 2,
-    -26, -15, -9, -5, -11, -14, -27, -11, 5, 10, -7, -25, -30, -22, -14, 7,
-    3, 9, 7, 19, 19, 32, 26, -12, -11, -29, 3, 50, -38, -13, -14, -11,
-    -23, -16, -19, -5, 14, 1, 3, -20, -22, -6, -14, 4, -13, 6, 6, 9,
-    13, 10, 31, -3, -9, -6, 23, 4, -23, -22, -7, -19, -21, -19, -6, 6,
-    10, -18, -7, -8, -5, 7, -13, 6, -31, -14, -5, -34, -19, -5, -3, -47,
-    -3, -3, -15, -2, -23, -34, -29, -15, -13, -3, 16, 16, 20, 6, 14, -10,
-    -4, -1, -21, -10, -11, -5, 4, -37, -4, -14, -20, -40, -2, -4, -33, 0,
-    -27, -34, -9, -4, 5, 21, 24, 4, 27, 13, 8, -2, -12, -3, -6, 2,
-    0, 2, 15, 9, -3, -9, -8, 27, -2, -11, -18, 5, -46, -6, 6, 7,
-    13, 13, 20, 0, 23, 2, 3, 0, -1, -5, 0, -2, -2, 11, 24, 27,
-    48, 25, -27, 26, 1, -4, -14, 13, -17, -3, 1, 6, 21, 26, 22, -3,
-    -1, -15, 1, -5, 0, 6, 7, 9, 7, 14, 19, 28, 16, 38, 17, 21,
-    -3, -9, -11, 35, 4, -8, 5, 24, 18, 36, 39, 34, 8, -10, 2, 9,
-    2, 15, 20, 26, 20, 30, 11, 22, 7, 73, -10, 37, -1, -12, 7, 35,
-    25, 0, 7, 22, 12, 25, 30, 23, -1, -5, -5, -6, -2, 7, 34, 34,
-    17, 36, 33, 25, -8, 34, -29, 52, -30, -12, -9, 25, 13, 1, 19, 14,
-    4, 8, 15, 3, 3, -3, 3, 2, -4, -10, 12, 30, 1, 30, 19, 27,
-    22, 27, -39, 2, -7, -10, -6, 43, 17, 8, -4, 13, 2, 14, 23, 13,
-    1, -14, 15, 7, -5, -2, 4, -4, -4, 2, 11, -10, -22, 24, 13, -12,
-    -2, -3, 19, 57, 35, -9, -13, -5, 23, 42, 22, 12, 10, 11, 9, 11,
-    -1, -11, -9, -3, -5, 15, 1, -37, -47, -27, 16, -1, 0, 5, 28, 20,
-    13, -6, -18, 0, 20, 30, 9, 25, 32, 22, 18, 8, -5, -9, -21, -3,
-    2, -5, 11, 15, -10, 23, 27, 8, -1, 0, 35, 27, 11, -1, -6, 0,
-    7, 17, 25, 44, 45, 31, 3, 0, -9, -28, -14, 3, -3, -8, 4, 7,
-    -7, -2, 20, 9, 4, 0, 41, 43, 30, 5, -17, 0, 29, 4, 34, 21,
-    12, 2, -11, -23, -16, -28, -6, 6, -22, -17, -10, 0, -32, -4, 8, -3,
-    -4, -2, -15, 37, 11, -19, -44, -27, -14, -23, -40, -30, -19, -31, -30, -31,
-    29, -13, -29, -43, -51, -27, 5, -5, -2, -3, -6, 1, -3, -1, -1, -16,
-    -20, -60, -49, -49, -59, -44, -49, -37, -30, -34, -47, -16, -2, -36, -65, -53,
-    -48, 6, 35, 34, 20, 4, 8, -5, -3, 0, -3, 1, -19, -37, -49, -74,
-    -19, -31, -48, -12, 2, -17, -25, -22, -28, -24, -9, -24, -31, -26, -23, -19,
-    -26, -5, -1, 1, 0, 3, -1, -1, -1, 1, -28, -24, -21, -29, -21, -11,
-    -17, -5, -24, -14, -2, -9, -14, -6, -18, -40, -38, -5, 2, 3, 2, 0,
-    0, -4, 4, -3, 2, -4, 0, 1, -2, 4, 1, 3, -20, -12, 11, 3,
-    3, -3, 0, -3, 4, 3, -1, 1, -2, 3, -4, 3, -5, -3, 5, 3,
-    -2, 0, -14, -15, -5, -5, -24, -19, -22, -25, -18, -34, -12, -10, 3, -22,
-    -17, -20, -15, -11, 4, -2, -5, 0, -1, 2, -3, 0, -9, 0, -3, -20,
-    29, 39, 35, 4, 15, -8, 25, 16, 0, 30, 0, -16, -1, 13, 2, 15,
-    29, 10, 1, 4, 0, 4, 9, -8, -8, 62, 37, 16, 35, 40, 22, 47,
-    33, 11, 11, 14, 12, -10, -10, 6, -15, 20, 32, 16, 17, 38, 27, 4,
-    0, 3, -16, -17, -24, -8, -7, -3, 7, 7, 13, 1, -3, 6, 1, -2,
-    -3, 16, 15, 0, 16, 11, 8, -9, -14, 3, -31, -14, -4, 4, -26, -3,
-    -20, -6, -1, -26, -19, -14, -20, -34, -18, 6, -8, -11, -12, 4, 11, -5,
-    18, -8, -30, 5, -4, 13, -27, -27, -4, -16, 1, 2, -4, 8, -14, -18,
-    -17, -20, -39, -19, -15, -9, -9, 1, -5, 10, 7, -15, -6, -33, -40, -32,
-    -11, 20, -6, 7, 0, -13, 6, -9, 34, 6, 3, -43, -43, -30, -33, -23,
-    -30, -20, -17, 0, -4, 5, 14, 6, 14, 7, -8, -3, 26, 37, 4, 12,
-    -45, -18, 16, -23, -21, -33, -40, -72, -61, -20, -18, -3, -6, -2, 3, 12,
-    -7, -4, 5, 16, 6, 1, 2, 9, 28, 19, 21, -25, -7, -41, 2, 14,
-    -29, -45, -50, -43, -52, -8, 9, 4, 12, 24, -4, -9, -19, -18, 3, 0,
-    1, -12, -13, -29, -2, -34, 20, 4, -6, -28, -24, 18, -20, -23, -14, -18,
-    -27, 6, 5, 7, 21, -1, -35, -30, -19, -22, -19, -9, -15, -24, -27, -31,
-    -13, 15, 3, 2, -1, -4, -11, -20, -25, -13, 25, -7, -7, 6, -4, -10,
-    12, -24, -44, -44, 0, -5, -24, 5, -5, -22, -29, -28, -51, -16, -54, -34,
-    0, -12, -3, -19, -15, -11, 14, -1, 1, 2, 4, 0, 14, -3, -4, -11,
-    2, -11, 3, 6, -4, -26, -38, -44, -67, -16, -24, -24, -1, -4, -31, -17,
-    -18, -12, 22, 39, 13, 5, 25, 13, 21, 35, 14, 7, -1, 5, 10, -6,
-    -29, -34, -19, -32, -31, -6, -9, 33, 0, -9, -33, 17, 18, -6, 18, 36,
-    22, 31, 22, 13, 22, 15, 5, 15, 24, 12, 18, -2, -1, -16, -7, -27,
-    -17, 36, 59, 40, 2, -10, -2, 41, 52, 14, 13, 13, 25, 19, 8, 10,
-    20, 8, 13, 31, 38, 29, 22, 18, -12, 4, 6, -2, 0, 44, 69, 40,
-    -4, -4, 7, 17, 34, 27, 28, 24, 11, -1, 15, 31, 12, -1, 24, 34,
-    42, 39, 29, 15, 1, 28, 18, -9, -11, 60, 84, 32, 0, -5, 20, 11,
-    21, 6, 7, 10, 16, 26, 33, 29, 15, 14, 13, 33, 33, 12, 5, 0,
-    6, 33, 13, -10, -38, 55, 41, 10, 20, -3, 6, 34, 34, 8, 11, 13,
-    18, 34, 21, 12, 20, 12, 34, 33, 22, -2, 10, 25, 15, 25, 30, 21,
-    5, 58, 16, 37, -3, -22, -4, 30, 37, 13, -16, -5, 5, -11, 11, 15,
-    1, -10, 21, 25, 21, 4, 13, 25, 11, 32, 36, 41, 29, 54, 32, 7,
-    -1, -24, 6, 23, 20, -16, -23, -4, -9, -3, -11, -4, -27, -33, -22, -11,
-    0, 2, 18, -4, -4, 11, 15, 23, 42, 38, 40, 0, -1, 10, -16, 6,
-    -1, -13, -16, -12, -4, -17, -27, -30, -22, -28, -27, -44, -24, -21, -15, -24,
-    -16, 8, 0, -2, 16, -22, 13, 2, 1, 3, 15, -2, -13, -24, -36, -29,
-    -36, -42, -25, -26, -29, -32, -40, -47, -17, -15, -15, -19, 2, 4, -12, -6,
-    12, -4, -18, 3, 4, 0, 24, 22, 4, -31, -34, -26, -42, -32, -20, -22,
-    -23, -35, -18, -32, -37, -38, -37, -7, -4, 10, 15, 7, 16, -17, 0, 4,
-    -1, -2, 19, -2, 36, -23, 13, 20, -5, -16, -21, -23, -32, -40, -17, -34,
-    -27, -30, -11, 7, 7, 22, 32, 24, 3, 18, 13, 0, 4, -4, 22, -34,
-    18, 21, 38, 45, 41, 18, 11, 20, -3, 11, 21, -4, 13, 5, 19, 14,
-    30, 23, -1, -1, -18, 12, 18, 1, 2, 1, -2, 11, 52, 46, 44, 38,
-    28, 20, 3, 19, 19, 6, 42, 25, 23, 7, 11, 5, 35, 32, 25, 25,
-    24, -5, -4, 4, 2, 3, -4, -5, -8, -6, 23, 16, 16, 19, 15, 35,
-    38, 23, 43, 38, 6, -6, 1, 18, 11, -32, -6, -21, -3, 5, -4, 1,
-    -4, -1, 2, -3, 2, -2, 4, -1, 0, 0, -1, 4, 8, 1, -14, -2,
-    3, 2, 3, -3, -4, -2, -4, -5, 4, -1, -4, -3, 4, -4, 2, -1,
-    -2, -4, -14, -7, -6, 1, 17, -11, -22, -10, 27, 2, -30, -18, 4, -13,
-    -5, 3, -2, -5, 2, -3, -3, 2, 2, 1, 3, 0, -14, -7, -6, -13,
-    -3, -6, -14, -8, 6, 44, 15, 3, 27, 24, 15, 28, 23, 0, 22, -13,
-    -1, 5, 1, -2, -1, 1, -4, -15, -8, 9, 23, 32, 34, -5, 9, -7,
-    5, 4, -2, 2, 10, 4, 7, 15, 8, 0, 17, 14, -2, -21, -27, 2,
-    4, -3, -2, 23, 27, 32, 21, 14, 28, -7, 12, 5, 20, 28, 10, -2,
-    -3, -18, -32, -2, -13, 18, 25, 4, 16, -2, -25, 8, 0, -4, -17, -6,
-    10, 45, 23, 14, 4, -2, 0, 12, 24, 5, -3, 1, -12, -3, -15, -4,
-    1, -5, 6, 27, 38, -14, -19, 12, 3, -14, 4, -16, 7, -6, 3, 4,
-    -7, -7, -7, 15, 12, -4, -5, 0, -3, 3, 0, -5, 23, 4, -6, 30,
-    43, 7, -1, 19, 3, -12, 4, -11, 0, 0, 2, -7, -12, -14, -5, 3,
-    11, -5, -3, 7, -9, 8, 3, 19, 16, 9, 5, 21, 25, -17, 22, 5,
-    -39, 10, 1, 4, -1, 7, 2, -1, 4, -5, -7, 3, 3, -1, -3, -3,
-    -20, 0, 11, 12, -2, 27, 3, -25, 19, 13, 10, -19, 3, 44, 1, -2,
-    9, -4, 3, 9, 6, 15, 0, 26, 0, -3, 6, 3, -8, 18, 15, 13,
-    -1, 15, 14, -17, -23, -2, -5, -22, 0, 27, -9, -2, 13, -15, -17, 10,
-    6, 2, 1, 4, 13, 0, -11, -4, -7, 20, 19, 22, 12, 5, -1, -23,
-    -44, 14, -29, -16, 10, 4, 21, 9, 10, 3, -11, 0, 6, 4, 6, 3,
-    19, 1, 7, 1, 5, 14, 20, -1, -5, -10, -4, -15, -40, -14, 4, 10,
-    6, -2, 22, -18, 4, 18, 3, 4, 11, -9, -9, -3, -10, 11, 19, 32,
-    17, 13, 12, -9, -7, -12, -10, -5, -35, -33, -17, -8, 3, 4, -14, -20,
-    11, 9, 5, 7, 5, -19, -15, -24, -29, -23, 5, 25, 28, 14, 1, -16,
-    -4, -9, -20, -17, -33, -14, -26, -24, 4, 21, -8, -5, 21, -12, -9, 0,
-    -2, 3, -10, -23, -27, -19, 0, 3, 23, 25, -11, 2, -11, -12, -15, -21,
-    -26, -3, -17, -7, 7, 6, 19, 6, 15, -13, 2, 4, 7, 2, 10, -4,
-    -20, -14, 5, -3, 10, 17, 7, 12, 3, 4, 10, -3, -31, -6, -16, -18,
-    2, 4, 3, -12, 0, 3, 13, 4, 23, 2, 2, -10, -16, -3, 7, 11,
-    8, 10, 17, 10, 4, -6, -3, -12, 11, -3, -24, -39, 1, 19, -7, -2,
-    -11, -4, -4, 12, 21, 6, 0, -5, -27, -15, 16, 18, 13, 8, 14, 4,
-    -9, -15, -8, -12, 8, -34, -27, -38, 4, 12, 7, 3, -2, -7, -10, -6,
-    3, 10, -12, -4, -24, -1, 26, 22, 11, 15, 9, 3, 11, 0, -8, -4,
-    -11, -32, -14, 17, 7, -11, -11, 3, -20, -16, -2, -8, 11, 15, -6, -15,
-    -29, -9, 18, 22, 26, 1, 10, 24, 4, 8, -6, 12, 7, -21, -30, 22,
-    2, -9, -31, -15, -33, -17, 1, -1, 3, -7, -13, -25, -8, 1, 21, 24,
-    26, 20, 14, 23, 5, 2, 4, 8, 13, 5, -26, 1, 5, -7, -27, -15,
-    -21, 12, 1, -2, 8, -5, -16, -10, -4, -5, 4, 3, 16, 11, 16, 15,
-    22, 12, -5, -33, -32, -11, -24, -1, -2, 4, -42, -25, -10, -3, -3, -6,
-    -14, -17, -19, -14, -4, -1, 0, -3, 13, 11, 4, 14, 27, 30, 8, -29,
-    -1, 8, 3, -4, 2, 1, -20, -30, -7, 10, 12, -6, -47, -34, -32, -17,
-    -8, 1, -15, 4, 5, -7, 14, 17, 21, 19, 3, -16, 5, 5, -10, 4,
-    3, 0, 12, -1, 20, 15, 14, 13, 4, -1, 20, 34, 16, 1, -20, -8,
-    0, -9, -10, 3, 39, 32, 8, 8, -28, -6, -2, 1, -2, -4, 10, -1,
-    41, 50, -11, -10, 24, 42, 17, 18, 26, 15, 22, -6, -1, -10, 10, 11,
-    9, 12, -11, -12, -24, -5, -12, -3, -2, 1, -1, 1, 43, 59, 47, 23,
-    37, 63, 36, 16, -1, 2, 50, 30, 29, 52, 32, -1, 21, 47, 37, 26,
-    26, 3, 1, -4, -2, -3, -4, 3, 0, 2, 18, 19, 19, 14, 35, 30,
-    16, 3, 32, 43, 27, 12, 7, 35, 21, 33, 37, 11, 3, 3, 0, -1,
-    2, -2, -3, -1, 4, -5, -1, 3, -3, 2, -1, -2, -15, -12, 13, 5,
-    0, -3, -2, 0, 4, -1, -3, 2, -2, 4, 4, 2, -1, 1, 3, -3,
-    0, -7, -14, -23, -15, -5, -14, -16, -23, -26, 20, -9, 6, -4, -7, -22,
-    -23, -24, -15, -21, -2, -1, 1, 2, 2, -4, 2, 0, -10, 7, -13, -24,
-    8, 24, 17, 0, 3, 23, 34, 38, -2, -24, -10, -12, -1, 3, -1, 10,
-    15, 6, 4, 4, 0, 5, 4, -30, -24, -12, 5, 8, 4, 21, -2, 19,
-    20, 16, 4, 12, -2, -9, -37, -17, -49, -14, 16, 7, 4, -18, -16, -3,
-    -2, -2, -24, -45, -17, 24, 34, 26, 34, 44, 38, 4, 9, -1, -5, 2,
-    20, 12, -2, 4, -2, -14, -4, -18, -52, -48, -34, 0, -1, -3, -16, 10,
-    45, 25, 34, 18, 11, 2, 17, -17, -30, -49, -33, -17, 19, 28, 29, 15,
-    -9, 17, 26, 38, 21, 1, -5, 0, -3, 14, -5, 34, 35, 35, 26, -13,
-    -11, -4, -29, -34, -52, -63, -46, -2, 21, 24, 16, 0, -2, -22, 11, 9,
-    -13, 25, -16, 8, -4, 15, -9, 23, 25, 3, -14, -14, -7, -22, -25, -28,
-    -42, -55, -20, 14, 21, 23, -1, -17, 8, -3, 19, -18, -39, -17, -30, 13,
-    37, 4, 8, 16, 17, 3, -1, -9, -17, 4, -2, -29, -47, -41, -16, 18,
-    36, 23, 10, -16, -3, -3, -18, -14, -40, -43, -15, -3, 3, 13, 2, 15,
-    -20, 1, -23, -14, -12, -7, -17, -39, -32, -31, -23, 27, 39, 9, 3, -11,
-    -7, -3, -26, -51, -13, -51, 3, -21, 1, 28, 2, 6, -6, -2, -20, -1,
-    3, -12, -18, -27, -26, -56, -33, 30, 31, 19, 7, -11, -15, -15, -19, -42,
-    -8, -18, 5, -11, 1, 2, 37, 5, -18, 1, 9, 0, 9, -1, -16, -46,
-    -53, -52, -2, 16, 19, -2, -7, -3, -17, -11, -4, -29, -46, -25, -45, -26,
-    -1, -2, 29, 4, -25, -1, -5, -1, -4, -11, 11, -11, -24, -9, -18, -18,
-    2, -10, -22, -6, -3, 2, 17, -21, -7, 0, -9, -20, 2, -10, 10, 3,
-    -18, -5, 4, -4, 12, 4, 3, 13, 20, 15, -13, -7, -9, -5, -14, 7,
-    5, 8, 24, 25, 9, 5, 3, 35, 0, -1, 4, 9, -16, 16, 13, 13,
-    12, 17, 22, 21, 32, 16, 17, 5, 18, -2, -4, -3, -3, 16, 21, 8,
-    24, 41, 67, 37, 4, -6, 42, 42, 15, 29, 7, 16, 2, 12, 15, 19,
-    37, 33, 24, 12, 16, 2, -7, -3, -9, 8, 11, -1, 9, 39, 60, 38,
-    -5, -3, 37, 39, 24, 17, 12, 31, 10, 24, 6, 8, 20, 8, 18, 20,
-    11, 11, 5, 4, 12, 44, 10, -2, -12, 39, 99, 46, 1, 1, 29, 19,
-    25, 15, 19, 19, 20, 36, 15, 9, -4, -9, 8, 8, 7, 4, 7, -11,
-    1, 27, 17, -8, -34, 33, -3, 44, 12, 11, 22, 2, 29, 13, 12, 10,
-    15, 31, 20, 0, 2, 5, -2, 15, 15, 9, 2, -11, -7, 6, -11, -6,
-    7, 23, -8, 32, 11, -18, 15, 22, 28, 15, 11, 23, 7, 17, 2, -10,
-    -10, -4, -4, 28, 32, 19, 8, -3, 5, 8, 5, -6, -19, 32, 43, 22,
-    3, -28, 39, 30, 22, -5, 4, 20, 25, 19, 7, 6, -5, -25, -15, 19,
-    40, 33, 31, 15, 30, 21, 15, -12, -21, -28, 45, 0, 11, 14, 31, 40,
-    12, 10, -6, 3, 11, 9, 7, -9, -13, -23, -10, 0, 3, 29, 13, -5,
-    -3, -1, 3, 6, -9, 12, 25, 2, 18, 6, 38, 30, -18, 12, -8, -23,
-    -11, -22, -9, -6, -26, -13, -17, -10, -18, -11, -12, -14, -8, 4, -4, -18,
-    -19, -15, 1, -2, 0, 4, 19, -4, -29, -31, -39, -32, -14, -27, -12, -8,
-    -13, -7, -22, -24, -35, -36, -16, -9, -1, 6, -18, -30, -53, -34, 20, -2,
-    -4, 0, 13, -23, -32, -37, -42, -44, -49, -34, -45, -28, -52, -40, -35, -29,
-    -29, -16, -9, -23, -30, -27, -28, -40, -9, 8, 12, -1, 4, 1, -5, -2,
-    -16, -35, -39, -55, -50, -33, -48, -25, -40, -45, -30, -15, -34, -9, -15, -52,
-    -42, -27, -19, 10, 3, 8, 15, 3, -3, -4, -5, -4, -17, -40, -36, -29,
-    -18, -20, -9, -34, -70, -35, -25, -35, -55, -43, -35, -38, -71, -53, -54, -53,
-    -22, 3, 2, 1, 0, -1, -3, 4, 3, 3, -11, -16, -20, -21, -16, -17,
-    -15, -7, -44, -21, -40, -16, -14, -24, -22, -25, -18, -14, 0, -1, 2, 2,
-    2, 4, 4, -4, 3, -2, -1, -5, 1, 0, 0, 3, -7, -1, 7, -1,
-    2, -3, -4, 2, -1, -3, 3, 1, -1, -1, -1, 4, -1, -1, -4, 3,
-    4, 0, -8, -11, -9, -11, -28, -26, -34, -36, -7, -14, -13, -20, -10, -12,
-    -19, -13, -2, -6, -4, 0, 3, 2, -2, -4, 1, 4, -16, -17, -13, -18,
-    -4, -16, -2, -26, 9, 16, -10, -2, 9, -7, 14, -5, 11, 2, 3, 8,
-    9, 12, -1, 0, -4, 4, -5, -3, 1, -12, 12, -3, 9, -21, 6, 3,
-    18, 1, -12, 30, 5, -4, -10, -5, -3, -5, -9, -9, 5, -4, -15, 2,
-    3, 5, -14, -40, -15, 4, 32, 28, 13, 14, 37, 30, 20, 23, 29, 23,
-    14, 7, 3, 2, -13, -16, 2, 12, 9, 7, -6, -21, 1, -4, -11, 34,
-    -5, -19, 5, 9, -4, 4, 9, 12, 26, 25, 3, 1, 5, 10, -9, 2,
-    12, 3, 7, 8, -2, -2, -19, -19, -4, 7, -23, 10, -12, -1, -2, 3,
-    13, 15, 15, 1, 13, 5, 2, -15, -18, -14, -13, -11, -9, -3, -4, -5,
-    -7, 0, 3, -24, -4, -3, -25, 10, 7, 14, -1, 8, 20, 14, 8, 2,
-    6, -7, -11, -23, -31, -17, -23, -19, -25, -11, 1, -3, -21, -1, 15, -23,
-    -19, -24, -11, 8, 13, 17, 6, 9, -6, 0, -2, -1, 8, -2, -8, -13,
-    -27, -16, -5, -4, -5, -27, -8, 5, -5, 7, 8, 10, -11, -30, 10, -7,
-    -2, 19, 0, 1, 4, 0, -4, -3, 6, 6, 7, -5, 4, -6, 18, 17,
-    -1, -21, -8, 5, 5, 21, 45, 13, -8, -5, -4, 9, 19, 10, -1, 0,
-    -4, 4, 15, 7, 29, 10, 2, -4, 0, 10, 12, 29, 1, -25, -30, -3,
-    -2, -5, 35, 15, 4, -5, -15, -9, 12, -5, -8, -8, -16, 1, 1, 8,
-    25, 11, 0, 5, 16, -3, 3, 11, -8, -17, -24, -15, -3, -9, 17, -6,
-    -3, -4, -25, 17, 7, -18, -8, -11, -10, 4, 7, 4, 25, 15, -2, -6,
-    -2, 3, -14, 2, 8, 2, 2, -4, 10, 1, -3, -12, 1, -10, -18, 5,
-    -28, -32, -29, -23, -4, 1, -9, 13, 20, 17, 14, 5, -3, 8, -6, -7,
-    20, 5, 5, -7, 11, 6, 23, 36, 2, -7, -13, -17, -43, -61, -47, -39,
-    -19, -34, -27, -17, -13, 5, 30, 10, 0, -5, -18, -7, -5, -11, -2, -9,
-    -6, 6, 33, 22, 0, -12, 25, -17, -22, -52, -39, -56, -46, -51, -50, -31,
-    -16, 10, 28, 10, 0, -15, -19, -9, -9, 2, -9, -5, 6, 20, 26, 32,
-    -6, -2, 23, -6, -29, -17, -18, -31, -31, -39, -32, -33, -23, 9, 21, 6,
-    5, -6, 6, -1, 1, 19, 10, 8, 12, 46, 56, 25, 1, -2, 11, 0,
-    -27, -1, 7, -3, 0, -4, -10, -16, -20, 0, 8, 11, 12, 8, 13, 16,
-    11, 21, 15, 7, -1, 29, -1, 22, -24, 1, 3, 11, -4, 11, 19, 6,
-    8, 22, 14, 2, -8, 10, 14, 7, 16, 6, -3, 0, 14, 17, 13, 22,
-    30, 14, -3, 38, 7, -6, 11, 26, 6, 2, 12, 12, 19, 15, 12, 15,
-    -7, 15, 8, -3, 21, 12, -7, -13, -2, 0, 5, 8, -11, 22, 34, 19,
-    -2, -12, 37, 46, 3, 0, 13, 12, 33, 14, -1, 1, -13, 2, -12, -8,
-    6, 15, 12, -11, -4, 4, 20, 25, -3, 4, 15, 3, 6, 10, 34, 35,
-    15, 15, 4, 16, 12, 7, 9, -3, -5, 0, -1, -6, -10, 11, 10, 5,
-    5, 24, 28, 38, 19, 7, 5, -5, 6, 3, 39, 20, 12, 14, 13, 2,
-    0, -5, 2, 12, 1, -7, 2, -11, -4, 11, 5, -1, 18, 14, 12, 27,
-    46, 25, 22, -4, -1, 3, 9, 13, 15, 3, -9, -13, -1, 18, 10, 7,
-    5, 8, 5, 15, 20, 6, 1, 14, 11, 1, 13, 19, 43, 28, 38, -3,
-    -2, 4, -16, -13, -29, -34, -16, -23, -3, 20, 15, 17, 10, 3, 17, -3,
-    -13, -13, -13, 12, -6, 13, 12, 13, 34, 12, 11, 4, 1, -4, 2, -9,
-    -21, -37, -49, -56, -27, -6, -14, -32, -3, 16, 6, -9, -31, 3, 5, -5,
-    -1, 13, 15, 18, 20, -3, 4, 0, 5, 3, -4, -6, -7, -15, -27, -35,
-    -23, -45, -19, -36, -73, -72, -76, -67, -30, -18, -2, -17, -15, -30, -26, -4,
-    -2, 4, -4, 0, -4, 1, -2, -4, 2, 3, -6, 1, -2, -13, -37, -31,
-    -15, -3, -21, -23, -24, -21, -10, -9, -6, -6, -10, -4, -3, -4, -1, 2,
-    2, -2, -2, 0, -3, -3, 4, 1, 4, 2, -1, 2, 16, 12, -8, 0,
-    2, -4, -2, -4, 4, 1, -4, 1, 2, -3, 3, 0, 1, -1, 1, -3,
-    -5, 4, 17, 23, 18, 9, 39, -1, -1, 15, -6, -25, -11, -15, 11, 30,
-    37, 27, 16, 10, 1, -1, 4, 4, -3, 4, 12, 2, 20, 15, 14, 8,
-    35, 39, 0, 3, 19, -21, 1, 1, -16, 0, 21, 1, 13, 23, 14, -2,
-    0, -1, -4, -3, -4, -1, 13, 30, 28, 20, 16, 39, 20, -7, -1, -11,
-    -17, -8, 19, 22, 8, 6, 10, 11, 7, 30, 30, 6, -17, 19, 8, -3,
-    3, 5, 17, 53, 30, 19, 4, 13, 26, -2, 14, 3, -3, 3, 15, 7,
-    7, 7, -4, -18, -11, -1, 3, -14, 11, 33, 30, 16, -3, 1, 6, 15,
-    26, 7, 11, 33, 23, 21, 3, 1, 11, 11, 18, 4, 22, 21, 2, 4,
-    -17, -11, -21, -14, -11, 64, 18, 21, -4, 5, 7, -9, 32, 1, -3, 14,
-    13, 27, -6, -6, 15, 10, 8, 19, 14, 12, -5, 1, -25, -13, -15, -7,
-    -8, 26, 28, 31, -2, 33, 24, 5, 16, 1, 4, 5, 10, 3, -14, -7,
-    13, 6, 3, 11, 0, 2, -17, -28, -29, -15, -25, -17, -21, 3, 40, 30,
-    -10, 26, 2, 21, 15, -2, -1, 8, 2, 1, -17, 5, 5, 11, -5, -12,
-    -12, -27, -28, -16, -32, 1, 21, -9, -20, 36, 59, 8, 12, 36, 4, 20,
-    23, 1, -2, 5, -4, -8, -22, 5, 2, -5, -4, -13, -20, -13, -8, -10,
-    -12, 4, 20, 25, -3, 28, 6, 15, 15, 4, -11, 22, 12, -3, 3, -2,
-    -14, -16, -10, -5, 3, -10, -8, -22, -28, -20, -1, 7, 7, 3, 12, 17,
-    11, -7, -11, 24, -2, 5, -4, 53, 20, 16, 13, -3, 11, 14, 17, 9,
-    16, -2, 3, -11, -13, -1, 14, 14, 0, -6, 21, -3, -1, 8, 30, -4,
-    3, 7, -1, 22, -8, 11, -1, 10, 13, -8, 3, -1, -7, 5, 13, 25,
-    27, 26, 29, 15, -9, -3, 6, 7, 14, 4, -14, -8, 2, 10, 16, 4,
-    -11, 17, 5, -6, 11, -8, 8, -5, -6, 27, 28, 40, 51, 30, 25, 9,
-    5, 6, -3, -5, 16, 7, -16, -10, -2, 10, -5, 10, -17, -11, -15, -17,
-    -7, -13, -4, -2, 12, 19, 31, 43, 47, 45, 18, 24, 0, 7, 11, -10,
-    -9, 12, -49, -17, 2, 4, -23, 23, -16, -21, -1, -17, -7, -12, -3, 13,
-    0, 11, 28, 32, 26, 32, 10, 24, 20, 18, 22, 3, -11, 15, -22, -7,
-    1, 8, -13, 4, -17, -9, 2, -7, 8, 0, -2, 7, -5, 12, -4, 5,
-    12, 13, 23, 17, 10, 21, 18, 7, 19, 18, -50, -34, 2, 4, 1, 3,
-    -22, -3, 0, 6, 14, -9, -10, -5, -21, 1, -37, -24, 1, 8, 14, 4,
-    2, 21, 10, 15, 28, 16, 9, -37, -26, 5, -1, 11, -4, 4, 8, 2,
-    0, -3, -19, -17, -16, -15, -39, -32, -3, 6, -6, 0, 24, 24, 2, 2,
-    8, 7, 27, -39, -18, -3, -17, 9, 2, 11, 3, 3, 1, -7, -8, -18,
-    -30, -30, -9, -19, -19, -3, -7, -2, -1, -2, -3, 7, 4, -24, -23, -35,
-    -4, -3, -26, 11, 3, 8, -3, -1, 6, 0, -9, -16, -24, -6, 0, -13,
-    -32, -15, -9, -8, 6, -2, -4, 7, -3, -31, -21, -1, -12, -3, 3, 4,
-    -6, 10, 4, 3, 12, 13, -1, 3, 0, 3, 9, -11, -13, 6, -4, 6,
-    -3, -18, -1, -6, -3, -28, -16, 1, -12, -1, 6, 12, 19, -29, -6, 3,
-    -1, 10, 9, 13, 4, -1, -23, -14, 2, 1, 2, 3, -19, -10, -24, -9,
-    0, -10, -26, 2, -4, 2, 33, 23, 24, -7, 0, 3, 3, -10, -8, 8,
-    -23, -17, -25, -23, -5, -9, 12, 15, 1, -24, -23, 0, 22, -12, -19, -5,
-    3, 2, 23, 26, 8, 14, 43, 39, 35, 10, 14, 20, -10, -15, -22, -14,
-    19, 5, 0, 16, 10, -19, -20, -19, -36, -23, -21, -2, 3, 3, -6, -13,
-    20, 68, 43, 31, 29, 30, 63, 61, 36, 12, -1, 3, 20, 28, 48, 44,
-    -9, -33, -40, -28, -19, -10, -7, -2, 4, -1, -4, -19, -31, 27, 40, 32,
-    30, 26, 37, 26, 19, 27, 21, 19, 27, 34, 39, -6, -27, -7, -7, 7,
-    10, -2, 1, -3, -5, 2, -4, 0, 13, 11, -12, -17, -17, -5, -2, -14,
-    -7, 12, -4, -9, -5, 31, 25, -12, 2, 32, 18, 8, -4, 1, 3, -3,
-    3, 0, 3, 2, 4, -4, -1, 0, 2, 2, -2, 4, -13, -10, -2, -3,
-    -4, -2, 3, -3, 2, -4, -3, 4, -4, 2, 2, -2, 0, 1, -1, -2,
-    -3, -7, -7, -7, -16, -16, -17, 0, -3, 12, 19, -23, 4, 9, -15, -18,
-    -19, -16, -11, -10, -3, 4, -3, 2, 2, 3, -15, -4, -12, -20, -8, -7,
-    -13, -15, -33, -45, -4, -2, -8, -30, -36, -45, -32, -32, -38, -33, -35, -35,
-    -8, 8, -2, -3, 1, 0, -19, 19, 25, -24, -33, -22, -17, -20, -12, -25,
-    -29, -25, -8, -4, 7, -7, -17, -13, 28, 5, -14, -23, -13, 20, 13, -4,
-    1, 0, -35, 16, -33, -44, -37, -18, -43, -21, -46, -28, -20, -23, -23, -5,
-    -9, 4, 9, 5, 18, 27, 15, 8, 37, 31, 14, -37, -1, -3, -37, 21,
-    -48, -37, -21, -15, -18, -6, -10, 12, 0, -9, 6, 5, 3, 25, 18, 0,
-    8, -6, 3, -23, -8, 12, -8, -30, 4, -6, 12, -32, -33, 7, -9, -11,
-    -1, -1, 4, -2, -7, 1, 15, 7, 18, 11, 9, 21, 20, 22, 16, 9,
-    -3, 1, 5, -30, 3, -26, 12, -15, -39, 6, 4, -12, 2, 22, 13, 3,
-    -11, 7, -14, 6, 7, 9, 6, 13, 9, 2, 7, 33, 26, 15, -7, -27,
-    36, -23, 37, 6, -26, -15, 10, -2, 5, 26, 12, 6, 5, 5, -1, 10,
-    17, -3, 15, -4, 9, -6, 2, 32, 46, 52, 5, 12, -6, -11, 20, -15,
-    -15, 2, 4, -17, -10, 5, 4, 4, 11, 11, 0, -4, -2, 4, -1, -7,
-    5, -8, -2, 13, 42, 41, 36, 1, -8, -6, 7, -10, -3, 20, 10, -2,
-    4, 4, 12, -1, 14, -3, 2, -7, -1, -7, 1, -8, -11, 5, 20, 7,
-    23, 35, 53, -2, 2, -12, -30, -11, -11, 7, 27, 16, -3, -8, 5, 7,
-    5, 2, -1, -8, -2, -3, 4, -4, -3, 6, 1, -4, 24, 12, 41, -11,
-    -9, -11, -13, 17, 40, 28, 23, 10, -10, -8, 8, -1, 6, 1, -2, -8,
-    -28, -8, 1, 28, 25, 15, 0, 9, 4, 6, 37, -15, 1, -12, -16, 27,
-    50, 22, 14, 22, -2, 6, 9, 7, 3, 5, -4, -4, -41, -24, 0, 13,
-    20, 14, 20, 11, -10, 13, 6, 11, -1, -15, -44, 8, 39, 36, 21, 27,
-    15, 0, 1, -4, 0, 0, -1, -5, -40, -28, -9, -7, 16, 16, 6, 23,
-    24, 18, -28, 1, -1, -13, -27, -8, 38, 26, 23, 23, 19, 1, -2, -13,
-    -12, -21, -6, -4, -37, -19, -2, -11, 4, 10, 9, 15, 27, 8, -12, -1,
-    -8, -14, -29, 3, 34, 0, 6, 12, 16, -7, -16, -13, -5, -14, 12, 7,
-    -12, -5, -13, -14, 7, -7, -13, -7, -4, -9, -35, 21, -2, -24, -14, -3,
-    32, 3, 8, 16, 9, 11, 1, -1, -5, -9, 11, 17, 4, 4, -4, -9,
-    -11, -8, -8, 8, 4, -17, -26, 33, -21, -16, -13, -32, 7, -2, 5, 6,
-    15, -7, 4, 16, -7, -5, 5, 16, 21, -2, 5, 1, -13, -6, 9, 11,
-    23, -24, -13, -24, -3, 16, 7, 5, 15, 4, -6, 2, 6, -12, -5, -3,
-    4, 6, 15, 6, 8, 6, 12, -6, 0, 9, 9, -19, -2, -24, -9, -16,
-    -2, 23, 11, -6, 10, -12, -7, -11, 10, 10, -2, 3, 3, 19, -11, -12,
-    -3, 1, -12, -4, -9, 3, 7, -16, -30, -25, -15, -3, -8, -1, -26, -22,
-    5, 6, -5, -11, -4, 3, -14, -4, -6, -9, -20, -4, -5, -9, -23, -15,
-    -11, -7, 26, 5, -10, 17, -1, 4, -11, -12, -14, 4, -3, -1, 13, 1,
-    10, -4, -12, -9, -1, -1, 3, -5, -4, 1, 11, 7, -10, -3, 35, 11,
-    -5, 3, 9, 7, 3, 1, -6, 25, 19, 7, 10, 2, 21, 8, 13, -2,
-    2, 9, 6, 0, 5, 12, 12, -5, -28, -10, -5, -10, -11, 11, -12, 4,
-    3, -3, -23, 27, 13, 13, 12, 25, 31, 17, -13, -17, 18, 29, 8, 1,
-    16, 0, 14, -4, -3, -2, 1, 0, -9, -24, -26, 1, 1, -5, 14, 14,
-    -5, -7, -4, 1, -19, -23, -9, 0, -35, -1, -34, -7, 9, 11, 18, 10,
-    -8, 3, 33, 35, 22, 1, -9, -2, 4, -4, 1, -17, 43, 31, 16, -35,
-    -56, -54, -49, -1, 30, -4, -30, -24, -15, -9, -6, 2, -13, -30, -15, -31,
-    -22, 1, -3, 1, 2, 3, 2, -1, -12, -19, -19, -10, -17, -28, -26, -4,
-    -3, -32, -46, -2, -17, -59, -47, -22, -27, -31, -26, -26, -4, 3, -3, -1,
-    -2, -1, 3, 4, -2, 0, -2, 1, 3, -2, 3, -4, 3, 13, 13, 1,
-    5, -3, 0, 0, -3, -4, 4, -1, -2, -2, -4, 1, 2, 4, -2, -5,
-    -3, 2, -1, -3, 1, 7, 8, 1, -17, -29, -16, -13, 13, 9, -9, -18,
-    -10, -3, 3, 0, 2, -1, -2, 2, 5, -2, 3, 4, -8, 3, -1, -3,
-    12, 12, 17, 6, 37, 6, -6, -6, -15, -37, -20, -35, -38, -19, -10, 10,
-    12, 7, 4, 1, -4, 0, 2, -17, -12, 6, 3, -22, -12, -18, 4, 19,
-    -5, -19, -22, -9, -16, -31, -14, -3, 13, -9, -5, -30, -24, 1, -5, -1,
-    -1, -3, 16, -21, -6, 24, 23, -5, -28, -29, -19, -6, -10, 7, -2, 1,
-    -7, 3, 3, -2, 24, -14, -28, -47, -37, -20, -18, -12, 3, -3, -14, -9,
-    24, 51, 28, 15, 41, 26, 18, 9, 16, 32, 22, 10, 21, -1, 20, 25,
-    7, 5, -11, -18, -55, -23, -18, -12, 0, 17, 31, 12, 24, 47, -2, 0,
-    18, 47, 38, 10, 17, 6, 9, -2, -6, -11, 0, 33, 15, 4, -17, -43,
-    -42, -30, -7, 0, 0, 38, 44, 39, -7, -2, 1, 11, 11, 19, 7, 3,
-    0, 17, 3, -15, -12, 9, 21, 36, 32, 14, 8, -33, -58, -55, -3, -2,
-    23, 22, 26, -2, -20, -13, -12, 13, 10, 19, 9, 8, 20, 22, 32, 17,
-    20, 29, 32, 30, 21, -2, 20, 11, -40, -37, -9, -2, 14, 1, 3, -3,
-    -28, -2, 9, 13, 5, 5, 1, -15, 26, 18, 16, 9, 23, 30, 25, 18,
-    19, -9, 17, 20, -47, -6, -15, 7, 16, -7, 11, 0, -23, 7, 9, 6,
-    -2, -12, -23, -32, -21, 3, -13, -13, 14, 30, 16, 11, 7, -1, 1, -2,
-    -46, 3, 26, 12, 7, 4, 10, -1, -26, 30, 6, -10, -11, -29, -42, -25,
-    3, -24, -39, -22, 0, 18, 7, 7, 5, 0, 8, 9, 3, -4, 21, 8,
-    1, 8, -7, -23, -30, 6, -8, -15, -25, -50, -38, -32, 11, -41, -63, -32,
-    8, 3, 2, -31, -20, -3, -18, 1, 22, 17, 15, 4, 3, -1, 9, -20,
-    -38, -18, -19, -29, -27, -18, -13, -1, -28, -27, -47, -18, -2, 8, 6, -44,
-    -24, -23, -45, -18, -1, -12, 13, 0, 4, -4, -15, -4, -26, -56, -40, -27,
-    -30, -18, 9, -8, -16, -35, -30, -13, -10, 7, 11, -19, -38, -27, -29, -23,
-    6, 6, 31, 7, 1, -7, -28, -6, -34, -70, -58, -38, -40, -15, -9, -26,
-    -35, -14, -17, -6, -15, -5, -15, -14, -20, -1, -11, 3, 22, 18, 46, 9,
-    3, 0, -14, -2, -31, -39, -29, -15, 1, -9, -10, -10, -5, 1, -9, 0,
-    4, 7, 1, 12, 0, 6, -12, -16, -22, 22, 22, 1, 3, -1, 17, 2,
-    -13, -16, -10, -15, -4, -7, -11, -5, 20, 9, 0, 12, 9, 14, 9, 29,
-    18, 3, 5, -24, -4, 30, 39, -18, -28, 10, 10, 32, 7, 13, 4, 12,
-    10, -5, -11, 0, 20, 17, 6, 17, 12, 13, 10, 30, 10, -7, -12, -10,
-    -2, 31, 45, -15, -10, 20, -13, 22, 14, 3, 15, 3, 9, 0, -6, 7,
-    11, 30, 40, 26, -8, 2, -22, -1, -6, -20, -24, -13, -2, 18, 29, -4,
-    -3, 29, 7, 35, 23, 7, 1, 15, 10, -1, -2, 14, 14, 19, 30, 16,
-    -22, -20, -23, -5, -8, -12, -19, -17, -14, 11, 6, 3, -8, 19, 42, 20,
-    29, 18, -8, -5, -4, 0, 14, 21, 21, 15, 12, -9, -9, -5, -11, 4,
-    0, 1, 26, 13, 13, 19, -8, -1, -10, -4, 50, -4, 17, 20, -7, 6,
-    0, 2, 3, 10, -1, -2, -8, -7, 10, 16, 3, -2, -10, 6, 33, 16,
-    2, 17, -1, 0, -5, 0, -8, -9, 25, 17, 14, 8, -7, -5, -5, 1,
-    -2, -2, -4, -3, 14, -2, -15, -16, 5, 21, 27, 18, 4, 11, 0, 2,
-    -2, 0, 17, 9, 24, 17, 36, 19, 20, 3, -11, 2, -17, 8, 16, 8,
-    -13, -18, -43, -26, -36, -6, 2, 5, 37, 9, 19, -2, 0, -4, -20, 15,
-    17, 15, 17, 19, 27, 13, 3, 23, 25, -5, 8, 24, 10, -20, -48, -62,
-    -42, -15, -19, -18, -10, -10, 11, 3, -2, -2, 0, -19, -47, -38, -11, 37,
-    37, 7, 13, 7, 22, 40, 27, 36, 43, 16, 14, 20, -31, -41, -19, 2,
-    -11, 0, -4, -1, -4, -3, 1, 1, 12, 21, 25, 5, 13, 11, 38, 26,
-    14, 8, -2, 44, 26, 24, 12, 3, -2, -12, -17, 2, -1, 3, 2, 1,
-    3, 2, 0, -3, 4, -2, 3, 1, -1, 0, -1, 0, -16, -10, 0, 3,
-    4, 3, -4, -1, -2, -1, 2, -1, -3, 4, 0, -4, 2, -1, -1, -4,
-    2, 3, -13, -13, -2, -6, -30, -19, -35, -63, -5, 12, -34, -37, -47, -13,
-    -20, 0, -9, -5, 0, 0, -3, 2, -2, -1, 3, 2, -18, -21, -19, -29,
-    -2, 17, 29, 18, 41, 37, -2, -4, -15, -75, -63, -28, -21, -9, -11, -10,
-    15, 17, -4, 2, -3, 5, 0, 0, -12, -20, 12, -2, 1, -14, -16, 3,
-    5, -3, -21, -24, -20, -31, -38, -24, -5, -27, -26, -7, 17, 23, 2, 2,
-    2, -2, -1, -25, 3, 19, 24, 14, 26, -24, -7, 14, 27, 21, -3, -2,
-    -15, -42, -63, -65, -58, -27, -50, -45, -10, -2, 3, -1, -3, 1, -19, 36,
-    47, 24, 41, 38, 20, -4, 8, 25, 27, 19, -7, 10, -18, -41, -36, -73,
-    -113, -59, -47, -12, 28, 13, -28, -12, 4, 4, -16, 40, 6, -21, 23, 19,
-    -6, 8, 11, 10, 7, 9, -1, 7, 9, -14, -44, -99, -127, -65, -50, 9,
-    11, 7, -14, -4, 5, 16, -14, 40, -5, -14, -5, -6, 2, 2, 3, 1,
-    -5, -3, 25, 36, 26, -7, -43, -90, -106, -80, -38, -33, -73, -46, -23, -19,
-    -5, 8, -29, 17, 30, 1, -34, -16, -11, -1, 0, -24, -11, 13, 58, 69,
-    35, -3, -40, -83, -99, -87, -77, -60, -46, -39, -12, -23, -1, -2, 3, 12,
-    8, 31, -24, -2, -35, -17, -11, -4, 19, 41, 75, 90, 47, -7, -39, -82,
-    -118, -86, -77, -47, -28, -30, -4, -21, -5, 2, 6, 14, -12, -13, -9, 7,
-    -43, -41, 9, 23, 27, 55, 73, 72, 35, -8, -47, -92, -111, -72, -39, -5,
-    9, 22, 34, 1, 13, 17, 1, 22, 3, -15, -15, 1, -10, -3, 28, 22,
-    22, 47, 65, 36, 0, -15, -27, -81, -63, -40, -17, 5, -23, 5, 1, 39,
-    3, 12, -1, 5, -1, -10, -28, -13, 6, 13, 16, 8, 16, 41, 47, 21,
-    15, -2, 6, -55, -45, -32, -16, -14, 10, 39, 0, 37, 1, 9, 25, -4,
-    0, -3, -4, -14, 1, 16, 15, 13, 2, 12, 28, 6, 15, 35, 13, -40,
-    -41, -9, -5, 12, 50, 64, 23, 20, -2, 12, 15, 41, 12, -8, -43, -37,
-    -2, 14, 10, 1, -7, -2, 21, 9, 11, 12, -15, -27, -27, -5, 14, 11,
-    5, 33, 70, 41, 11, -2, 8, 43, 15, 6, -25, -41, -16, 6, 2, 3,
-    -5, 15, 15, 1, 27, 7, -32, -27, -15, -3, 18, 17, 19, 1, 49, 42,
-    10, 14, 0, 45, 32, -12, -19, -4, -27, 6, 14, 7, -8, 6, 23, 4,
-    24, -9, -23, -16, -3, 1, 30, 27, 31, 2, 81, 44, -2, 19, -14, 4,
-    11, -21, -17, -27, -20, -12, 9, -8, -18, 9, 32, 12, 6, -19, -11, -2,
-    4, 0, 30, 11, 0, 29, 36, 39, -4, 15, -8, -12, 1, -13, -24, -15,
-    -12, -14, -2, -11, -19, 25, 25, 5, -18, -2, 15, 13, 11, 7, 30, 5,
-    18, 29, 20, 40, 11, 13, -2, -9, -6, -7, -17, 7, -10, -13, -3, -22,
-    -16, 25, 29, 7, -1, 4, 22, 10, 5, 2, 8, 11, 24, 46, 31, 34,
-    0, -4, -11, -3, -43, -18, 9, -3, -26, -11, -11, -8, 10, 23, 22, -4,
-    9, 9, 14, 2, -3, -15, 5, 0, 26, 25, 28, -5, 18, 23, -6, 16,
-    -14, -46, -17, -16, -16, -7, -8, -19, -9, -7, 3, -3, -6, -18, -2, -1,
-    -10, -10, -10, -20, -34, -7, 1, -3, 18, 7, -2, 37, 35, -5, -1, 3,
-    -1, -11, -15, -28, -16, 1, 4, -1, -18, -18, 7, -9, 11, 9, -16, -27,
-    -12, 1, -20, 5, 2, 2, 8, 51, 47, 6, -26, 1, -12, -21, -14, -8,
-    15, 13, 3, -7, -9, 10, 9, 3, 10, -2, -24, -20, -20, 1, 4, 2,
-    -2, -4, -1, 5, 30, -1, -28, -3, -4, -8, -10, 9, -4, 2, 0, -14,
-    -18, 23, 13, 23, -15, 27, 6, -15, -4, 31, 27, 3, -1, -4, 4, 2,
-    25, 28, 37, 19, -3, -47, -47, -25, -20, 0, 25, -11, -20, 6, 20, -29,
-    -25, 7, -14, -18, -11, 12, 10, 2, 1, -2, 4, -2, 4, -15, -14, -18,
-    -19, -10, -18, 18, 43, 22, 19, -5, -14, 49, 35, 22, 9, 9, 3, -19,
-    1, 1, -1, 3, 3, 4, 5, 4, -4, -3, 3, 10, 11, 16, -6, 10,
-    13, 16, -1, -14, -9, -7, -6, 29, 41, 32, 37, -2, -2, -2, 0, 2,
-    4, 3, -3, 3, 0, -4, 3, 4, 2, -3, -1, 1, 0, 1, -1, 0,
-    -1, 0, -2, -4, 3, 1, -4, 4, -3, 2, -1, 0, -3, 2, 2, -4,
-    -3, -1, 0, 5, -1, -3, -18, 3, 4, 22, 35, -7, -13, -12, -8, -7,
-    -8, -13, -17, -9, 1, 1, -3, 4, 1, -4, -3, 4, -16, -9, 8, -3,
-    20, 16, 8, -50, 17, 19, -11, -29, -28, -29, -17, -37, -39, -30, -29, -14,
-    14, 8, 1, -4, 4, 2, 5, -11, -10, -7, -6, -20, -8, 18, -19, -28,
-    5, -5, -27, -23, -27, -29, -29, -19, -48, -23, -11, -34, -19, 33, 9, 4,
-    2, -1, -11, -15, -10, 6, -6, -54, -67, -20, -53, -44, -4, -8, 8, -7,
-    -34, -2, 18, -8, -24, -5, 8, 0, -4, 16, 6, -26, -3, 4, -11, 2,
-    -28, -2, -22, -46, -33, -21, -19, 9, 29, 24, 7, -6, -20, 1, -4, 0,
-    -8, 8, -6, -43, -19, -3, -26, -30, -4, 4, 9, -1, -18, 2, -26, -31,
-    -27, -25, -8, 21, 35, 15, 4, -18, -23, -12, -2, 2, 5, 0, -5, -18,
-    -33, -2, -11, -20, 6, -25, 18, -28, -28, 12, 4, -35, -59, -25, 6, 33,
-    27, 12, -17, -20, -26, 0, 17, 4, 3, 0, 4, 4, 0, 14, 10, -21,
-    36, -8, 14, -13, -12, 14, 16, -25, -51, -18, 18, 40, 42, 22, -8, -24,
-    -27, 4, 12, 2, 9, -4, -11, 29, 37, 32, 27, 17, 13, -10, 28, 17,
-    5, 3, -5, -27, -40, -31, -11, 24, 45, 44, 11, -13, -12, 18, 19, -1,
-    -8, 25, 3, -1, 47, 40, 71, 14, 14, -6, 26, 21, 5, 4, -3, 5,
-    -19, -23, 12, 21, 43, 43, 25, 4, 4, 21, 17, 2, 1, 32, 3, -7,
-    27, -20, 66, 17, 7, 1, -22, -11, -1, -7, -3, 16, -14, -9, -18, 6,
-    30, 42, 25, -2, 2, 11, 11, 8, 10, 17, 21, 21, 49, 9, 59, -11,
-    0, 8, -34, -14, -12, -24, -22, -19, -11, -8, -20, -1, 32, 37, 4, -23,
-    -19, 8, 17, 15, 26, 32, 31, 31, 56, 36, 26, 5, 0, 3, -26, 2,
-    -41, -41, -47, -32, -20, 2, -4, 8, 18, 10, -5, -12, -10, 9, 8, -6,
-    15, 17, 4, 10, 36, 43, 41, 38, 4, -6, 4, 1, -41, -25, -45, -17,
-    1, -20, 7, -4, -7, 6, -2, -23, -5, 9, -3, -10, 3, 15, -6, 10,
-    30, 24, 30, 32, 4, -4, 1, 20, -16, -21, -19, -13, -12, -14, -9, 7,
-    20, 24, -6, -21, -22, 3, 1, -25, -8, 12, 10, 3, 19, 15, -13, 38,
-    6, -4, -13, 5, -14, -17, 8, -8, -14, -14, -8, 17, 36, 22, -21, -23,
-    -18, -3, -2, -6, -15, 5, 3, 15, -2, 9, 40, 38, -3, -5, -28, -5,
-    6, 20, 26, 3, -16, -1, 21, 43, 36, -11, -16, -14, -4, -12, 8, -2,
-    -15, -8, -7, 2, 19, 19, 18, 58, -34, -12, -23, -48, 10, 6, 20, -1,
-    -5, 14, 24, 21, 22, -21, -42, -30, -10, -31, -1, -1, 0, -8, -11, 12,
-    26, -2, 15, 34, 6, 7, 7, -12, 11, -3, 4, -3, 8, 6, 16, 20,
-    10, -22, -36, -7, -4, -12, -11, 2, -5, -11, -10, -17, -17, 16, 30, 7,
-    -2, -8, 17, -8, 4, 5, 14, -4, 21, 9, 22, 28, 19, -20, -32, -5,
-    -13, -9, -1, -8, -18, -31, -24, -22, -26, -8, 14, -6, -2, -10, 19, 15,
-    -3, 16, 9, -15, 7, 30, 31, 30, 0, -29, -25, -14, -20, -4, -4, -11,
-    -13, -29, -22, -20, 11, -13, -1, 8, 6, -7, 2, 3, -16, 4, 11, -1,
-    0, 17, 18, 31, 4, -14, -19, -16, -11, -24, 0, -16, -9, -27, -8, -11,
-    3, 12, -13, 3, -3, 0, -28, -24, -3, -2, 21, -5, 4, 20, 17, 15,
-    20, 12, 1, -9, -6, -1, -9, 20, 0, -16, -16, -8, -22, 15, -17, -2,
-    4, 1, -12, -41, -53, -29, -7, -8, 0, -1, 10, 26, 34, 42, 21, 0,
-    -4, -31, -14, 24, 7, 10, 2, -21, -11, 5, -17, -1, 2, 2, -2, 15,
-    -2, -27, -18, -33, -43, -6, 7, 14, 22, 33, 7, 6, -3, -33, -6, -28,
-    -9, -2, 0, -19, 4, 0, -1, -1, 3, -1, 2, -19, -21, -17, -14, -14,
-    -24, -26, -31, -8, 23, -1, -39, -12, 11, -22, -32, -14, -25, -28, 1, 9,
-    -7, -1, 4, 1, -3, -3, -2, 2, 14, 27, -12, -19, -17, -7, -4, -13,
-    -12, 22, -14, 11, 17, -22, -22, -3, -3, 0, -4, 2, 1, -2, -1, -1,
-    -4, 1, 2, -4, -3, -3, 2, 2, -2, 1, -1, -4, -4, 1, -2, -2,
-    1, 2, 1, 1, -3, 5, 4, 2, -1, -3, 2, -1, -2, 3, 3, -1,
-    2, 4, -2, -5, -5, -20, -21, 0, -7, -6, 21, -43, -24, -4, -6, -15,
-    -17, -4, -9, -9, 2, -1, 4, 3, 3, -1, 1, 1, -13, -12, -4, -5,
-    4, -8, -2, -58, -13, -3, -28, -41, -29, -27, 5, 0, -10, 4, 7, -9,
-    6, 18, 0, 0, -3, -3, -5, 12, 23, -5, 7, -2, 15, 27, 17, 7,
-    -5, -8, -14, 10, 17, 22, 7, 0, 7, 24, 24, -2, -10, -14, 0, -4,
-    1, 2, -9, -2, -1, -25, -31, -43, -41, 20, -22, -2, 28, 27, 20, 34,
-    9, -11, -13, -3, 19, 36, 44, 46, 33, 18, 24, -2, 1, 0, -13, 17,
-    -13, -27, -43, -60, -28, 2, 17, 19, 13, 4, 8, -5, -10, 4, 0, -20,
-    -14, 11, 13, -10, 19, -4, 34, 10, -1, -6, 26, 17, 15, 28, -36, -58,
-    -32, -15, 3, 26, 18, 2, -1, -34, -31, -22, -2, 1, -23, -23, -1, -9,
-    -7, -5, 31, 3, 5, -26, 44, 39, -12, -2, -24, -39, -24, 2, 22, 20,
-    7, 3, -23, -31, -24, -3, 31, 25, 1, -16, -7, -2, -5, 20, 28, -4,
-    43, 11, 59, 2, -19, 6, -17, -36, -43, -6, 18, 25, 6, -3, -22, -30,
-    -19, 7, 43, 18, 8, -5, -17, 8, 11, 32, 37, -7, 14, 24, -12, -24,
-    -7, 24, -21, -42, -28, -7, 7, 23, 17, 15, -22, -38, -29, 24, 50, 22,
-    1, 12, -4, -2, 23, 47, 15, 11, 11, 22, -13, -24, 7, 24, -26, -14,
-    -9, 3, 17, 46, 31, 7, -22, -59, -33, 35, 52, 27, -1, 12, 8, -33,
-    13, 11, 21, 19, 11, 36, -10, -11, -19, 21, -1, -19, -24, -15, 7, 32,
-    30, 6, -52, -82, -34, 16, 34, 21, -18, -7, -17, -34, -10, -37, 14, -7,
-    9, 24, -21, -3, -29, -6, 1, -12, -16, -17, 4, 36, 46, 7, -56, -74,
-    -24, 13, 24, 27, 15, -5, -15, -29, 1, -33, 3, 5, 3, 33, 6, 2,
-    -13, -10, -13, -19, -16, 7, 25, 43, 34, -13, -49, -51, -15, 27, 8, -3,
-    7, -13, -22, -18, 5, -2, -3, 1, -3, -13, 12, 2, -6, 11, -16, -12,
-    -15, 4, 28, 14, 10, -16, -36, -37, 6, 12, -1, -10, -4, 1, -21, 3,
-    26, -10, 7, 0, 7, -11, 14, 23, -1, -2, -15, 7, 3, 28, 23, 3,
-    -4, -35, -38, -17, -4, 5, 10, -18, -24, 0, -2, -8, -15, -37, -44, 7,
-    5, -13, -24, 7, -7, -28, 3, 6, 15, 2, -2, -14, -21, -37, -30, -11,
-    9, 22, 5, -3, -11, 3, -11, -13, -17, -40, -37, 35, 3, -14, -5, -13,
-    11, 2, 15, 6, 9, -4, -17, -15, -25, -21, -5, 4, 29, 26, 22, 12,
-    1, 2, 7, 7, 0, 13, 7, 44, -26, -18, -4, -34, 8, 12, 13, 0,
-    1, -18, -28, -24, -13, -12, 7, 2, 24, 15, 20, 5, 5, -4, 3, 4,
-    11, 9, 16, 11, 0, 3, 10, 2, 24, 12, 13, -6, -10, -20, -38, -31,
-    -7, 6, 12, 7, 5, 5, 7, 4, 11, 0, 0, -27, 13, 4, 20, 5,
-    4, -3, 32, 3, 8, 5, 2, -19, 4, -10, -14, -8, 1, 5, -15, -15,
-    -1, 1, 7, 17, 11, -5, -17, -24, -23, -18, 1, 3, -3, 0, 35, 28,
-    1, 7, -23, -19, 10, 10, 31, 16, 1, -9, -22, 1, 6, -10, 0, 2,
-    15, 4, 19, -1, 8, 6, 2, 5, -2, -15, 31, 29, -27, -8, -4, 4,
-    20, 18, 16, 16, -6, -18, -28, -11, -1, -17, -10, -14, 11, 29, 24, 8,
-    11, 14, 23, 4, 0, 2, -28, 15, -6, -17, 16, 4, 11, 24, 31, 3,
-    7, -3, -4, -6, -1, -16, -20, -13, -9, 17, -1, 27, 14, 27, 25, -1,
-    2, 0, 13, 2, -3, 14, 12, 24, 29, 32, 28, 3, 13, 21, -7, -1,
-    17, 9, -16, -34, -35, -3, 7, 3, 14, 11, 2, 1, -2, -2, -19, 10,
-    31, 14, -10, -13, -1, 17, 9, 12, 2, -1, -26, 27, 44, 8, -2, -32,
-    -47, -9, -2, -10, 7, -12, 2, 3, 3, -1, 3, -7, 10, 0, -3, -28,
-    -21, -10, -27, -19, 5, -28, -39, 2, -1, -34, -30, -11, -28, -18, -5, -22,
-    -17, 5, 1, -2, 0, 3, 0, 3, 22, 37, -1, -8, -10, -5, -22, -29,
-    -20, 20, -22, -34, -19, 24, 21, -13, -4, 19, 13, 26, 0, 4, -3, -2,
-    4, -4, -4, -2, 3, -2, -4, 1, -1, -2, 3, -4, 10, 10, 2, 2,
-    2, 3, 3, -2, 0, -3, -3, 2, 1, 0, -2, 3, 2, -4, 1, -4,
-    -4, 4, 7, 11, 8, 13, 4, 11, 27, 41, 10, 40, 25, 22, 22, 24,
-    27, 7, 11, 5, 4, 0, 4, 4, -3, 4, 13, 2, 17, 16, 15, 16,
-    16, 12, 23, 40, -6, -16, -4, 39, 43, 29, 4, 40, 42, 31, 30, 25,
-    11, 1, -1, -3, 3, 0, 21, -3, -16, 27, 32, 26, -6, -6, 15, 5,
-    -9, -7, 3, -9, -1, -22, -27, -15, -12, -17, 20, 38, 25, -28, -9, 0,
-    1, 3, 22, 37, 49, 10, 0, -12, 1, 0, 2, 7, -4, 20, -2, 1,
-    6, 12, 18, 17, -1, -46, -6, 1, -10, -29, -16, 16, 0, 3, 39, -3,
-    43, 19, -11, -2, 15, 14, 30, 13, 4, 11, -4, 4, 4, -11, 19, 18,
-    -1, -8, -1, 9, -8, -14, 0, 3, -5, 14, 21, 20, 55, 15, -6, 1,
-    8, 12, 29, 20, 27, 28, 6, -6, -10, 0, 15, 18, -5, 0, 5, -31,
-    -30, -15, -5, 6, 4, 39, 5, 29, 53, 10, -3, 32, 11, 21, 20, 23,
-    21, 7, 13, -5, -4, 12, 6, 5, -12, -15, 1, -30, -21, -18, -18, 7,
-    39, 39, -22, 17, 23, -9, -12, 15, -7, 1, -8, -24, -15, -21, -9, -4,
-    7, 21, 0, -12, -5, -14, -13, -28, -45, -43, -39, -9, 7, 41, -14, -7,
-    10, -9, -20, -19, -49, -53, -66, -66, -59, -37, -4, 7, 26, 9, 2, -7,
-    -8, -1, -25, -27, 3, 3, -41, -8, 11, 40, 19, -9, -39, -49, -52, -68,
-    -102, -85, -61, -43, -32, -11, 1, 13, 17, 7, -13, -12, -7, -9, -18, -30,
-    -25, -36, -31, -10, 6, 26, 5, 11, -16, -41, -63, -60, -53, -31, 1, 17,
-    23, 32, 23, 13, -5, -17, -5, 3, 7, -10, 4, -17, -52, -73, -36, 33,
-    -4, 9, -4, 5, -16, -15, -29, -26, 3, 29, 52, 48, 54, 28, 13, -6,
-    -6, -6, 4, -14, -12, -4, 30, -5, 3, 2, 4, 37, 4, 11, 27, 19,
-    1, 21, 28, 9, 34, 46, 56, 37, 10, -10, -10, -6, -6, 2, 23, 12,
-    2, 12, 13, 18, 16, -15, -2, -37, -1, 1, 33, 17, -3, 30, 39, 26,
-    32, 36, 24, 19, 1, -9, 1, -10, -10, -10, 3, 18, 9, 4, 12, 15,
-    -4, -35, 12, -20, 2, 2, 4, 4, -15, 13, 15, 6, -8, 10, 3, -8,
-    -1, -5, -12, -10, -1, -17, -9, 2, 2, -2, -8, 5, 2, -30, -5, 6,
-    -3, 5, 11, 1, -2, -2, -29, -7, -1, 23, 8, -1, -18, -3, -6, -3,
-    -3, -7, 2, 2, -7, 12, 24, -8, -1, 0, 32, -2, -1, 8, -5, -13,
-    -19, -25, -26, -13, -9, -8, -13, -9, -3, -3, -5, -5, 5, -3, -7, -4,
-    -20, 15, 16, -20, -9, -2, 27, 6, -23, 21, -7, 4, -25, -23, -16, -1,
-    0, 11, -11, -12, 9, 9, -6, 3, 4, 5, 2, -13, -19, 14, 13, -17,
-    -29, 32, 21, 9, 13, 21, 5, 12, -22, -8, -8, -10, -12, 12, -3, 2,
-    19, 27, 21, 7, -6, -5, -4, -20, -6, 6, 2, -1, -9, -3, 1, 23,
-    3, 15, -15, 20, -10, 0, -14, -8, -11, 7, 7, 10, 24, 26, 23, 4,
-    -16, -14, 0, -20, -8, -10, -7, -24, -3, -12, 5, 2, 6, 9, 3, 23,
-    3, -4, -3, -19, -5, -2, 7, 5, -1, -4, -3, -9, 8, -14, 3, -26,
-    -29, -24, -14, -7, 9, 0, 9, 2, 13, 13, 2, 14, 43, 19, -4, 3,
-    -17, 3, 11, 2, -6, -7, -9, 8, 17, 1, -21, -15, -6, -10, -6, 15,
-    -12, -10, 25, 10, -3, -1, 13, 12, -14, 3, -2, 6, -2, -2, 13, 15,
-    7, 5, 4, 6, 11, -2, -29, -21, -12, 5, -9, 2, -22, -8, 24, 2,
-    4, -3, 7, 42, -20, -31, -16, 8, -3, 2, 1, 8, -14, 10, 14, -10,
-    -16, 18, -8, -28, -28, 2, 8, -23, 3, 23, 21, -2, -2, 3, 4, 8,
-    20, -10, -7, -12, -17, -17, 2, 7, 16, 27, 22, -18, -45, -31, -32, -32,
-    -28, -19, -10, -19, -1, -3, -1, 1, -3, 0, -3, -16, 19, -11, -24, -25,
-    -45, -29, -5, 11, -9, 7, -10, -21, -12, -23, -41, -41, -16, -5, 0, 5,
-    -1, -1, -2, -3, -3, 1, 5, 3, -1, 7, -22, -25, -28, -23, -40, -38,
-    -32, -15, -31, 3, 24, -18, -26, -14, 1, -5, -2, -1, 4, -4, 2, -4,
-    0, 3, -1, -2, 2, 0, 5, 0, 4, 0, -3, -3, -1, -4, -2, -4,
-    2, -4, -2, -1, -4, -4, -2, -3, 3, -3, -3, -2, 1, -1, 3, 3,
-    -1, 1, 8, 8, 11, 7, 4, 13, 18, 3, -17, -2, 11, 6, 14, 8,
-    11, 7, 7, 4, 2, 0, 4, -3, 0, -2, 7, -1, 14, 8, 2, 9,
-    3, -4, -12, 24, 27, 10, 9, 3, 17, 15, 23, 3, 25, 34, 10, 6,
-    1, -2, 2, 3, 3, 0, 15, 27, 43, 52, 30, 20, 3, 11, 34, 39,
-    41, 38, 44, 29, 46, 34, 63, 23, 16, 29, 19, 25, 23, -18, 5, 1,
-    4, 5, 36, 42, 19, 29, 6, 10, 17, 23, 30, 44, 24, 10, 13, 48,
-    38, 30, 37, 11, -6, -10, -1, 18, 17, 10, 33, 40, 4, -3, 41, 17,
-    10, -24, -25, -4, -4, -1, 12, -2, -16, -16, -17, -2, -3, 13, 11, 19,
-    37, 15, -12, -24, -4, 14, 46, 35, -1, 11, -19, -20, 4, -38, -30, -22,
-    -16, -4, -35, -47, -31, -17, -12, -13, 11, 30, 23, 8, 7, 4, 0, 0,
-    -1, 2, 14, 29, 4, 3, -27, -18, -27, -38, -37, -50, -22, -21, -39, -32,
-    -20, 5, 6, 16, 21, 26, 32, 28, 12, 2, 16, 7, -19, -10, -8, 46,
-    -2, -17, -8, -13, -22, -34, -12, -7, 0, -27, -15, -5, 3, 10, 2, 10,
-    37, 27, 20, 38, 28, 18, 22, 9, -9, -22, -13, 25, -5, -5, -8, 1,
-    -18, -43, -2, -1, -3, -11, 23, 13, 5, 10, -7, 3, 12, -7, -8, 18,
-    33, 0, 14, 23, 17, 2, 2, 18, -5, 0, -4, -7, -27, -17, -14, -2,
-    -1, 12, 20, 23, 21, -8, 9, 7, 0, -28, -8, -7, 13, -3, 13, 55,
-    30, -15, 38, 20, 0, -13, -4, -20, -40, -28, -4, 8, -6, -5, 3, 7,
-    -22, -3, 21, 15, -16, -11, 1, -14, -7, 5, 8, 33, 36, 20, 63, -13,
-    -7, -20, -3, -31, -18, -18, 10, 12, -22, 0, -6, -8, -31, 7, 33, 7,
-    -19, -10, -3, -11, -18, -3, 13, 14, -5, -24, 14, -15, -1, -8, -15, -25,
-    -10, -9, 7, -3, -12, -8, -4, -10, 4, 21, 27, -3, -10, -14, -7, -11,
-    -23, 2, 30, 2, -33, -35, 6, 10, 4, 5, -13, -34, -12, 4, 2, -10,
-    -10, -2, 0, 9, 20, 26, 8, -5, -16, -18, -15, -18, 1, 26, 19, 5,
-    -2, -20, 3, -15, -2, 6, -8, -56, -13, 22, 2, -3, 7, -4, 0, 16,
-    29, 14, 0, -24, -7, -13, -12, -3, -5, -3, -15, 7, 20, -49, -29, -21,
-    -7, 13, 8, -43, -13, 14, 2, 1, 13, 17, 13, 26, 14, -16, -22, -30,
-    0, -17, -5, -11, -10, -19, -6, -1, -13, -39, -38, -24, -2, 6, -10, -24,
-    -30, -8, -3, 20, 15, -5, 2, 20, -3, -28, -34, -12, -1, 11, -4, 5,
-    -23, -32, -26, -23, -40, -60, -36, -8, 28, 8, -2, -18, -25, -1, 3, 21,
-    26, -10, 3, -17, -35, -43, -20, -2, 9, 14, 3, 8, -5, -28, -21, -34,
-    -44, -23, -27, -21, 2, 14, -14, -36, -8, 10, 0, 7, -7, -8, -4, -31,
-    -16, -18, -13, -2, 12, 30, 28, 27, 21, -17, -13, -24, -26, -37, -18, -19,
-    -3, 21, -31, -16, 5, 15, -8, -4, -3, 14, 9, 5, 8, 18, 14, 4,
-    5, 20, 16, 15, 9, -22, -19, -27, -29, -43, -9, 3, 8, -1, -25, -23,
-    -23, -37, 4, 13, 2, 13, 8, 33, 36, 44, 27, 14, 10, 7, 12, 8,
-    -24, -55, -45, -17, -35, -22, -3, 8, 7, 13, -15, 8, -12, -10, -11, 12,
-    1, 23, 15, 30, 44, 34, 22, 16, 0, -4, -19, -17, -51, -55, -40, 5,
-    -6, -14, -21, 7, -3, 1, 30, 5, 2, 32, 7, 10, 11, 17, 23, 30,
-    20, 9, -4, 1, -3, -7, -27, -58, -54, -29, -11, -13, 16, 3, -12, 3,
-    2, -4, -7, 9, 20, 19, 7, -2, 13, 28, 34, 20, 24, 2, -7, -11,
-    -11, -14, -36, -35, -1, -7, 9, 3, -5, -32, -29, -2, -1, 3, 11, -25,
-    -38, -18, 21, 31, 23, 18, 14, 9, 9, 13, -2, -27, 6, 10, -17, 1,
-    5, -1, 28, -12, -18, -13, -14, 0, 1, -3, -1, 21, 16, -5, -11, 1,
-    18, 12, 15, 20, 15, 11, 18, -6, -3, 13, -11, -1, 18, 14, 11, 3,
-    4, -8, 2, 0, 1, -4, 3, 2, -20, -34, 20, 28, 23, 5, 5, 22,
-    19, -23, 27, 20, 20, 3, 7, -2, -13, -11, -9, -12, 1, -2, 1, -4,
-    -1, 4, -4, 5, 3, 3, 2, -3, -3, -2, 5, -1, -16, -7, 4, 2,
-    -4, -1, -2, 1, -2, 1, -3, 0, -2, 2, -3, -1, 2, -3, 0, -1,
-    -2, -1, -10, -13, -11, -17, -32, -33, -27, -43, -5, -9, -2, -19, -16, -18,
-    -22, -23, -18, -16, 4, -4, -3, -4, 1, 5, 10, 4, -8, -11, -20, -19,
-    -34, -29, -31, -46, -62, -63, -67, -22, -11, -17, 15, -38, -38, -17, -14, -21,
-    -10, -25, -4, 3, 5, -4, 5, -36, -33, -21, -21, -19, -16, -45, -19, -30,
-    -61, -85, -19, 7, -8, -24, -3, -11, -8, -16, -36, -39, -48, -8, -2, 5,
-    -2, -1, 22, -12, -28, -28, -33, -13, -40, -70, -53, -51, -64, -78, -71, -22,
-    -12, -5, 5, 15, 8, -37, -4, -17, 1, 19, 10, -17, -4, -4, 8, -18,
-    -42, -47, -40, -33, -64, -44, -31, -1, -2, -11, -15, -7, 2, -4, -6, 14,
-    6, 4, 13, 18, 10, 22, -23, -22, -1, 14, 3, -7, -19, -43, -32, -15,
-    -22, 13, 18, -2, -5, 1, -1, 10, 10, 8, 7, -1, -6, 21, 4, 7,
-    -7, -12, -4, 25, 0, 46, 9, 18, -17, -24, -3, -8, 3, 13, -4, -1,
-    6, 4, -8, 0, -7, -15, -3, 3, 12, 15, -3, -2, 10, -4, -7, 19,
-    -43, 33, 46, 31, -20, -8, -10, -5, 22, 27, 17, 25, 14, 20, 13, -12,
-    -16, -16, 2, 16, -3, 8, 17, -17, -20, 7, 11, -22, 15, 34, 55, 23,
-    -21, 1, 9, 24, 27, 42, 28, 29, 31, 29, -10, -16, -19, 4, 5, 19,
-    39, 14, 17, -3, -24, -7, 6, 14, 20, -7, 13, 56, 8, 1, 17, 39,
-    24, 27, 5, 2, -7, -21, -36, -34, -19, 9, 27, 46, 49, 19, 5, -17,
-    -44, -31, -9, 22, 2, -3, 0, 62, 17, 10, 3, 24, 13, 8, 3, -3,
-    -15, -39, -23, 0, 18, 38, 44, 56, 58, 27, 6, -29, -41, -10, 17, 27,
-    5, 6, 50, 11, 1, 13, -3, -22, -24, -29, -6, -28, -23, -31, -15, 30,
-    36, 56, 52, 39, 34, 18, 17, 12, -55, -36, -15, 37, -3, 14, 24, -13,
-    -4, -21, -11, -25, -9, -32, -19, -3, -9, -2, 4, 26, 29, 50, 54, 25,
-    21, 13, -1, -38, -37, -8, 18, 12, 0, 18, -17, -18, 9, -34, -21, -4,
-    -16, -19, -10, 9, 19, 18, 12, 11, 0, 38, 25, 20, 6, -33, -38, -37,
-    -26, -26, 7, 17, 3, 16, -24, -2, 16, 5, -20, -37, -9, -12, -14, -2,
-    23, 27, 36, 46, 8, 17, 6, 19, 6, -11, -10, -16, -14, -29, 51, 0,
-    10, 17, 11, -1, 19, -5, -17, 11, -6, -20, 0, 4, 34, 45, 49, 31,
-    0, 12, -2, -1, -22, 5, -16, -20, -14, -14, 42, 2, 2, 11, 22, 10,
-    6, -15, -20, 25, -7, -21, -18, 12, 43, 57, 24, 5, -17, 1, -23, -17,
-    -32, 1, -17, -30, -38, 21, 41, -10, 29, 7, 23, 29, -14, -21, -11, -2,
-    -12, -37, -20, 24, 20, 33, 17, 2, -28, -10, -6, -7, -16, 6, 0, -10,
-    -17, 16, 53, -39, -15, 9, 11, 22, -12, 0, 11, 10, -13, -27, -19, -16,
-    -6, 20, 16, 2, -4, -12, -10, -8, -8, 0, 1, -8, -12, -21, 14, -32,
-    4, 24, -6, 42, 7, -11, -10, 19, -3, -17, -16, -4, 9, 3, 7, 5,
-    -2, -24, -19, -16, -14, -2, 13, 11, -4, -2, 4, -4, -9, 13, -3, 3,
-    1, -25, -4, 13, 16, -11, 1, 6, -1, -10, -14, -12, -9, -31, -22, -14,
-    -18, -1, 3, 2, 6, -24, -23, -3, -13, 0, 32, -7, -2, -7, -6, 0,
-    13, -4, 7, 13, 0, -21, -21, -22, -28, -12, -15, -13, -8, 7, 22, 6,
-    2, 1, -16, -4, 4, -2, 36, 1, -23, -9, -8, 17, 2, -18, 4, 11,
-    -15, -21, -26, -22, -27, -20, 6, -10, -6, 22, 16, 13, 20, 2, -31, -3,
-    -1, -1, 18, 21, 46, 20, 27, 20, 3, -18, -29, -8, -31, -13, -6, 1,
-    2, -1, -1, -15, 0, 9, 16, 17, -15, 0, -26, -1, -3, 1, 23, -17,
-    34, 66, 36, 26, 31, 17, 22, 9, 7, -15, 5, -8, -10, -11, -21, -19,
-    -20, -31, -43, -28, -33, 0, -17, 2, 0, 0, -3, 16, 16, 37, 54, 56,
-    58, 48, 63, 9, -18, -1, 24, 2, 1, 29, 9, -17, -2, 29, 18, 30,
-    26, -3, 0, 3, 0, -1, -3, 0, -14, -24, 23, 30, 24, 12, 7, 8,
-    13, 1, 65, 53, 52, 49, 27, 27, 34, 49, 44, 15, -4, -4, -2, 3,
-    1, 3, 1, -1, -3, 3, -5, -3, 1, -2, 4, 2, -2, -6, -8, -1,
-    3, -3, -1, 4, 4, 2, -4, -4, 3, 1, 3, -4, 1, 2, -3, 2,
-    1, 4, 3, 4, 2, -2, 1, 8, 9, -12, 9, 8, -27, -32, -1, 50,
-    44, 28, 4, 0, 3, -2, -2, 4, 2, -4, 1, -4, 8, -8, -9, 10,
-    30, 5, -17, -4, -2, -25, -16, 1, 1, -13, -9, 16, 10, 0, 7, -21,
-    -13, -17, -1, -4, -3, -4, 0, -2, -7, 26, 22, 26, 29, 0, 10, 5,
-    -2, -14, -5, -19, -11, -17, 16, 27, 25, -1, -13, 11, -5, -31, -23, 2,
-    -4, 4, 16, 40, 33, 8, 5, 21, 16, 3, 10, 0, -4, 4, -2, 0,
-    5, -23, -12, 5, -1, 13, 16, 13, 10, 2, 20, 19, -3, 4, 14, 4,
-    17, 27, 21, 42, 4, -3, -20, -39, -7, -8, 4, -9, -9, 2, 0, 11,
-    8, 6, 5, 11, 14, 17, 22, 15, -1, 17, 3, -14, 23, 12, 25, 30,
-    16, -15, -10, -21, -9, -7, -12, -12, -1, -4, -18, 7, 0, -7, -2, 23,
-    5, 10, -1, 22, 0, 22, 1, -14, 34, 12, 20, 39, 3, 3, 0, -12,
-    -3, -32, -19, -15, -10, 5, 6, 10, -7, -10, 2, 10, 10, 12, 31, 19,
-    1, -9, 29, 33, 16, 11, 6, 25, -12, -6, -11, -16, -1, -19, -23, -13,
-    7, 9, 6, 18, 3, 10, 28, -9, 0, 22, 19, -10, 5, 23, 16, 25,
-    26, 2, 21, 9, -3, 9, -18, -23, -31, -16, -1, 1, 16, 24, 15, 19,
-    23, 10, 20, 21, -19, 20, -4, 15, 8, 26, 12, 38, 41, 18, 13, 3,
-    -15, -3, -9, -17, -20, 13, 18, 6, 4, 17, 21, 35, 25, -6, 23, 32,
-    -20, -53, -1, 30, -2, 3, 3, 41, 49, 20, -5, -21, -22, -10, -32, -29,
-    8, 23, 26, 11, -3, 10, 20, 16, 12, -16, -12, 5, 9, -7, 38, -26,
-    2, 9, 11, 19, 3, 10, 3, -12, -39, -37, -16, 2, 27, 44, 30, 20,
-    8, 17, 4, -22, -26, -28, -6, 8, 6, -26, -47, -29, -1, 0, -5, 13,
-    -20, 3, 0, -37, -39, -29, -7, 10, 22, 24, 19, 15, 7, 12, -3, -17,
-    -22, -23, -30, -36, -18, -38, -41, -15, -1, 8, 11, 1, -23, 6, -14, -37,
-    -19, -21, -11, 1, 20, 34, 32, 9, 4, 9, -12, -5, -20, -17, -28, -29,
-    -9, -8, -38, -12, 5, 11, 28, -11, -14, -3, 3, -2, -2, -12, -19, -5,
-    8, 34, 30, -2, -9, -21, 4, 21, 9, 1, -10, -19, -23, 0, -49, -1,
-    -2, 12, 4, 1, 9, -1, 7, 11, 8, 5, -9, -3, 12, 21, 4, -2,
-    -16, -9, 29, 25, 13, 3, -8, -30, -12, -44, -14, -31, 3, 15, -8, 17,
-    22, 0, 6, 28, 2, -6, -16, 0, 4, 3, -8, -15, -3, 5, 5, 12,
-    -1, 20, 7, -23, -24, -42, 13, -39, -32, 14, 0, 35, 5, 4, 1, -1,
-    -17, -12, -12, 3, 6, 5, -10, -5, -6, 8, 2, -4, 14, 11, -6, -46,
-    -49, -49, 19, -26, 11, -22, -14, 24, 14, 14, 8, 7, -16, -1, 2, -12,
-    -28, -15, 5, -2, 7, 17, 11, 15, 15, 1, -16, -35, -46, -49, 1, -13,
-    -4, -22, -38, 7, 27, 15, 4, 7, -20, -13, -5, -10, -16, 1, 10, 9,
-    2, 4, 6, -2, 5, -10, -19, -54, -44, -46, 11, -5, 2, 3, -20, -5,
-    11, 5, 14, 7, 2, -17, -7, 3, 0, 0, 6, -2, 0, -2, -20, -25,
-    -10, -10, -20, -64, -46, -43, -5, -1, 4, 18, -16, -3, 21, 9, 5, 5,
-    -11, -16, -4, 9, -2, 0, -12, -7, 10, 0, -15, -5, -3, 0, 2, -40,
-    -46, -17, -15, -1, -4, -4, 31, 9, 5, 4, -10, 6, -19, -2, -14, -4,
-    -3, 12, -1, 11, 1, -10, -11, 14, 20, -6, -42, -63, -23, 9, -15, 2,
-    -4, 0, 12, 21, -18, -5, 16, -5, 3, 13, 3, 7, -3, 2, 3, -2,
-    9, -17, -8, 11, 19, -1, -44, -33, -39, -8, -8, 0, 0, 5, -1, -19,
-    -16, 3, 26, 6, 15, 20, 9, -8, 20, 13, -23, -17, -22, -13, 8, 42,
-    13, -23, -33, -40, -27, 3, 4, 0, 3, -4, -1, -14, -33, -32, -23, -36,
-    -40, -58, -7, 8, -57, -27, -29, -20, 9, 40, 24, -3, -30, -31, -41, -3,
-    0, 1, 1, -1, 2, -1, -1, -2, 6, 12, -11, -6, -9, -11, -42, -31,
-    -5, 30, 6, 2, -14, -3, -2, -21, -18, -31, -29, 3, 2, 2, 4, -2,
-    0, 3, -4, -5, -1, -2, 0, 2, 0, 2, 4, 4, -3, 5, 2, -1,
-    -3, -2, 0, -2, -3, -4, -1, 3, 2, 1, -2, -3, 3, -4, -3, -4,
-    -3, -2, 3, 5, 12, 6, 17, 13, 13, 25, 17, 24, 22, 17, 25, 15,
-    11, 1, -2, -3, 4, 0, 3, -1, 2, 0, 9, 0, 14, 8, 4, 14,
-    -16, 2, 11, 41, 2, 36, 5, 14, 56, 38, 2, -17, -19, -16, -9, -10,
-    2, -6, -3, 4, 0, -3, 13, 3, -17, -13, -6, 5, -16, -15, -22, -11,
-    -2, 33, 56, 54, 46, 38, 23, 25, 26, 13, 1, 2, -20, 24, 3, -3,
-    -4, 3, -3, 8, 19, 18, 8, -12, 6, 18, 19, 24, 33, 13, 2, 1,
-    36, 22, 23, 25, 5, 13, 14, -2, -47, -28, -22, 2, 3, 5, -4, -15,
-    -6, 40, 5, -23, 17, 28, 11, -18, -12, 1, 14, -7, -14, -10, 3, 26,
-    -4, -15, 8, 42, 9, 11, 16, -16, 0, 0, 0, -10, 4, 27, -12, -16,
-    -16, -11, 7, -1, 16, 21, 8, -2, -12, -19, -25, -14, -17, 1, 12, 2,
-    19, 37, 1, -29, 3, 30, -4, -2, -19, -14, 16, 2, -8, 11, 13, 7,
-    9, -1, 12, -7, -10, -19, -17, -29, -22, -22, -1, -3, 37, 47, 3, -45,
-    25, 38, 0, -2, -17, -16, 0, -1, 7, 8, -5, -2, 27, 31, 16, 3,
-    -8, -16, -16, -9, 9, -2, 13, 7, 32, 53, -14, -20, 13, 54, -32, -9,
-    14, -18, -6, 7, -6, -1, -2, 7, 39, 56, 29, -3, -26, -15, 14, 9,
-    21, 16, 16, 15, 39, 39, -6, 16, 13, 53, 4, 2, 7, -11, -17, -12,
-    -13, 11, 2, 46, 61, 49, -22, -42, -29, -7, 0, 14, 21, 20, 8, 11,
-    1, 22, 20, 1, 13, 29, 17, 5, -6, -10, -15, -15, -13, 14, 33, 57,
-    56, -7, -75, -43, -15, -2, 13, 6, -4, -21, -18, -12, -14, -32, 15, 2,
-    7, 22, -7, -12, -13, -16, 11, 12, 33, 43, 47, 56, 19, -38, -54, -16,
-    0, 3, -4, -10, -17, -19, 5, 0, 23, -15, 31, 7, -4, 17, 30, -6,
-    -34, 3, 30, 34, 42, 42, 26, 13, -25, -42, -27, -11, -13, -15, -21, -32,
-    -1, -16, -9, 19, 43, -6, 28, -6, -2, 17, 48, 9, -16, 23, 25, 45,
-    40, 7, 6, -24, -38, -41, -21, 3, -23, -27, -27, -19, -2, -8, 9, 42,
-    45, -61, -3, -5, 5, 14, 33, 36, -11, 30, 20, 40, 13, -8, -23, -42,
-    -71, -53, -17, 8, -10, -9, -18, -22, -14, -24, -1, 12, -7, -56, -16, -7,
-    11, 15, 16, 38, -2, 13, -14, 17, -8, -15, -27, -43, -56, -31, -4, 20,
-    0, -10, -24, -21, -22, -16, -10, -24, -4, -59, -30, -13, -1, 7, 11, 17,
-    8, 5, -34, -21, -28, -38, -29, -45, -33, -38, -8, 3, -9, -9, -9, -10,
-    -3, -4, 13, -6, -18, -29, -34, -22, -8, 0, 18, 24, -14, -12, -38, -22,
-    -25, -29, -26, -38, -42, -39, -11, -5, -8, -13, 10, 4, 9, 30, 25, 5,
-    -11, -4, -32, -26, -3, 16, 15, 18, 19, -2, -11, 1, 8, 4, -5, 14,
-    -9, -39, -8, 0, 2, 5, 15, 7, 22, 19, 11, 11, 12, 18, -29, -3,
-    -3, 4, -24, -3, 7, -19, -5, -4, 14, 10, 7, 13, 26, -4, -9, 2,
-    19, 23, 26, 15, -7, 8, 4, -1, 2, -9, -26, 7, -4, -5, -25, 8,
-    11, 0, 6, 3, 15, 18, 25, 43, 26, -6, -4, 8, 15, 10, 25, 6,
-    4, 20, 14, 12, 26, 13, 2, 9, 1, 0, -33, -18, -6, 2, 26, -6,
-    18, 34, 15, 21, 3, 1, -7, 13, 10, 19, 22, 32, 23, 27, 17, 9,
-    -23, -2, 11, 7, 4, -2, -3, -19, -18, -7, 21, 8, 13, 29, 17, 15,
-    -11, 3, 16, 6, 1, 10, 3, 34, 17, 21, -9, -35, -33, -5, 6, -2,
-    0, 1, 2, 2, 11, 14, -15, 7, 19, 20, 16, 8, -3, 9, 7, 14,
-    9, 25, 30, 26, 0, 19, -3, -35, -26, 4, 6, -3, 4, 0, -2, -3,
-    21, -13, -39, -9, 25, 30, 13, 14, 23, 11, 2, 13, 7, -6, 22, 20,
-    -6, 27, 24, -13, 22, 4, 1, 3, -1, 1, 4, 4, -18, -25, -13, 4,
-    8, -12, -13, -13, -8, 8, -24, 15, 9, -12, 9, 42, 13, 17, 40, 4,
-    -1, 7, 4, 0, 5, 0, -3, -4, 30, 33, 32, 11, 25, 1, -3, 7,
-    8, 41, -2, -21, -7, 22, 9, -3, 26, 37, 42, 36, 0, 1, 2, 0,
-    4, 2, 5, 3, 3, -2, 1, -2, -5, 1, 1, -1, 14, 13, 12, 3,
-    -4, -4, 0, 1, 3, 3, 4, -4, 0, -4, 2, 0, 2, -2, 4, -2,
-    3, 4, 16, 12, 12, 21, 28, 20, 33, 38, -4, 19, 46, 38, 29, 13,
-    17, 11, 12, 5, -1, 0, 1, -4, 2, -2, 21, 1, 15, 16, 15, 24,
-    34, 47, 27, 37, -2, -18, 10, -4, -18, 36, 8, 13, -13, -5, -1, -9,
-    3, -6, -3, -4, -2, 4, 19, 10, 21, 36, 22, 15, 25, 29, 12, 26,
-    -5, 4, 9, -13, -15, 13, -3, -22, -10, 27, 24, 6, 9, 2, 8, 2,
-    -2, -1, -3, 9, 23, 2, 2, -1, 24, 29, 31, 26, -7, -19, -4, -16,
-    -29, -47, -65, -47, -26, -12, -40, -23, 6, 20, 38, 37, 2, -3, -3, 14,
-    47, 12, 13, 31, 40, 32, 34, -23, -23, -17, -2, 1, 7, -13, -45, -53,
-    -30, 5, -14, 0, 15, 30, 29, 38, 3, 2, 20, 36, 48, 40, 19, 35,
-    22, 12, 2, -8, -11, -18, -11, -1, -9, -30, -28, -12, -15, 9, 6, -8,
-    5, 11, 26, 36, 3, 17, 26, 26, 41, 22, 19, 42, 2, 1, 3, -1,
-    -7, -9, -19, -13, -25, -19, -27, -29, -6, 3, -18, -38, -2, 20, 17, 32,
-    5, 13, 25, -8, 36, 18, 6, 17, 0, 11, 26, 14, 15, 7, -16, -27,
-    -11, -8, -30, -23, -8, -21, -15, -4, 8, 4, 28, -27, 6, 5, 27, 22,
-    22, 16, -2, 13, 19, 4, 7, 18, 37, 20, 10, -20, -10, -3, -41, -31,
-    -23, -30, 3, 17, 6, -5, 30, 24, 0, -5, 18, -6, 21, -4, 1, 0,
-    2, 8, 14, 31, 18, 7, 12, -7, 0, 0, -10, -23, -26, -18, 2, 12,
-    19, -1, 12, 10, 3, 10, -13, -8, 10, -13, -18, -8, 5, 7, 10, 16,
-    -33, -16, 15, -6, -17, -4, -5, -4, 1, 6, -11, -13, 22, 13, -31, 30,
-    6, 11, -10, 6, -8, -20, -36, -38, -9, -12, -7, -14, -31, -14, 3, -16,
-    1, 5, -2, 5, 14, 20, -7, -22, 20, 47, 28, 40, 1, 8, 20, 5,
-    -27, -24, -33, -49, -42, -31, -23, -11, 12, 26, 6, 0, 16, 7, 6, 28,
-    15, 25, 3, 22, 52, 26, 28, 9, 2, -7, -22, -9, -39, -11, -10, -38,
-    -37, -33, -12, 11, 44, 47, 17, 10, -1, -12, 1, 9, 14, 18, 17, 26,
-    42, 13, 46, 13, 5, -6, -20, -5, -49, -12, 10, -3, -9, -19, 8, 33,
-    50, 53, 23, 5, -12, -30, 7, 11, -10, 10, 33, 33, 39, 33, 12, 18,
-    5, -9, -11, 8, -30, 2, 18, 12, -6, 16, 26, 42, 26, 26, 11, -3,
-    -13, -17, 6, 17, -14, 10, 30, 51, 42, 42, 45, 25, -3, -6, -9, -7,
-    -1, 1, 12, 4, -20, 7, 23, 37, 35, 20, -5, -12, -7, -5, -8, 3,
-    -5, 12, 25, 48, 33, 62, 35, 15, -9, -1, -18, -12, -8, -19, -50, -24,
-    -41, -17, 22, 17, 37, 10, -15, -12, -10, 6, 10, 7, -6, 9, 23, 31,
-    14, 59, 25, -18, -13, 16, 0, 0, -3, -28, -60, -46, -42, -25, 22, 32,
-    16, 1, -3, -2, -13, 13, 21, 7, -3, -4, 8, -11, -16, 40, 14, -17,
-    -4, 22, 3, -3, -5, -32, -67, -34, -26, -25, 10, 27, 17, 18, 8, 10,
-    -11, -2, 16, 15, 8, -7, -8, -26, -39, -21, 8, -2, -10, 8, 10, 9,
-    -6, -44, -44, -45, -54, -37, -15, 5, 13, 25, 28, 17, 3, -4, 11, 10,
-    -4, -34, -19, -21, -14, 19, -4, 0, -12, -5, 7, -6, -10, -36, -5, -8,
-    -28, -16, -18, 0, 3, 12, 0, 12, 3, -15, -1, 15, -17, -37, -22, -24,
-    -16, 17, -17, -3, -3, 1, 5, -19, -21, -14, -5, -3, -24, -10, 13, -1,
-    -2, 14, -2, 8, 12, -2, -22, -5, -13, -39, -15, -5, -23, -9, -22, 4,
-    0, 3, 7, -17, -24, -18, 23, 3, -36, -30, -11, 3, 3, 8, 1, 14,
-    31, 15, -19, -25, -30, -34, -9, -13, 27, -1, -2, -1, 3, 2, -3, -3,
-    1, 0, 21, 35, 19, -14, 16, -1, 6, -27, -46, 8, 20, 8, -30, -13,
-    7, 13, 17, 15, 22, -12, 4, -4, -1, -3, 0, -1, -10, -23, -30, 16,
-    -21, -5, 8, 10, -25, -16, -14, 19, -20, -44, -25, 2, -8, -45, -28, -17,
-    -8, -3, -4, -2, -4, 1, -2, -4, 9, 7, 11, 6, 11, 19, 36, 4,
-    -6, -7, -9, 15, -13, -20, -11, -5, -15, -14, -8, -1, 1, -3, -1, 2,
-    1, 4, 1, -4, -1, 0, 1, 3, 0, -4, -1, -1, 0, -5, 2, -3,
-    -4, -3, -3, 2, 5, -3, 4, -4, -2, 3, -2, 1, 0, 0, -4, 4,
-    -2, 3, -3, 3, -6, -8, -4, 9, 10, 14, -14, -5, 11, 7, -16, -1,
-    -5, -2, -1, 5, 2, 3, -2, 2, 2, -2, 1, 0, -6, -5, 5, 7,
-    -6, -1, -7, -25, -22, -33, -27, -24, -18, 3, 19, -17, -28, -29, -23, -12,
-    10, 17, -1, 2, -4, -5, -2, -1, -3, 2, 3, -10, -9, -12, -24, -28,
-    -28, -54, -40, -4, -3, -3, -14, -21, -20, 0, 10, -12, -3, 33, 25, 4,
-    3, 3, -3, -9, -1, -8, -18, -20, -40, -56, -73, -43, -47, -52, -13, -8,
-    -5, 23, 18, -18, -8, -7, -6, 10, 12, 21, 21, -23, -1, -1, 1, 6,
-    2, -5, -22, -35, -33, -34, -43, -60, -58, -32, -9, -19, -20, -6, -20, -29,
-    -10, 4, -9, -35, -26, 8, -1, -29, 2, 7, 38, 29, 27, 49, -4, -25,
-    -18, -1, -13, -13, -16, -15, -8, -5, -22, -16, -2, 17, 3, 34, 20, -11,
-    -11, 1, 28, -16, 4, 14, 45, 41, -17, 4, 2, -8, 11, 17, 11, 6,
-    9, 28, 6, 9, 24, 24, 21, 20, 16, 30, 37, 12, -19, -8, 33, -15,
-    40, 30, 36, 1, -22, 2, 0, 16, 25, 25, 17, 22, 40, 31, 20, 20,
-    33, 21, 25, 20, 36, 11, 32, 39, 8, -6, 1, 31, 15, 25, 4, 8,
-    -6, 11, 11, 14, 11, 5, 28, 46, 52, 52, 40, 29, 28, 28, 20, 4,
-    15, 4, 26, 25, 18, 15, -24, 14, 16, 15, 27, 6, 4, 24, 33, 1,
-    9, 14, 26, 40, 30, 62, 47, 28, 30, -1, 14, -14, -3, 3, -2, -1,
-    20, -7, 4, -8, 5, 12, 10, -5, -8, 21, 16, 2, 5, 10, 23, 49,
-    35, 39, 12, 7, -14, -28, -6, -15, -13, -31, -24, -24, -15, -36, 9, -17,
-    8, 11, -6, -25, -24, -11, -14, 2, 3, 12, 5, 5, 4, -6, -16, -17,
-    -44, -21, -2, -8, -19, -29, -23, -16, -8, -16, 18, -22, -4, 12, 11, -14,
-    -40, -17, -15, -15, -5, -9, -3, -9, -9, -5, -3, -13, -23, -8, -4, -8,
-    -4, -2, -8, 10, 17, -34, -7, 2, -2, 4, 30, 3, -33, -29, -25, -33,
-    -19, -24, -17, -22, -13, -9, -5, -8, -29, -11, -2, -20, -14, -9, 0, 40,
-    24, -1, 1, 5, 3, 0, 24, 11, -23, -25, -11, -23, -18, -25, -23, -15,
-    -1, -20, -17, -11, -40, -16, -1, -20, -11, -23, -11, 26, 32, 15, 8, 35,
-    6, -20, -8, 5, -15, -35, -13, -8, -5, -7, -17, -7, -12, -29, -17, -6,
-    -4, 8, -9, -5, -13, -22, -2, 4, -7, 1, 39, 37, 1, -12, -16, 0,
-    -13, -6, 5, -11, -5, -4, -13, -11, -16, -12, -8, 6, 8, 27, 8, -12,
-    -27, -38, -3, -7, 20, 70, 26, 40, 21, -8, 3, -38, 8, 13, 7, 15,
-    -1, -20, -13, -17, -9, -19, -4, 16, 24, 17, 4, -1, -18, -6, 27, 22,
-    17, 2, 17, 20, 0, 18, 3, -35, 11, 10, 9, 19, 13, -16, -19, -16,
-    3, 0, -1, 7, 11, 17, 2, 2, 13, 20, 35, 3, -13, -20, 7, -14,
-    -4, 7, 11, -27, 12, 13, 23, 18, 24, 3, -16, -8, 5, 2, -2, -3,
-    -13, -8, -15, -10, 5, 9, 15, -7, -37, -34, -5, 5, -3, -10, 6, -19,
-    15, 23, 16, -2, 4, 9, 8, 7, 7, 14, 1, -10, -9, -15, -27, -27,
-    -27, -25, 1, -10, -27, -10, -18, -1, -2, -6, 11, -13, -1, 1, 37, 19,
-    22, 15, 2, -2, 6, 2, 3, -6, -5, -7, -18, -28, -45, -53, -39, -36,
-    -39, -14, -21, 1, 1, 3, -26, 17, 45, 21, 43, 19, 0, -8, 2, 9,
-    -1, 2, -4, -8, -5, -5, -20, -26, -28, -30, -43, -41, -28, -12, -30, 0,
-    0, 1, -4, 25, 26, 48, 20, 4, 4, -8, -8, -7, 1, 4, -10, -2,
-    4, -7, 1, 25, 18, -38, -53, -39, -13, -35, -25, 3, -2, -5, -17, 32,
-    3, -10, 6, 0, -8, -15, 5, 10, 4, 14, 19, 35, 20, 29, 29, 42,
-    42, 18, 2, -20, -13, 3, 1, -3, -3, -4, 1, 18, -46, -44, -41, 4,
-    9, 5, -3, 14, 30, 47, 3, 4, 10, -9, 5, 44, 23, -1, 4, 3,
-    -7, 0, 3, -4, 2, -2, -1, 1, 14, 27, -1, -14, -1, 19, 20, 3,
-    4, 31, 23, -19, -6, 29, 18, 17, 16, 8, -12, 11, -1, 1, -3, -1,
-    -3, -2, 2, -2, -4, 1, -1, 2, 3, 2, -1, -4, 9, 4, 3, -2,
-    -4, 2, 1, 5, 1, -2, -4, -3, -4, 4, -2, -1, 0, 0, 4, 1,
-    -3, 4, 2, 5, 2, -5, 15, 12, 17, 15, 15, 44, 33, 17, 16, 16,
-    20, 13, 5, 5, 1, -5, -4, 2, 1, -4, 2, 3, 17, 14, 1, 7,
-    -2, -14, -10, 10, -28, 8, 25, 38, 34, 22, 33, 38, 10, 8, 23, 8,
-    -13, -18, 3, -4, -4, 2, 2, 8, 3, -4, -12, -17, -35, -6, -41, -53,
-    -23, -4, -7, -7, -10, 5, 16, -13, -34, 12, 39, 36, 13, -7, 20, 4,
-    -3, -3, -2, -16, -22, -17, -59, -59, -64, 2, -19, -41, -23, -11, -4, -31,
-    -15, 6, 40, 20, -8, 10, 15, 66, 37, 30, 18, 26, 2, -4, 19, -26,
-    -38, -30, -57, -66, -38, -11, -9, 3, 0, 4, 2, -11, 4, 4, 4, 17,
-    21, 26, 24, 26, 47, 16, 34, 30, 0, -5, 8, -21, -29, -48, -56, -48,
-    -24, -31, -12, 1, 10, 8, 23, 8, -11, -5, -2, -19, -5, -6, 0, -3,
-    18, 30, 42, 7, -4, -16, -19, -36, -46, -55, -51, -48, -32, -14, 2, 14,
-    31, 14, 8, 2, -17, -3, 4, -6, -3, 6, 15, 14, 10, 15, 29, 33,
-    3, -15, -30, -24, -53, -41, -11, -21, -41, -37, -7, 34, 33, 15, -6, -20,
-    -16, 4, 16, 12, 21, 28, 18, 30, 42, 11, 18, 22, 5, 3, -28, -23,
-    -47, -43, -19, -50, -41, -17, -2, 33, 21, 24, 2, -10, -19, -9, -4, -14,
-    -12, 23, 18, 4, 53, 31, 11, 6, 2, 15, -27, -39, -50, -42, -30, -40,
-    -14, 7, -2, 14, 16, 26, 22, 5, -30, -45, -52, -60, -45, -14, -4, -14,
-    7, 29, 30, -8, 0, 0, 0, -37, -30, -32, -28, -27, -32, -12, -9, -8,
-    10, 25, 6, 3, -3, -34, -43, -49, -47, -36, -23, -20, -13, 7, 30, -18,
-    -4, -3, -4, -17, -11, -19, -35, -35, -33, -14, -14, 12, 15, 15, 18, 11,
-    -1, -15, -5, -21, -6, -51, -55, -43, -26, -20, 5, -12, 1, -3, -3, 1,
-    -5, 4, -30, -33, -12, -20, -24, 2, 22, 4, 19, 24, -7, -19, -5, 9,
-    19, -27, -76, -52, -32, -25, -15, 6, 2, -6, 5, 3, -5, 1, -20, -8,
-    7, -18, -16, -4, -5, 19, 31, 3, -11, -24, 4, -4, 35, -18, -37, -55,
-    -35, -8, 0, 17, 2, -4, 13, -3, -7, 8, 8, 10, 10, -12, -23, -12,
-    -2, 24, 23, 3, -14, -9, 8, -21, 2, -1, -5, -32, -14, -10, -18, -28,
-    -3, -5, -5, 19, -27, -2, 3, -14, -19, -20, -14, -6, 12, 24, 10, -4,
-    -15, -3, -1, -9, 4, 0, 14, -11, 14, -50, -39, -36, 4, -6, -20, 41,
-    8, 3, -1, -19, -32, -24, 1, 14, 14, 17, 30, 5, -20, -1, 8, 1,
-    22, 26, 11, 18, 28, -47, -5, -39, -11, 4, -8, 37, 14, 3, 7, -3,
-    -18, -8, 9, 8, 23, 17, 25, 3, -10, -6, -2, -2, 10, 5, -20, -2,
-    6, -40, 2, 0, 18, 14, 15, -1, -15, -7, 10, -13, -14, -4, 8, 11,
-    17, 12, -2, -6, -5, -5, -8, -5, 3, -6, -22, 22, 41, -12, -17, 25,
-    -4, -8, 15, -8, -25, -8, 0, -27, -19, -11, 11, 15, 16, 6, 1, -1,
-    8, 3, -7, 14, 6, -16, 6, 33, 43, 11, -1, 0, 4, -8, -18, 17,
-    4, -11, -16, -31, -22, -2, -14, 12, 18, 13, 2, 1, 8, 5, 0, 15,
-    16, -17, 5, 7, 4, -2, 2, 3, 5, -6, -21, 33, 2, -13, -22, -22,
-    -5, -8, 12, 22, 33, 21, 17, 12, 17, 7, 7, 6, -6, -34, -14, -5,
-    -32, -14, 11, -3, 5, 4, -11, -8, 14, -1, 9, -4, -1, 9, -6, -2,
-    24, 16, 12, 11, 15, 11, 10, 8, -7, -2, -21, -26, -45, -27, 8, 0,
-    4, 2, -1, -30, -25, -25, -23, -33, -37, -16, -5, -17, -2, 12, -6, 0,
-    6, -22, -5, -25, -15, -17, -21, -31, -8, 7, 9, 4, 2, 1, -1, -1,
-    -16, -53, -53, -43, -67, -21, -18, -17, -15, -36, -22, -25, -64, -47, -11, -13,
-    -10, 5, -13, -18, 1, -2, 2, 2, -1, -1, 3, -1, -12, -11, -10, 0,
-    14, 8, -23, -30, 0, -28, -61, -46, -9, -35, -20, -11, -12, -8, -2, 0,
-    2, 0, -4, -1, -1, 1, -5, 1, 2, -2, -3, 4, -3, 5, 0, 4,
-    8, 11, -4, 0, -3, 3, 0, 4, -5, -1, -3, 1, 2, -2, -1, 4,
-    2, -2, -3, 0, 1, 1, -4, -3, 2, 5, 3, 2, 5, 5, 17, 8,
-    4, 0, 1, 3, -1, 3, 2, -2, 3, 3, -5, 2, 0, -1, -2, 2,
-    3, 1, 11, 15, 6, 8, 1, -2, 10, 16, -13, 0, 30, 26, 23, 18,
-    10, 8, 2, 3, 0, -3, 1, 1, 2, 0, 11, 0, 17, 15, 9, 18,
-    38, 28, 27, 38, 13, -8, 22, 31, 3, 7, 16, -12, 9, 12, -9, 7,
-    14, 13, 0, 4, 1, 0, 13, -4, -12, 37, 38, 27, 24, 11, 16, 42,
-    26, 12, 14, 15, 3, -9, 5, 10, -12, 8, 0, 11, 12, -3, 2, 4,
-    -5, -3, 31, 20, 8, 18, 29, 30, 31, 11, 42, 28, 8, -4, -1, 0,
-    11, 17, 11, 4, 2, -26, -27, -16, -1, 12, 25, 15, -4, 4, 33, 35,
-    22, -19, -3, 19, -8, -17, 4, -9, 3, -5, -13, -1, 11, -2, -16, 5,
-    23, 22, 9, 9, -7, -1, 12, 11, 3, 11, -10, 6, 6, -7, 9, 4,
-    -6, -7, 14, 7, 0, -3, 0, -7, -6, -20, -25, -7, -18, -4, 5, 9,
-    -7, 18, 19, 27, -6, 12, -19, 5, 28, 11, 0, 11, 18, -2, 11, 15,
-    4, -6, 1, -12, -16, -23, -19, -22, -25, -23, -5, -25, -21, 10, 15, 29,
-    2, -21, -19, 5, 15, -1, -10, 2, -12, -1, 3, -3, 0, 6, -8, -5,
-    -1, -15, -21, -22, -7, -13, -5, -9, -40, -7, -4, 22, -14, -42, 5, 2,
-    3, 8, 6, 3, 1, -1, -5, -20, -2, -6, 0, -15, 8, -10, -12, -9,
-    5, -14, -2, 7, -40, -4, 12, 25, -16, -24, -14, 16, 5, 15, 13, 7,
-    -10, -18, -10, -8, -1, -13, -20, -22, -14, -2, 1, 5, 10, -9, -25, 16,
-    -9, -33, 44, 23, -23, -14, -36, 8, 8, -12, -2, -11, -20, -12, -12, 4,
-    -5, -22, -15, -10, -9, -8, -3, 14, 12, 4, -19, -11, 30, 41, 34, -38,
-    -15, -4, -28, 22, -5, -22, -8, -10, -15, 2, 3, 15, 10, -8, -7, -21,
-    -15, 11, -9, 4, -3, -2, -19, -34, 23, 19, -13, -26, 1, -9, -42, 13,
-    -31, -19, 1, -1, 12, 3, -8, 10, 12, 16, 13, -13, -8, 1, -1, 5,
-    -1, -5, -11, -6, 11, 5, 23, 30, 2, 5, -23, 17, -47, -17, 21, -4,
-    -2, -20, -10, -2, 6, 14, 20, 14, 2, -13, -5, 0, -1, -11, -17, -16,
-    -5, 13, 40, 13, -5, 8, 26, -3, -30, -1, 9, -4, -10, -24, -32, -16,
-    6, 27, 33, 10, 11, -11, -8, 8, -1, 1, -3, -12, 15, 33, 34, 29,
-    -11, 5, 39, 15, -4, 3, -1, -7, -18, -15, -13, -6, 6, 17, 18, 0,
-    -2, -2, 9, 19, -2, 26, 19, 20, 18, 55, 55, 34, 2, 6, 27, 23,
-    -1, -11, 5, 2, 2, -16, -1, 5, 7, 21, -4, -13, 0, -1, 7, 19,
-    -1, 22, 10, 3, -17, 26, -10, 42, -13, 13, 11, 23, 11, 12, 12, 0,
-    -14, -14, -12, -5, 14, 10, -3, -9, 1, 0, -5, 7, 1, 1, 4, 2,
-    -4, 39, -19, 32, 1, -7, -14, -10, 18, 29, 9, 6, -8, -2, 4, 7,
-    -3, 12, -1, -10, 6, 12, 13, 0, -2, -13, 11, 26, -19, 66, 27, 4,
-    2, -12, 2, 22, 13, 15, 5, 26, 12, 18, 13, 24, -5, 5, 5, 4,
-    -5, 4, 25, 2, 19, 9, 22, 30, -11, 36, 31, -4, 6, 14, 34, 18,
-    6, -24, 1, 28, 10, 10, 7, 18, -1, 6, 13, 4, -12, 7, 27, 22,
-    22, 2, 26, 38, -11, 8, 20, -7, 8, 14, 27, 24, 14, -9, -6, 5,
-    2, 9, 3, 12, -6, 1, 1, 3, -9, 4, 22, 6, 5, 7, 3, 19,
-    1, -9, -15, -6, 3, -3, 14, 55, 19, 4, -24, -21, -9, 1, 3, 4,
-    -4, 2, -4, 17, 4, 3, 16, 6, 9, 14, 22, 26, -2, -5, -2, -3,
-    -4, 0, -4, 27, 5, -23, -21, -31, -32, -11, -15, 3, 6, -5, 20, 15,
-    17, 5, 14, 4, -13, -6, -2, -1, 16, 9, 3, 1, 0, 2, 2, -25,
-    -17, -17, -14, -20, -20, -25, -11, -24, 9, 18, 5, 17, 19, 34, 17, 13,
-    17, 7, 7, 8, 21, 5, 6, 3, 0, -4, -3, 2, 6, -10, -19, -17,
-    -12, -18, -3, -14, -27, -6, -24, -23, 21, 20, 10, -23, -28, -10, -10, -20,
-    -17, 3, 2, 0, -1, -4, 2, 2, -11, -13, -14, -19, -26, -9, -32, -20,
-    -13, -37, -21, -7, -35, -41, -16, -13, -4, 6, 0, -7, -3, -2, 2, -5,
-    4, -3, 2, 2, 3, 3, -3, -1, 0, 3, 2, 2, 3, 1, 0, -1,
-    1, 0, 1, 3, 1, 4, -3, 1, -1, -4, 2, 3, 0, 1, 1, -4,
-    -1, 4, 16, 11, 17, 18, 23, 13, 23, 49, 39, 24, 20, 22, 19, 24,
-    18, -9, 5, 5, -3, 2, -4, -4, -5, -2, -4, -2, 21, 19, 17, 17,
-    60, 53, 37, 44, 1, -25, 16, 5, -8, -3, -16, 24, 26, 21, 20, 15,
-    17, -4, 0, -1, -1, -3, 0, 6, 36, 42, 35, 23, 2, -21, -22, -26,
-    -35, -20, 7, -8, -40, -57, -26, -10, 10, -11, -18, -4, -1, 3, 4, -4,
-    -3, 4, 1, -17, 41, 36, 13, -10, 15, -12, 1, -21, -35, -22, -5, -36,
-    -34, -13, -25, -46, 0, -19, -47, -18, -19, 3, 3, -2, 2, -2, 8, 11,
-    51, 7, -10, 3, 42, 5, 7, -20, -4, 19, 3, -35, -14, -18, -23, -7,
-    -9, -6, -28, -17, -18, -2, -4, -5, 3, -3, -5, 47, 31, 5, -7, 6,
-    22, 21, 6, -2, 22, 7, 7, -4, -17, -1, -14, -8, -12, 4, -52, -54,
-    -58, -32, -12, -11, 1, 28, 22, 53, 19, -2, 4, 27, 22, 8, 2, -6,
-    -5, -1, 2, 3, -1, -15, -9, -23, -24, 5, -56, -80, -65, -16, -18, -31,
-    -17, 26, 8, 26, 46, 15, 13, 20, 21, -1, 2, -7, -1, 8, 15, 7,
-    7, -18, -35, -12, -2, -11, -42, -32, -49, -17, -6, -22, 11, 6, 3, 30,
-    26, 33, 10, 25, 25, 4, -4, -11, 7, 11, 22, 6, -11, -6, -38, -22,
-    4, -2, -35, -10, -3, -19, 9, -6, 7, -2, 5, 11, 12, 24, 33, 37,
-    24, 3, 21, 0, 7, 23, -4, -18, -17, -10, -7, -10, -3, -6, -18, -8,
-    12, -26, -22, -5, 7, 6, -9, 9, 20, 32, 13, 18, 25, 20, 29, 40,
-    27, -3, -30, -16, -17, -15, 7, -1, 10, -7, 1, 1, 37, 8, -14, -15,
-    6, 17, 1, -11, 16, 11, -15, 4, -12, -18, 3, 8, 1, -55, -56, -31,
-    -7, 10, 27, 5, -3, -5, -3, -12, 4, 6, -9, 11, -2, 7, 13, -6,
-    -5, 4, -29, -27, -31, -14, -1, -6, -41, -64, -33, -14, 9, 29, 16, 12,
-    -1, 16, 15, 25, 23, 17, 24, 24, 1, -1, 13, 2, -17, -13, -27, -49,
-    -39, -20, 8, -12, -63, -46, -12, 11, 11, 12, 19, 16, 3, 20, 27, 38,
-    10, 2, 35, 12, 6, -1, -2, 13, -50, -20, -9, -28, -19, -5, -12, -33,
-    -55, -6, 16, 30, 5, 14, 7, 14, 23, 20, 38, 15, 31, 24, 10, 4,
-    6, -3, -3, 9, -28, -9, -16, -37, -25, -14, -29, -53, -59, 6, 34, 20,
-    22, 24, 15, 26, 12, 28, 27, 7, -7, -10, 25, 27, 1, 0, 34, -31,
-    -31, -17, -20, -61, -50, -44, -46, -41, -33, 14, 31, 20, 8, 29, 38, 21,
-    7, -1, -3, -5, -1, 48, 27, 30, 5, 3, 19, -31, -17, -8, -17, -35,
-    -60, -44, -15, -14, 10, 22, 11, 12, 17, 39, 34, 12, -22, -39, -12, -19,
-    -12, 31, 27, 8, -7, 17, 21, -5, 0, -12, -13, -8, -33, -34, 19, 35,
-    25, 12, 17, 8, 11, 23, 18, -3, -25, -34, -35, -39, -20, 7, 35, -33,
-    -3, 0, 27, 10, -13, -5, 4, 4, -8, -14, 14, 32, 30, 11, 16, 7,
-    -9, -11, -17, -30, -14, -33, -44, -38, -6, 4, 34, 0, -3, -1, 25, 15,
-    -9, -12, -11, -49, -27, -5, 7, -4, 8, 26, 30, 9, 9, -11, -18, -19,
-    -32, -25, -24, 1, 8, 23, 0, -3, -4, 3, 14, -10, -17, -24, -9, -16,
-    -8, 6, -20, -15, -2, 8, 17, 13, -22, -21, -3, -17, -2, -8, -17, 9,
-    -3, 19, -3, 3, -3, 4, -1, -30, -26, -23, 12, 8, 8, -6, -19, 6,
-    -4, 7, 10, 6, -4, -4, -13, 6, 0, -19, -1, 15, -13, 10, 3, 3,
-    2, -2, -8, -11, -28, -22, 17, 5, 2, -2, -28, -2, -8, -8, -3, 14,
-    -8, -1, 5, 28, 3, -20, 7, 4, 35, 6, -18, -1, 4, -3, -5, 1,
-    -30, -30, 7, 13, 3, -21, -24, -17, 14, -25, 4, 1, 10, 14, 1, 23,
-    13, -23, -27, -17, 18, -17, -2, 4, -5, 5, 4, 11, -46, -46, -34, 3,
-    29, 2, 1, -5, -5, 30, -5, -8, -5, -4, 10, 47, 19, -10, -3, -7,
-    -20, -1, -3, -1, -1, 4, 0, 4, 11, 12, 19, 16, 26, 28, 29, 7,
-    -2, 24, 26, -8, -4, 32, 22, 6, -15, -12, -9, 11, 1, 4, -1, -3,
-    3, 3, 2, 0, -3, 4, 0, 0, 0, 0, -4, 1, -12, -10, -13, -3,
-    4, -2, -3, 4, -2, -3, 1, -4, -4, -1, 0, -4, -3, 2, -1, 4,
-    3, 1, -15, -12, -11, -15, -35, -3, -1, 3, 22, 11, -8, -5, -46, -30,
-    -29, -8, -12, -2, 0, 3, 3, -3, -2, 4, -11, -3, -19, -19, -16, -19,
-    -45, -60, -54, -23, 6, 17, -21, -21, 17, 3, -5, 3, -9, -19, -10, -14,
-    -32, -18, 0, -1, -4, 0, -15, 12, 17, -7, -23, 1, 14, -6, 11, -3,
-    8, 14, 0, 17, 20, 21, 9, 12, 44, 1, -28, -35, -14, 19, 3, -4,
-    0, 1, -6, 46, 12, -27, -15, 4, 1, 14, 8, 16, 9, 5, 2, 20,
-    25, 5, 8, 16, 8, 9, 10, -4, 15, 30, 18, -31, -2, -1, -29, 24,
-    -10, -29, 1, 4, -24, -18, -10, 13, 6, -1, 9, 9, 4, 6, -6, 13,
-    19, -2, 10, -26, -5, 9, -19, -24, -4, 4, -5, -18, -5, -24, 10, 5,
-    -7, -18, 4, 3, -13, 8, 0, -4, 8, 8, 9, 4, 11, -3, 5, 25,
-    18, -6, 8, -15, -5, -9, -37, -24, 19, 14, 12, -1, 3, -1, 4, 1,
-    10, 5, 1, 12, 11, -1, 6, 7, -4, -5, -4, 34, 10, -4, 5, -16,
-    8, -24, 16, 12, 5, -4, 9, 11, -3, -6, 0, -7, 14, 17, 10, 21,
-    17, 11, 14, 0, -8, -3, 18, 8, 23, 33, 11, 22, -12, -42, 14, 7,
-    -7, -10, 11, -1, 3, 0, -5, -3, 7, 19, 12, 13, 24, 15, 6, 0,
-    1, -1, -4, 16, 26, 33, 42, 20, -10, -11, -13, 25, 4, -5, -5, 5,
-    3, -2, 7, 4, 26, 7, 18, 13, 21, 21, -2, -2, 2, -9, 13, 37,
-    23, 8, 34, 18, -7, -16, -20, 16, -1, -11, 3, 8, -6, -22, -8, -7,
-    -1, 7, 22, 14, 3, 19, 12, -4, 4, 7, 9, 20, 39, 39, 57, -28,
-    -4, -17, -7, 20, 21, 22, 16, 11, -26, -20, -9, -3, 6, 18, 18, 3,
-    -11, 15, 7, 12, 24, 14, 1, 36, 12, -4, -2, -33, -1, -13, -30, 8,
-    34, 12, 4, 10, -3, -5, -3, 9, 8, 4, 8, -4, -2, 10, 9, 26,
-    13, 12, 10, -1, -30, -5, -15, -4, 2, 7, -32, 3, 22, 14, 14, 7,
-    -1, 2, 1, 0, 5, 11, 10, -8, -6, 6, 2, 22, 11, 18, -8, -9,
-    5, 18, -44, -15, -8, 5, -9, -16, 38, 18, 15, 2, 15, 0, 11, 2,
-    6, 4, -1, -23, -2, -1, 10, 17, 13, 4, 1, 2, 2, 10, -18, -28,
-    -8, 5, 3, -8, 26, 7, 8, -5, 4, -8, 7, 3, 13, 6, -14, -23,
-    -18, -7, 11, -2, 4, -18, -19, -3, 4, -21, -59, -22, 1, 12, -6, 11,
-    17, -6, 8, 13, 6, 7, -2, 5, 4, -10, -11, -18, -1, 1, -6, 8,
-    -9, -22, -17, 14, 4, -75, -56, 31, 17, 17, -5, 12, 3, 8, 11, -11,
-    4, -2, 9, 31, -1, 0, 0, -5, -7, -21, -13, 7, 3, -23, -18, -12,
-    -7, -58, -59, -27, 11, 18, -16, 5, -5, 17, 6, -2, 4, -6, -2, -9,
-    12, 11, 6, -3, -5, -1, 17, 18, 5, -10, -10, -1, 2, -40, -34, -23,
-    -2, 21, -26, -1, 17, 8, 2, 5, 1, 2, -6, 4, 1, 10, -3, -1,
-    1, 3, 19, 18, 5, -8, 7, 17, -11, -15, -5, 3, 7, -5, -18, -14,
-    -2, -6, 14, 15, -1, -8, -13, 1, -10, -6, -11, -1, -19, -3, 11, 14,
-    15, 6, 1, -16, -33, -9, -1, 3, 6, 9, -30, 2, -2, -6, -1, 4,
-    -14, -15, -9, 1, -8, -6, -3, 0, -11, 11, 17, 8, 13, 9, 19, 8,
-    7, 12, 1, 9, -4, -3, 23, 29, -7, 15, -25, -12, 12, 4, 0, -4,
-    -13, -1, -3, 12, 13, 24, 35, -5, 8, 2, 12, 1, 29, 11, -5, -2,
-    1, 0, -5, 29, 16, -2, -9, 2, 14, 23, 21, 12, 26, 12, 9, -4,
-    7, -4, 20, 1, 20, 25, 7, 36, -26, -22, -12, 5, -4, 2, 10, -23,
-    -16, 10, 8, 20, 13, 15, 19, 7, 12, 28, -1, -15, 2, -5, 0, 42,
-    25, 6, 8, 9, -7, -8, -9, -1, -2, 4, -2, 14, 47, 49, 41, 4,
-    7, -1, 3, 16, 7, -12, 8, -10, 3, 27, 16, -16, 6, -3, -11, 8,
-    21, 2, 4, -5, 3, 2, 5, -4, -14, -22, 12, 22, 17, -6, -13, 5,
-    1, -22, -9, 14, -4, -27, -12, 3, -19, -33, -18, -26, 1, 3, 2, -1,
-    0, 4, 1, -2, -4, 4, -3, -4, -2, 2, 1, 4, -13, -28, -15, -2,
-    -1, 0, -4, 5, 0, -4, 1, -4, -4, 4, -2, 0, 5, 3, -1, -2,
-    4, 0, -12, -9, -15, -24, -25, 0, -1, 8, 24, -13, -9, -4, -28, -21,
-    -23, -16, -15, -6, 0, 5, -2, -2, -2, -1, -20, 4, -9, -14, -8, -12,
-    -26, -36, -31, -26, -51, -30, -28, -55, -36, -71, -30, -75, -66, -57, -30, -36,
-    -33, -24, 1, 2, 1, -3, -20, -34, -28, -46, -44, -50, -64, -40, -25, -34,
-    -58, -64, -47, 0, 6, -9, -19, -9, 17, -21, -26, -53, -32, 11, 2, 1,
-    4, -1, -14, -27, -36, -53, -65, -59, -62, -41, -38, -13, 7, -8, -9, 19,
-    22, 3, -10, 12, 31, 23, 18, -19, -8, 12, 17, -4, -5, 3, -37, -15,
-    -34, -24, -38, -54, -31, -9, -5, 18, 15, 9, 6, 11, -7, 8, -8, -12,
-    1, 9, 14, -32, -7, 1, -21, -17, -3, -8, 11, 36, -23, -26, -7, -15,
-    -14, -23, -9, 9, 9, 3, 5, -7, 0, 12, 6, -7, -3, 20, 7, -1,
-    -18, -34, -19, 1, 6, -4, 24, 37, 9, -15, 1, -16, -17, -1, -18, -22,
-    -11, -14, -12, 1, 5, 2, 11, 3, -2, -5, 4, 22, 10, -18, -27, 2,
-    38, 17, 42, 31, 20, 16, 28, 8, 8, 1, -13, -34, -19, 1, 13, 17,
-    19, 1, 19, 3, -17, -15, 5, 8, 17, 11, -1, 7, 6, 41, 6, 8,
-    14, 11, 25, 9, 5, 3, -17, -19, -10, 13, 22, 22, 27, 9, 20, 5,
-    1, -1, 2, 12, 14, -9, 1, 3, 8, 25, 25, -6, 29, 5, -1, 16,
-    21, 4, -7, -1, 3, 3, 16, 26, 20, 23, 22, 9, 14, 9, 29, 11,
-    -13, -38, -22, 13, 6, 12, 18, 52, 31, 7, -5, 28, 14, -8, -2, 1,
-    -5, -1, 14, 6, 10, 9, 13, -5, 13, 25, 22, 11, 15, -22, 33, 32,
-    12, 12, 26, 29, 26, 18, 15, 30, 7, -8, -1, 6, -4, -12, -15, -6,
-    -8, 14, 10, 7, 17, 28, 21, 18, 5, -22, 0, 38, 3, 12, 35, 25,
-    26, 3, 7, 15, 22, 14, 11, 16, -3, -20, -21, -10, -2, 19, 13, 17,
-    22, 29, 1, -14, -21, 11, -4, -11, -3, 0, 33, -1, 9, 14, 5, 15,
-    19, 18, 14, 25, -3, -10, -8, -10, 3, 21, 13, 24, 20, 14, -8, -4,
-    -4, 8, -43, -25, 7, -1, 15, -28, 13, 13, 15, 20, 24, 27, 21, 12,
-    0, -13, -21, -7, 10, 23, 4, 2, 24, 10, 14, -12, -6, -18, -33, -21,
-    7, -1, -10, -35, 3, -8, 14, 11, 24, 17, 5, 1, 12, 13, -22, -5,
-    13, 11, -12, -20, 8, -4, -7, -7, -10, -45, -43, 25, 0, -5, -13, -39,
-    -2, -10, -3, 7, 8, 11, -12, 13, 15, 3, -8, -6, 0, 0, -13, 1,
-    0, -10, -4, 0, 15, -46, -39, 33, 31, -5, 12, -47, -28, -17, -22, -3,
-    7, 0, 3, 21, 13, 13, -6, -8, -2, -16, -5, -6, -6, -7, -8, -9,
-    1, -43, -24, 8, 7, 27, 19, -19, -21, -20, -7, -15, -1, -5, -12, -12,
-    10, 15, -6, -12, -18, -23, -13, 2, 1, 5, -11, -24, -6, -48, -14, 26,
-    3, 31, -9, -16, -19, -28, -31, -25, -18, -35, -15, -17, 11, 3, -11, -12,
-    -21, -19, -6, 6, -3, -10, -6, -7, -3, -9, -18, -5, 2, -1, -16, -14,
-    4, -3, -3, -17, -32, -28, -23, -15, -5, -6, -18, -17, -19, -20, 2, 3,
-    -3, 7, -3, -26, -9, -17, -20, 3, 7, 0, -8, -16, 8, 23, 12, 8,
-    -3, -2, -9, -8, 2, 5, 15, 5, -10, -13, -2, 1, -4, 8, 6, -16,
-    8, 13, -15, 7, -1, -2, -24, -44, -21, 1, -1, 9, 3, 11, 4, -6,
-    4, 2, 1, 3, -9, -9, -13, -34, -31, -19, -25, -19, 23, 14, -18, 2,
-    3, 4, 8, -13, 6, 38, -1, -10, -9, -13, 9, 14, 25, 24, 2, 4,
-    -28, -58, -61, -33, -29, 1, -6, 1, -23, -8, -5, 3, 3, 3, -1, 12,
-    -7, -14, -20, -19, -4, 15, -4, -19, -22, -4, 32, 13, -3, -44, -50, -35,
-    -26, -26, -44, -30, -24, -6, -6, 3, 0, -1, -4, 15, -32, -39, -29, -9,
-    14, 24, 10, -11, -26, -10, 17, 16, 14, -5, -2, -4, -4, 25, 34, 25,
-    17, -2, -1, 2, -1, -4, -2, 4, 15, 21, 18, 19, 22, 27, 40, 24,
-    9, 21, 47, 7, 24, 48, 31, 29, 25, 33, 40, 20, -3, -3, 4, 4,
-    1, 3, -2, -5, 3, 0, 4, -4, 4, -3, 3, 3, 6, 8, 6, -1,
-    4, -4, -1, 0, -3, 4, -1, -5, -1, 3, 3, 4, -3, 2, -2, -1,
-    -4, 6, 7, 4, 5, 3, 3, 7, 6, 6, -3, 8, 7, 12, 7, 3,
-    -2, 3, 5, 0, 2, 0, -1, -1, 2, -2, 1, 4, 1, 5, 10, 1,
-    31, 36, 32, 31, 40, 12, 24, 5, -30, -13, -15, 4, 4, 4, 6, 5,
-    13, 11, 5, -4, 4, 2, 3, 2, -7, -15, -15, -3, 2, 15, 29, 27,
-    28, 24, 32, 15, -26, -27, -11, -13, -19, 12, -1, 16, 17, -8, -8, -1,
-    3, 2, -4, -8, -13, -1, 3, 13, -18, -12, -7, -10, -16, -17, -6, -23,
-    -26, 8, 1, -26, -12, -12, -24, 15, 23, 23, 31, 33, 3, 3, 2, -14,
-    -37, -39, -7, 25, 13, 1, 4, 6, -8, -1, -4, -10, -11, -10, -17, -7,
-    6, 21, 4, 7, 10, 44, 38, 23, -3, 13, 18, -33, -35, -4, -9, 15,
-    17, 13, 24, 4, 9, 1, 5, 3, -12, -8, -6, 9, 13, 28, 7, -10,
-    -4, 24, 26, 7, 0, 25, 19, 2, -15, 8, 3, 13, -6, 3, 5, 2,
-    -2, 1, -1, 11, 31, 24, 11, -3, 10, 35, 32, 3, -16, -22, 32, 12,
-    2, 16, -4, 2, 0, -12, -20, -18, -35, -25, -22, -2, 7, 11, 18, 15,
-    36, 39, 7, 18, 28, 31, 28, 37, -19, -32, 17, 1, 3, 4, 4, -16,
-    17, -3, -38, -32, -39, -19, -9, -9, 14, 13, 13, 1, 27, 24, 20, -2,
-    5, 24, 29, 29, 0, 21, 2, 13, 9, 2, 10, -9, -11, -11, -16, -23,
-    -13, 8, 20, 1, 6, 18, 2, -17, 5, 16, 14, -3, 18, 11, 12, 18,
-    7, 11, 21, -9, 0, 2, -2, -3, -31, -23, -19, -3, 4, 14, 7, 18,
-    27, 7, -19, -25, -15, -5, -18, -8, 1, -9, -11, -16, -3, -9, 27, -14,
-    -2, 12, 5, 11, -23, -33, -10, 0, 13, 12, 2, 6, 17, -20, -23, -31,
-    -28, -6, -17, -1, -24, -16, -21, -22, 1, 1, 22, 0, 4, 7, 19, -2,
-    -6, -14, -13, -7, -5, -3, -4, -3, -12, -10, -12, -36, -31, -13, -16, -24,
-    -20, -16, -3, 11, -1, -5, 16, 17, 0, -1, -2, -2, 0, -15, -5, -16,
-    -20, -30, 6, -28, -44, -27, -10, -26, -30, -25, -34, -46, -29, -8, 11, 11,
-    -15, -9, 25, 25, -1, 0, -3, 4, -10, -27, -51, -21, -38, -25, -15, -11,
-    -10, -24, -16, -20, -27, -25, -44, -58, -56, -32, -20, 16, 10, 26, 2, 26,
-    0, -4, -13, 10, -19, -23, -53, -30, -22, -9, 4, 0, 12, -14, -11, -14,
-    -3, -9, -31, -41, -56, -41, -21, 18, -4, 63, 43, 35, 0, -3, -10, -5,
-    -20, -32, -33, -38, -28, 2, 18, 0, -1, -11, -12, -8, -8, -10, -25, -30,
-    -56, -26, -5, 3, 1, 53, 20, 36, -14, -5, -12, -22, 10, -10, 4, -12,
-    -19, -4, 4, -15, 0, -21, -23, -7, -6, -22, -20, -18, -33, -3, -9, -25,
-    7, 40, 5, 8, -10, 6, 13, -16, 12, 3, 5, 1, -2, 1, 11, 26,
-    17, 9, -7, -11, -9, -18, -24, -19, 1, 4, -16, -44, -28, 8, 14, -15,
-    -1, 1, 25, 2, 10, 26, 12, 0, 17, 11, 21, 33, 31, 16, 6, 4,
-    1, -8, -14, -6, -2, -1, -13, -43, -38, -5, 1, 3, -7, -1, 31, 9,
-    17, 19, 0, -10, 10, 6, 13, 30, 29, 26, 17, 16, 11, 15, -2, -1,
-    8, -19, 5, -12, -14, -3, 10, 6, -6, -4, 34, 29, 20, 17, 25, 12,
-    8, 11, 3, 20, 29, 11, 13, 17, 20, 18, 11, -4, -10, -16, -4, -34,
-    -25, 6, -15, 6, -3, -2, -2, 38, 24, 10, 29, 20, 12, 1, -3, 12,
-    20, 28, 25, 27, 31, 26, 15, 5, 18, 19, 2, -10, -21, 10, -24, -2,
-    4, 1, -4, 0, -27, -5, 10, 7, 19, 31, 2, 6, 27, 52, 44, 48,
-    39, 42, 55, 57, 60, 6, -27, -16, 16, 1, -8, 3, 2, 3, -20, 3,
-    5, -13, 25, 25, 19, 12, 15, -1, 4, 29, 15, 37, 17, 38, 51, 38,
-    48, 39, 9, -16, 1, 4, 5, -3, 0, -2, -4, 0, -44, -50, -37, 17,
-    34, -12, -9, -1, 26, 34, -4, 1, -2, -9, 12, -4, -5, -10, -2, 8,
-    -1, -5, -2, 4, 2, 4, -1, -1, 18, 14, 12, -1, 9, 4, -2, 6,
-    30, 11, -23, -24, -3, 4, -2, 3, 2, 2, 4, 0, 3, -3, -3, 4,
-    -2, -3, 2, 0, 1, 2, 3, -5, 5, -4, 3, -4, -2, 5, 2, -4,
-    4, -4, -1, 3, 3, 2, 0, 4, 3, 4, -2, -2, -2, -1, 4, 3,
-    -4, -1, -3, 0, -1, -3, -18, -17, -16, -4, 21, 19, -24, -30, -25, -6,
-    -6, -8, -5, 1, 2, 3, 4, -1, 3, 0, -3, -2, 0, 2, -4, 10,
-    -5, -5, -15, -26, -43, -46, -23, -6, -8, -20, -3, -12, -17, -19, -16, -35,
-    -31, 1, 2, -4, 1, -4, -1, 29, 31, -37, -35, -29, -32, -50, -81, -23,
-    17, 12, 11, 0, -10, 5, 44, 27, 19, -10, -46, -21, -18, -20, -30, -2,
-    1, -3, -4, 30, -5, -30, -23, -30, -28, -44, -45, 6, 7, 15, 12, 15,
-    5, -21, -26, -5, -5, 8, 3, -5, -22, -1, 5, -29, -3, 4, 2, 38,
-    -4, 26, 21, 8, 3, -5, 0, 9, 5, 1, 3, -19, -17, 9, -12, -23,
-    -27, -23, -12, -34, -33, -3, -21, -30, -3, -14, -6, 11, 12, 23, 9, -6,
-    10, -6, 15, 19, -5, 0, -4, -11, 1, 4, 4, -4, 0, -16, 4, 35,
-    14, -18, 5, -21, -5, -20, 4, 3, -14, -43, -38, -21, -32, -15, 1, 21,
-    13, 1, 4, 2, -4, -2, 2, 2, 4, -14, 16, 42, -11, -29, 2, -13,
-    -26, -13, 3, -1, -37, -44, -25, -10, -21, -16, -7, 5, 2, 4, 0, 13,
-    12, 2, 9, 7, 5, 13, 16, -9, 14, 24, 4, 39, -8, 16, 1, 3,
-    -29, -22, 6, 6, -17, -11, -9, 0, -11, 3, 15, 1, 1, 23, -3, 9,
-    30, 19, 20, 14, 10, 47, 48, 43, -11, 22, 6, -18, -22, -10, -13, 1,
-    -21, -13, -21, -6, -5, -12, 11, 4, -5, 1, 1, 20, 38, 24, 51, 47,
-    15, 51, 37, 15, -1, -7, 1, -7, -14, 8, 8, 1, -17, -17, -18, -10,
-    -29, -11, 13, 5, 8, 30, 24, 8, 2, 14, 40, 37, 33, 40, 57, 19,
-    -4, -6, 16, 7, 24, 34, -8, -13, -38, -6, -4, -6, -32, 8, 25, 23,
-    14, 27, 8, -15, -24, -4, -4, 17, -25, -31, 10, 35, 0, -8, 7, -7,
-    20, 7, -43, -35, -28, -1, 0, 5, 3, 13, 28, 25, 5, 12, -18, -19,
-    -27, -23, -45, -35, -57, -26, -4, 18, -3, 7, -4, -23, 14, -9, -26, -26,
-    -29, -18, -14, -2, 9, 32, 35, 24, 3, -6, -36, -29, -29, -35, -44, -58,
-    -70, -34, -17, 3, 1, 10, -19, -25, 11, 23, 22, -3, -8, -24, -8, 8,
-    27, 27, 15, 12, 9, 5, -4, -36, -29, -25, -24, -40, -58, -25, -30, -2,
-    2, 11, -12, -8, 32, 46, 16, -14, -9, -13, -6, -10, 12, 22, 14, 12,
-    23, 18, -20, -53, -28, -66, -44, -19, -2, -39, -2, -9, 3, 9, -11, -25,
-    25, 8, 2, 6, -3, 1, -19, -15, -2, 3, 8, 20, 20, 12, -18, -43,
-    -48, -50, -16, 30, 25, 10, 26, -7, 26, 15, 28, -55, -6, -5, -7, -8,
-    -7, -20, -16, -2, -1, 9, 24, 20, 29, 14, -16, -70, -76, -66, -24, -6,
-    15, 14, 45, -28, 16, 16, 7, -65, -26, -2, 4, 14, 8, -6, -17, -19,
-    -10, -1, 6, 18, 20, 17, -5, -69, -91, -54, -33, -11, 0, -10, 15, -21,
-    -4, 21, -16, -34, -23, -2, 5, 13, -1, -8, -19, -16, -6, 9, 11, 16,
-    14, 10, -38, -55, -66, -51, -35, -31, -27, -32, 17, 2, -3, 3, -23, -28,
-    -15, -2, 12, 3, -13, -26, -9, -2, -2, -1, 8, 10, -7, -22, -57, -80,
-    -52, -41, -27, -10, -20, 1, 7, -2, 1, -2, -16, -35, -4, 1, 21, 8,
-    -8, -5, 4, -1, 2, 1, 13, -7, -41, -51, -75, -65, -48, -35, -40, -13,
-    -6, -8, -32, 1, 2, -5, 16, -30, 0, 25, 2, 1, -9, -5, -1, 5,
-    0, 2, -6, -29, -65, -76, -72, -72, -22, -20, 12, -11, 19, 3, -28, 4,
-    0, 4, 22, -4, 17, 46, 15, 15, 13, 12, 9, 8, 29, 18, -12, -38,
-    -53, -75, -68, -53, -30, -9, 12, 10, -5, -17, -10, -1, -2, 3, 11, 11,
-    -14, 13, -1, 5, 14, 15, 5, 9, 12, 17, 6, -29, -9, -25, -41, -38,
-    -35, -36, -38, -15, -3, 1, -2, -4, -4, 0, -1, 22, 18, 19, 19, 21,
-    28, 28, 23, 26, 17, 18, 54, 36, 7, 9, 30, 29, 9, 9, 4, -8,
-    1, 5, -3, -2, -1, 2, 2, -3, -16, -21, 15, 15, 17, 5, 10, 23,
-    17, -12, 47, 16, 4, 24, 24, 15, 14, 3, 3, 0, 3, 4, 0, 4,
-    -1, -4, -1, 2, 4, 3, -4, -1, -1, -5, 2, -5, -14, -9, 10, 7,
-    -2, -2, 5, 4, 3, -1, 0, -3, 0, 4, -3, -3, 2, -1, 2, 2,
-    -3, -6, -17, -15, -16, -14, -31, -25, -29, -49, -16, -32, -24, -26, -23, -25,
-    -25, -18, -17, -17, -5, 4, -1, -3, 3, 1, -3, -3, -19, -12, -12, -22,
-    -32, -3, -4, -16, -9, -27, -49, -31, -24, -59, -43, -62, -51, -21, -10, -24,
-    -16, -3, 4, 2, 5, 4, -6, -11, -2, -8, -13, -29, -27, -12, -3, 26,
-    -14, -54, -35, -12, -23, 2, 2, 9, -3, 12, 14, -24, -28, -20, -8, 2,
-    0, 4, -1, -5, -42, -4, -22, -20, -17, -38, -23, 8, -9, -35, -48, -7,
-    -33, -38, -21, -22, -29, 10, -2, -25, -15, -22, -23, -30, -4, -2, -25, -10,
-    -45, -11, -37, -17, 20, 27, -8, -35, -26, -31, -4, 4, -9, -14, -20, -30,
-    -4, -2, -16, -16, -16, -29, -11, -22, 0, -2, -7, 30, -3, 21, 7, 5,
-    24, 37, 1, -29, -15, -6, -5, -11, -14, -13, -10, -11, -11, 11, -1, -13,
-    -3, -16, 26, -35, 1, 14, 18, 44, -11, 27, 20, 7, 29, 30, 6, -27,
-    -15, -5, -14, -30, -22, 10, 1, -2, 9, 14, 10, 18, 12, 3, 15, -23,
-    -18, 25, -3, 12, -4, 14, 0, -6, 13, 25, 9, 15, 3, 1, 0, -16,
-    -24, 10, -2, 2, 14, 8, 8, 7, 20, 3, -22, 10, 16, 25, 3, -4,
-    -11, -4, -17, -16, -3, -3, 18, 20, 23, 13, 19, 4, -23, -14, 3, 6,
-    -5, 3, 0, -12, -19, 6, -8, 38, 14, 21, 13, -17, -26, -14, -5, 0,
-    6, 6, 4, 8, 13, 29, 23, 28, -3, -17, -15, -8, -5, -4, -5, -46,
-    -29, 24, 10, 4, 8, 13, 30, -8, -26, -13, 1, 8, 27, 10, 7, 19,
-    16, 14, 13, 19, 21, 3, -12, -12, -13, -12, -17, -48, -49, 8, -25, 24,
-    8, 17, 25, 10, -23, -23, -12, 2, 23, 13, 13, 4, -7, 16, -2, 25,
-    20, -11, 1, -3, -18, -24, -17, -56, -29, 31, 9, 38, -1, 16, 34, 23,
-    -6, 1, 13, 5, -6, -8, 12, 3, -13, -7, -5, 9, 6, 9, 6, -33,
-    8, -14, -38, -48, 19, 37, 11, 6, 3, 6, 25, 6, 32, 2, -9, 10,
-    -8, 2, 9, 6, 1, 18, 1, 18, 21, 24, 11, -14, 6, 6, 13, 12,
-    15, 15, 22, 16, 0, 1, 23, 26, 42, 23, 2, 9, -10, -1, 10, 23,
-    29, 4, 17, 28, 19, 48, 33, 0, 27, 21, 19, 26, 16, -13, 42, 21,
-    7, 1, 21, 8, 36, 27, -3, 20, 16, 10, 22, 38, 36, 6, 21, 39,
-    24, 40, 30, 29, 39, 38, 27, 28, 15, -28, 65, -7, -3, -1, 30, -16,
-    36, 39, 23, 32, 21, 24, 42, 20, 11, -1, 24, 44, 12, 22, 30, 36,
-    41, 37, 24, 20, -25, 0, 53, -27, -20, 5, 8, -2, 17, 26, 13, 27,
-    19, 6, -4, -3, -32, -19, 7, 8, 1, -1, -18, 5, 7, -10, -14, 10,
-    -26, -6, 51, 17, 2, -7, 7, 49, 32, 10, -21, -34, -34, -35, -38, -52,
-    -65, -35, -9, -5, -10, -23, -32, -36, -42, -30, -37, -18, -2, 11, 24, 18,
-    1, -16, 0, 13, 10, -15, -42, -60, -63, -46, -62, -61, -50, -25, -18, -22,
-    -19, -17, -24, -60, -46, -30, -23, -35, 36, 33, 12, 4, -5, 2, -8, -13,
-    -8, -23, -40, -51, -48, -27, -45, -23, -18, -17, -14, -30, -10, -30, -23, -48,
-    -56, -51, -35, -43, 37, 31, 2, 4, 1, -2, -17, 4, -18, -47, -8, -21,
-    1, -6, 3, -3, -6, -11, -7, -26, -9, -9, -35, -43, -65, -45, -21, -36,
-    40, 19, 23, -4, 3, 4, -13, 4, -11, -26, 31, 25, -4, -4, 8, 15,
-    10, 0, 5, -26, -10, -16, -15, -12, -32, -3, 0, -26, 23, 15, 23, -1,
-    4, -3, -6, -17, -43, -24, 21, 16, 0, -19, -14, 9, -7, 4, 6, -9,
-    -3, 9, 17, 35, 16, 36, 47, 23, 29, 25, 18, -2, -1, -5, 7, 7,
-    -19, -34, -25, -13, -19, -37, -11, 17, -31, -19, -4, 0, -12, -2, 29, -7,
-    0, 27, 50, 35, 35, 12, 20, 3, 1, -2, 4, 4, -25, -36, -18, -1,
-    -16, 12, -1, -8, 8, 15, 1, 24, -4, -23, -11, 17, 13, 9, 19, -11,
-    -15, 0, -2, 1, 3, 1, -2, -3, 12, 18, -10, -14, -12, 7, 13, -3,
-    -8, 27, -4, -20, -1, 26, 12, -1, 19, 41, 24, 26, 4, 1, -3, -2,
-    -1, 2, 4, 0, 0, 1, 4, -5, -4, 3, -2, -1, -11, -7, 8, 0,
-    4, -4, 1, -2, 1, 2, 3, 1, 4, 4, -1, -3, -4, 4, 1, 1,
-    3, -3, -13, -15, -11, -14, -27, -10, -5, -13, 10, -39, -24, -5, -11, -22,
-    -27, -13, -18, -14, 3, -5, -1, -2, 0, 1, -5, -2, -19, -19, -12, -22,
-    -47, -41, -21, -48, 6, -10, -13, -22, -10, -41, -33, -40, -45, -39, -32, -33,
-    -23, -21, -1, -3, 0, -4, -7, -29, -18, -19, -28, -18, -34, -37, -43, -38,
-    -37, -41, -12, 8, -15, -48, -59, -43, -8, -28, -21, -37, -35, -17, -1, 2,
-    1, 4, -18, -7, -29, -18, -7, -29, -43, -24, -19, -13, -9, -18, -19, 14,
-    -7, 5, 2, -16, -14, -23, 14, -6, -6, -1, -16, 0, 4, -2, -31, -8,
-    -15, -12, -9, -32, -14, 6, -6, -18, -32, -27, -26, -4, -2, -6, 22, -1,
-    -8, -15, 3, -13, -17, -20, -13, -7, 0, -5, 1, 31, 15, 2, 16, 6,
-    19, 5, -20, -24, -13, -2, -14, -11, 0, 0, 2, -7, -13, 6, 1, -26,
-    -27, -56, -47, -26, 2, 20, 15, 56, 1, 18, 37, 1, -6, -6, -12, -15,
-    -6, -1, -10, -3, 2, 21, 0, -4, 3, 1, -8, 2, 18, 9, -40, -28,
-    36, 19, 27, 34, 12, 4, 13, -15, 1, 12, 1, -2, -11, -15, -1, 15,
-    21, 7, -2, -17, -3, 1, -1, -4, -5, 10, -6, -20, 13, 29, 35, 23,
-    -10, 12, 11, 6, -8, 6, 14, -3, -5, 5, 20, 24, 11, 4, -5, 1,
-    8, -14, 8, 4, -16, -26, -18, -20, 14, 12, 43, 35, -22, 6, 17, 15,
-    -1, -3, -1, -4, -3, 15, 17, 8, 4, -5, -4, 4, 15, 0, 11, -16,
-    -20, -5, -36, 1, 3, 13, 43, 16, -32, -7, 11, -4, 6, -1, -2, -8,
-    13, 14, 1, -3, -4, 3, 4, 13, 7, 8, 9, -21, -38, -30, -51, -5,
-    8, 7, 42, -10, -17, -4, 13, -22, -8, -5, -6, -9, 17, 1, -9, -8,
-    -8, 2, 16, 19, 11, 7, 20, -6, -40, -34, -28, -17, -1, 9, 5, -13,
-    7, -1, 2, -5, 12, -6, -8, -13, 0, -17, -21, -10, -12, 17, 28, -1,
-    5, 4, 9, 4, 0, -16, -4, 5, 3, 2, -14, -19, 35, 0, -13, 17,
-    3, 6, -18, -11, -3, -7, -7, -6, -4, 28, 18, 21, 12, 10, 22, 8,
-    5, -1, 11, 18, 4, -1, 5, 8, 47, 9, -12, 0, 1, 7, 0, 0,
-    13, 0, 7, 13, 1, 22, 17, 23, 25, 32, 29, 7, 3, -5, 49, 14,
-    9, 6, 26, -13, 26, -5, -12, 10, 10, 3, 3, 22, 16, -4, 6, 8,
-    6, 25, 23, 22, 32, 29, 29, 0, -11, -25, 45, 36, 4, 9, 40, -14,
-    26, -21, -32, 0, 6, -5, 4, 12, 0, -3, 8, 8, 13, 31, 34, 23,
-    7, 23, 23, -8, -21, 4, 20, 43, 2, 16, 20, 29, 16, -11, -32, -14,
-    6, 1, 2, 1, -13, -7, 14, 24, 38, 41, 34, 18, -9, 22, 18, -9,
-    -13, -1, 50, 4, -1, 25, -11, 31, 16, -9, -21, -36, -8, -9, -4, -5,
-    -8, -1, 11, 23, 21, 17, 8, 4, 4, 24, 8, -16, -20, -6, 24, -14,
-    1, 26, 8, 46, 6, -28, -19, -12, 2, 10, 3, 0, -8, -18, -3, -12,
-    -5, -2, -4, 5, -3, 12, -8, -4, -6, 8, 21, -2, -3, 9, 29, 58,
-    7, -10, -22, -22, -1, -8, -9, -6, -8, -19, -29, -27, -2, -15, -22, -9,
-    -15, -8, -1, -9, 10, -20, -12, 7, 3, 1, 40, 21, -10, -6, -7, -9,
-    -3, -20, -9, -11, -9, -9, -15, -12, 3, -2, -28, -19, -26, -28, -1, -9,
-    5, 1, -22, 2, -3, -1, -2, 13, -8, -10, 10, 32, -2, -20, 13, 18,
-    4, -2, 1, -5, -17, -26, -46, -30, -42, -27, -27, -19, 18, -6, -18, 4,
-    4, -2, 7, 10, 46, 37, 31, 36, 4, -4, -10, -11, -15, -8, 13, -18,
-    -21, -19, -24, -22, -17, -7, 16, 7, -2, 24, 15, 0, -5, 3, 23, -9,
-    54, 62, -2, 0, 4, 4, 3, 10, -30, -8, 10, -6, -17, -3, 23, -11,
-    -26, -22, -31, -31, -34, 16, 13, -3, -4, -3, 4, 2, 24, 46, 45, 36,
-    29, 39, 28, -15, -22, -8, 34, 16, 11, 14, 16, -2, -4, 21, 17, 19,
-    21, 4, -3, -4, 4, 0, -1, 0, 8, 16, 1, 7, 6, 11, 30, 7,
-    0, 11, 27, 35, 24, 26, 20, 36, 38, 45, 45, 6, -3, 3, -2, 1,
-    -3, 3, -2, -3, 0, -3, 3, -1, 3, -1, -1, 3, 8, 5, 2, -1,
-    -4, 4, 2, 0, -3, 1, -1, 4, 4, 3, 4, -3, -2, -1, 3, 1,
-    -3, 2, 5, -1, 8, 8, 11, 19, 9, -7, -11, 23, 17, 8, 25, 15,
-    19, 6, 0, 6, 1, 0, 4, 4, 0, 2, 12, 1, 8, 25, 9, 11,
-    33, 39, 66, 73, 21, 22, 33, 47, 17, 15, 3, 31, 16, 18, 15, 8,
-    27, 5, 1, 3, -4, 0, 22, 2, 1, -16, -8, -25, -31, -7, -17, -37,
-    -26, -13, -2, 1, 14, 14, 6, -6, -50, -8, 19, 42, 25, -21, -17, -4,
-    -3, -3, 7, -48, -17, 12, -17, -20, -16, -9, -26, -40, -8, -7, 5, -11,
-    -4, 19, 12, -2, 4, -6, 0, 32, -14, -22, -13, 35, -2, 3, 29, -26,
-    -12, 5, -23, -20, -12, -12, -5, -24, -11, 0, 2, 12, 4, 5, 27, 27,
-    26, 38, 23, 37, 36, 10, 13, 31, -3, -3, -16, -19, -30, -33, -14, 0,
-    -5, -17, -16, -8, 6, -1, 19, 17, 8, 2, 8, -5, 8, 14, 28, 21,
-    7, 35, 11, 38, -2, -11, -5, -46, -65, -61, -31, -3, 1, -18, -12, -4,
-    26, 12, 15, -5, -20, -11, -20, -38, -11, 22, 39, 14, -15, 20, 3, 28,
-    -2, 1, 14, -52, -58, -37, -5, 1, -7, -10, 4, 13, 25, 22, 11, -22,
-    -36, -20, -41, -22, -10, -2, -6, 13, -21, -30, -3, -17, 0, -27, 6, -6,
-    -41, -25, 0, 13, -4, -8, 0, 7, 21, 24, 17, 0, -23, -45, -37, -25,
-    -21, -5, 0, -10, 0, 1, -1, 16, -1, -9, -10, -56, -40, -1, 4, -13,
-    -9, -8, -9, -6, 0, 30, 25, 20, -16, -49, -24, -6, -13, -4, -18, -15,
-    6, -26, 29, 12, -1, 7, 0, -65, -15, 20, 19, 4, -39, -18, -11, -15,
-    12, 33, 25, 12, -2, -34, -15, 13, 11, -19, -10, -6, -32, -5, -2, -21,
-    4, 4, -23, -40, -12, -10, 11, 18, 0, -8, -4, 10, 0, 17, 3, 6,
-    -1, -21, -4, -2, 11, -4, -2, -49, -50, -12, -1, -8, 0, 6, -20, -17,
-    -9, 7, -1, 10, 9, -18, -17, -8, 0, -2, 0, 12, 8, -15, -15, -22,
-    2, 5, -14, -64, -30, -9, 26, 38, 2, -13, 5, 29, -9, 2, 11, 4,
-    -6, -22, -25, -4, 8, 11, 4, 2, 0, -22, -11, -27, -5, -10, -19, -68,
-    -24, 7, 68, 33, -1, -8, 4, 24, -11, -27, -5, -4, -4, -7, -8, 22,
-    30, 32, 24, 3, -9, -27, -28, -43, -25, -15, -16, -54, -32, -7, 9, 49,
-    2, -14, -1, 35, -16, -36, -12, 8, 0, 19, 26, 32, 28, 19, 23, 19,
-    -5, -22, -23, -34, -19, 0, 12, -7, 0, 27, 58, 44, -3, -8, -2, 22,
-    -30, -28, -25, -21, -1, 19, 21, 30, 21, 5, 29, 18, -12, -22, -1, -16,
-    2, 26, 32, 7, 13, 49, 5, 59, 10, 7, 12, 14, 15, -20, -10, 8,
-    12, 12, 7, 7, 12, 7, 10, 6, 5, -1, 8, 1, 7, 28, 14, 8,
-    22, 48, -4, 50, 9, 0, 41, 13, 10, -22, 2, 12, 21, 28, 18, 9,
-    0, 13, 1, 14, 29, 15, 3, 3, 15, -1, 2, 21, 12, 70, 49, 32,
-    -2, -15, 33, 12, 8, -6, 18, 8, 23, 12, 6, 2, 2, -18, -8, 17,
-    22, 20, 27, 11, 20, 7, 13, 29, 43, 25, 43, -5, 6, 8, -22, 12,
-    27, 16, 5, 17, 13, 10, -3, -10, -13, -16, 9, 7, 12, 25, 25, 23,
-    20, 9, 21, 50, 54, 12, 39, 0, 7, 7, -18, 27, 35, 30, 13, 10,
-    11, 8, -2, -10, -8, -13, -4, 13, 7, 22, 31, 23, 26, 23, 21, 48,
-    21, -10, -3, -1, -4, 0, -5, -7, 35, 16, 25, 2, -10, -3, -27, -23,
-    -5, -24, -40, -17, 6, 3, 18, 30, 17, -3, -3, 12, -13, -24, 4, -3,
-    0, 4, 0, -38, -31, -26, -1, 4, 3, 9, 14, -7, -49, -71, -59, -57,
-    -36, -38, -12, -3, -25, -30, -34, -38, 16, 29, 26, 0, -2, 4, 4, -5,
-    -30, -52, -12, -11, -48, -31, -24, -46, -69, -91, -108, -117, -109, -64, -59, -71,
-    -47, -38, -24, -12, -7, 21, 17, -3, 0, -2, -1, -14, -15, -19, -31, -24,
-    -14, -21, -33, -32, -36, -34, -40, -50, -51, -38, -47, -8, 1, 0, -1, -1,
-    2, 0, -1, 0, 4, -4, 4, -2, 5, 4, 2, 0, 0, 2, 0, 2,
-    -3, -6, -7, -9, 2, -8, -3, 0, 1, -5, -3, 4, -2, -1, -1, -3,
-    -2, 2, 3, 3, 2, -3, 1, -3, 2, 4, -3, -2, 4, 9, 18, 10,
-    -4, 5, 2, 2, 5, 2, 2, -2, 3, 4, -5, -3, 1, -3, -4, 0,
-    0, 4, 0, 2, -2, -3, -21, -16, -2, -14, -22, -3, 1, -6, -25, 13,
-    0, -6, 6, -2, -3, -3, 2, -4, 1, 1, -5, 1, -3, 6, 1, 0,
-    13, 13, 22, 25, 32, 15, 12, 25, 23, 18, 13, 11, 17, 13, -4, 6,
-    7, 5, 0, 3, -1, 3, -3, -16, -26, 7, 12, 19, 52, 8, 31, 40,
-    52, 32, 13, 25, 25, 22, 28, 29, 11, 3, -4, -24, -10, -8, -14, 0,
-    1, 4, 30, 23, 27, -7, 28, 50, 70, 34, 47, 41, 27, 22, 31, 29,
-    23, 7, 1, 13, 11, -4, 0, -40, -21, 6, 13, -14, -2, -4, 26, 2,
-    31, 19, 33, 58, 51, 24, 11, -2, 3, 9, 10, 5, 18, 2, 5, 18,
-    15, 25, 17, -11, -23, -11, -18, -17, 5, 17, -6, 16, 28, 6, 10, 21,
-    2, 4, 3, -19, -15, 3, 0, -5, -2, 8, 14, 6, 1, 6, -3, 16,
-    -7, -28, 14, 4, -2, 31, -13, -3, 5, -20, 0, 3, -15, -25, -7, -19,
-    -5, 3, 1, -1, -1, 0, 2, 5, -3, -4, 16, 5, -33, -22, 24, -5,
-    -37, 29, -9, -11, -24, -15, -7, 5, -27, -46, -17, -7, 0, 6, 7, 2,
-    4, -5, 8, 21, 13, -3, 42, -1, -28, -16, 37, 13, 4, 43, 14, 16,
-    -2, 1, 9, -6, -11, -25, -7, -13, -7, -2, 12, 6, 6, 4, -2, 9,
-    18, 1, 30, 10, -31, -9, 41, 9, 14, 15, 3, 22, 4, 8, 5, -12,
-    -3, -14, 14, 6, -20, 4, 1, -8, -5, -9, 14, 12, 12, 4, 14, 12,
-    -18, -1, 30, 11, 0, 2, -11, 24, 7, -1, -8, 0, -3, -1, 11, 11,
-    -10, 1, 4, 13, -12, 0, 13, 15, 26, 4, 7, 24, -6, 14, 28, 9,
-    2, 6, 16, -7, -11, -31, -20, 19, 2, -1, -4, -19, -30, -24, -1, 1,
-    -3, 2, 7, -2, -6, -8, -19, -11, -12, -10, 1, 6, 0, 7, 35, -1,
-    -27, -31, -29, -16, 8, -6, -21, -30, -55, -26, 2, -6, 4, 0, 1, -16,
-    -25, -14, -19, -24, -37, -11, -4, 10, -3, 12, 16, 11, -28, -59, -22, -36,
-    -22, -25, -28, -30, -39, -12, 11, 6, -2, -5, -2, -5, -18, -16, -15, -9,
-    -12, -19, 20, -2, -1, 13, 22, 21, -19, -40, -25, -38, -45, -31, -34, -22,
-    -18, 14, 21, 6, -8, -24, -7, -1, -12, -29, -12, 0, 0, -15, 30, 8,
-    4, 19, 34, 31, -14, -13, -18, -28, -21, -10, -26, 0, 3, 26, 9, 2,
-    8, -16, 5, 13, -5, -16, -9, 4, 13, 6, 9, 7, -4, 15, 9, 40,
-    -10, 3, -11, -8, -4, -5, -5, 15, 17, 25, 0, 2, 2, -8, -7, 4,
-    -8, -23, -23, -27, -24, 25, 33, 13, 2, 10, 0, 42, -13, 24, 8, 3,
-    0, -4, 9, 9, 1, 17, -9, 6, 11, -2, -14, 1, 11, -14, -22, -26,
-    -10, 10, 23, 12, 8, 2, -18, -1, -1, 15, 26, 23, 11, 14, 15, 2,
-    0, 3, 11, 6, 18, 11, 3, 18, -1, -25, -21, -19, -2, 22, 11, -1,
-    5, 0, -20, 3, 6, 23, 25, 38, 17, -6, 2, 1, -2, -9, 3, 18,
-    0, 6, 15, 11, 0, -11, -6, 1, 12, 20, 4, 0, -2, 3, 7, 2,
-    0, -3, 20, 18, 1, -8, 7, -3, 3, 10, 11, 6, -2, 5, 22, 16,
-    -19, -4, 5, 8, -2, 7, -14, 0, 3, 8, 11, -4, 21, 15, 11, 27,
-    5, 4, -4, 4, -5, 8, 8, 5, 2, 24, 17, -12, -20, -18, -9, -7,
-    10, 13, -2, -6, -3, 5, 29, 0, 14, 19, 7, 7, -8, -16, -12, -7,
-    -13, 9, 13, 36, 22, 16, 0, -16, -4, -3, 12, 17, 30, 8, -3, 3,
-    -4, -3, 9, 24, -11, -6, 3, -14, -6, -9, -24, -8, -13, -2, 14, 41,
-    7, -4, -23, -4, 25, 12, -13, -17, 8, 4, 10, -2, 5, 2, -17, -10,
-    -11, -7, 23, 14, 39, 26, 15, 2, 38, 27, 36, 30, 16, 16, 15, 40,
-    27, -12, -37, -19, -5, -9, 2, -2, 0, -1, -4, 15, -46, -41, -32, 8,
-    38, -5, 5, 4, 2, 44, 0, -15, -4, 21, 24, 2, 4, -16, -16, 3,
-    -7, 1, 1, -5, 0, 1, 2, -4, 15, 4, 7, 8, 8, 7, 11, -13,
-    -12, 17, 4, 6, 3, -19, -31, -4, -2, -9, -15, 1, 1, 4, 1, -4,
-    -3, 2, 1, -3, 2, 5, -4, -2, 0, 3, 3, 2, -10, -8, -15, -6,
-    0, -1, -2, -3, 1, -1, 0, -1, 5, 1, -2, 5, -2, 0, 3, 0,
-    2, -4, -8, -10, -7, 1, -3, 3, 1, 0, 11, -13, -6, 4, -16, -16,
-    -20, -9, -7, -8, -2, -1, 2, -3, -3, -5, -8, -5, -14, -15, -7, -13,
-    -46, -49, -61, -52, 1, -22, -37, -70, -38, -52, -28, -43, -35, -24, -1, -12,
-    -24, -12, 3, -3, 1, -1, -13, 17, 26, -29, -36, -23, 3, -3, 12, -12,
-    -13, -3, 8, 9, 5, 4, -7, -15, 38, 27, -16, -21, -16, 17, 15, -2,
-    3, -2, -27, 31, 1, -25, -40, -5, -28, 3, -14, -4, 9, -6, -11, 9,
-    3, -3, -1, 1, 13, 41, 28, 22, 47, 48, 27, -5, -1, -2, -39, -1,
-    -22, 1, -3, 4, 21, 29, 6, 26, 16, 6, 16, 1, -7, 15, 3, -12,
-    -8, -17, -14, -35, 2, 21, -1, -17, 4, -8, 35, -10, -7, 15, 11, 12,
-    24, 10, 0, 19, 10, 0, -1, 5, 13, 11, 11, 13, 15, 17, 8, 9,
-    6, -11, 2, -15, 2, -2, 37, -5, -26, -5, 6, -1, -1, 3, 2, 2,
-    -4, -13, -14, 9, 17, 18, 15, 16, 10, 2, 9, 34, 27, -2, -13, -18,
-    43, 25, 37, 17, -19, 1, 18, 14, 19, 9, -1, -2, 3, -5, 7, 17,
-    13, -3, 13, -4, -2, 2, 1, 12, 44, 69, 7, 24, 13, 29, 12, 8,
-    -13, -5, 9, -3, 8, 9, 5, 4, 1, 14, 15, 11, -1, 15, -6, -8,
-    6, 12, 2, 11, 48, 67, 8, 11, 14, 14, 33, 0, 6, -11, 3, -1,
-    9, 16, -5, -2, 6, 7, 24, 17, 11, 1, -5, -13, 5, 8, 31, 10,
-    21, 39, -1, 15, 1, 8, 32, 43, 3, 10, 0, 14, 15, -5, 0, 8,
-    14, 17, 15, 10, 1, 6, -6, -17, -4, 5, 8, 7, 28, 10, 48, 17,
-    6, 12, 27, 22, 20, 28, 1, 13, 2, -17, -7, 6, -4, -3, -10, 8,
-    3, -5, 2, 7, 5, 11, 0, 22, 5, -8, 13, 26, -1, 11, 21, 24,
-    36, 18, -5, 16, -1, 4, 10, 3, 0, -8, -16, 10, -7, -20, -11, 2,
-    9, 17, 7, -1, -22, -1, -18, -29, -4, 11, 7, -8, 39, 37, 3, 20,
-    16, 11, 12, 2, 0, -1, -7, -4, -17, -7, -1, 11, 11, 18, 10, 16,
-    8, -7, -58, -21, 5, 5, -20, -8, 31, 18, 22, 32, 17, 9, 14, -4,
-    -12, -21, -14, -2, -21, 3, 13, 1, 10, 16, 19, 14, -4, -17, -46, -25,
-    5, 6, -37, -17, 19, 9, 18, 16, 17, 2, -6, -23, -7, -13, -5, 7,
-    -10, 11, -10, -14, 16, -8, -9, -6, -14, -42, -56, -26, 0, -4, -20, -13,
-    24, 13, 7, 13, 1, 14, -4, -1, -10, -13, 3, 8, 8, 9, -1, 1,
-    9, -16, 0, 18, 19, -37, 2, 14, -6, -19, -5, -32, 2, 2, -2, 6,
-    23, 5, 6, 11, -2, -4, 2, 8, 5, 1, 1, -2, 13, -6, 6, 4,
-    4, -43, 16, -45, -10, 26, 8, -5, 4, -12, -5, -10, 17, 6, -4, -12,
-    4, 2, 6, -5, -14, 3, -1, 6, 7, 7, -16, -27, 10, -63, -38, -27,
-    -1, 19, -17, -24, 0, -9, -15, -9, 4, -2, 2, -5, 7, 12, 2, -12,
-    -13, -8, -23, -2, -12, -15, -15, -30, -7, -27, -37, 0, -9, -8, -42, -41,
-    0, 8, -8, -13, -13, -10, -5, 5, 8, -8, -20, -10, -8, -3, -16, -1,
-    -18, -17, -11, -31, -22, -2, -14, 4, -11, -12, -34, -26, 3, -13, -1, -5,
-    -4, -10, -2, -7, 5, -4, 0, -2, 11, 4, -2, 13, -17, -10, 21, -11,
-    -1, 22, 3, 5, 0, -4, -27, -19, 5, 1, 5, 9, 0, -8, -2, -5,
-    -7, -1, 1, -7, -3, -2, -3, -7, -24, -13, -18, -19, 21, 16, -23, -3,
-    -3, 0, 11, 12, 29, 45, 17, 15, 15, -1, -2, -3, 6, 26, 0, -2,
-    2, -25, -7, 1, 6, -15, -7, -4, -26, -33, -19, 1, -4, 2, -6, 20,
-    17, 16, -18, -9, -15, 6, 7, 17, -23, -4, -5, 0, 11, -21, -10, 8,
-    -20, -8, -8, -6, -8, -7, -4, -2, 0, 1, -1, -4, -18, -12, -15, -3,
-    13, 16, -2, 3, 24, 14, 8, 13, -1, -9, -2, 21, 7, 18, 32, 3,
-    20, -3, 1, 0, -4, -4, 2, -4, 15, 14, 5, -9, -6, 4, 38, 17,
-    7, 13, 16, -2, 7, 22, 20, 12, 19, 28, 30, 11, -4, 3, 2, -4,
-    1, -2, 2, 2, 4, -2, -4, -2, 4, 0, 0, 4, 0, -3, -3, -3,
-    -1, -4, -1, -2, 3, 0, -3, 2, -5, -3, -2, 4, 1, -3, 4, 0,
-    2, -3, 1, 1, 2, 3, -1, 4, 0, 1, 1, 3, 3, 1, -4, 1,
-    2, -1, 5, 1, -1, 0, 2, -3, 4, -3, -1, -4, 3, -3, 4, -3,
-    -2, 1, -3, 4, -4, 2, 0, 3, 2, 0, -2, 2, 2, -4, -1, -2,
-    -1, 4, -1, -3, 2, 1, 1, -3, 0, 3, -4, -1, 0, 2, 2, 1,
-    2, 1, 0, 0, -3, -1, 2, 5, 0, 0, -2, -2, -1, -2, -1, 3,
-    4, 2, -2, -4, 3, -3, -3, 1, 4, 0, 2, -1, -4, 3, 3, 0,
-    0, -6, -5, -5, 1, 4, -1, 3, 1, -4, -2, 2, -4, -1, 0, 0,
-    -2, 2, 2, 1, 2, 3, -1, 3, -5, -5, 1, -3, 2, -2, -2, 3,
-    -5, -3, 1, -4, -2, -5, -1, 1, 0, -5, -2, 4, 0, -2, 2, 0,
-    2, 2, 4, -1, 2, -1, -3, -5, -4, 1, -5, -4, -1, -1, 3, 3,
-    1, 4, 4, -2, 0, -3, -3, 3, 1, -2, -2, -4, 3, 2, -2, 0,
-    -2, -2, 3, -1, -5, -4, -5, -5, -5, 1, -5, -1, -5, 2, 1, -3,
-    3, -1, 0, -1, 0, -3, 3, -5, -3, -2, 3, 1, -2, -1, 3, 1,
-    0, -2, 0, -4, 3, -2, 2, 2, 2, -1, 2, 5, -4, 1, -3, -2,
-    -2, -3, 2, 3, -2, 0, -4, -2, 5, 1, -4, -4, 3, 0, 0, 0,
-    3, -1, -5, 1, -3, 1, -3, 0, -1, 3, 3, 4, 2, 4, -5, 1,
-    -4, -3, 1, -2, 0, -2, 2, -6, 0, 0, 2, -6, -1, 3, -4, -4,
-    1, -4, -1, -2, 1, -4, 3, -4, -3, -1, 2, 1, -2, -4, -5, -3,
-    0, -3, -1, -3, -1, 1, -1, -5, -2, 0, -1, -4, 0, 3, 0, -5,
-    4, -3, -1, 2, 1, -4, -4, 3, 2, -3, 3, -2, 1, -4, -5, 1,
-    2, 1, 1, 3, 2, 1, 1, 4, 2, 0, -4, 2, -3, 4, 5, -4,
-    -3, 0, -3, 3, 0, -4, 5, -2, 3, -2, 3, 1, 0, -3, -3, 2,
-    3, -2, 4, 4, 1, 4, -4, 2, -4, 3, -2, 0, 3, 2, -1, 3,
-    -4, 1, 0, -4, -5, -5, -4, 1, -4, 0, -2, -3, 1, -3, -1, 3,
-    -4, -2, -3, 2, 4, -2, -2, 2, -4, -3, 0, -1, -2, -3, 0, 2,
-    1, 1, 1, 3, -3, 0, -4, -1, -5, -1, -2, 4, -2, -2, -2, 1,
-    1, 0, 1, -4, 4, 0, -5, 1, 1, -2, 1, -5, 2, -4, -5, -2,
-    -4, 0, -2, 0, -4, 1, 4, 1, -4, 2, -2, -2, -1, 0, -4, 0,
-    -2, 0, -1, 3, 0, 1, -3, -2, 0, -5, 3, 2, -4, -5, 3, -3,
-    -4, -2, 0, 0, -1, -5, -2, -1, -3, -3, -3, 3, 1, 1, -1, -5,
-    -2, -2, 3, -1, -3, 3, -1, 1, -3, -6, -2, -4, -3, -3, -4, 4,
-    -5, 2, -1, -1, 4, 3, -2, 4, 2, -1, 0, -3, -3, -4, 3, -2,
-    -3, -2, -6, -1, -1, -1, 1, -3, -4, 0, -2, -1, 5, -4, 3, -3,
-    -3, 4, -3, 1, 1, 3, -3, 2, -5, 1, -1, -3, -2, -3, -4, -3,
-    -3, -1, -4, -4, -3, -5, -3, -1, -3, -1, 1, 2, 2, 0, -1, -3,
-    2, -2, -1, -5, -6, -4, 4, 1, 3, -1, -3, -5, -2, -4, -3, -4,
-    -3, -4, -3, -2, -1, -3, 3, 0, 2, -3, 0, -3, -1, -4, 2, 2,
-    1, 2, 0, -2, 0, -2, -5, -1, 0, -3, -4, -1, -1, 2, -2, 3,
-    -2, 1, -4, -3, -3, 1, 1, -1, 3, -3, -1, 0, -1, -2, -5, 3,
-    0, -4, 3, 1, 2, -4, -1, 2, -4, 3, -1, -2, -2, -2, 4, -1,
-    -5, 0, 3, 0, -2, 0, 2, 4, 3, -4, -4, -4, 2, 2, -3, -4,
-    4, -2, 1, -3, 0, -4, 0, -1, -1, 3, -5, -2, 1, -3, 1, -3,
-    -4, 4, 3, -1, -2, -1, 1, -2, -2, -2, 2, 3, -1, -3, 3, -4,
-    2, -2, -2, -3, -2, -2, -2, 1, 4, 2, -4, -4, 2, -3, 0, 3,
-    -4, 3, 2, 4, -4, 2, 1, -1, 1, -3, 4, -4, 5, 5, -1, 0,
-    4, -2, 3, -3, -1, 1, 4, -2, -3, -1, 0, -4, 5, 3, -4, 4,
-    -3, -4, 4, -3, 0, -2, 4, -3, 2, 0, 2, 3, -3, 3, 2, -3,
-    2, -4, 2, 3, 4, 2, -2, 3, -4, 3, -5, 3, 14, 15, 6, 2,
-    1, -3, -2, -4, 2, -1, -2, 1, -5, 1, 3, 4, 2, -1, 2, -3,
-    1, 3, -16, -16, 2, 0, 15, 34, 24, 12, 25, -8, 11, 29, 18, -8,
-    -4, -5, -13, -4, 3, 1, 3, 1, -1, 1, 13, -4, -18, 3, 7, 3,
-    17, 37, 48, 7, 4, 9, 34, 8, -24, -31, 4, 4, -7, 11, 9, 7,
-    24, 13, -4, -4, 3, 0, 15, -34, -27, -4, -2, 13, 15, 23, -5, 0,
-    -3, 19, 7, 1, -9, -10, -12, -10, -18, -4, 2, 22, 3, -15, -27, -4,
-    3, 4, -20, -43, -5, -4, 12, 19, 3, 11, -5, -15, -9, -10, -25, -12,
-    -2, 8, 8, -5, 10, -1, 7, -5, -22, -8, -34, 11, -4, -3, -20, -21,
-    11, -9, 19, 21, 26, 13, 8, -5, -11, 3, -5, -12, -17, -9, 6, -7,
-    -2, 3, -15, -10, -20, -1, -33, 1, -4, -3, 9, 24, -1, 7, 42, 20,
-    0, -1, 13, 20, 9, 1, 4, -14, -18, -11, 3, 2, 8, 1, -15, -19,
-    -42, -30, -49, -11, -2, -21, 16, 27, -4, 9, 34, -14, -24, -1, 5, 12,
-    18, 21, -5, -6, -9, 11, 24, 5, 6, 19, 9, -8, 8, -1, -34, -14,
-    -25, 3, 28, 7, -2, -3, 22, -20, -9, 7, -2, -2, -8, -1, -6, -5,
-    -1, 10, 20, 13, 6, 12, -24, -14, -1, -3, -13, -14, 3, 5, 0, 5,
-    -8, 15, 17, -5, -14, -4, -15, -33, -22, -4, -30, -25, -1, 15, 25, 29,
-    24, 11, -29, -18, 2, -23, -6, -17, 4, 2, 15, -3, -9, 32, 31, 4,
-    -16, -3, -29, -35, -40, -24, -29, -31, -14, 21, 23, 15, 17, 7, 9, -5,
-    -16, -9, -49, -13, -3, -4, 7, -20, -14, 27, 20, 6, -5, -1, -9, -21,
-    -12, -8, -16, -35, -35, -18, -2, 22, 31, 29, 27, 12, 11, 17, -52, 0,
-    1, -9, 20, -11, 20, 8, 21, 8, 5, -2, -13, -15, -3, 1, -32, -75,
-    -69, -23, -7, 18, 18, 28, 30, 23, 15, -13, -47, 27, 4, 2, -7, -8,
-    19, 14, 23, 25, 20, -5, -5, -16, -14, -17, -30, -62, -50, 3, 2, 12,
-    2, 17, 39, 32, -16, 1, -10, 32, 3, -6, -43, -19, 23, 34, 18, 37,
-    23, 13, 13, -2, -10, -28, -26, -36, -19, -3, 21, 19, 21, 27, 34, -4,
-    -11, 4, 19, 13, 6, -4, -21, 0, 24, 25, 9, 39, 36, 26, 16, 0,
-    -5, -14, -24, -16, 1, 13, 13, 15, 20, 38, 24, -13, -24, -3, 6, 9,
-    2, -7, -5, -4, -4, 19, 40, 34, 24, 6, 6, -2, -16, -21, -13, -2,
-    12, 41, 27, 15, 18, 41, 12, -25, -37, 18, 19, 26, 4, -13, 12, -19,
-    -1, 10, 27, 22, 18, 7, -15, -19, -28, -13, 4, 11, 23, 37, 37, 28,
-    16, 26, 7, -16, -6, 59, 32, 51, -2, -12, -1, -28, 11, 9, 14, 32,
-    15, 10, -5, -16, -10, 1, 13, 26, 38, 51, 38, 29, 6, 9, -9, -7,
-    13, 46, 29, 23, -4, 31, 0, 0, 14, 13, 25, 21, 29, 19, 20, 8,
-    5, 7, 20, 30, 41, 28, 17, 14, -2, 14, 2, 11, 2, 17, 32, -1,
-    -4, 24, 30, 13, 9, 23, 9, -1, 2, 8, 16, 6, 4, -11, 0, 16,
-    20, 10, 11, 13, 10, 9, 1, 11, 30, 10, 32, -4, -4, 11, 23, 26,
-    23, 32, 12, -12, 7, -1, 19, 14, -9, -9, -3, 0, 12, 3, -7, 0,
-    -10, 5, 16, 23, 26, -25, 6, 6, 0, -10, 35, 33, 10, 30, 24, 5,
-    10, -8, 2, -1, 4, -6, -5, 0, -3, -20, -32, -4, 3, 1, 18, 1,
-    20, -5, -17, 4, 0, 0, -31, 0, 2, -1, 7, 16, 12, -3, -22, -3,
-    14, 10, 9, -2, -36, -38, -34, 2, 22, 6, 1, 3, 20, -9, -15, 4,
-    -4, -4, -14, -33, -4, 1, 12, 22, 21, 33, 4, 12, 28, 18, 2, -4,
-    -43, -37, -24, -23, -3, -1, 12, 7, 8, 19, 9, -2, 1, 1, 20, 2,
-    23, 17, 15, -9, -3, 14, 13, 18, 19, 19, 25, 4, -29, -41, -12, 8,
-    18, 15, -8, -16, -21, 18, 9, -3, 3, 1, -2, -1, 42, 41, 27, -1,
-    4, -1, -6, -21, -15, -3, -5, -9, -7, -38, -22, -14, -2, 28, 26, 25,
-    20, 4, -2, 1, 2, 3, 1, -3, -8, -20, 18, 27, 24, 12, -10, 14,
-    24, -31, -38, -48, -16, -11, -13, 30, 21, -2, 17, -34, 4, -1, -1, -4,
-    2, 0, 1, 2, 3, 3, 2, -3, 0, -4, -3, -3, -1, 4, 4, -1,
-    4, 1, 4, -4, -3, -4, -2, -2, -1, 1, -2, 4, 3, 0, 1, -4,
-    0, 0, 3, 0, 0, -4, 0, -6, 2, 1, 0, 2, -5, -1, -3, 0,
-    -3, -2, 1, -1, -2, -1, -4, 3, -1, -4, -2, 0, -6, -7, -1, -4,
-    21, 5, -6, -44, -28, -44, -30, -32, -30, -22, 9, 0, 23, 14, 15, 21,
-    8, 12, -2, 2, -1, -3, 0, 1, 0, 5, 4, -19, 6, 24, 25, -3,
-    15, 14, -9, -3, -16, -20, -19, -8, -9, -33, -12, -3, 18, 21, 26, -4,
-    3, -1, -21, -14, -9, 1, 39, 55, 26, 43, 19, 47, 35, 22, 25, 35,
-    9, 18, 19, -4, -2, -19, -8, 0, 11, 4, 23, -7, -2, 1, -10, 23,
-    -1, -18, -3, 5, -11, -14, 20, 34, 20, 12, 2, 27, 21, 11, -4, -12,
-    35, 14, 10, -5, 0, 58, 22, 3, 0, 10, -4, -3, -14, -18, 8, -9,
-    -6, -7, 18, 27, 13, 29, 34, 25, 21, 23, 12, 4, 5, -4, -2, 5,
-    -7, 41, 37, 13, -1, 8, -23, 0, -2, -7, -4, -2, 18, 0, 21, 35,
-    26, 28, 38, 9, 0, -16, -5, -6, -11, -3, -9, -12, -18, 15, 34, 2,
-    -5, -11, -17, 10, 9, -11, -1, 4, 17, 16, 27, 18, 19, 17, 6, -13,
-    -9, -15, -5, -15, -1, 12, -2, 6, -1, 5, 36, 15, -7, -18, 11, -4,
-    -4, 11, 20, 4, 24, 12, 10, -6, -9, -2, -9, -17, -3, -17, -17, -17,
-    -7, -10, 4, 14, 7, 31, 26, -9, -3, -17, 22, 7, -16, 15, 7, 3,
-    14, -9, 7, -3, 5, 10, 0, -12, 9, 3, -7, -29, -16, -4, 17, 5,
-    -4, 1, 26, -9, -11, -25, -36, 16, -6, -20, -14, -2, -19, -17, -9, 9,
-    20, 38, 10, 1, -4, 3, -7, -32, -19, -7, -5, -7, -27, -7, 22, 3,
-    -16, -21, -27, 25, -13, -25, -17, 1, -4, 13, -1, 26, 33, 35, 5, -27,
-    -25, 2, -23, -24, -16, -9, -41, -21, -33, -32, 19, -3, -1, -33, -26, 14,
-    4, -29, -25, 10, -12, 9, -6, 1, 16, -4, -15, -35, -16, -3, -15, -14,
-    -12, -15, -21, -20, -23, -21, 4, 1, -2, -1, -18, -11, -34, -33, -6, 4,
-    -12, -6, -7, -5, -6, -8, -14, -14, -4, -14, -13, -15, -5, -5, -25, -10,
-    -9, -3, 17, 5, -7, -2, -11, -24, -36, -26, 2, -12, -13, -3, -15, 3,
-    22, 2, -6, -20, 2, -17, -16, -4, 4, 11, -26, 4, 34, 5, 28, 18,
-    -5, -4, -3, -18, -15, -27, -6, -21, -16, -21, -21, 3, 24, 14, 1, -26,
-    -12, -23, -8, 10, 16, 24, 8, 18, 30, 13, 37, 20, 3, 2, -4, 28,
-    8, -21, 8, -8, -14, -38, -36, -28, -18, -14, -17, -33, -15, -11, 3, 18,
-    10, 16, -5, -9, -17, -7, -20, 31, 26, 2, -10, -6, 11, -11, 1, 1,
-    -2, -23, -24, -33, -38, -37, -33, -28, -1, 1, 4, 12, 4, -2, -12, -14,
-    -2, 9, -40, 36, 0, -31, 21, -21, -1, 4, 21, 10, -10, -28, -31, -38,
-    -16, -2, -27, -9, 9, 25, 17, 8, 10, 12, 8, 5, -15, 18, 16, 28,
-    5, -4, 22, 12, 20, 41, 39, 4, 6, 6, -24, -11, 3, 22, -6, 8,
-    20, 27, 25, 24, 28, 22, 31, 36, -26, -27, -6, -1, 8, -1, 8, 22,
-    21, 21, 37, 52, 48, 21, 5, 16, 22, 25, 14, 17, 12, 16, 17, 16,
-    45, 42, 35, 54, -3, -16, -1, 6, 11, -2, 28, 55, 18, 42, 50, 67,
-    59, 26, 26, 36, 27, 14, 18, 31, -1, 4, 5, -1, 47, 23, 35, 65,
-    -13, -8, -4, 8, 3, -4, 31, 74, 36, 48, 50, 63, 54, 42, 39, 49,
-    29, 12, 27, 43, 37, 29, -2, -35, 18, 21, 32, 47, 2, -5, 5, 4,
-    0, 2, -14, 41, 10, 5, 35, 48, 35, 40, 26, 21, 28, 10, 34, 40,
-    26, 24, 10, -18, -12, 12, 7, 18, 5, 16, 18, -1, 4, 1, 4, 15,
-    -25, -14, 23, 25, 2, 9, 11, -9, 10, 27, 13, 5, 27, 18, -17, -15,
-    -26, -24, -5, -9, 8, 18, 1, -4, -3, -3, 4, 2, -30, 6, -5, -59,
-    -50, -6, -5, -26, -4, -29, -24, -13, -15, -17, -25, -45, -19, -20, -4, 13,
-    -4, -4, -3, -3, -4, 2, -5, -3, -3, -2, -2, -11, -20, -23, -5, -8,
-    -13, -38, -29, 22, 22, -36, -45, -41, -26, -18, -16, -15, -1, 3, -1, 3,
-    5, 1, 1, -4, -4, -4, 2, 3, 3, -2, 3, 1, 6, 14, 17, 11,
-    1, 2, 2, -3, 4, 2, 0, 1, -4, 2, 1, -3, -4, 4, 4, -1,
-    -5, 2, 7, 3, 10, -1, 10, -1, 12, 8, -2, 0, 23, 17, 3, -1,
-    -2, -4, 1, 1, 2, -2, 5, -4, 1, -2, 0, 4, 5, 5, 8, 6,
-    13, 17, 24, 31, 50, 56, 47, 9, -17, -30, -18, -35, -20, -7, -2, 15,
-    12, -3, 4, -2, -4, 1, 1, -22, -28, 31, 34, 50, 65, 55, 23, 26,
-    28, 36, 30, 6, -5, -34, -56, -49, -47, -21, 10, -5, 8, 11, 4, 3,
-    4, -3, 23, -13, -8, 15, 19, 33, 28, 12, 8, 19, 23, 31, 31, 30,
-    6, -1, -17, -27, -20, -39, -3, 0, -6, 16, 27, 1, 4, 2, 23, -12,
-    -7, -24, 14, 21, -9, -31, -22, -13, 6, 45, 32, 29, 11, -19, 1, 2,
-    10, -7, 5, 20, 25, 39, 18, -1, 1, 10, -11, 1, -23, -9, -7, -31,
-    -38, -28, -7, -8, 5, 23, 34, 27, 39, 32, 21, 5, -17, -21, -35, -3,
-    -36, 13, 28, 29, -5, 38, -14, -27, 6, -19, -28, -35, -16, 13, 7, 16,
-    7, 30, 37, 25, 47, 26, 15, -2, -20, -10, -17, -54, -63, -38, 24, 27,
-    -8, 13, -31, -31, 14, -21, -34, -21, 23, 15, 14, -4, -13, -14, -15, 9,
-    22, 24, 31, 24, -9, -1, -20, -66, -63, -17, 27, -18, 0, -28, 1, -4,
-    11, -27, 7, 14, 22, 3, 9, -26, -33, -45, -40, -19, 5, 26, 34, 46,
-    20, -22, -47, -42, -49, -1, 5, 15, 1, -13, -4, 14, 12, -10, 3, 4,
-    -5, -11, -37, -30, -44, -41, -28, -14, 8, 22, 45, 49, 39, -7, -38, -51,
-    -60, -5, 14, 20, -6, -14, 3, 13, 21, -7, -15, -17, -22, -17, -14, -15,
-    -39, -25, -21, 9, 13, 20, 38, 39, 52, 16, -23, -52, -55, 4, -9, -1,
-    -6, -16, 13, 5, 16, -27, -27, -25, -24, -6, -12, -15, -26, -25, 19, 13,
-    -3, 0, -8, 11, 5, -1, -15, -49, -43, -39, -16, -17, 5, -4, 14, 7,
-    13, -17, -19, -11, -4, -3, 1, -12, -16, -4, 23, 1, 9, -1, -2, 5,
-    -7, 13, -4, -46, -59, -31, -14, -2, 2, 12, 11, 17, 13, -5, -3, -9,
-    -4, -9, -7, -5, -1, 5, 6, 9, 3, 2, 17, -10, -2, -15, -4, -15,
-    -22, 9, 38, 14, -3, 10, -3, 10, 12, -15, -8, -20, -5, 5, -8, 5,
-    -8, -4, -10, -6, 12, 6, -3, 1, -10, -22, -6, -8, -7, 15, 57, 23,
-    2, 19, 42, 12, 14, -1, -7, -5, -14, -1, 0, 16, 11, -14, -14, -19,
-    8, 3, -16, -9, -19, -9, 9, -1, -10, -9, -2, 30, 4, 14, 15, 6,
-    0, -4, -8, -21, -18, -10, 10, 24, 20, 14, 7, -1, 3, -16, -18, -16,
-    -23, -11, -8, -11, -7, 2, -12, 16, 28, 22, 10, 16, -9, 15, 0, -20,
-    -19, -29, 9, 24, -4, -11, -8, -5, -13, -18, -8, -4, -31, -16, 3, 9,
-    1, 3, -14, 28, 9, 30, -18, 1, -2, 18, 18, 8, -18, 0, 13, 5,
-    -3, -1, -8, -13, -19, -8, 0, 2, -11, -29, 1, 19, -1, -2, 29, 21,
-    -1, 26, -16, 37, 18, 8, 15, 16, -15, 6, 11, 15, 14, 6, 12, -7,
-    -12, -16, -5, 7, -9, -3, 6, 12, 8, -3, 31, 2, 6, 11, 49, 78,
-    19, -19, 15, 15, -10, 3, -1, -6, 15, 30, 21, 3, 18, 5, 5, 4,
-    -2, 13, 12, -2, 5, -9, 20, 3, 11, 19, 59, 22, 16, 40, 20, 21,
-    5, 15, 4, -10, 1, 7, 19, 6, 7, 2, 4, 4, 19, 17, -1, -6,
-    19, -14, -20, 0, -2, 1, 39, 9, -26, 16, 0, 15, 3, 23, 24, 9,
-    19, 0, 3, 4, -1, -2, 13, 11, 1, 3, 27, 18, 14, -15, -5, -4,
-    -1, -1, -15, 16, 33, -11, -35, -34, -29, -6, 10, 3, 5, 0, -15, 6,
-    18, -5, 9, -9, -11, 2, 15, 31, 41, 25, 7, 2, -1, 1, 24, -19,
-    -31, -24, -6, 2, 11, 7, -7, 3, 32, 8, -5, -23, -3, -1, 4, -7,
-    20, 6, -18, 4, 2, 12, 8, -4, 2, 4, 3, 17, -24, -20, -22, 0,
-    5, 37, 47, 10, 12, 20, 19, -26, -1, 47, 37, 9, 46, 39, 15, -13,
-    -5, -6, 3, -1, -2, 2, 3, 3, -9, -6, -3, -4, -1, 6, 33, 42,
-    30, -5, 25, -7, 19, 35, 33, 17, 21, 33, 32, 7, 3, -1, 4, -3,
-    -3, 5, -3, 4, -2, -4, -1, 2, -1, 3, -3, 2, -3, -4, 1, -1,
-    -1, 3, -3, 2, 1, 1, 3, 3, 3, -3, 2, 5, 1, 2, 2, -3,
-    4, 2, -3, -8, -7, -9, -10, -8, -10, -16, 9, -17, -11, -13, -15, -12,
-    -16, -5, -8, -4, 4, 0, -1, -5, -3, 5, -1, 1, -5, -15, -4, -14,
-    -13, 4, -3, -31, -10, -29, -58, -67, -22, -10, 3, -28, -12, -21, -23, -17,
-    7, 18, -2, -3, -4, -1, -4, -11, 9, -28, -18, -5, -27, -50, -42, -53,
-    -22, -21, -27, 3, -29, -38, -42, -39, -52, -23, -9, 8, 21, -25, -27, 2,
-    1, -2, -6, 19, 5, -32, -18, -14, -36, -33, -19, -6, 5, -13, 4, 15,
-    -12, -3, 5, -11, -9, -7, -6, 6, 31, 21, 20, 2, 0, 1, -16, -14,
-    -18, -31, -12, -30, -25, -6, -11, 44, 41, 18, 2, -2, 10, 20, 5, -6,
-    3, -3, -21, -31, -4, -6, 19, 8, 2, -8, 6, -30, 4, -17, -9, -12,
-    13, 17, 19, 38, 24, 20, 18, 15, 20, 12, 8, 1, 1, -17, -15, 11,
-    3, -4, 11, -1, 2, -26, -3, -31, -3, 7, 17, -13, 22, 10, 21, 11,
-    10, 8, -4, 9, 13, -6, -11, -10, -2, -9, -22, -3, -9, -2, 16, -7,
-    -13, -24, 12, -1, -5, 21, 18, 2, 5, 3, 5, 9, 0, 6, 7, 13,
-    6, -16, -1, -8, -15, -7, -18, 16, 24, 36, 23, 16, -4, -27, 3, 19,
-    -9, 16, 27, -3, 8, 0, -1, -1, 0, 10, 9, 11, 8, 10, 12, -7,
-    -5, 4, 8, 7, 13, 38, 62, 23, -4, -29, -30, 7, 32, 15, 21, 16,
-    21, 5, -2, -7, 13, 1, 10, -1, 2, 3, 9, -6, 3, 12, 9, 8,
-    23, 24, 56, 21, 1, -17, -21, 4, 29, 18, 25, 22, 12, 2, -15, -4,
-    26, 6, 18, 15, 14, 1, -8, -10, 8, 5, 8, 16, 21, 28, 63, -5,
-    -4, -16, 1, 10, 24, 33, 17, 26, 13, -6, -8, 4, 16, 25, 16, 5,
-    0, 1, -8, 11, 15, 10, 4, 11, 2, 6, 34, 2, 3, -9, -26, -1,
-    1, 16, -8, 8, -2, -6, 3, 34, 27, 39, 28, 13, -3, -11, -3, 8,
-    19, 22, 9, -12, -18, 21, 34, 25, 2, 9, -36, 3, -8, -26, -7, -23,
-    -14, -9, 7, 16, 13, 25, 26, 11, -1, 4, -10, 6, 10, 9, 2, 1,
-    -25, 12, -10, -6, -7, 9, -33, 5, 9, -26, -6, -40, -20, -16, 0, 2,
-    3, 10, 23, 11, -1, 5, 1, -4, 5, 4, 12, -10, -22, 6, -12, 2,
-    1, 4, -16, -2, -4, -14, 2, -39, -19, -27, -24, -21, 2, 15, 14, 20,
-    6, 4, 2, -18, -19, 0, 17, -1, -16, 0, -10, 7, 2, -1, -10, -4,
-    -8, -6, 14, -14, -9, -19, -43, -29, -22, -5, 2, 13, 5, -7, -3, -19,
-    -16, -8, -3, 6, 3, -32, -10, -7, 19, -9, -3, -12, 11, 11, 25, -5,
-    -3, -25, -16, -24, -47, -17, 1, -6, -9, -8, -18, -4, -11, -13, -12, 12,
-    14, -43, 5, -11, -16, -14, 1, -21, -7, 12, 14, -1, -4, -13, -10, -30,
-    -36, -13, -22, -21, -3, -4, -8, 1, -11, -10, -15, 23, 13, -25, -12, -26,
-    1, -14, -11, -14, -6, 18, 7, 2, -6, -9, -3, -14, -26, -4, -23, -12,
-    -10, -3, -1, 6, 9, -3, 4, 37, 4, -2, -24, 0, -8, -12, -10, -38,
-    -5, 22, 15, 18, 2, -6, 2, 1, -17, -20, -20, -3, -8, 12, 5, 5,
-    2, 6, 1, 19, 7, 4, -2, -6, -7, -4, -11, 1, 2, -29, -1, 6,
-    4, -3, 4, 9, -5, -15, -8, -12, -7, 3, -9, -9, -3, -13, 9, 24,
-    42, 19, 9, -6, -3, 3, 18, 34, 14, -19, -34, -18, -1, 2, 15, 12,
-    -1, -3, -7, 1, -6, -4, -1, -10, 3, 18, 31, 56, 51, 21, 0, 2,
-    2, -1, 5, 29, -15, -29, -5, 18, 20, 8, 12, 17, 6, -7, -18, -29,
-    -16, -27, 2, 32, 34, 20, 31, 53, -3, -26, -14, 1, 4, 3, 10, -10,
-    -18, 3, 24, 15, 0, 15, 34, 25, 3, 33, 17, 23, 38, 34, 40, 60,
-    36, 26, 22, 15, 2, -8, -7, -3, 1, 0, 3, 10, 50, 48, 40, 10,
-    28, 24, 25, 27, 40, 13, 36, 16, 24, 47, 33, 2, 19, 15, 12, 15,
-    11, -1, -4, 0, -3, 0, 3, 1, -15, -16, 12, 15, 12, -6, 3, 13,
-    11, -24, 7, 22, 5, -16, -4, 7, -10, -23, -6, -10, 3, -3, 2, 3,
-    3, -1, -3, 2, -5, 3, 3, 1, 1, -1, 0, -2, -5, 0, 1, 6,
-    4, 4, 4, 0, 0, 1, 2, -2, 2, -1, 0, 2, -1, -2, -4, 2,
-    4, -1, -11, -12, -8, -3, -19, -23, -24, -38, -14, -2, -7, -19, -17, -21,
-    -20, -12, -2, -3, -3, -1, -4, 0, 0, 2, -10, 2, -13, -10, -18, -16,
-    -12, -13, 1, -19, 11, 15, -4, 8, 8, -6, 14, 3, 11, 6, -8, -17,
-    -3, 7, 2, 1, 4, -3, -7, -7, -7, -46, -25, -15, -8, 2, 13, 6,
-    27, 15, -24, 21, 13, 31, 15, 25, 19, 4, -8, -37, -25, 23, 13, 4,
-    1, -3, -23, -43, -20, -11, 13, 22, 27, 27, 20, 3, 16, 20, 15, 21,
-    32, 25, 17, 24, 8, 8, 10, 10, 13, 22, 18, -10, 5, 4, -20, 24,
-    23, -21, -1, 10, -1, -6, 0, -12, 3, 3, 3, 8, 0, -12, -7, 8,
-    6, 18, 49, 19, 18, 23, -2, -11, 3, 10, -28, 4, -5, 6, 10, 8,
-    4, -18, -15, -22, -10, -2, 5, -4, -17, -29, -10, 4, -2, 8, 16, 35,
-    1, 4, 21, -4, -7, -11, -35, 6, 17, 17, -5, 22, 8, -21, -16, -20,
-    0, -2, 13, -11, -22, -29, -14, -2, -3, -6, -1, -12, -32, 7, 28, -4,
-    -7, -26, -14, 8, 8, 12, -2, 13, -25, -19, -20, -24, 1, 5, 8, -4,
-    -28, -26, -3, 5, 15, -9, -15, -16, -36, 6, 25, 9, -8, -34, 20, 8,
-    3, 23, 7, 6, -2, -14, -25, -18, 1, 5, 7, 0, -4, -11, 2, 16,
-    22, 8, -29, -10, -7, 22, 62, 13, -16, -10, -9, 5, 29, 25, 12, 19,
-    12, -13, -7, -1, 10, 5, -5, -10, -1, 4, 14, 27, 8, -4, -25, 7,
-    3, -8, 23, 4, -15, -10, -19, -6, 17, 9, 17, 20, -1, -18, -18, -17,
-    -3, -14, -19, -10, 1, 0, 10, 16, -10, -14, -14, 1, 5, -10, -1, -4,
-    -10, -8, -16, 30, 21, 7, 15, 20, 8, -2, 3, -3, 11, -10, -31, -28,
-    -15, 8, -7, 11, 13, 7, -24, -44, -16, -29, -12, -3, -4, -13, -14, 19,
-    5, -4, 17, 13, 15, 16, -5, 4, 6, -8, -12, -12, -5, 20, 22, 19,
-    17, -12, -28, -44, -36, -30, -4, 8, -4, -9, -19, 12, 2, 5, 26, 9,
-    8, -3, -2, 3, 10, 11, 32, 21, 5, 4, -7, -9, -19, -18, -22, -39,
-    -51, -21, 14, 10, -5, -10, 31, 8, 0, 1, -6, -2, 12, -7, -10, -12,
-    0, 32, 39, 20, 6, -15, -21, -26, -29, -14, -23, -28, -15, -9, 6, 9,
-    -9, -9, 17, 10, -13, -11, 2, 1, -4, -18, -18, -40, -14, 14, 24, 16,
-    13, -8, -22, -23, -10, 6, -7, -15, -21, -2, 25, 11, 4, -6, 8, -14,
-    1, -7, 8, -13, -15, -19, -25, -18, -25, 2, 7, 10, 22, -9, -13, 4,
-    9, 11, 3, -15, -14, 12, 29, 30, -20, -4, -17, -10, 18, 3, -15, -33,
-    -25, -25, -29, -14, 2, 18, 11, 3, 30, 1, -3, 1, 4, -10, 4, -9,
-    19, 36, 23, 30, 7, -12, 13, 14, 13, 0, -30, -36, -13, -25, -20, -1,
-    3, 25, 18, 20, 36, 29, 15, -3, -1, -16, 1, -13, -6, 45, 27, 26,
-    0, -10, 41, 26, 8, -12, -7, -21, 3, -8, -5, 7, 6, 13, 7, 21,
-    40, 39, 42, 16, 6, 4, 11, 21, 3, 11, 16, 5, 7, 2, 31, 31,
-    19, 5, 0, 12, -7, -5, 0, 1, 4, 6, 19, 17, 2, 16, 37, 23,
-    12, 17, 27, 46, 41, 25, 0, 2, 7, 5, 38, 31, 26, 25, 23, 3,
-    -2, -15, -19, 6, -8, -2, 12, 3, -8, 12, 35, 24, 22, 25, 19, 38,
-    57, 33, 19, 1, 0, 0, 19, 1, 40, 18, 1, -8, 9, 3, -23, -24,
-    -4, 6, -2, 16, 31, 35, 23, 29, 14, 10, 15, 28, 33, 20, 23, -3,
-    -1, 1, 23, -31, -20, -20, -28, -38, -4, 6, -13, 0, -5, -24, 7, -11,
-    -9, -6, 0, 11, -7, 4, 17, 16, 36, 12, 6, 4, -2, 0, -2, -18,
-    -30, -33, -59, -35, -19, -22, -32, -50, -21, -12, -10, -18, -50, -34, -23, -33,
-    -28, -23, 2, 26, 37, -5, 5, -3, 2, 4, -2, -4, -8, -9, -12, -31,
-    -59, -69, -66, -48, -68, -68, -62, -79, -59, -59, -41, -20, -46, -43, -44, -31,
-    -2, 4, -3, -1, -2, -2, 3, 4, 4, -4, -7, -3, -3, -17, -53, -36,
-    -16, -14, -43, -39, -49, -35, -12, -20, -18, -17, -19, -9, 3, 1, 3, -3,
-    -3, -1, 1, 2, 1, 1, 3, 4, -2, -1, 2, 1, 25, 25, 10, 1,
-    2, 1, 4, 3, 0, 2, -3, -3, -4, 2, -1, -2, 1, 1, 4, -1,
-    4, 3, 29, 29, 18, 25, 69, 36, 69, 57, 25, 18, 50, 62, 47, 29,
-    29, 17, 24, 22, -2, -5, 3, 0, -2, -3, 10, 1, 16, 16, 35, 57,
-    41, 47, 48, 58, 42, 2, 25, 23, 11, 35, 39, -10, -30, -23, -13, -11,
-    -3, -15, 1, -3, 3, 4, 19, 10, 36, 31, 30, 36, -6, 13, 13, 50,
-    40, 23, 20, 11, 11, -11, -26, -33, -34, 18, 15, 3, -11, -18, 3, 2,
-    4, 1, -2, -8, 37, 52, 35, 16, -12, -2, 39, 27, 27, 32, 39, 18,
-    22, -9, -27, -54, -22, 7, 1, -40, -40, -31, -25, -26, 1, -5, 10, 26,
-    37, 43, 20, -1, -2, 10, 36, 9, 20, 31, 24, -6, -7, -14, -59, -73,
-    -33, -25, -45, -44, -52, -39, -22, -4, -3, -2, -9, 38, 25, 29, 3, -2,
-    8, 28, 19, 24, 26, 21, 6, -18, -32, -36, -50, -53, -40, -53, -68, -71,
-    -27, 3, -20, -20, -4, 4, -4, 13, 20, 12, -3, -9, 7, 11, 6, 27,
-    5, -10, -29, -39, -28, -30, -33, -54, -56, -18, -34, -56, 3, 7, -8, -19,
-    -3, 2, -33, -18, 24, 20, 0, -4, 15, 24, 30, 26, -9, -27, -48, -32,
-    -37, -22, -37, -44, -14, -3, 2, -16, -3, -29, -22, 15, 1, -30, -18, -7,
-    1, 17, 12, 13, 16, 11, 14, 17, -13, -36, -27, -14, -17, 0, 3, 9,
-    12, 12, 21, -4, 3, -27, 13, 11, 5, -21, -22, -15, -3, 29, 13, 0,
-    -1, -9, -12, -15, -9, -14, -1, 8, 19, 14, 11, -5, 26, 35, -4, 18,
-    37, 45, 17, -15, 2, 4, -11, -32, -2, 10, 2, -16, -12, -3, -8, -17,
-    -27, -18, 3, 19, 46, 21, 13, 6, 21, 19, 28, 27, 24, 40, -18, -22,
-    -2, 3, -32, -21, -10, -18, -22, -19, -15, -5, -21, -25, -37, -20, 11, 23,
-    36, 10, 6, 20, -4, 9, 25, 9, 20, 40, 17, -22, -2, 4, -23, -14,
-    -36, 4, -14, -11, -23, -22, -26, -25, -14, 6, 35, 29, 31, -13, -3, 0,
-    -7, -4, 4, 35, 31, 8, 32, 27, 2, -14, 5, 20, -47, 1, -6, -4,
-    -2, -11, -10, -9, -12, 15, 22, 25, 24, -3, 8, -19, -27, -12, 7, 23,
-    14, 16, 41, 28, -1, -2, 6, -11, -40, -16, -15, -8, -1, -6, -15, -4,
-    -2, 27, 6, 3, 7, 6, -15, -8, -24, 8, 17, 12, 5, 5, 38, 41,
-    3, -8, 19, -5, -5, -3, -7, -13, -11, -13, -16, 5, 13, 22, 6, -2,
-    7, -5, -16, -21, -13, 19, 4, 10, 10, 40, 26, 33, 4, -2, 30, 7,
-    17, 6, -5, -11, -14, -3, 2, 14, 23, 15, 4, 6, 8, -10, -13, -21,
-    -3, 9, -2, 3, 3, 44, 23, 20, -5, -3, -3, 21, 20, 7, -3, 13,
-    -2, -1, 22, 2, 12, 3, 23, 26, 7, 1, 4, -22, -15, 3, -3, 4,
-    -6, 43, 33, 50, -2, -9, 23, 60, 33, 12, -17, -16, -6, -3, 4, 18,
-    0, 1, 29, 24, 20, 17, 11, -5, 5, -6, -3, 18, -2, 55, 39, 29,
-    1, 0, 26, 72, 36, 19, -9, -11, -20, -21, -17, -7, 4, 14, 33, 25,
-    21, 31, 24, 7, 2, -8, -2, 3, 31, 44, 41, 4, -4, 2, 18, 45,
-    24, 8, 7, 1, 3, -1, -17, -14, 0, 20, 24, 15, 9, 20, 14, 10,
-    6, 9, -1, 13, 34, 17, 19, 4, -3, 1, 28, 25, -4, 1, -13, -19,
-    -16, -1, 5, -21, -37, -1, -5, -19, -15, -12, -4, -4, -23, -13, -5, 12,
-    -5, -25, -13, 5, 3, 1, -8, 10, -5, -14, -24, -28, -36, -21, -13, -12,
-    -24, -42, -37, -30, -26, -43, -53, -42, -17, 16, 8, 10, -6, -22, -16, -2,
-    2, -1, 1, -11, -13, -38, -59, -61, -46, -45, -12, -45, -56, -66, -29, -11,
-    -23, -18, -24, -33, -41, -22, 1, 11, 49, 29, 20, -2, 2, 0, 1, 5,
-    2, 2, -5, -31, -42, -34, -42, -35, -38, -43, -15, -4, -12, -13, -20, -31,
-    -10, 39, 44, 21, 22, 26, 17, -4, 4, 0, -1, -1, 14, 18, 14, -19,
-    2, 19, 9, -13, -13, -21, 2, -3, -46, -23, 12, 26, 26, 12, 20, 2,
-    -5, -3, 3, 3, 4, 2, -1, 2, -4, -3, 0, -2, 0, 6, 4, 7,
-    -16, 2, 11, -23, -5, 16, 20, 16, 4, -10, -5, -24, 0, -2, -2, -2,
-};
+extern const int8_t fc1_weight[100352];
 
 // fc2.weight: shape=(10, 128), scale=106.262321
 #define FC2_WEIGHT_SCALE 106.262321f
-const int8_t fc2_weight[1280] = {
-    7, -50, -53, -20, -15, 0, -1, -77, 16, -5, -33, 1, 17, 2, 25, -20,
-    16, 33, -88, -46, -4, 20, 26, -56, -35, -7, 44, -3, -64, -7, 42, -67,
-    -59, -76, 39, 21, -53, 20, -35, 8, -79, 24, 19, -3, -21, -25, -32, -62,
-    12, 9, -38, -4, -67, 17, 3, 12, 31, 3, 9, -65, 31, -49, 23, 20,
-    3, -42, -19, -40, 15, 4, -16, 5, 2, -35, -4, -12, -42, 9, 15, 16,
-    28, -3, 8, 15, 20, -17, -29, 13, 0, -72, -2, 8, -25, -28, 4, -55,
-    -56, 17, -29, 6, 0, 23, 10, 14, -5, -36, 6, 27, 15, -10, -14, -32,
-    5, 12, 1, -7, -27, 19, -37, -45, 13, 5, 17, 21, 21, -28, -27, -18,
-    -27, -29, 18, -6, -8, -23, -31, -9, -62, 1, -26, -11, -50, -12, 28, 6,
-    -37, 45, -39, 4, -31, -37, -23, 7, 26, -12, 8, -22, -7, -17, -33, 15,
-    -59, 63, 77, -22, -12, -7, -8, -7, 18, -45, -99, 6, -73, -27, 31, 16,
-    54, -24, 60, 3, 26, -29, -35, -36, -20, 9, -35, 6, -43, 8, -30, 13,
-    30, -26, -4, 51, -9, -29, 19, 25, -46, 21, 37, -4, -120, 13, 11, 14,
-    20, 14, -6, 16, -17, 15, 44, -24, -23, -16, -50, -29, -45, 31, 27, 10,
-    -26, -39, -12, 48, 27, 12, 19, -9, -31, 10, 69, -11, -68, 9, 8, -18,
-    5, 34, -29, -12, -26, -20, 26, 13, -24, -2, -2, 5, 14, -7, 27, -5,
-    -28, -32, 46, 9, 0, 7, -77, -36, 25, -3, -9, -3, 7, 36, -21, 16,
-    3, 30, -1, -22, -46, -1, 12, 19, -17, 6, 25, 4, -30, -11, 18, 21,
-    -29, -73, -36, -32, -54, -38, -70, 1, 19, -19, -7, 23, 24, 11, -6, -43,
-    -15, 19, -11, -5, 21, -10, 22, 14, 10, 6, -5, 45, 18, 37, -35, 13,
-    -53, 8, -3, 27, -7, -3, 23, 15, -17, 20, -37, -42, -60, 9, -89, 28,
-    25, 8, 4, -9, -88, 25, -37, -3, -1, -71, 10, 9, 47, -21, 41, 15,
-    0, -1, 22, 31, 18, 4, 15, 3, 1, -31, -11, 14, 34, -27, 11, 55,
-    -15, -27, 56, -90, 27, 18, 27, 12, -19, -3, 14, 16, 27, 0, 19, 20,
-    -4, 34, 17, -6, -5, -6, 15, 13, 11, 6, 23, 9, -10, 3, 23, 4,
-    -17, -20, -41, 1, -51, 36, 25, -7, 19, 1, -65, 23, 11, 11, -29, 37,
-    -8, 31, -46, 32, 19, 26, 3, 9, 11, -17, 2, 3, -91, 14, 5, 15,
-    6, -6, -107, 8, 21, 17, -52, 7, -6, -6, 21, -29, 10, 5, -16, -5,
-    -11, 19, -12, 31, 13, -14, 20, -79, -10, 53, -9, 9, 29, -6, -40, 14,
-    -42, -71, -6, -18, -18, 14, -54, 8, -19, 46, 3, 12, -7, -5, -39, 10,
-    13, -6, 10, 5, -70, -84, 52, 16, 34, 17, 6, 18, -9, -77, 14, 9,
-    11, -6, -11, 14, -26, 3, -83, 24, -6, 0, -58, 6, 15, 9, -2, -50,
-    -110, 18, -20, 17, 20, 9, 33, 19, 36, -6, -89, 19, 13, 10, -54, -8,
-    15, -61, -57, 14, 39, -48, -71, 16, 3, -1, -54, 5, 31, 15, -16, 26,
-    8, 33, 32, -60, 33, -5, 15, 1, -60, 4, -15, -55, 13, 12, -112, -9,
-    37, 23, 44, -9, -22, -44, 10, -64, 8, 11, -24, 5, -106, -58, -47, 3,
-    23, -8, 1, 64, -69, -3, -64, 28, 14, -75, 11, 52, -13, -20, 32, -85,
-    -44, 9, -3, 14, -1, -52, -1, 13, 12, 11, -106, 30, 16, 14, 35, 18,
-    11, 13, 20, 12, 36, 70, -27, -68, 6, 10, 29, -44, -59, 3, -20, -67,
-    11, 4, -29, -14, 20, 16, 10, -43, 10, 5, 28, -93, -77, 8, 15, -30,
-    44, 29, -15, -98, -18, -1, 31, 39, -39, -1, 46, 1, -13, 17, -14, 12,
-    -8, 20, 67, 9, 44, -5, -25, -8, -88, -16, -54, 15, -40, -15, -61, -62,
-    26, -24, -11, 25, 27, 21, 23, -23, 46, 24, 11, -32, -41, -26, 43, 14,
-    11, -30, 5, 5, -3, 9, 10, 6, -25, -17, 62, 15, 4, -34, 17, -72,
-    -2, 11, -7, -44, 7, 2, 10, -43, -6, -71, -39, -4, 42, 7, 0, -21,
-    -30, 32, -8, -40, 22, 11, -24, 6, 15, 54, 9, 4, -9, -10, 7, 8,
-    3, 11, -13, -108, 20, 19, -31, 5, -79, -10, -8, -19, 27, 26, 0, -74,
-    4, -13, 18, 18, 20, -20, -9, -3, 1, 5, -41, 14, -81, 9, 12, 19,
-    8, -52, -37, 37, 12, 11, -27, -87, -11, 4, 38, 5, -4, 6, -3, 5,
-    15, -34, 34, 11, 18, 14, -83, -51, -16, 8, 21, -96, -21, -22, 7, -18,
-    23, -45, 26, -16, 31, -3, -8, -42, -66, -74, 21, 14, -50, -40, 19, -36,
-    30, -52, -37, -5, 11, 24, 14, -14, 19, 8, 8, -54, -35, 4, 37, 10,
-    22, -83, 3, -48, 5, 18, 12, 12, 8, 25, 12, -7, -53, 12, -20, -48,
-    19, -6, 5, 11, 37, 6, 40, 6, 11, -24, -34, 18, 4, -12, 11, -36,
-    22, -14, -39, -49, -30, -24, 7, 14, -44, 18, 25, 27, -32, 26, 4, 36,
-    -12, -39, 25, -21, -60, -17, 11, -26, -9, -10, 5, -18, 7, -57, -36, 51,
-    38, 11, 37, 1, -12, -22, -64, 6, -31, -2, 28, -42, -2, 54, 2, -62,
-    -7, 22, 6, -23, -7, 2, 1, -14, 16, -12, -17, 15, 24, -18, 15, 10,
-    -6, -20, 26, -3, -13, -97, -18, 13, 50, 22, -4, -23, 54, 17, 27, 13,
-    -15, -9, 50, 7, -7, -41, 7, 10, 26, -8, -7, 4, 29, -24, -41, -1,
-    25, 10, -18, -15, -13, -25, 17, 28, -1, 38, 13, 73, -43, -85, 23, -7,
-    11, -34, 6, -37, -14, -49, 0, -7, -59, -29, -3, -49, -68, 4, -67, -11,
-    10, -13, 41, 21, 10, 37, 31, -48, 6, -4, 62, 22, 23, -3, -31, 13,
-    -23, 12, -9, -6, 35, 13, -13, 15, 6, 1, -9, -69, -2, -1, -36, -26,
-    16, -57, -21, 40, 10, 10, 16, 14, -34, -8, -15, 4, 18, -55, -14, 3,
-    13, -98, 1, 13, 11, -55, -5, 16, 28, 11, 54, -7, -99, 18, -16, 17,
-    39, -18, -38, -20, -3, -1, 24, 12, -39, -8, 0, 11, -37, 25, -19, 28,
-    -54, -19, -59, -8, -6, 8, 29, 8, -103, 14, -56, 7, -1, 14, -6, 17,
-    -48, 13, 9, -32, 7, 20, -12, -40, 14, -22, 2, -25, -1, 8, -42, 12,
-    24, 18, -8, 25, -1, -1, -43, 9, 12, -127, 18, 6, -73, -2, -13, 9,
-    20, 6, -23, -23, 26, -12, -42, 11, 0, 25, -88, -1, -10, 11, 12, 14,
-    17, 16, -4, 23, -115, -39, 7, 7, 7, -3, -9, 7, 3, 20, 16, -31,
-    9, 21, -122, -9, 1, 5, 30, 11, 32, 5, -96, -10, 0, -95, 28, -39,
-    -8, 19, 24, -1, -32, 4, 22, 22, -3, -9, -25, 5, 34, 4, 20, -59,
-    -9, 1, -78, 3, -46, 15, 6, 12, -93, 13, 21, 25, 0, 5, -36, 12,
-    -50, 32, 10, -9, -8, -5, 4, 1, 19, -1, -68, 20, -1, 27, 13, 3,
-    17, -2, 13, -62, -23, -25, -114, 9, 12, -34, 11, -68, 18, -3, 29, 15,
-    -89, 26, -2, 13, 22, -64, 30, 2, 5, 42, 33, -58, 38, 12, -89, -5,
-    4, -1, -54, 8, -48, -22, -74, 14, 13, -27, -74, -84, -14, -11, -14, -30,
-    9, 12, -70, 23, 10, 15, -15, -11, 8, 2, 29, 1, 24, 9, -51, 8,
-};
+extern const int8_t fc2_weight[1280];
 
 // fc1.bias: pre-scaled to accumulator scale (bias_q * s_w1 * 127 / s_b1)
-const int32_t fc1_bias[128] = {
-    890, 222, -3425, 2002, 1557, 2357, 1957, 5649,
-    -1957, -623, 1868, 1557, 623, -1334, -2580, 2580,
-    2446, 2402, 1156, 3158, 2580, -2046, 0, 2446,
-    -1112, -400, -400, -1290, 2491, -667, -2135, -267,
-    3203, 1779, 1913, -623, 1290, 2002, 4759, -1201,
-    -2580, 3603, 1913, 445, 267, -578, -178, 489,
-    -445, -222, 1156, -801, 1068, 667, 2268, -1601,
-    -1068, 534, -311, 2980, -845, 311, -1735, -1468,
-    311, -1245, 1379, 756, -1379, 1646, 311, 1868,
-    2180, -3825, -1334, 2802, -979, 890, 623, -1646,
-    1112, 3736, -623, 623, 2624, 801, 400, 2224,
-    2357, 2847, 534, 1690, 2313, 89, 4137, 1913,
-    1023, 3336, -1601, 222, -89, 2847, -2847, -1646,
-    -400, -667, 4670, -1913, 534, 2091, 2046, 801,
-    1735, -89, -1245, 3692, 4848, -934, 2713, -2402,
-    2224, -222, 2091, 1334, -1868, 2402, 2268, 2091,
-};
+extern const int32_t fc1_bias[128];
 
 // fc2.bias: pre-scaled to accumulator scale (bias_q * s_w2 * 127 / s_b2)
-const int32_t fc2_bias[10] = {
-    -1688, -1658, -890, -860, 1903, 1489, -1474, -1949,
-    1320, 368,
-};
+extern const int32_t fc2_bias[10];
 
 #define INPUT_SIZE 784
 #define HIDDEN_SIZE 128
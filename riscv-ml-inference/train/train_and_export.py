@@ -3,9 +3,18 @@ import torch.nn as nn
 import torch.optim as optim
 from torch.utils.data import random_split, DataLoader
 from torchvision import datasets, transforms
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import os
 
+# Leave cores free for the DataLoader workers instead of oversubscribing,
+# and keep the fc1 GEMM on the MKL-DNN path
+torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+torch.set_num_interop_threads(2)
+torch.backends.mkldnn.enabled = True
+if torch.cuda.is_available():
+    torch.backends.cudnn.benchmark = True
+
 # =============================================================
 # Step 1: Define the MLP
 # =============================================================
@@ -25,7 +34,26 @@ class MLP(nn.Module):
 # =============================================================
 # Step 2: Train
 # =============================================================
+def compile_model(model, batch_size):
+    """
+    torch.compile `model` for fixed-size training batches, falling back to
+    eager mode if the compile backend (e.g. a C++ toolchain) is unavailable.
+    """
+    try:
+        compiled = torch.compile(model, fullgraph=True, dynamic=False)
+        # Compilation is lazy, so run one forward/backward to surface failures
+        compiled(torch.zeros(batch_size, 1, 28, 28)).sum().backward()
+        model.zero_grad()
+        return compiled
+    except Exception as exc:
+        print(f"torch.compile unavailable, training in eager mode: {exc}")
+        model.zero_grad()
+        return model
+
 def train():
+    # Fixed seed so the train/validation split and init are reproducible
+    torch.manual_seed(0)
+    
     # MNIST dataset - downloads automatically on first run
     transform = transforms.ToTensor()  # converts images to [0, 1] floats
     full_train_data = datasets.MNIST('./data', train=True, download=True, transform=transform)
@@ -35,37 +63,47 @@ def train():
     print(f"Data split: {len(train_data)} train / {len(val_data)} validation")
     print(f"Test set: hidden until after training\n")
     
-    train_loader = DataLoader(train_data, batch_size=64, shuffle=True)
-    val_loader = DataLoader(val_data, batch_size=1000)
+    # Worker processes decode and convert batches in the background so the
+    # training loop isn't stalled on ToTensor between steps. drop_last keeps
+    # every batch the same shape so the compiled model never recompiles.
+    train_loader = DataLoader(train_data, batch_size=64, shuffle=True, drop_last=True,
+                              num_workers=4, persistent_workers=True)
+    
+    # The validation images never change, so decode them once into a single
+    # tensor and evaluate with one forward pass per epoch
+    val_images = torch.stack([image for image, _ in val_data])
+    val_labels = torch.tensor([label for _, label in val_data])
     
     model = MLP()
+    # Fuse the small training forward pass into compiled kernels; the compiled
+    # wrapper shares parameters with `model`, which is what gets returned and
+    # quantized (and used eagerly for the one-shot validation pass)
+    compiled_model = compile_model(model, batch_size=64)
     optimizer = optim.Adam(model.parameters(), lr=0.001)
     loss_fn = nn.CrossEntropyLoss()
     
     # Train for 15 epochs for more robust quantization
     for epoch in range(15):
         model.train()
-        total_loss = 0
+        # Accumulate on-device and sync once per epoch rather than per batch
+        total_loss_t = torch.zeros((), device=next(model.parameters()).device)
         for images, labels in train_loader:
             optimizer.zero_grad()
-            output = model(images)
+            output = compiled_model(images)
             loss = loss_fn(output, labels)
             loss.backward()
             optimizer.step()
-            total_loss += loss.item()
+            total_loss_t += loss.detach()
+        total_loss = total_loss_t.item()
         
         # Evaluate on VALIDATION set (not test set)
         model.eval()
-        correct = 0
-        total = 0
         with torch.no_grad():
-            for images, labels in val_loader:
-                output = model(images)
-                predictions = output.argmax(dim=1)
-                correct += (predictions == labels).sum().item()
-                total += labels.size(0)
+            predictions = model(val_images).argmax(dim=1)
+            correct = (predictions == val_labels).sum().item()
+        
+        acc = 100.0 * correct / len(val_labels)
         
-        acc = 100.0 * correct / total
         print(f"Epoch {epoch+1}/15 | Loss: {total_loss:.2f} | Val Accuracy: {acc:.2f}%")
     
     return model
@@ -86,25 +124,51 @@ def quantize_weights(model):
     quantized = {}
     
     for name, param in model.named_parameters():
-        data = param.detach().numpy()
-        max_val = np.max(np.abs(data))
-        
-        # scale maps the range [-max_val, max_val] -> [-127, 127]
-        scale = 127.0 / max_val if max_val > 0 else 1.0
-        
-        quantized_data = np.round(data * scale).astype(np.int8)
+        with torch.no_grad():
+            # aminmax reads the weights once without an abs() temporary
+            min_val, max_val = torch.aminmax(param)
+            max_val = max(-min_val.item(), max_val.item())
+            
+            # scale maps the range [-max_val, max_val] -> [-127, 127]
+            scale = 127.0 / max_val if max_val > 0 else 1.0
+            
+            # quantize_per_tensor rounds and casts in one fused ATen kernel
+            q = torch.quantize_per_tensor(param, 1.0 / scale, 0, torch.qint8)
+            quantized_data = q.int_repr().numpy()
         
         quantized[name] = {
             'data': quantized_data,
             'scale': scale,
-            'shape': data.shape
+            'shape': tuple(param.shape)
         }
         
-        print(f"Quantized {name}: shape={data.shape}, scale={scale:.4f}, "
+        print(f"Quantized {name}: shape={tuple(param.shape)}, scale={scale:.4f}, "
               f"range=[{quantized_data.min()}, {quantized_data.max()}]")
     
     return quantized
 
+def prescale_biases(quantized):
+    """
+    Pre-scale the int8 biases to each layer's int32 accumulator scale.
+    Shared by the C exporter and the Python verifier so both use the
+    exact same bias values.
+    """
+    s_w1 = quantized['fc1.weight']['scale']
+    s_b1 = quantized['fc1.bias']['scale']
+    s_w2 = quantized['fc2.weight']['scale']
+    s_b2 = quantized['fc2.bias']['scale']
+    
+    # Layer 1 bias: accumulator scale = s_w1 * 127 (input scale)
+    # To add bias correctly: bias_scaled = round(bias_q * s_w1 * 127 / s_b1)
+    b1_q = quantized['fc1.bias']['data'].astype(np.int64)
+    fc1_bias_scaled = np.round(b1_q * s_w1 * 127.0 / s_b1).astype(np.int32)
+    
+    # Layer 2 bias: pre-scale with same approach
+    b2_q = quantized['fc2.bias']['data'].astype(np.int64)
+    fc2_bias_scaled = np.round(b2_q * s_w2 * 127.0 / s_b2).astype(np.int32)
+    
+    return fc1_bias_scaled, fc2_bias_scaled
+
 # =============================================================
 # Step 4: Quantize input images (0.0-1.0 floats -> 0-127 ints)
 # =============================================================
@@ -113,66 +177,76 @@ def quantize_input(image_tensor):
     image = image_tensor.numpy().flatten()
     return np.round(image * 127).astype(np.int8)
 
+def quantize_test_images(test_data, num_images):
+    """
+    Quantize the first `num_images` images of a dataset in one batch.
+    Returns a (num_images, 784) int8 array and the matching labels.
+    """
+    images = torch.stack([test_data[i][0] for i in range(num_images)])
+    q_images = quantize_input(images).reshape(num_images, 784)
+    labels = np.array([test_data[i][1] for i in range(num_images)])
+    return q_images, labels
+
 # =============================================================
 # Step 5: Export everything to C header files
 # =============================================================
-def export_to_c(quantized, test_data, num_test_images=10):
+def format_c_values(values, per_line, indent="    "):
+    """Format a flat array as C initializer lines, `per_line` values each."""
+    values = values.tolist()
+    return f",\n{indent}".join(", ".join(map(str, values[i:i+per_line]))
+                           for i in range(0, len(values), per_line))
+
+def export_to_c(quantized, biases, test_data, num_test_images=10):
     os.makedirs('../runtime', exist_ok=True)
     
-    # Pre-compute bias scales for accurate fixed-point inference
-    s_w1 = quantized['fc1.weight']['scale']
-    s_b1 = quantized['fc1.bias']['scale']
-    s_w2 = quantized['fc2.weight']['scale']
-    s_b2 = quantized['fc2.bias']['scale']
+    fc1_bias_scaled, fc2_bias_scaled = biases
     
-    # Layer 1 bias: accumulator scale = s_w1 * 127 (input scale)
-    # To add bias correctly: bias_scaled = round(bias_q * s_w1 * 127 / s_b1)
-    b1_q = quantized['fc1.bias']['data'].astype(np.int64)
-    fc1_bias_scaled = np.round(b1_q * s_w1 * 127.0 / s_b1).astype(np.int32)
+    # --- Export weights ---
+    # Arrays are written as raw little-endian blobs and pulled into .rodata
+    # with .incbin, so the C compiler never parses ~100k integer literals
+    blobs = [
+        ('fc1_weight', quantized['fc1.weight']['data'].flatten()),
+        ('fc2_weight', quantized['fc2.weight']['data'].flatten()),
+        ('fc1_bias', fc1_bias_scaled.astype('<i4')),
+        ('fc2_bias', fc2_bias_scaled.astype('<i4')),
+    ]
+    for c_name, data in blobs:
+        data.tofile(f'../runtime/{c_name}.bin')
     
-    # Layer 2 bias: pre-scale with same approach
-    b2_q = quantized['fc2.bias']['data'].astype(np.int64)
-    fc2_bias_scaled = np.round(b2_q * s_w2 * 127.0 / s_b2).astype(np.int32)
+    with open('../runtime/weights.S', 'w') as f:
+        f.write("// Auto-generated by train_and_export.py\n")
+        f.write("// Embeds the raw weight/bias blobs declared in weights.h\n")
+        f.write("    .section .rodata\n")
+        for c_name, _ in blobs:
+            f.write(f"\n    .balign 16\n    .global {c_name}\n")
+            f.write(f"    .type {c_name}, @object\n{c_name}:\n")
+            f.write(f"    .incbin \"{c_name}.bin\"\n")
+            f.write(f"    .size {c_name}, .-{c_name}\n")
     
-    # --- Export weights ---
     with open('../runtime/weights.h', 'w') as f:
         f.write("// Auto-generated by train_and_export.py\n")
         f.write("// Quantized INT8 weights with pre-scaled INT32 biases\n")
+        f.write("// Array contents live in *.bin, embedded by weights.S\n")
         f.write("#ifndef WEIGHTS_H\n#define WEIGHTS_H\n\n")
         f.write("#include <stdint.h>\n\n")
         
-        # Export weight matrices as int8
+        # Declare weight matrices as int8
         for name in ['fc1.weight', 'fc2.weight']:
             q = quantized[name]
             c_name = name.replace('.', '_')
-            data = q['data']
             scale = q['scale']
             shape = q['shape']
             
             f.write(f"// {name}: shape={shape}, scale={scale:.6f}\n")
             f.write(f"#define {c_name.upper()}_SCALE {scale:.6f}f\n")
-            
-            flat = data.flatten()
-            f.write(f"const int8_t {c_name}[{len(flat)}] = {{\n")
-            for i in range(0, len(flat), 16):
-                chunk = flat[i:i+16]
-                f.write("    " + ", ".join(str(x) for x in chunk) + ",\n")
-            f.write("};\n\n")
+            f.write(f"extern const int8_t {c_name}[{q['data'].size}];\n\n")
         
-        # Export pre-scaled biases as int32
+        # Declare pre-scaled biases as int32
         f.write(f"// fc1.bias: pre-scaled to accumulator scale (bias_q * s_w1 * 127 / s_b1)\n")
-        f.write(f"const int32_t fc1_bias[{len(fc1_bias_scaled)}] = {{\n")
-        for i in range(0, len(fc1_bias_scaled), 8):
-            chunk = fc1_bias_scaled[i:i+8]
-            f.write("    " + ", ".join(str(x) for x in chunk) + ",\n")
-        f.write("};\n\n")
+        f.write(f"extern const int32_t fc1_bias[{len(fc1_bias_scaled)}];\n\n")
         
         f.write(f"// fc2.bias: pre-scaled to accumulator scale (bias_q * s_w2 * 127 / s_b2)\n")
-        f.write(f"const int32_t fc2_bias[{len(fc2_bias_scaled)}] = {{\n")
-        for i in range(0, len(fc2_bias_scaled), 8):
-            chunk = fc2_bias_scaled[i:i+8]
-            f.write("    " + ", ".join(str(x) for x in chunk) + ",\n")
-        f.write("};\n\n")
+        f.write(f"extern const int32_t fc2_bias[{len(fc2_bias_scaled)}];\n\n")
         
         # Write dimensions
         f.write("#define INPUT_SIZE 784\n")
@@ -182,31 +256,20 @@ def export_to_c(quantized, test_data, num_test_images=10):
         f.write("#endif // WEIGHTS_H\n")
     
     # --- Export test images ---
-    with open('../runtime/test_images.h', 'w') as f:
+    with open('../runtime/test_images.h', 'w', buffering=1 << 20) as f:
         f.write("// Auto-generated test images from MNIST\n")
         f.write("#ifndef TEST_IMAGES_H\n#define TEST_IMAGES_H\n\n")
         f.write("#include <stdint.h>\n\n")
         f.write(f"#define NUM_TEST_IMAGES {num_test_images}\n\n")
         
-        # Store expected labels
-        labels = []
-        for i in range(num_test_images):
-            image, label = test_data[i]
-            labels.append(label)
-            q_image = quantize_input(image)
-            
-            f.write(f"// Test image {i}: label = {label}\n")
-            f.write(f"const int8_t test_image_{i}[784] = {{\n")
-            flat = q_image.flatten()
-            for j in range(0, len(flat), 16):
-                chunk = flat[j:j+16]
-                f.write("    " + ", ".join(str(x) for x in chunk) + ",\n")
-            f.write("};\n\n")
-        
-        # Array of pointers to test images
-        f.write("const int8_t* test_images[NUM_TEST_IMAGES] = {\n")
-        for i in range(num_test_images):
-            f.write(f"    test_image_{i},\n")
+        # All images go in one contiguous row-major [N][784] array; rows are
+        # streamed through writelines into the 1 MB file buffer
+        q_images, labels = quantize_test_images(test_data, num_test_images)
+        f.write("const int8_t test_images[NUM_TEST_IMAGES][784] = {\n")
+        f.writelines(
+            f"    // Test image {i}: label = {labels[i]}\n"
+            f"    {{\n        {format_c_values(q_images[i], 16, ' ' * 8)},\n    }},\n"
+            for i in range(num_test_images))
         f.write("};\n\n")
         
         # Expected labels
@@ -216,7 +279,7 @@ def export_to_c(quantized, test_data, num_test_images=10):
         
         f.write("#endif // TEST_IMAGES_H\n")
     
-    print(f"\nExported weights to ../runtime/weights.h")
+    print(f"\nExported weights to ../runtime/weights.h, weights.S and *.bin")
     print(f"Exported {num_test_images} test images to ../runtime/test_images.h")
 
 # =============================================================
@@ -229,44 +292,52 @@ def load_hidden_test_set():
     print(f"Loaded hidden test set: {len(test_data)} images")
     return test_data
 
-def verify_quantized_accuracy(model, quantized, test_data, num_test=1000):
+def infer_batch(X, quantized, biases):
+    """
+    Run the int8 forward pass on a batch of quantized images.
+    X is an (N, 784) int8 array and `biases` comes from prescale_biases();
+    returns the (N,) predicted labels.
+    """
+    w1 = quantized['fc1.weight']['data']                    # (128, 784) int8
+    w2 = quantized['fc2.weight']['data']                    # (10, 128) int8
+    fc1_bias, fc2_bias = biases                             # (128,), (10,)
+    
+    # Layer 1 on the whole batch: result has scale = s_w1 * 127 (input scale)
+    # int8 operands accumulated in int32, numerically the same as the RISC-V
+    # kernels (NumPy upcasts both operands to int32 internally to do this)
+    H = np.matmul(X, w1.T, dtype=np.int32) + fc1_bias       # (N, 128)
+    
+    # ReLU
+    np.maximum(H, 0, out=H)
+    
+    # Rescale each image's hidden layer to int8 range for next layer, same
+    # integer math as rescale_to_int8() in inference.c: (h * 127) / max, so
+    # each row's max maps to exactly 127 and all-zero rows stay zero.
+    # H is non-negative after ReLU, so floor division matches C's truncation.
+    h_max = np.max(H, axis=1, keepdims=True)                # (N, 1)
+    H = (H.astype(np.int64) * 127 // np.maximum(h_max, 1)).astype(np.int8)
+    
+    # Layer 2: the exported bias is added as-is, like add_bias() in the runtime
+    OUT = np.matmul(H, w2.T, dtype=np.int32) + fc2_bias
+    
+    preds = OUT.argmax(axis=1)
+    return preds
+
+def verify_quantized_accuracy(model, quantized, biases, test_data, num_test=1000):
     """
     Run inference using quantized int8 weights in pure numpy
     to verify accuracy before porting to RISC-V.
     """
-    w1 = quantized['fc1.weight']['data'].astype(np.int32)  # (128, 784)
-    b1 = quantized['fc1.bias']['data'].astype(np.int32)     # (128,)
-    w2 = quantized['fc2.weight']['data'].astype(np.int32)  # (10, 128)
-    b2 = quantized['fc2.bias']['data'].astype(np.int32)     # (10,)
+    # Quantize all test images up front so inference runs on one batch
+    q_images, labels = quantize_test_images(test_data, num_test)
     
-    s_w1 = quantized['fc1.weight']['scale']
-    s_b1 = quantized['fc1.bias']['scale']
-    s_w2 = quantized['fc2.weight']['scale']
-    s_b2 = quantized['fc2.bias']['scale']
-    
-    correct = 0
-    for i in range(num_test):
-        image, label = test_data[i]
-        x = quantize_input(image).astype(np.int32)  # (784,)
-        
-        # Layer 1: result has scale = s_w1 * 127 (input scale)
-        # We use int32 accumulation to avoid overflow
-        h = w1 @ x + (b1 * 127 / s_b1 * s_w1).astype(np.int32)
-        
-        # ReLU
-        h = np.maximum(h, 0)
-        
-        # Rescale hidden layer to int8 range for next layer
-        h_max = np.max(np.abs(h)) if np.max(np.abs(h)) > 0 else 1
-        h_scale = 127.0 / h_max
-        h = np.round(h * h_scale).astype(np.int32)
-        
-        # Layer 2
-        out = w2 @ h + (b2 * h_scale * 127 / s_b2 * s_w2).astype(np.int32)
-        
-        pred = np.argmax(out)
-        if pred == label:
-            correct += 1
+    # Images are independent and NumPy's integer matmul releases the GIL,
+    # so split the batch into chunks and run them on a thread per core
+    chunks = np.array_split(q_images, os.cpu_count() or 1)
+    with ThreadPoolExecutor() as pool:
+        preds = np.concatenate(list(pool.map(
+            lambda chunk: infer_batch(chunk, quantized, biases), chunks)))
+    correct = int((preds == labels).sum())
     
     acc = 100.0 * correct / num_test
     print(f"\nQuantized accuracy (Python, {num_test} hidden test samples): {acc:.1f}%")
@@ -286,6 +357,7 @@ if __name__ == '__main__':
     # Quantize
     print("\n--- Quantizing weights ---")
     quantized = quantize_weights(model)
+    biases = prescale_biases(quantized)
     
     # NOW load the hidden test set for the first time
     print("\n--- Loading hidden test set ---")
@@ -293,10 +365,10 @@ if __name__ == '__main__':
     
     # Verify quantized accuracy on hidden test data
     print("\n--- Verifying quantized accuracy on hidden test set ---")
-    verify_quantized_accuracy(model, quantized, test_data)
+    verify_quantized_accuracy(model, quantized, biases, test_data)
     
     # Export hidden test images to C
     print("\n--- Exporting to C ---")
-    export_to_c(quantized, test_data, num_test_images=100)
+    export_to_c(quantized, biases, test_data, num_test_images=100)
     
     print("\nDone! Next step: compile and run runtime/inference.c on RISC-V")
\ No newline at end of file